@@ -1,10 +1,14 @@
 import streamlit as st
+import os
 import sys
 from pathlib import Path
 
 # Modül yolunu ekle
 sys.path.append(str(Path(__file__).parent))
 
+# Sayfa modülleri (ve plotly gibi ağır kütüphaneler) yalnızca seçildiklerinde yüklenir
+from modules import loader, profiler
+
 # Sayfa yapılandırması
 st.set_page_config(
     page_title="Fizik Simülatörleri",
@@ -45,16 +49,7 @@ st.sidebar.markdown("---")
 
 module = st.sidebar.radio(
     "Bir modül seçin:",
-    [
-        "🏠 Ana Sayfa",
-        "📐 Modül 1: Temel Araçlar ve Vektörler",
-        "🏃 Modül 2: Kinematik (Hareket)",
-        "💪 Modül 3: Dinamik (Kuvvetler)",
-        "⚡ Modül 4: İş, Güç ve Enerji",
-        "💥 Modül 5: Momentum ve Çarpışmalar",
-        "🏗️ Modül 6: Statik ve Dönme Hareketi",
-        "〰️ Modül 7: Salınımlar ve Dalgalar"
-    ]
+    ["🏠 Ana Sayfa", *loader.PAGES]
 )
 
 # Modül içeriklerini yükle
@@ -114,33 +109,58 @@ if module == "🏠 Ana Sayfa":
     Tüm simülasyonlarda parametreleri değiştirerek sonuçların nasıl değiştiğini gözlemleyebilirsiniz.
     """)
 
-elif module == "📐 Modül 1: Temel Araçlar ve Vektörler":
-    from modules import module1_vectors
-    module1_vectors.show()
-
-elif module == "🏃 Modül 2: Kinematik (Hareket)":
-    from modules import module2_kinematics
-    module2_kinematics.show()
-
-elif module == "💪 Modül 3: Dinamik (Kuvvetler)":
-    from modules import module3_dynamics
-    module3_dynamics.show()
-
-elif module == "⚡ Modül 4: İş, Güç ve Enerji":
-    from modules import module4_energy
-    module4_energy.show()
-
-elif module == "💥 Modül 5: Momentum ve Çarpışmalar":
-    from modules import module5_momentum
-    module5_momentum.show()
-
-elif module == "🏗️ Modül 6: Statik ve Dönme Hareketi":
-    from modules import module6_statics
-    module6_statics.show()
-
-elif module == "〰️ Modül 7: Salınımlar ve Dalgalar":
-    from modules import module7_oscillations
-    module7_oscillations.show()
+else:
+    page_name = loader.PAGES[module]
+    page = loader.load_page(page_name)
+    if profiler.enabled():
+        # Yeniden çalıştırma profili (FIZIKSIM_PROFILE=1 ile açılır)
+        history = st.session_state.setdefault("profil_gecmisi", [])
+        history.append(profiler.run(page_name, page.show))
+        del history[:-profiler.HISTORY]
+    else:
+        page.show()
+
+# İçe aktarma süresi raporu (FIZIKSIM_IMPORT_REPORT=1 ile açılır)
+if loader.report_enabled():
+    with st.sidebar.expander("⏱️ İçe Aktarma Süreleri"):
+        records = loader.import_times()
+        if records:
+            for record in records:
+                heavy = f" ({', '.join(record.heavy)})" if record.heavy else ""
+                st.write(f"`{record.module}`: {record.ms:.1f} ms{heavy}")
+        else:
+            st.write("Henüz sayfa modülü yüklenmedi.")
+
+# Son yeniden çalıştırmanın zaman dağılımı (FIZIKSIM_PROFILE=1 ile açılır)
+if profiler.enabled():
+    with st.sidebar.expander("🔬 Yeniden Çalıştırma Profili", expanded=True):
+        history = st.session_state.get("profil_gecmisi", [])
+        if history:
+            last = history[-1]
+            st.write(f"**{last.page}**: {last.total_ms:.0f} ms")
+            for category in profiler.CATEGORIES:
+                share = last.spans[category] / last.total_ms if last.total_ms else 0.0
+                calls = f", {last.calls[category]} çağrı" if last.calls[category] else ""
+                st.progress(min(share, 1.0),
+                            text=f"{category}: {last.spans[category]:.0f} ms (%{share * 100:.0f}{calls})")
+            st.caption("Son yeniden çalıştırmalar (ms):")
+            st.table(profiler.summary_rows(history))
+            if last.dump:
+                st.caption(f"cProfile: `{last.dump}`")
+                st.code(last.top, language=None)
+        else:
+            st.write("Bir modül seçildiğinde ölçülür.")
+
+# Önbellek isabet/ıska sayaçları (FIZIKSIM_CACHE_REPORT=1 ile açılır)
+if os.environ.get("FIZIKSIM_CACHE_REPORT", "").lower() in ("1", "true", "yes"):
+    from physics import cache
+
+    with st.sidebar.expander("🗄️ Önbellek"):
+        for name, s in cache.stats().items():
+            total = s.hits + s.misses
+            ratio = s.hits / total * 100 if total else 0.0
+            st.write(f"`{name.rsplit('.', 1)[-1]}`: {s.hits}/{total} isabet (%{ratio:.0f}), "
+                     f"{s.entries} girdi, {s.nbytes / 1024:.0f} KB")
 
 # Footer
 st.sidebar.markdown("---")
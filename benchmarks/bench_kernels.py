@@ -0,0 +1,95 @@
+"""Tepki eğrisi çekirdekleri: vektörize sürüm ile eski örnek başına döngü.
+
+Her çekirdek 10⁵ ve 10⁶ örnekte ölçülür ve sonuçların eşitliği doğrulanır:
+
+    python benchmarks/bench_kernels.py [--n 100000 1000000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from physics import kernels  # noqa: E402
+
+FRICTION = dict(m=5.0, g=9.81, mu_s=0.5, mu_k=0.3)
+
+
+def friction_loop(m, g, mu_s, mu_k, F_max, n):
+    # modules/module3_dynamics.py eski hâli
+    f_s_max = mu_s * m * g
+    f_k = mu_k * m * g
+    F_range = np.linspace(0, F_max, n)
+    friction_force = []
+    acceleration = []
+    for F in F_range:
+        if F <= f_s_max:
+            friction_force.append(F)
+            acceleration.append(0)
+        else:
+            friction_force.append(f_k)
+            acceleration.append((F - f_k) / m)
+    return F_range, np.array(friction_force), np.array(acceleration)
+
+
+def path_loop(vx, vy, t_before, n):
+    # modules/module5_momentum.py eski hâli
+    x = np.array([vx * (-t) for t in np.linspace(t_before, 0, n)])
+    y = np.array([vy * (-t) for t in np.linspace(t_before, 0, n)])
+    return x, y
+
+
+def zigzag_loop(x_start, x_end, n, amplitude):
+    # modules/module7_oscillations.py eski hâli
+    x = np.linspace(x_start, x_end, n)
+    y = np.zeros(n)
+    for i in range(n):
+        y[i] = amplitude * ((-1) ** i)
+    return x, y
+
+
+CASES = {
+    "friction_response": (
+        lambda n: kernels.friction_response(F_max=2 * 0.5 * 5.0 * 9.81, n=n, **FRICTION),
+        lambda n: friction_loop(F_max=2 * 0.5 * 5.0 * 9.81, n=n, **FRICTION),
+    ),
+    "straight_path": (
+        lambda n: kernels.straight_path(3.0, 2.0, -2.0, 0.0, n),
+        lambda n: path_loop(3.0, 2.0, 2.0, n),
+    ),
+    "zigzag": (
+        lambda n: kernels.zigzag(-0.4, 0.9, n, 0.05),
+        lambda n: zigzag_loop(-0.4, 0.9, n, 0.05),
+    ),
+}
+
+
+def _timed(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'çekirdek':<20}{'n':>10}{'vektörize':>14}{'döngü':>14}{'hızlanma':>10}")
+    for name, (vectorized, loop) in CASES.items():
+        for n in args.n:
+            t_vec, fast = _timed(lambda: vectorized(n))
+            t_loop, slow = _timed(lambda: loop(n), repeat=1)
+            for a, b in zip(fast, slow):
+                np.testing.assert_allclose(a, b, rtol=1e-12, atol=1e-12)
+            print(f"{name:<20}{n:>10}{t_vec * 1000:>11.2f} ms{t_loop * 1000:>11.1f} ms{t_loop / t_vec:>9.0f}×")
+
+
+if __name__ == "__main__":
+    main()
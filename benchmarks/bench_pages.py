@@ -0,0 +1,413 @@
+"""Sayfa başına yeniden çalıştırma maliyeti: hesap, şekil oluşturma ve serileştirme.
+
+Her modül (module1_vectors … module7_oscillations) için temsilî senaryolar
+küçük/orta/büyük parametrelerle ölçülür:
+
+* hesap_ms: sayfanın kullandığı physics fonksiyonları
+* sekil_ms: Plotly şeklinin kurulması (sayfanın build_*_figure oluşturucusu)
+* serilestirme_ms / json_bayt: st.plotly_chart'ın tarayıcıya gönderdiği JSON
+
+Her tekrar önbellekler boşaltılarak başlar; hesap adımının önbelleğe aldığı
+sonuçları şekil oluşturucu yeniden kullanır, böylece sekil_ms yalnızca
+şeklin süresidir. Oluşturucunun önbelleğe alınmayan ara hesapları ve
+önbellek bayt sınırını aşan büyük seriler şekil süresine yeniden girer.
+En iyi süre raporlanır. Sonuçlar JSON olarak yazılır ve kayıtlı taban
+çizgisiyle karşılaştırılır; tolerans aşılırsa çıkış kodu 1 olur. Tüm
+sürelerin ortanca oranı da yazılır: her şey birlikte yavaşladıysa sebep
+kod değil makine olabilir (taban çizgisi aynı makinede kaydedilmelidir).
+
+Kapsam: girdiyle büyüyen hesap veya şekil içeren sekmeler (CASES). Sabit
+boyutlu, birkaç izli şekli show() içinde kuran sekmeler (Modül 1 vektör
+hesaplayıcı, Modül 3 Newton/sürtünme/eğik düzlem kuvvetleri ve Atwood,
+Modül 6 tork, geometrik kütle merkezi ve dönme dinamiği, Modül 4'ün tek
+değerli hesaplayıcıları) ölçülmez.
+
+    python benchmarks/bench_pages.py                         # karşılaştır
+    python benchmarks/bench_pages.py --modules 5 7 --sizes large
+    python benchmarks/bench_pages.py --save-baseline         # taban çizgisini güncelle
+"""
+import argparse
+import functools
+import io
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+import numpy as np
+import plotly
+import plotly.graph_objects as go
+import plotly.io as pio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules import (module2_kinematics, module3_dynamics, module4_energy, module5_momentum,  # noqa: E402
+                     module6_statics, module7_oscillations)
+from physics import (ballistics, cache, coaster, collisions, disks, driven, energy, incline,  # noqa: E402
+                     kinematics, momentum, oscillations, pulleys, spectral, statics, units, vectors)
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_pages.json")
+SIZES = ("small", "medium", "large")
+# Bu süreden kısa ölçümler gerilemede dikkate alınmaz (zamanlayıcı gürültüsü)
+MIN_MS = 5.0
+
+
+class Case(NamedTuple):
+    sizes: Dict[str, dict]
+    compute: Callable[..., Any]
+    figure: Optional[Callable[..., Any]] = None  # figure(hesap sonucu, **parametreler)
+
+
+# --- Modül 1 ---
+
+def _vector_batch(n):
+    rng = np.random.default_rng(0)
+    A, B = rng.normal(size=(n, 3)), rng.normal(size=(n, 3))
+    return vectors.summarize(vectors.batch("cross", A, B))
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_csv_text(n):
+    return "id,hiz,enerji\n" + "".join(f"{i},{i * 0.5},{'' if i % 100 == 0 else i * 2.0}\n" for i in range(n))
+
+
+def _unit_csv(n):
+    # Birim dönüştürücü sekmesinin CSV sütun dönüşümü (girdi metni ölçüm dışında bir kez üretilir)
+    out = io.StringIO()
+    units.convert_csv(io.StringIO(_unit_csv_text(n)), out, {"hiz": ("km/h", "m/s"), "enerji": ("kWh", "J")})
+    return out
+
+
+# --- Modül 3 ---
+
+def _incline_run(t_sim):
+    return incline.simulate_incline(5.0, 0.3, 0.2, incline.Profile("sinüs", 0.0, 30.0, 4.0),
+                                    incline.Profile("rampa", 30.0, 60.0, t_sim), 0.0, t_sim, 9.81,
+                                    max_step=4.0 / 20)
+
+
+def _incline_figure(run, t_sim):
+    return module3_dynamics.build_incline_events_figure(run)
+
+
+# --- Modül 4 ---
+
+def _coaster_points(profile):
+    if profile == "drop":
+        return coaster.compose([coaster.drop(30.0, 100.0)], start=(0.0, 40.0))
+    return coaster.compose([coaster.drop(30.0, 60.0), coaster.straight(20.0), coaster.loop(8.0),
+                            coaster.straight(20.0), coaster.hill(10.0, 40.0), coaster.straight(10.0)],
+                           start=(0.0, 40.0))
+
+
+def _coaster_ride(profile, mu, k):
+    track = coaster.build_track(_coaster_points(profile))
+    result = coaster.ride(track, 2.0, 9.81, mu, k)
+    return coaster.loop_check(track, result, 9.81)
+
+
+def _coaster_figure(_, profile, mu, k):
+    return module4_energy.build_coaster_figure(_coaster_points(profile), 500.0, 2.0, 9.81, mu, k)[0]
+
+
+# --- Modül 5 ---
+
+def _collision_positions(n_frames):
+    c = momentum.restitution_collision(2.0, 3.0, 1.0, -1.0, 0.8)
+    return c.v1_final, c.v2_final, momentum.collision_positions(3.0, -1.0, c.v1_final, c.v2_final, n_frames, 2, 2)
+
+
+def _collision_figure(result, n_frames):
+    v1_final, v2_final, _ = result
+    return module5_momentum.build_collision_animation(3.0, -1.0, v1_final, v2_final, n_frames)
+
+
+def _chain_run(model, n_bodies):
+    # modules/module5_momentum.py build_chain_figures ile aynı çağrı (önbellek anahtarı ortak)
+    if model == "Newton Beşiği":
+        m, x, v, radius = collisions.newtons_cradle(n_bodies, 1)
+        walls, t_end = None, 10.0
+    else:
+        m, x, v, radius, walls = collisions.piston_gas(n_bodies)
+        t_end = 100.0
+    return collisions.simulate_chain(m, x, v, t_end, 120, radius, 1.0, walls, max_events=500_000)
+
+
+def _chain_figures(_, model, n_bodies):
+    t_end = 10.0 if model == "Newton Beşiği" else 100.0
+    return module5_momentum.build_chain_figures(model, n_bodies, 1, 1.0, t_end)[:2]
+
+
+def _disk_run(n_disks):
+    pos, vel, radius, mass, box = disks.ideal_gas(n_disks, (2.0 * np.sqrt(n_disks),) * 2)
+    return disks.simulate_disks(pos, vel, radius, mass, box, 30.0, 40, 1.0)
+
+
+def _disk_figures(_, n_disks):
+    return module5_momentum.build_disk_figures("İdeal Gaz", n_disks, 1.0)[:2]
+
+
+# --- Modül 6 ---
+
+def _beam_loads(n_loads):
+    return [((i + 1) * 10.0 / (n_loads + 1), 500.0) for i in range(n_loads)]
+
+
+def _beam_figure(reactions, n_loads):
+    return module6_statics.build_beam_figure(10.0, 0.0, 10.0, _beam_loads(n_loads), *reactions)
+
+
+def _masses(n_masses):
+    return [(1.0, float(i), float(i)) for i in range(n_masses)]
+
+
+def _center_of_mass_figure(result, n_masses):
+    return module6_statics.build_center_of_mass_figure(_masses(n_masses), *result)
+
+
+# --- Modül 7 ---
+
+def _shm_figure(_, n):
+    return module7_oscillations.build_shm_figure(1.0, 10.0, 0.5, 0.0, 10.0, n)
+
+
+def _pendulum_figure(_, n):
+    return module7_oscillations.build_pendulum_figure(1.0, 9.81, 1.0, np.radians(60.0), 15.0, n)
+
+
+def _driven_run(n):
+    return driven.driven_response(1.0, 10.0, 0.4, 1.0, 3.0, 0.0, 0.0, 20.0, n)
+
+
+def _driven_figure(_, n):
+    return module7_oscillations.build_driven_figure(1.0, 10.0, 0.4, 1.0, 3.0, 0.0, 0.0, 20.0, n)
+
+
+def _resonance(n):
+    return oscillations.steady_state(1.0, 10.0, 0.4, 1.0, np.linspace(0.0, 3 * np.sqrt(10.0), n))
+
+
+def _resonance_figure(_, n):
+    return module7_oscillations.build_resonance_figure(1.0, 10.0, 0.4, 1.0, 3.0, n)
+
+
+def _chain_motion(N):
+    # Sayfanın önbellekli _chain_motion'ı; şekil aynı anahtarla ondan okur
+    system = module7_oscillations.ZINCIR_SISTEMLERI[0]
+    return module7_oscillations._chain_motion(system, N, 1.0, 1.0, 10.0, 1.0, 9.81, True, "dalga paketi", 0, 0.1)
+
+
+def _chain_figure(_, N):
+    system = module7_oscillations.ZINCIR_SISTEMLERI[0]
+    return module7_oscillations.build_chain_figure(system, N, 1.0, 1.0, 10.0, 1.0, 9.81, True, "dalga paketi", 0, 0.1,
+                                                   20.0)
+
+
+def _spectrum_series(n):
+    t = np.linspace(0.0, 100.0, n)
+    return t, oscillations.pendulum_state(1.0, 9.81, 1.0, np.radians(120.0), t).theta
+
+
+def _spectrum(n):
+    t, y = _spectrum_series(n)
+    dt = float(t[1] - t[0])
+    spectral.spectrum(y, dt)
+    spectral.welch_psd(y, dt, 1024)
+    return spectral.harmonics(y, dt, 5)
+
+
+def _spectrum_figure(_, n):
+    return module7_oscillations.build_spectrum_figure(*_spectrum_series(n), "θ", "hann", 1024)[0]
+
+
+CASES: Dict[str, Dict[str, Case]] = {
+    "module1_vectors": {
+        "birim_csv": Case({"small": dict(n=1_000), "medium": dict(n=100_000), "large": dict(n=500_000)}, _unit_csv),
+        # Toplu işlem sekmesinde şekil yoktur; süre tamamen hesaptır
+        "toplu_vektorel_carpim": Case({"small": dict(n=1_000), "medium": dict(n=100_000), "large": dict(n=2_000_000)},
+                                      _vector_batch),
+    },
+    "module2_kinematics": {
+        "tarama": Case(
+            {"small": dict(na=20, nv=20, nh=1), "medium": dict(na=90, nv=100, nh=5),
+             "large": dict(na=180, nv=400, nh=20)},
+            lambda na, nv, nh: kinematics.projectile_grid(np.linspace(5, 85, na), np.linspace(5, 50, nv),
+                                                          np.linspace(0, 20, nh), 9.81),
+            lambda grid, **_: module2_kinematics.build_sweep_figure(grid, "range_x", "Menzil (m)", 0)),
+        "direncli_atis": Case(
+            {"small": dict(v0=20.0, variable_g=False), "medium": dict(v0=80.0, variable_g=False),
+             "large": dict(v0=600.0, variable_g=True)},
+            lambda v0, variable_g: ballistics.solve_trajectory(v0, 45.0, 0.0, 9.81, 0.0076, 0.0, variable_g),
+            lambda _, v0, variable_g: module2_kinematics.build_drag_figure(v0, 45.0, 0.0, 9.81, 0.0076, 0.0,
+                                                                           variable_g)),
+    },
+    "module3_dynamics": {
+        "egik_duzlem_olay": Case({"small": dict(t_sim=5.0), "medium": dict(t_sim=15.0), "large": dict(t_sim=30.0)},
+                                 _incline_run, _incline_figure),
+        "makara_zinciri": Case(
+            {"small": dict(n=1), "medium": dict(n=10), "large": dict(n=50)},
+            lambda n: pulleys.block_chain([5.0] * n, 0.1, 3.0 * n, 9.81, 0.0, 0.1).solve()),
+    },
+    "module4_energy": {
+        "hiz_treni": Case(
+            {"small": dict(profile="drop", mu=0.0, k=0.0), "medium": dict(profile="loop", mu=0.0, k=0.0),
+             "large": dict(profile="loop", mu=0.02, k=0.5 * 1.225 * 1.5 / 500.0)},
+            _coaster_ride, _coaster_figure),
+        "sarkac_enerjisi": Case(
+            {"small": dict(n=100), "medium": dict(n=10_000), "large": dict(n=1_000_000)},
+            lambda n: energy.pendulum_energy_profile(1.0, 2.0, 9.81, 10.0, np.linspace(-0.5, 0.5, n))),
+    },
+    "module5_momentum": {
+        "carpisma_animasyonu": Case({"small": dict(n_frames=60), "medium": dict(n_frames=150),
+                                     "large": dict(n_frames=600)}, _collision_positions, _collision_figure),
+        "zincir": Case({"small": dict(model="Newton Beşiği", n_bodies=5),
+                        "medium": dict(model="Piston ve Gaz", n_bodies=200),
+                        "large": dict(model="Piston ve Gaz", n_bodies=500)}, _chain_run, _chain_figures),
+        "diskler": Case({"small": dict(n_disks=100), "medium": dict(n_disks=1000), "large": dict(n_disks=5000)},
+                        _disk_run, _disk_figures),
+    },
+    "module6_statics": {
+        "kiris": Case({"small": dict(n_loads=1), "medium": dict(n_loads=3), "large": dict(n_loads=5)},
+                      lambda n_loads: statics.beam_reactions(10.0, 100.0, 9.81, 0.0, 10.0, _beam_loads(n_loads)),
+                      _beam_figure),
+        "kutle_merkezi": Case({"small": dict(n_masses=2), "medium": dict(n_masses=5), "large": dict(n_masses=10)},
+                              lambda n_masses: statics.center_of_mass(*zip(*_masses(n_masses)))[1:],
+                              _center_of_mass_figure),
+    },
+    "module7_oscillations": {
+        "basit_harmonik": Case({"small": dict(n=500), "medium": dict(n=50_000), "large": dict(n=1_000_000)},
+                               lambda n: oscillations.shm_series(1.0, 10.0, 0.5, 0.0, 10.0, n), _shm_figure),
+        "sarkac": Case({"small": dict(n=500), "medium": dict(n=50_000), "large": dict(n=1_000_000)},
+                       lambda n: oscillations.pendulum_series(1.0, 9.81, 1.0, np.radians(60.0), 15.0, n),
+                       _pendulum_figure),
+        "zorlanmis": Case({"small": dict(n=500), "medium": dict(n=50_000), "large": dict(n=500_000)},
+                          _driven_run, _driven_figure),
+        "rezonans": Case({"small": dict(n=1_000), "medium": dict(n=20_000), "large": dict(n=100_000)},
+                         _resonance, _resonance_figure),
+        "bagli_zincir": Case({"small": dict(N=10), "medium": dict(N=200), "large": dict(N=1000)},
+                             _chain_motion, _chain_figure),
+        "spektrum": Case({"small": dict(n=4_096), "medium": dict(n=65_536), "large": dict(n=1_000_000)},
+                         _spectrum, _spectrum_figure),
+    },
+}
+
+
+def _figures(result) -> list:
+    if isinstance(result, go.Figure):
+        return [result]
+    if isinstance(result, (tuple, list)):
+        return [fig for fig in result if isinstance(fig, go.Figure)]
+    return []
+
+
+def measure(case: Case, params: dict, repeat: int) -> Dict[str, Optional[float]]:
+    """En iyi hesap/şekil/serileştirme süreleri (ms) ve JSON boyutu (bayt)."""
+    best = {"hesap_ms": np.inf, "sekil_ms": np.inf, "serilestirme_ms": np.inf}
+    json_bytes = None
+    for _ in range(repeat):
+        cache.clear_all()
+        start = time.perf_counter()
+        result = case.compute(**params)
+        best["hesap_ms"] = min(best["hesap_ms"], (time.perf_counter() - start) * 1000)
+        if case.figure is None:
+            continue
+        start = time.perf_counter()
+        figures = _figures(case.figure(result, **params))
+        best["sekil_ms"] = min(best["sekil_ms"], (time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        # st.plotly_chart şekli bu biçimde serileştirir
+        payload = [pio.to_json(fig, validate=False).encode("utf-8") for fig in figures]
+        best["serilestirme_ms"] = min(best["serilestirme_ms"], (time.perf_counter() - start) * 1000)
+        json_bytes = sum(len(p) for p in payload)
+    out = {key: (round(value, 3) if np.isfinite(value) else None) for key, value in best.items()}
+    out["json_bayt"] = json_bytes
+    return out
+
+
+def compare(results: dict, baseline: dict, tolerance: float, size_tolerance: float):
+    """Taban çizgisine göre toleransı aşan ölçümler [(anahtar, alan, eski, yeni)] ve sürelerin ortanca oranı."""
+    regressions, ratios = [], []
+    for key, row in results.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+        for field, value in row.items():
+            prev = old.get(field)
+            if value is None or prev is None:
+                continue
+            if field == "json_bayt":
+                if value > prev * (1 + size_tolerance):
+                    regressions.append((key, field, prev, value))
+            else:
+                if prev >= MIN_MS:
+                    ratios.append(value / prev)
+                if value > max(prev * (1 + tolerance), prev + MIN_MS):
+                    regressions.append((key, field, prev, value))
+    return regressions, float(np.median(ratios)) if ratios else np.nan
+
+
+def _fmt(value, unit=""):
+    return "-" if value is None else f"{value:.1f}{unit}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", nargs="+", help="modül numaraları veya adları (varsayılan: hepsi)")
+    parser.add_argument("--sizes", nargs="+", choices=SIZES, default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("-o", "--output", default="bench_pages.json", help="sonuç dosyası")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="sonuçları taban çizgisi olarak kaydet")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="izin verilen göreli süre artışı")
+    parser.add_argument("--size-tolerance", type=float, default=0.05, help="izin verilen göreli JSON boyutu artışı")
+    args = parser.parse_args()
+
+    selected = [name for name in CASES
+                if not args.modules or any(sel == name or name.startswith(f"module{sel}_") for sel in args.modules)]
+
+    results = {}
+    print(f"{'senaryo':<46}{'hesap':>12}{'şekil':>12}{'serileştirme':>14}{'JSON':>12}")
+    for module in selected:
+        for case_name, case in CASES[module].items():
+            for size in args.sizes:
+                key = f"{module}/{case_name}/{size}"
+                row = results[key] = measure(case, case.sizes[size], args.repeat)
+                size_kb = None if row["json_bayt"] is None else row["json_bayt"] / 1024
+                print(f"{key:<46}{_fmt(row['hesap_ms'], ' ms'):>12}{_fmt(row['sekil_ms'], ' ms'):>12}"
+                      f"{_fmt(row['serilestirme_ms'], ' ms'):>14}{_fmt(size_kb, ' kB'):>12}")
+
+    report = {
+        "ortam": {"python": platform.python_version(), "numpy": np.__version__, "plotly": plotly.__version__,
+                  "platform": platform.platform(), "tarih": time.strftime("%Y-%m-%d %H:%M:%S")},
+        "sonuclar": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)["sonuclar"]
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"ortam": report["ortam"], "sonuclar": baseline}, f, ensure_ascii=False, indent=1)
+        print(f"Taban çizgisi güncellendi: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Taban çizgisi yok ({args.baseline}); --save-baseline ile oluşturun.")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        regressions, median_ratio = compare(results, json.load(f)["sonuclar"], args.tolerance, args.size_tolerance)
+    for key, field, old, new in regressions:
+        print(f"GERİLEME {key} {field}: {old} → {new}")
+    print(f"{len(regressions)} gerileme (tolerans: süre %{args.tolerance * 100:.0f}, "
+          f"boyut %{args.size_tolerance * 100:.0f}); süre oranı ortancası {median_ratio:.2f}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
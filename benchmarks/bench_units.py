@@ -0,0 +1,62 @@
+"""Toplu birim dönüşümü verimi.
+
+10 milyon elemanlık dizi üzerinde bellek içi, yerinde ve .npy akışlı
+dönüşümü; daha küçük bir CSV üzerinde de sütun akışını ölçer:
+
+    python benchmarks/bench_units.py [--n 10000000] [--csv-rows 1000000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from physics import units  # noqa: E402
+
+SPEC = ("Uzunluk", "feet (ft)", "metre (m)")
+
+
+def _timed(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _report(label, n, seconds):
+    print(f"{label:<28}{seconds * 1000:>10.1f} ms{n / seconds / 1e6:>12.1f} M eleman/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=10_000_000)
+    parser.add_argument("--csv-rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    values = np.random.default_rng(0).random(args.n) * 1000
+    _report("convert (yeni dizi)", args.n, _timed(lambda: units.convert(values, *SPEC)))
+
+    buffer = values.copy()
+    _report("convert (out=, yerinde)", args.n, _timed(lambda: units.convert(buffer, *SPEC, out=buffer)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src, dst = os.path.join(tmp, "in.npy"), os.path.join(tmp, "out.npy")
+        np.save(src, values)
+        _report("convert_npy (mmap akış)", args.n, _timed(lambda: units.convert_npy(src, dst, *SPEC), repeat=1))
+
+        csv_src, csv_dst = os.path.join(tmp, "in.csv"), os.path.join(tmp, "out.csv")
+        n_rows = args.csv_rows
+        np.savetxt(csv_src, np.column_stack([np.arange(n_rows), values[:n_rows]]),
+                   delimiter=",", header="id,uzunluk", comments="", fmt=["%d", "%.6f"])
+        seconds = _timed(lambda: units.convert_csv(csv_src, csv_dst, {"uzunluk": SPEC}), repeat=1)
+        _report("convert_csv (1 sütun)", n_rows, seconds)
+
+
+if __name__ == "__main__":
+    main()
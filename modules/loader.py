@@ -0,0 +1,105 @@
+"""Sayfa modüllerinin ihtiyaç anında yüklenmesi ve içe aktarma süresi raporu.
+
+Sayfa modülleri (ve onların çektiği plotly gibi ağır kütüphaneler) yalnızca
+kenar çubuğunda ilk kez seçildiklerinde içe aktarılır. Her ilk yükleme süresi
+milisaniye olarak kaydedilir.
+
+Soğuk başlangıç ölçümü için her sayfayı ayrı bir süreçte içe aktarır:
+
+    python -m modules.loader
+"""
+import importlib
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, NamedTuple
+
+# Rapor açma anahtarı: FIZIKSIM_IMPORT_REPORT=1
+REPORT_ENV = "FIZIKSIM_IMPORT_REPORT"
+
+# Kenar çubuğu etiketi -> modules altındaki sayfa modülü
+PAGES = {
+    "📐 Modül 1: Temel Araçlar ve Vektörler": "module1_vectors",
+    "🏃 Modül 2: Kinematik (Hareket)": "module2_kinematics",
+    "💪 Modül 3: Dinamik (Kuvvetler)": "module3_dynamics",
+    "⚡ Modül 4: İş, Güç ve Enerji": "module4_energy",
+    "💥 Modül 5: Momentum ve Çarpışmalar": "module5_momentum",
+    "🏗️ Modül 6: Statik ve Dönme Hareketi": "module6_statics",
+    "〰️ Modül 7: Salınımlar ve Dalgalar": "module7_oscillations",
+}
+
+# Raporda ayrıca belirtilen ağır kütüphaneler
+HEAVY_PACKAGES = ("numpy", "scipy", "plotly", "matplotlib", "pandas")
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    ms: float
+    heavy: List[str]
+
+
+_records: Dict[str, ImportRecord] = {}
+
+
+def load_page(name: str):
+    """modules.<name> sayfasını yükler; ilk yüklemede süreyi kaydeder."""
+    qualified = f"modules.{name}"
+    if qualified in sys.modules:
+        return sys.modules[qualified]
+
+    before = {pkg for pkg in HEAVY_PACKAGES if pkg in sys.modules}
+    start = time.perf_counter()
+    page = importlib.import_module(qualified)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    loaded = [pkg for pkg in HEAVY_PACKAGES if pkg in sys.modules and pkg not in before]
+
+    _records[name] = ImportRecord(name, elapsed_ms, loaded)
+    return page
+
+
+def import_times() -> List[ImportRecord]:
+    """Bu süreçte yüklenen sayfaların ilk içe aktarma süreleri (yükleme sırasıyla)."""
+    return list(_records.values())
+
+
+def report_enabled() -> bool:
+    return os.environ.get(REPORT_ENV, "").lower() in ("1", "true", "yes")
+
+
+_PROBE = """
+import sys, time
+sys.path.insert(0, {root!r})
+t = time.perf_counter()
+import streamlit
+base = time.perf_counter() - t
+t = time.perf_counter()
+import importlib
+importlib.import_module({module!r})
+print(base * 1000, (time.perf_counter() - t) * 1000)
+"""
+
+
+def cold_import_times(names: List[str]) -> List[ImportRecord]:
+    """Her sayfayı temiz bir Python sürecinde içe aktarıp süresini ölçer.
+
+    Süre, streamlit zaten yüklüyken sayfanın kendisine ve bağımlılıklarına
+    harcanan kısımdır; streamlit'in kendi süresi "streamlit" satırında verilir.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    records = []
+    base_times = []
+    for name in names:
+        out = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(root=root, module=f"modules.{name}")],
+            capture_output=True, text=True, check=True, cwd=root,
+        ).stdout.split()
+        base_times.append(float(out[-2]))
+        records.append(ImportRecord(name, float(out[-1]), []))
+    records.insert(0, ImportRecord("streamlit", min(base_times), []))
+    return records
+
+
+if __name__ == "__main__":
+    for record in cold_import_times(list(PAGES.values())):
+        print(f"{record.module:<24}{record.ms:>10.1f} ms")
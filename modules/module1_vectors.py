@@ -1,12 +1,16 @@
+import csv
+import io
+
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-import matplotlib.pyplot as plt
+
+from physics import units, vectors
 
 def show():
     st.markdown('<h2 class="module-header">📐 Modül 1: Temel Araçlar ve Vektörler</h2>', unsafe_allow_html=True)
 
-    tab1, tab2 = st.tabs(["🔄 Birim Dönüştürücü", "📊 Vektör Hesaplayıcı"])
+    tab1, tab2, tab3 = st.tabs(["🔄 Birim Dönüştürücü", "📊 Vektör Hesaplayıcı", "🧮 Toplu Vektör İşlemleri"])
 
     # TAB 1: Birim Dönüştürücü
     with tab1:
@@ -14,78 +18,78 @@ def show():
 
         birim_kategorisi = st.selectbox(
             "Kategori seçin:",
-            ["Uzunluk", "Kütle", "Zaman", "Kuvvet", "Enerji", "Hız", "İvme"]
+            [*units.KATEGORILER, "Bileşik Birim (ifade)"]
         )
 
-        # Birim dönüşüm tanımları (her şey SI birimine göre)
-        birimler = {
-            "Uzunluk": {
-                "metre (m)": 1,
-                "kilometre (km)": 1000,
-                "santimetre (cm)": 0.01,
-                "milimetre (mm)": 0.001,
-                "feet (ft)": 0.3048,
-                "inç (in)": 0.0254,
-                "mil (mi)": 1609.34
-            },
-            "Kütle": {
-                "kilogram (kg)": 1,
-                "gram (g)": 0.001,
-                "ton": 1000,
-                "pound (lb)": 0.453592,
-                "ons (oz)": 0.0283495
-            },
-            "Zaman": {
-                "saniye (s)": 1,
-                "dakika (dk)": 60,
-                "saat (sa)": 3600,
-                "gün": 86400,
-                "yıl": 31536000
-            },
-            "Kuvvet": {
-                "Newton (N)": 1,
-                "kilonewton (kN)": 1000,
-                "pound-force (lbf)": 4.44822,
-                "dyne": 1e-5
-            },
-            "Enerji": {
-                "Joule (J)": 1,
-                "kilojoule (kJ)": 1000,
-                "kalori (cal)": 4.184,
-                "kilokalori (kcal)": 4184,
-                "kilowatt-saat (kWh)": 3.6e6,
-                "elektron-volt (eV)": 1.602e-19
-            },
-            "Hız": {
-                "metre/saniye (m/s)": 1,
-                "kilometre/saat (km/h)": 0.277778,
-                "mil/saat (mph)": 0.44704,
-                "knot": 0.514444
-            },
-            "İvme": {
-                "metre/saniye² (m/s²)": 1,
-                "g (yerçekimi ivmesi)": 9.80665,
-                "feet/saniye² (ft/s²)": 0.3048
-            }
-        }
+        col1, col2 = st.columns(2)
 
-        birim_secenekleri = list(birimler[birim_kategorisi].keys())
+        if birim_kategorisi == "Bileşik Birim (ifade)":
+            st.caption("Örnekler: `kN*m` → `lbf*ft`, `kWh/day` → `W`, `m/s^2` → `ft/s²`, `kg/(m·s²)` → `Pa`")
 
-        col1, col2 = st.columns(2)
+            with col1:
+                kaynak_birim = st.text_input("Kaynak birim:", value="kN*m", key="kaynak_ifade")
+                deger = st.number_input("Değer:", value=1.0, format="%.6f")
+
+            with col2:
+                hedef_birim = st.text_input("Hedef birim:", value="lbf*ft", key="hedef_ifade")
 
-        with col1:
-            kaynak_birim = st.selectbox("Kaynak birim:", birim_secenekleri, key="kaynak")
-            deger = st.number_input("Değer:", value=1.0, format="%.6f")
+            donusum = (kaynak_birim, hedef_birim)
+        else:
+            birim_secenekleri = list(units.BIRIMLER[birim_kategorisi].keys())
 
-        with col2:
-            hedef_birim = st.selectbox("Hedef birim:", birim_secenekleri, key="hedef")
+            with col1:
+                kaynak_birim = st.selectbox("Kaynak birim:", birim_secenekleri, key="kaynak")
+                deger = st.number_input("Değer:", value=1.0, format="%.6f")
 
-        # Dönüşüm hesaplama
-        kaynak_carpan = birimler[birim_kategorisi][kaynak_birim]
-        hedef_carpan = birimler[birim_kategorisi][hedef_birim]
-        sonuc = deger * (kaynak_carpan / hedef_carpan)
+            with col2:
+                hedef_birim = st.selectbox("Hedef birim:", birim_secenekleri, key="hedef")
 
-        st.success(f"**Sonuç:** {deger} {kaynak_birim} = **{sonuc:.6f}** {hedef_birim}")
+            donusum = (birim_kategorisi, kaynak_birim, hedef_birim)
+
+        # Dönüşüm hesaplama
+        try:
+            sonuc = deger * units.spec_factor(donusum)
+        except ValueError as hata:
+            st.error(f"❌ {hata}")
+            donusum = None
+        else:
+            st.success(f"**Sonuç:** {deger} {kaynak_birim} = **{sonuc:.6g}** {hedef_birim}")
+            if len(donusum) == 2:
+                st.info(f"**Boyut:** {units.format_dims(units.parse_unit(kaynak_birim).dims)}")
+
+        # Toplu dönüşüm: seçili birimlerle bütün bir CSV sütununu veya NPY dizisini çevirir
+        st.write("**Toplu Dönüşüm (CSV / NPY):**")
+        dosya = st.file_uploader("Dosya yükleyin:", type=["csv", "npy"], key="toplu_dosya")
+
+        if dosya is not None and donusum is not None:
+            if dosya.name.endswith(".npy"):
+                dizi = np.load(dosya)
+                cikti = io.BytesIO()
+                np.save(cikti, np.multiply(dizi, units.spec_factor(donusum), dtype=np.float64))
+                st.info(f"{dizi.size} eleman çevrildi (şekil {dizi.shape}).")
+                st.download_button("📥 Sonucu indir (.npy)", cikti.getvalue(),
+                                   file_name=f"donusturulmus_{dosya.name}", mime="application/octet-stream")
+            else:
+                metin = io.TextIOWrapper(dosya, encoding="utf-8", newline="")
+                basliklar = next(csv.reader([metin.readline()]))
+                metin.seek(0)
+                sutunlar = st.multiselect("Çevrilecek sütunlar:", basliklar, key="toplu_sutunlar")
+                if sutunlar:
+                    cikti = io.StringIO()
+                    try:
+                        rapor = units.convert_csv(metin, cikti, {ad: donusum for ad in sutunlar})
+                    except ValueError as hata:
+                        # Seçili sütunda sayı olmayan hücre
+                        st.error(f"❌ {hata}")
+                    else:
+                        st.info(f"{rapor.rows} satır çevrildi.")
+                        if rapor.short_lines:
+                            ornek = ", ".join(map(str, rapor.short_lines[:10]))
+                            st.warning(f"{len(rapor.short_lines)} satır seçili sütunlara ulaşmıyor, değiştirilmeden "
+                                       f"kopyalandı (satır {ornek}{' ...' if len(rapor.short_lines) > 10 else ''}).")
+                        st.download_button("📥 Sonucu indir (.csv)", cikti.getvalue(),
+                                           file_name=f"donusturulmus_{dosya.name}", mime="text/csv")
+                metin.detach()
 
     # TAB 2: Vektör Hesaplayıcı
     with tab2:
@@ -132,7 +136,7 @@ def show():
             B = np.array([Bx, By, Bz])
 
             if islem == "Vektör Toplama (A + B)":
-                C = A + B
+                C = vectors.add(A, B)
                 st.success(f"**A + B = ({C[0]:.3f}, {C[1]:.3f}" + (f", {C[2]:.3f})" if boyut == "3D" else ")"))
 
                 # Görselleştirme
@@ -224,22 +228,15 @@ def show():
                     st.plotly_chart(fig)
 
             elif islem == "Vektör Çıkarma (A - B)":
-                C = A - B
+                C = vectors.subtract(A, B)
                 st.success(f"**A - B = ({C[0]:.3f}, {C[1]:.3f}" + (f", {C[2]:.3f})" if boyut == "3D" else ")"))
 
             elif islem == "Skaler (Nokta) Çarpım (A · B)":
-                if boyut == "2D":
-                    dot_product = Ax*Bx + Ay*By
-                else:
-                    dot_product = np.dot(A, B)
+                dot_product = vectors.dot(A, B)
 
                 # Açı hesaplama
-                mag_A = np.linalg.norm(A)
-                mag_B = np.linalg.norm(B)
-                if mag_A > 0 and mag_B > 0:
-                    cos_theta = dot_product / (mag_A * mag_B)
-                    cos_theta = np.clip(cos_theta, -1, 1)  # Numerik hata düzeltmesi
-                    angle_rad = np.arccos(cos_theta)
+                if vectors.magnitude(A) > 0 and vectors.magnitude(B) > 0:
+                    angle_rad = vectors.angle_between(A, B)
                     angle_deg = np.degrees(angle_rad)
 
                     st.success(f"**A · B = {dot_product:.3f}**")
@@ -251,9 +248,9 @@ def show():
                 if boyut == "2D":
                     st.warning("Çapraz çarpım 3D vektörler için tanımlıdır. 2D için boyut seçeneğini 3D yapın.")
                 else:
-                    C = np.cross(A, B)
+                    C = vectors.cross(A, B)
                     st.success(f"**A × B = ({C[0]:.3f}, {C[1]:.3f}, {C[2]:.3f})**")
-                    st.info(f"Büyüklük: {np.linalg.norm(C):.3f}")
+                    st.info(f"Büyüklük: {vectors.magnitude(C):.3f}")
 
                     # 3D görselleştirme
                     fig = go.Figure()
@@ -309,7 +306,7 @@ def show():
                 Vz = 0
 
             V = np.array([Vx, Vy, Vz])
-            magnitude = np.linalg.norm(V)
+            magnitude = vectors.magnitude(V)
 
             if boyut == "2D":
                 st.success(f"**|V| = √({Vx}² + {Vy}²) = {magnitude:.3f}**")
@@ -326,10 +323,10 @@ def show():
                 Vz = 0
 
             V = np.array([Vx, Vy, Vz])
-            magnitude = np.linalg.norm(V)
+            magnitude = vectors.magnitude(V)
 
             if magnitude > 0:
-                unit_vector = V / magnitude
+                unit_vector = vectors.unit_vector(V)
                 st.success(f"**Birim vektör: ({unit_vector[0]:.3f}, {unit_vector[1]:.3f}" +
                           (f", {unit_vector[2]:.3f})" if boyut == "3D" else ")"))
                 st.info(f"Orijinal büyüklük: {magnitude:.3f}")
@@ -341,8 +338,7 @@ def show():
                 Vx = st.number_input("Vx:", value=3.0, format="%.3f")
                 Vy = st.number_input("Vy:", value=4.0, format="%.3f")
 
-                magnitude = np.sqrt(Vx**2 + Vy**2)
-                angle_rad = np.arctan2(Vy, Vx)
+                magnitude, angle_rad = vectors.to_polar(Vx, Vy)
                 angle_deg = np.degrees(angle_rad)
 
                 st.success(f"**Büyüklük:** {magnitude:.3f}")
@@ -388,9 +384,7 @@ def show():
                 Vy = st.number_input("Vy:", value=1.0, format="%.3f")
                 Vz = st.number_input("Vz:", value=1.0, format="%.3f")
 
-                r = np.sqrt(Vx**2 + Vy**2 + Vz**2)
-                theta = np.arccos(Vz / r) if r > 0 else 0  # Polar açı
-                phi = np.arctan2(Vy, Vx)  # Azimuthal açı
+                r, theta, phi = vectors.to_spherical(Vx, Vy, Vz)  # θ: polar, φ: azimuthal açı
 
                 st.success(f"**Büyüklük (r):** {r:.3f}")
                 st.success(f"**Polar açı (θ):** {np.degrees(theta):.2f}° ({theta:.3f} rad)")
@@ -401,9 +395,7 @@ def show():
                 magnitude = st.number_input("Büyüklük:", value=5.0, format="%.3f", min_value=0.0)
                 angle_deg = st.number_input("Açı (derece, x ekseninden):", value=53.13, format="%.2f")
 
-                angle_rad = np.radians(angle_deg)
-                Vx = magnitude * np.cos(angle_rad)
-                Vy = magnitude * np.sin(angle_rad)
+                Vx, Vy = vectors.from_polar(magnitude, np.radians(angle_deg))
 
                 st.success(f"**Vx = {Vx:.3f}**")
                 st.success(f"**Vy = {Vy:.3f}**")
@@ -454,13 +446,110 @@ def show():
                 theta_deg = st.number_input("Polar açı θ (derece, z ekseninden):", value=45.0, format="%.2f")
                 phi_deg = st.number_input("Azimuthal açı φ (derece, x ekseninden):", value=30.0, format="%.2f")
 
-                theta_rad = np.radians(theta_deg)
-                phi_rad = np.radians(phi_deg)
-
-                Vx = r * np.sin(theta_rad) * np.cos(phi_rad)
-                Vy = r * np.sin(theta_rad) * np.sin(phi_rad)
-                Vz = r * np.cos(theta_rad)
+                Vx, Vy, Vz = vectors.from_spherical(r, np.radians(theta_deg), np.radians(phi_deg))
 
                 st.success(f"**Vx = {Vx:.3f}**")
                 st.success(f"**Vy = {Vy:.3f}**")
                 st.success(f"**Vz = {Vz:.3f}**")
+
+    # TAB 3: Toplu Vektör İşlemleri (N×2 / N×3 diziler)
+    with tab3:
+        st.subheader("🧮 Toplu Vektör İşlemleri")
+        st.write("A ve B, her satırı bir vektör olan (N, 2) veya (N, 3) dizilerdir. İşlemler tüm satırlara tek seferde uygulanır.")
+
+        islemler = {
+            "Toplama (A + B)": "add",
+            "Çıkarma (A - B)": "subtract",
+            "Skaler Çarpım (A · B)": "dot",
+            "Vektörel Çarpım (A × B)": "cross",
+            "Büyüklük |A|": "magnitude",
+            "Birim Vektör (A)": "unit",
+            "A ile B Arası Açı": "angle",
+            "Kutupsal Koordinatlar (A, 2D)": "polar",
+            "Küresel Koordinatlar (A, 3D)": "spherical",
+        }
+        islem_adi = st.selectbox("İşlem seçin:", list(islemler), key="toplu_islem")
+        op = islemler[islem_adi]
+
+        kaynak = st.radio("Veri kaynağı:", ["Rastgele üret", "Dosya yükle (CSV / NPY)"], horizontal=True, key="toplu_kaynak")
+
+        A = B = None
+        if kaynak == "Rastgele üret":
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                n_vektor = st.number_input("Vektör sayısı N:", value=100000, min_value=1, max_value=5000000, step=10000)
+            with col2:
+                boyut_toplu = st.radio("Boyut:", [2, 3], index=1, horizontal=True, key="toplu_boyut")
+            with col3:
+                tohum = st.number_input("Tohum (seed):", value=0, min_value=0, step=1)
+
+            rng = np.random.default_rng(int(tohum))
+            A = rng.normal(size=(int(n_vektor), boyut_toplu))
+            B = rng.normal(size=(int(n_vektor), boyut_toplu))
+        else:
+            col1, col2 = st.columns(2)
+            with col1:
+                dosya_a = st.file_uploader("A dizisi:", type=["csv", "npy"], key="toplu_a")
+            with col2:
+                dosya_b = st.file_uploader("B dizisi:", type=["csv", "npy"], key="toplu_b")
+            try:
+                if dosya_a is not None:
+                    A = _read_vectors(dosya_a)
+                if dosya_b is not None:
+                    B = _read_vectors(dosya_b)
+            except ValueError as hata:
+                st.error(f"❌ Dosya okunamadı: {hata}")
+                A = None
+
+        if A is None:
+            st.info("Devam etmek için A dizisini yükleyin.")
+        elif op in vectors.BINARY_OPS and B is None:
+            st.info("Bu işlem için B dizisi de gerekli.")
+        else:
+            try:
+                sonuclar = vectors.batch(op, A, B if op in vectors.BINARY_OPS else None)
+            except ValueError as hata:
+                st.error(f"❌ {hata}")
+            else:
+                st.success(f"**{len(A):,}** vektör işlendi: {islem_adi}")
+
+                ozet = vectors.summarize(sonuclar)
+                st.table({
+                    "Sütun": list(ozet),
+                    "Min": [f"{s.min:.4g}" for s in ozet.values()],
+                    "Maks": [f"{s.max:.4g}" for s in ozet.values()],
+                    "Ortalama": [f"{s.mean:.4g}" for s in ozet.values()],
+                    "Std. sapma": [f"{s.std:.4g}" for s in ozet.values()],
+                    "NaN": [s.nan_count for s in ozet.values()],
+                })
+
+                tablo = np.column_stack(list(sonuclar.values()))
+                col1, col2 = st.columns(2)
+                with col1:
+                    npy = io.BytesIO()
+                    np.save(npy, tablo)
+                    st.download_button("📥 Sonuçları indir (.npy)", npy.getvalue(),
+                                       file_name=f"vektor_{op}.npy", mime="application/octet-stream")
+                with col2:
+                    if st.button("CSV hazırla", key="toplu_csv"):
+                        metin = io.StringIO()
+                        np.savetxt(metin, tablo, delimiter=",", header=",".join(sonuclar), comments="", fmt="%.10g")
+                        st.download_button("📥 Sonuçları indir (.csv)", metin.getvalue(),
+                                           file_name=f"vektor_{op}.csv", mime="text/csv")
+
+
+def _read_vectors(dosya) -> np.ndarray:
+    """Yüklenen CSV (başlıklı veya başlıksız) ya da NPY dosyasını (N, 2/3) diziye çevirir."""
+    if dosya.name.endswith(".npy"):
+        return vectors.as_vectors(np.load(dosya))
+    metin = io.TextIOWrapper(dosya, encoding="utf-8")
+    ilk_satir = metin.readline()
+    metin.seek(0)
+    try:
+        [float(hucre) for hucre in next(csv.reader([ilk_satir]))]
+        baslik = 0
+    except ValueError:
+        baslik = 1
+    dizi = np.loadtxt(metin, delimiter=",", skiprows=baslik, ndmin=2)
+    metin.detach()
+    return vectors.as_vectors(dizi)
@@ -3,6 +3,210 @@ import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from physics import cache, kinematics
+
+# Hava dirençli taramada en fazla yörünge sayısı (nokta başına ~1.5 ms ODE çözümü)
+DIRENCLI_TARAMA_SINIRI = 10_000
+
+
+@cache.cached(maxsize=32)
+def build_projectile_figures(v0, angle, h0, g):
+    """Eğik atış yörüngesi ve hız bileşenleri grafikleri (parametre başına önbellekli)."""
+    _, _, _, max_height, x_max, _, range_x = kinematics.projectile(v0, angle, h0, g)
+
+    # Yörünge simülasyonu
+    t_array, x_array, y_array, vx_array, vy_array = kinematics.projectile_series(v0, angle, h0, g)
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=x_array, y=y_array,
+        mode='lines',
+        name='Yörünge',
+        line=dict(color='blue', width=3)
+    ))
+
+    # Başlangıç ve bitiş noktaları
+    fig.add_trace(go.Scatter(
+        x=[0], y=[h0],
+        mode='markers',
+        name='Başlangıç',
+        marker=dict(color='green', size=12, symbol='circle')
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=[range_x], y=[0],
+        mode='markers',
+        name='İniş',
+        marker=dict(color='red', size=12, symbol='x')
+    ))
+
+    # Maksimum yükseklik noktası
+    fig.add_trace(go.Scatter(
+        x=[x_max], y=[max_height],
+        mode='markers',
+        name='Maks. Yükseklik',
+        marker=dict(color='orange', size=12, symbol='star')
+    ))
+
+    fig.update_layout(
+        title=f"Eğik Atış Yörüngesi (v₀={v0} m/s, θ={angle}°)",
+        xaxis_title="Yatay Mesafe (m)",
+        yaxis_title="Yükseklik (m)",
+        showlegend=True,
+        width=800,
+        height=500,
+        xaxis=dict(range=[0, range_x*1.1]),
+        yaxis=dict(range=[0, max_height*1.2])
+    )
+
+    # Hız bileşenleri grafikleri
+    fig2 = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=("Yatay Hız (sabit)", "Düşey Hız")
+    )
+
+    fig2.add_trace(go.Scatter(x=t_array, y=vx_array, mode='lines', name='vₓ',
+                             line=dict(color='blue', width=3)), row=1, col=1)
+    fig2.add_trace(go.Scatter(x=t_array, y=vy_array, mode='lines', name='vᵧ',
+                             line=dict(color='red', width=3)), row=1, col=2)
+
+    fig2.update_xaxes(title_text="Zaman (s)", row=1, col=1)
+    fig2.update_xaxes(title_text="Zaman (s)", row=1, col=2)
+    fig2.update_yaxes(title_text="Hız (m/s)", row=1, col=1)
+    fig2.update_yaxes(title_text="Hız (m/s)", row=1, col=2)
+
+    fig2.update_layout(height=400, showlegend=True)
+    return fig, fig2
+
+
+@cache.cached(maxsize=16)
+def build_sweep_figure(grid, metric, label, h_index):
+    """Açı × v₀ kontur haritası; her v₀ için en iyi açı eğrisi ve kesitteki optimum (önbellekli)."""
+    values = getattr(grid, metric)[:, :, h_index]
+    best_angle, _ = grid.best_angle(metric)
+    i, j = np.unravel_index(np.nanargmax(values), values.shape)
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Contour(
+        x=grid.v0, y=grid.angle_deg, z=values,
+        colorscale='Viridis',
+        colorbar=dict(title=label),
+        contours=dict(showlabels=True),
+        name=label
+    ))
+
+    # Her v₀ için en iyi açı
+    fig.add_trace(go.Scatter(
+        x=grid.v0, y=best_angle[:, h_index],
+        mode='lines',
+        name='En iyi açı',
+        line=dict(color='white', width=2, dash='dash')
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=[grid.v0[j]], y=[grid.angle_deg[i]],
+        mode='markers',
+        name=f'Optimum ({values[i, j]:.2f})',
+        marker=dict(color='red', size=14, symbol='star')
+    ))
+
+    fig.update_layout(
+        title=f"{label} (h₀ = {grid.h0[h_index]:.2f} m)",
+        xaxis_title="İlk hız v₀ (m/s)",
+        yaxis_title="Atış açısı θ (derece)",
+        height=550,
+        legend=dict(orientation='h', y=-0.15)
+    )
+    return fig
+
+
+@cache.cached(maxsize=32)
+def build_target_figure(v0, h0, g, target_x, target_y, low_deg, high_deg, drag=None):
+    """Hedefi vuran alçak ve yüksek atış yörüngeleri (önbellekli)."""
+    fig = go.Figure()
+
+    for angle, name, color in ((low_deg, 'Alçak atış', 'blue'), (high_deg, 'Yüksek atış', 'orange')):
+        if drag is None:
+            _, x_array, y_array, _, _ = kinematics.projectile_series(v0, angle, h0, g)
+        else:
+            from physics import ballistics
+
+            _, x_array, y_array, _, _ = ballistics.solve_trajectory(v0, angle, h0, g, *drag).sample()
+        fig.add_trace(go.Scatter(
+            x=x_array, y=y_array,
+            mode='lines',
+            name=f'{name} (θ={angle:.2f}°)',
+            line=dict(color=color, width=3)
+        ))
+
+    fig.add_trace(go.Scatter(
+        x=[target_x], y=[target_y],
+        mode='markers',
+        name='Hedef',
+        marker=dict(color='red', size=16, symbol='circle-x')
+    ))
+
+    fig.update_layout(
+        title="Hedefi Vuran Yörüngeler",
+        xaxis_title="Yatay Mesafe (m)",
+        yaxis_title="Yükseklik (m)",
+        showlegend=True,
+        height=500
+    )
+    return fig
+
+
+@cache.cached(maxsize=32)
+def build_drag_figure(v0, angle, h0, g, k, wind, variable_g):
+    """Hava dirençli yörünge ile boşluktaki yörüngenin karşılaştırması (önbellekli)."""
+    from physics import ballistics
+
+    traj = ballistics.solve_trajectory(v0, angle, h0, g, k, wind, variable_g)
+    _, x_drag, y_drag, _, _ = traj.sample()
+    fig = go.Figure()
+
+    if np.isfinite(kinematics.projectile(v0, angle, h0, g).t_flight):
+        _, x_vac, y_vac, _, _ = kinematics.projectile_series(v0, angle, h0, g)
+        fig.add_trace(go.Scatter(
+            x=x_vac, y=y_vac,
+            mode='lines',
+            name='Boşlukta',
+            line=dict(color='gray', width=2, dash='dash')
+        ))
+
+    fig.add_trace(go.Scatter(
+        x=x_drag, y=y_drag,
+        mode='lines',
+        name='Hava dirençli',
+        line=dict(color='blue', width=3)
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=[traj.x_apex], y=[traj.max_height],
+        mode='markers',
+        name='Tepe noktası',
+        marker=dict(color='orange', size=12, symbol='star')
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=[traj.range_x], y=[0],
+        mode='markers',
+        name='İniş',
+        marker=dict(color='red', size=12, symbol='x')
+    ))
+
+    fig.update_layout(
+        title="Hava Dirençli ve Boşluktaki Yörünge",
+        xaxis_title="Yatay Mesafe (m)",
+        yaxis_title="Yükseklik (m)",
+        showlegend=True,
+        height=500
+    )
+    return fig
+
+
 def show():
     st.markdown('<h2 class="module-header">🏃 Modül 2: Kinematik (Hareketin Tanımı)</h2>', unsafe_allow_html=True)
 
@@ -28,12 +232,12 @@ def show():
             with col2:
                 t = st.number_input("Zaman t (s):", value=5.0, format="%.2f", min_value=0.0)
 
-            x = x0 + v * t
+            x = kinematics.uniform_velocity_position(x0, v, t)
             st.success(f"**Konum:** x = {x:.2f} m")
 
             # Grafik
             t_array = np.linspace(0, t*1.5, 100)
-            x_array = x0 + v * t_array
+            x_array = kinematics.uniform_velocity_position(x0, v, t_array)
 
             fig = go.Figure()
             fig.add_trace(go.Scatter(x=t_array, y=x_array, mode='lines', name='Konum-Zaman',
@@ -66,16 +270,16 @@ def show():
                 t = st.number_input("Zaman t (s):", value=10.0, format="%.2f", min_value=0.0)
 
             # Hesaplamalar
-            v = v0 + a * t
-            x = x0 + v0 * t + 0.5 * a * t**2
+            v = kinematics.uniform_acceleration_velocity(v0, a, t)
+            x = kinematics.uniform_acceleration_position(x0, v0, a, t)
 
             st.success(f"**Son hız:** v = {v:.2f} m/s")
             st.success(f"**Son konum:** x = {x:.2f} m")
 
             # Grafikler
             t_array = np.linspace(0, t, 100)
-            x_array = x0 + v0 * t_array + 0.5 * a * t_array**2
-            v_array = v0 + a * t_array
+            x_array = kinematics.uniform_acceleration_position(x0, v0, a, t_array)
+            v_array = kinematics.uniform_acceleration_velocity(v0, a, t_array)
 
             fig = make_subplots(
                 rows=2, cols=1,
@@ -106,20 +310,15 @@ def show():
                 g = st.number_input("Yerçekimi ivmesi g (m/s²):", value=9.81, format="%.2f")
 
             # Yere çarpma zamanı (h = h0 + v0*t - 0.5*g*t^2 = 0)
-            # -0.5*g*t^2 + v0*t + h0 = 0
-            # Çözüm: t = (-v0 ± sqrt(v0^2 + 2*g*h0)) / (-g)
-            discriminant = v0**2 + 2 * g * h0
-            if discriminant >= 0:
-                t_hit = (-v0 + np.sqrt(discriminant)) / g
-                v_hit = v0 - g * t_hit
-
+            t_hit, v_hit = kinematics.free_fall_impact(h0, v0, g)
+            if np.isfinite(t_hit):
                 st.success(f"**Yere çarpma zamanı:** t = {t_hit:.2f} s")
                 st.success(f"**Yere çarpma hızı:** v = {abs(v_hit):.2f} m/s (aşağı)")
 
                 # Simülasyon
                 t_array = np.linspace(0, t_hit, 100)
-                h_array = h0 + v0 * t_array - 0.5 * g * t_array**2
-                v_array = v0 - g * t_array
+                h_array = kinematics.free_fall_height(h0, v0, g, t_array)
+                v_array = kinematics.uniform_acceleration_velocity(v0, -g, t_array)
 
                 fig = make_subplots(
                     rows=1, cols=2,
@@ -147,7 +346,7 @@ def show():
 
         atis_tipi = st.radio(
             "Atış tipi:",
-            ["Eğik Atış", "Yatay Atış", "Nehir Problemi"],
+            ["Eğik Atış", "Yatay Atış", "Nehir Problemi", "Parametre Taraması"],
             horizontal=True
         )
 
@@ -162,100 +361,78 @@ def show():
             with col2:
                 g = st.number_input("Yerçekimi ivmesi g (m/s²):", value=9.81, format="%.2f", key="egik_g")
 
-            # Bileşenler
-            angle_rad = np.radians(angle)
-            v0x = v0 * np.cos(angle_rad)
-            v0y = v0 * np.sin(angle_rad)
-
-            # Maksimum yükseklik zamanı
-            t_max_height = v0y / g
-            max_height = h0 + (v0y**2) / (2 * g)
-
-            # Toplam uçuş süresi (y = h0 + v0y*t - 0.5*g*t^2 = 0)
-            discriminant = v0y**2 + 2 * g * h0
-            if discriminant >= 0:
-                t_flight = (v0y + np.sqrt(discriminant)) / g
-                range_x = v0x * t_flight
+            # Bileşenler, maksimum yükseklik ve toplam uçuş süresi
+            v0x, v0y, t_max_height, max_height, x_max, t_flight, range_x = kinematics.projectile(v0, angle, h0, g)
 
+            if np.isfinite(t_flight):
                 st.success(f"**Maksimum yükseklik:** {max_height:.2f} m (t = {t_max_height:.2f} s)")
                 st.success(f"**Toplam uçuş süresi:** {t_flight:.2f} s")
                 st.success(f"**Menzil:** {range_x:.2f} m")
 
-                # Yörünge simülasyonu
-                t_array = np.linspace(0, t_flight, 200)
-                x_array = v0x * t_array
-                y_array = h0 + v0y * t_array - 0.5 * g * t_array**2
-
-                fig = go.Figure()
-
-                fig.add_trace(go.Scatter(
-                    x=x_array, y=y_array,
-                    mode='lines',
-                    name='Yörünge',
-                    line=dict(color='blue', width=3)
-                ))
-
-                # Başlangıç ve bitiş noktaları
-                fig.add_trace(go.Scatter(
-                    x=[0], y=[h0],
-                    mode='markers',
-                    name='Başlangıç',
-                    marker=dict(color='green', size=12, symbol='circle')
-                ))
-
-                fig.add_trace(go.Scatter(
-                    x=[range_x], y=[0],
-                    mode='markers',
-                    name='İniş',
-                    marker=dict(color='red', size=12, symbol='x')
-                ))
-
-                # Maksimum yükseklik noktası
-                x_max = v0x * t_max_height
-                fig.add_trace(go.Scatter(
-                    x=[x_max], y=[max_height],
-                    mode='markers',
-                    name='Maks. Yükseklik',
-                    marker=dict(color='orange', size=12, symbol='star')
-                ))
-
-                fig.update_layout(
-                    title=f"Eğik Atış Yörüngesi (v₀={v0} m/s, θ={angle}°)",
-                    xaxis_title="Yatay Mesafe (m)",
-                    yaxis_title="Yükseklik (m)",
-                    showlegend=True,
-                    width=800,
-                    height=500,
-                    xaxis=dict(range=[0, range_x*1.1]),
-                    yaxis=dict(range=[0, max_height*1.2])
-                )
-
+                fig, fig2 = build_projectile_figures(v0, angle, h0, g)
                 st.plotly_chart(fig)
+                st.plotly_chart(fig2)
 
-                # Hız bileşenleri grafikleri
-                vx_array = np.full_like(t_array, v0x)
-                vy_array = v0y - g * t_array
-
-                fig2 = make_subplots(
-                    rows=1, cols=2,
-                    subplot_titles=("Yatay Hız (sabit)", "Düşey Hız")
-                )
-
-                fig2.add_trace(go.Scatter(x=t_array, y=vx_array, mode='lines', name='vₓ',
-                                         line=dict(color='blue', width=3)), row=1, col=1)
-                fig2.add_trace(go.Scatter(x=t_array, y=vy_array, mode='lines', name='vᵧ',
-                                         line=dict(color='red', width=3)), row=1, col=2)
+            else:
+                st.error("Geçersiz parametreler!")
 
-                fig2.update_xaxes(title_text="Zaman (s)", row=1, col=1)
-                fig2.update_xaxes(title_text="Zaman (s)", row=1, col=2)
-                fig2.update_yaxes(title_text="Hız (m/s)", row=1, col=1)
-                fig2.update_yaxes(title_text="Hız (m/s)", row=1, col=2)
+            # Hava direnci, rüzgâr ve yüksekliğe bağlı g
+            st.write("**Hava Direnci ile Atış:**")
+            surtunme = None
+            if st.checkbox("Hava direnci (karesel sürüklenme) hesaba katılsın", key="egik_drag"):
+                # scipy yalnızca bu seçenek açıldığında yüklenir
+                from physics import ballistics
+
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    kutle = st.number_input("Kütle m (kg):", value=0.145, format="%.3f", min_value=0.001, key="egik_m")
+                    cap = st.number_input("Çap d (m):", value=0.074, format="%.3f", min_value=0.001, key="egik_d")
+                with col2:
+                    Cd = st.number_input("Sürüklenme katsayısı C_d:", value=0.47, format="%.2f", min_value=0.0, key="egik_cd")
+                    rho = st.number_input("Hava yoğunluğu ρ (kg/m³):", value=ballistics.AIR_DENSITY, format="%.3f",
+                                          min_value=0.0, key="egik_rho")
+                with col3:
+                    ruzgar = st.number_input("Rüzgâr hızı w (m/s, +x yönünde):", value=0.0, format="%.2f", key="egik_w")
+                    degisken_g = st.checkbox("Yüksekliğe bağlı g(y)", key="egik_gy")
+
+                k = ballistics.drag_constant(kutle, Cd, np.pi * cap**2 / 4, rho)
+                surtunme = (k, ruzgar, degisken_g)
+                traj = ballistics.solve_trajectory(v0, angle, h0, g, k, ruzgar, degisken_g)
+
+                if np.isfinite(traj.t_flight):
+                    st.latex(r"\vec a = -k\,|\vec v_r|\,\vec v_r - g\,\hat y,\quad k = \frac{\rho C_d A}{2m}")
+                    col1, col2, col3 = st.columns(3)
+                    col1.metric("Menzil", f"{traj.range_x:.2f} m",
+                                f"{traj.range_x - range_x:+.2f} m" if np.isfinite(range_x) else None)
+                    col2.metric("Maksimum yükseklik", f"{traj.max_height:.2f} m",
+                                f"{traj.max_height - max_height:+.2f} m")
+                    col3.metric("Uçuş süresi", f"{traj.t_flight:.2f} s")
+                    st.info(f"**Çarpma hızı:** {traj.impact_speed:.2f} m/s, **çarpma açısı:** {traj.impact_angle_deg:.1f}° "
+                            f"(k = {k:.2e} 1/m)")
+                    st.plotly_chart(build_drag_figure(v0, angle, h0, g, k, ruzgar, degisken_g))
+                else:
+                    st.error("Cisim yere ulaşmıyor; parametreleri kontrol edin.")
+
+            # Hedef vurma: v₀ sabitken hedefe giden alçak ve yüksek atış açıları
+            st.write("**🎯 Hedef Vurma:**")
+            col1, col2 = st.columns(2)
+            with col1:
+                hedef_x = st.number_input("Hedef x (m):", value=60.0, format="%.2f", min_value=0.01, key="hedef_x")
+            with col2:
+                hedef_y = st.number_input("Hedef y (m):", value=0.0, format="%.2f", min_value=0.0, key="hedef_y")
 
-                fig2.update_layout(height=400, showlegend=True)
-                st.plotly_chart(fig2)
+            if surtunme is None:
+                cozum = kinematics.launch_angles(v0, hedef_x, hedef_y, h0, g)
+            else:
+                cozum = ballistics.launch_angles(v0, hedef_x, hedef_y, h0, g, *surtunme)
 
+            if np.isnan(cozum.low_deg):
+                st.error(f"Hedef v₀ = {v0} m/s ile vurulamaz; hızı artırın veya hedefi yaklaştırın.")
             else:
-                st.error("Geçersiz parametreler!")
+                col1, col2 = st.columns(2)
+                col1.success(f"**Alçak atış:** θ = {cozum.low_deg:.2f}°")
+                col2.success(f"**Yüksek atış:** θ = {cozum.high_deg:.2f}°")
+                st.plotly_chart(build_target_figure(v0, h0, g, hedef_x, hedef_y, cozum.low_deg, cozum.high_deg, surtunme))
 
         elif atis_tipi == "Yatay Atış":
             st.write("**Yatay Atış:** Cisim yatay olarak atılır (θ = 0°)")
@@ -268,9 +445,7 @@ def show():
                 g = st.number_input("Yerçekimi ivmesi g (m/s²):", value=9.81, format="%.2f", key="yatay_g")
 
             # Düşme süresi
-            t_flight = np.sqrt(2 * h0 / g)
-            range_x = v0 * t_flight
-            v_final = np.sqrt(v0**2 + (g * t_flight)**2)
+            t_flight, range_x, v_final = kinematics.horizontal_projectile(v0, h0, g)
 
             st.success(f"**Uçuş süresi:** {t_flight:.2f} s")
             st.success(f"**Menzil:** {range_x:.2f} m")
@@ -278,8 +453,7 @@ def show():
 
             # Simülasyon
             t_array = np.linspace(0, t_flight, 100)
-            x_array = v0 * t_array
-            y_array = h0 - 0.5 * g * t_array**2
+            x_array, y_array = kinematics.projectile_path(v0, 0.0, h0, g, t_array)
 
             fig = go.Figure()
 
@@ -326,21 +500,12 @@ def show():
                 river_width = st.number_input("Nehir genişliği (m):", value=100.0, format="%.2f", min_value=1.0)
                 angle = st.number_input("Yüzme açısı (derece, akıntıya göre):", value=90.0, format="%.2f")
 
-            angle_rad = np.radians(angle)
-
-            # Hız bileşenleri
-            v_swim_x = v_swimmer * np.cos(angle_rad)  # Akıntı yönü
-            v_swim_y = v_swimmer * np.sin(angle_rad)  # Karşıya
-
-            # Net hız
-            v_net_x = v_swim_x + v_river
-            v_net_y = v_swim_y
+            # Hız bileşenleri, net hız ve karşıya geçme süresi
+            v_swim_x, v_swim_y, v_net_x, v_net, t_cross, drift = kinematics.river_crossing(
+                v_swimmer, v_river, river_width, angle
+            )
 
-            # Karşıya geçme süresi
             if v_swim_y > 0:
-                t_cross = river_width / v_swim_y
-                drift = v_net_x * t_cross
-                v_net = np.sqrt(v_net_x**2 + v_net_y**2)
 
                 st.success(f"**Karşıya geçme süresi:** {t_cross:.2f} s")
                 st.success(f"**Akıntıda sürüklenme:** {drift:.2f} m")
@@ -419,6 +584,81 @@ def show():
             else:
                 st.error("Yüzücü karşıya geçemiyor! Açıyı değiştirin.")
 
+        elif atis_tipi == "Parametre Taraması":
+            st.write("**Parametre Taraması:** Menzil, maksimum yükseklik ve uçuş süresi tüm açı × v₀ × h₀ "
+                     "ızgarasında tek seferde hesaplanır; en iyi açı işaretlenir.")
+
+            direncli = st.checkbox("Hava direnci (noktalar çekirdeklere dağıtılarak çözülür)", key="tarama_drag")
+            # Dirençli ızgara her nokta için bir ODE çözer: daha küçük varsayılanlar ve sınırlar
+            ek = "_drag" if direncli else ""
+            n_sinir, n_h_sinir = (100, 10) if direncli else (400, 50)
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                aci_min, aci_max = st.slider("Açı aralığı θ (derece):", 1.0, 89.0, (5.0, 85.0), key="tarama_aci")
+                n_aci = st.number_input("Açı sayısı:", value=20 if direncli else 100, min_value=2,
+                                        max_value=n_sinir, key="tarama_na" + ek)
+            with col2:
+                v_min, v_max = st.slider("İlk hız aralığı v₀ (m/s):", 1.0, 200.0, (5.0, 50.0), key="tarama_v")
+                n_v = st.number_input("Hız sayısı:", value=20 if direncli else 100, min_value=2,
+                                      max_value=n_sinir, key="tarama_nv" + ek)
+            with col3:
+                h_min, h_max = st.slider("İlk yükseklik aralığı h₀ (m):", 0.0, 200.0, (0.0, 20.0), key="tarama_h")
+                n_h = st.number_input("Yükseklik sayısı:", value=1 if direncli else 5, min_value=1,
+                                      max_value=n_h_sinir, key="tarama_nh" + ek)
+
+            g = st.number_input("Yerçekimi ivmesi g (m/s²):", value=9.81, format="%.2f", min_value=0.01, key="tarama_g")
+            metrikler = {"Menzil (m)": "range_x", "Maksimum yükseklik (m)": "max_height", "Uçuş süresi (s)": "t_flight"}
+            metrik_adi = st.radio("Gösterilecek büyüklük:", list(metrikler), horizontal=True, key="tarama_metrik")
+            metrik = metrikler[metrik_adi]
+
+            acilar = np.linspace(aci_min, aci_max, int(n_aci))
+            hizlar = np.linspace(v_min, v_max, int(n_v))
+            yukseklikler = np.linspace(h_min, h_max, int(n_h))
+
+            if direncli:
+                from physics import ballistics
+
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    kutle = st.number_input("Kütle m (kg):", value=0.145, format="%.3f", min_value=0.001, key="tarama_m")
+                with col2:
+                    cap = st.number_input("Çap d (m):", value=0.074, format="%.3f", min_value=0.001, key="tarama_d")
+                with col3:
+                    Cd = st.number_input("Sürüklenme katsayısı C_d:", value=0.47, format="%.2f", min_value=0.0, key="tarama_cd")
+                k = ballistics.drag_constant(kutle, Cd, np.pi * cap**2 / 4)
+
+                izgara = None
+                n_nokta = acilar.size * hizlar.size * yukseklikler.size
+                if n_nokta > DIRENCLI_TARAMA_SINIRI:
+                    st.warning(f"Izgara {n_nokta:,} nokta; hava dirençli taramada en fazla "
+                               f"{DIRENCLI_TARAMA_SINIRI:,} yörünge çözülür. Nokta sayılarını azaltın.")
+                else:
+                    # Çözüm yalnızca düğmeyle başlar; sonuç parametreleriyle birlikte oturumda tutulur
+                    anahtar = (aci_min, aci_max, int(n_aci), v_min, v_max, int(n_v), h_min, h_max, int(n_h), g, k)
+                    cozulen = st.session_state.get("tarama_drag_izgara")
+                    if st.button(f"▶ {n_nokta:,} yörüngeyi çöz", key="tarama_coz"):
+                        with st.spinner(f"{n_nokta:,} yörünge çözülüyor..."):
+                            cozulen = (anahtar, ballistics.trajectory_grid(acilar, hizlar, yukseklikler, g, k))
+                        st.session_state["tarama_drag_izgara"] = cozulen
+                    if cozulen is not None and cozulen[0] == anahtar:
+                        izgara = cozulen[1]
+                    else:
+                        st.info("Taramayı başlatmak için düğmeye basın (parametre değişince yeniden çözülmesi gerekir).")
+            else:
+                izgara = kinematics.projectile_grid(acilar, hizlar, yukseklikler, g)
+
+            if izgara is not None:
+                h_index = 0
+                if len(yukseklikler) > 1:
+                    h_secim = st.select_slider("Gösterilen h₀ (m):", options=[f"{h:.2f}" for h in yukseklikler], key="tarama_hsec")
+                    h_index = [f"{h:.2f}" for h in yukseklikler].index(h_secim)
+
+                en_aci, en_v, en_h, en_deger = izgara.optimum(metrik)
+                st.success(f"**Izgaradaki en iyi nokta:** θ = {en_aci:.2f}°, v₀ = {en_v:.2f} m/s, h₀ = {en_h:.2f} m "
+                           f"→ {metrik_adi} = {en_deger:.2f}")
+
+                st.plotly_chart(build_sweep_figure(izgara, metrik, metrik_adi, h_index))
+
     # TAB 3: Dairesel Hareket
     with tab3:
         st.subheader("⭕ Düzgün Dairesel Hareket")
@@ -446,22 +686,20 @@ def show():
 
                 if bilinen == "Periyot (T)":
                     T = st.number_input("Periyot T (s):", value=2.0, format="%.3f", min_value=0.001)
-                    f = 1 / T
-                    omega = 2 * np.pi / T
                 elif bilinen == "Frekans (f)":
                     f = st.number_input("Frekans f (Hz):", value=0.5, format="%.3f", min_value=0.001)
-                    T = 1 / f
-                    omega = 2 * np.pi * f
                 else:  # Açısal hız
                     omega = st.number_input("Açısal hız ω (rad/s):", value=3.14, format="%.3f", min_value=0.001)
-                    T = 2 * np.pi / omega
-                    f = omega / (2 * np.pi)
 
             with col2:
                 r = st.number_input("Yarıçap r (m):", value=5.0, format="%.2f", min_value=0.01)
 
-            v = omega * r
-            ac = omega**2 * r
+            if bilinen == "Periyot (T)":
+                T, f, omega, v, ac = kinematics.circular_from_period(T, r)
+            elif bilinen == "Frekans (f)":
+                T, f, omega, v, ac = kinematics.circular_from_frequency(f, r)
+            else:
+                T, f, omega, v, ac = kinematics.circular_from_angular_velocity(omega, r)
 
             st.success(f"**Periyot (T):** {T:.3f} s")
             st.success(f"**Frekans (f):** {f:.3f} Hz")
@@ -565,8 +803,7 @@ def show():
             with col2:
                 r = st.number_input("Yarıçap r (m):", value=5.0, format="%.2f", min_value=0.01, key="fc_r")
 
-            ac = v**2 / r
-            Fc = m * ac
+            ac, Fc = kinematics.centripetal(m, v, r)
 
             st.success(f"**Merkezcil ivme:** aᶜ = {ac:.3f} m/s²")
             st.success(f"**Merkezcil kuvvet:** Fᶜ = {Fc:.3f} N")
@@ -3,6 +3,26 @@ import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from physics import dynamics, kernels
+
+
+def build_incline_events_figure(run):
+    """Olay güdümlü eğik düzlem benzetiminin s(t), v(t) ve sürtünme grafikleri; geçişler dikey çizgilerle."""
+    fig3 = make_subplots(rows=3, cols=1, shared_xaxes=True, vertical_spacing=0.06,
+                         subplot_titles=("Konum s(t)", "Hız v(t)", "Sürtünme kuvveti"))
+    fig3.add_trace(go.Scatter(x=run.t, y=run.s, name='s(t)', line=dict(color='green')), row=1, col=1)
+    fig3.add_trace(go.Scatter(x=run.t, y=run.v, name='v(t)', line=dict(color='blue')), row=2, col=1)
+    fig3.add_trace(go.Scatter(x=run.t, y=run.friction, name='f(t)', line=dict(color='orange')), row=3, col=1)
+    for olay in run.events:
+        fig3.add_vline(x=olay.t, line=dict(color='gray', dash='dot', width=1))
+    fig3.update_xaxes(title_text="Zaman (s)", row=3, col=1)
+    fig3.update_yaxes(title_text="m", row=1, col=1)
+    fig3.update_yaxes(title_text="m/s", row=2, col=1)
+    fig3.update_yaxes(title_text="N", row=3, col=1)
+    fig3.update_layout(height=650, showlegend=False)
+    return fig3
+
+
 def show():
     st.markdown('<h2 class="module-header">💪 Modül 3: Dinamik (Hareketin Nedenleri)</h2>', unsafe_allow_html=True)
 
@@ -28,7 +48,7 @@ def show():
             with col2:
                 a = st.number_input("İvme a (m/s²):", value=2.0, format="%.2f")
 
-            F = m * a
+            F = dynamics.net_force(m, a)
             st.success(f"**Net Kuvvet:** F = {F:.2f} N")
 
         elif hesaplama == "Kütle":
@@ -38,7 +58,7 @@ def show():
             with col2:
                 a = st.number_input("İvme a (m/s²):", value=2.0, format="%.2f", min_value=0.01)
 
-            m = F / a
+            m = dynamics.mass(F, a)
             st.success(f"**Kütle:** m = {m:.2f} kg")
 
         else:  # İvme
@@ -48,7 +68,7 @@ def show():
             with col2:
                 m = st.number_input("Kütle m (kg):", value=10.0, format="%.2f", min_value=0.01)
 
-            a = F / m
+            a = dynamics.acceleration(F, m)
             st.success(f"**İvme:** a = {a:.2f} m/s²")
 
         st.markdown("---")
@@ -87,21 +107,18 @@ def show():
                 mu_k = st.number_input("Kinetik sürtünme katsayısı μₖ:", value=0.3, format="%.3f", min_value=0.0)
                 F_applied = st.number_input("Uygulanan kuvvet F (N):", value=30.0, format="%.2f", min_value=0.0)
 
-            N = m * g  # Normal kuvvet
-            f_s_max = mu_s * N  # Maksimum statik sürtünme
-            f_k = mu_k * N  # Kinetik sürtünme
+            N, f_s_max, f_k, moving, friction_now, a = dynamics.horizontal_friction(m, g, mu_s, mu_k, F_applied)
 
             st.success(f"**Normal kuvvet:** N = {N:.2f} N")
             st.success(f"**Maksimum statik sürtünme:** fₛ(max) = {f_s_max:.2f} N")
             st.success(f"**Kinetik sürtünme:** fₖ = {f_k:.2f} N")
 
             # Hareket analizi
-            if F_applied <= f_s_max:
+            if not moving:
                 st.info(f"✋ **Cisim hareketsiz!** Uygulanan kuvvet ({F_applied:.2f} N) maksimum statik sürtünmeden ({f_s_max:.2f} N) küçük.")
                 st.info(f"Statik sürtünme kuvveti: fₛ = {F_applied:.2f} N (Uygulanan kuvvete eşit)")
             else:
                 F_net = F_applied - f_k
-                a = F_net / m
                 st.success(f"🏃 **Cisim hareket ediyor!**")
                 st.success(f"Net kuvvet: Fₙₑₜ = {F_net:.2f} N")
                 st.success(f"İvme: a = {a:.2f} m/s²")
@@ -110,17 +127,7 @@ def show():
             fig = go.Figure()
 
             # Kuvvet-hareket grafiği
-            F_range = np.linspace(0, f_s_max * 2, 100)
-            friction_force = []
-            acceleration = []
-
-            for F in F_range:
-                if F <= f_s_max:
-                    friction_force.append(F)
-                    acceleration.append(0)
-                else:
-                    friction_force.append(f_k)
-                    acceleration.append((F - f_k) / m)
+            F_range, friction_force, acceleration = kernels.friction_response(m, g, mu_s, mu_k, f_s_max * 2)
 
             fig = make_subplots(
                 rows=1, cols=2,
@@ -135,7 +142,7 @@ def show():
             ), row=1, col=1)
 
             fig.add_trace(go.Scatter(
-                x=[F_applied], y=[f_k if F_applied > f_s_max else F_applied],
+                x=[F_applied], y=[friction_now],
                 mode='markers',
                 name='Mevcut durum',
                 marker=dict(color='blue', size=12)
@@ -149,7 +156,7 @@ def show():
             ), row=1, col=2)
 
             fig.add_trace(go.Scatter(
-                x=[F_applied], y=[(F_applied - f_k) / m if F_applied > f_s_max else 0],
+                x=[F_applied], y=[a],
                 mode='markers',
                 name='Mevcut durum',
                 marker=dict(color='blue', size=12)
@@ -185,19 +192,8 @@ def show():
 
         theta_rad = np.radians(theta)
 
-        # Kuvvet analizi
-        W = m * g  # Ağırlık
-        N = W * np.cos(theta_rad)  # Normal kuvvet
-        W_parallel = W * np.sin(theta_rad)  # Paralel bileşen (aşağı)
-        f = mu * N  # Sürtünme kuvveti
-
-        # Net kuvvet (yukarı + pozitif)
-        if v0 >= 0:  # Yukarı hareket veya durgun
-            F_net = -W_parallel - f  # Sürtünme aşağı
-        else:  # Aşağı hareket
-            F_net = -W_parallel + f  # Sürtünme yukarı
-
-        a = F_net / m
+        # Kuvvet analizi (yukarı + pozitif, sürtünme hareket yönünün tersine)
+        W, N, W_parallel, f, F_net, a = dynamics.incline_forces(m, theta, g, mu, v0)
 
         st.success(f"**Ağırlık:** W = {W:.2f} N")
         st.success(f"**Normal kuvvet:** N = {N:.2f} N")
@@ -347,6 +343,44 @@ def show():
             fig2.update_layout(height=400, showlegend=True)
             st.plotly_chart(fig2)
 
+        # Zamanla değişen kuvvet/eğim ve statik-kinetik sürtünme geçişleri
+        st.write("**Zamanla Değişen Kuvvet ve Eğim:**")
+        if st.checkbox("F(t), θ(t) ve durma/kayma geçişleriyle simüle et (olay güdümlü çözücü)", key="incline_events"):
+            # scipy yalnızca bu seçenek açıldığında yüklenir
+            from physics import incline
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                mu_s = st.number_input("Statik sürtünme katsayısı μₛ:", value=max(mu, 0.3), format="%.3f",
+                                       min_value=mu, key="incline_mus")
+                t_sim = st.slider("Simülasyon süresi (s):", min_value=1.0, max_value=30.0, value=10.0, step=0.5,
+                                  key="incline_tsim")
+            with col2:
+                kuvvet_turu = st.selectbox("Kuvvet profili F(t) (yukarı +):", incline.PROFILE_KINDS, index=2,
+                                           key="incline_fkind")
+                F_a = st.number_input("F: a (N)", value=0.0, format="%.2f", key="incline_fa")
+                F_b = st.number_input("F: b (N)", value=30.0, format="%.2f", key="incline_fb")
+                F_T = st.number_input("F: T (s)", value=4.0, format="%.2f", min_value=0.01, key="incline_ft")
+            with col3:
+                aci_turu = st.selectbox("Eğim profili θ(t):", ["sabit", "rampa"], key="incline_akind")
+                theta_son = st.number_input("Son eğim θ₂ (derece):", value=60.0, format="%.2f", min_value=0.0,
+                                            max_value=90.0, key="incline_theta2")
+                theta_T = st.number_input("Eğim rampa süresi (s):", value=t_sim, format="%.2f", min_value=0.01,
+                                          key="incline_thetat")
+            st.caption("sabit: a · rampa: a → b ([0, T]) · sinüs: a + b·sin(2πt/T) · basamak: t < T iken a, sonra b")
+
+            kuvvet = incline.Profile(kuvvet_turu, F_a, F_b, F_T)
+            egim = incline.Profile(aci_turu, theta, theta_son, theta_T)
+            run = incline.simulate_incline(m, mu_s, mu, kuvvet, egim, v0, t_sim, g,
+                                           max_step=F_T / 20 if kuvvet_turu == "sinüs" else np.inf)
+
+            for olay in run.events[:10]:
+                st.info(f"t = {olay.t:.4f} s, s = {olay.s:.3f} m: cisim **{olay.kind}**")
+            if len(run.events) > 10:
+                st.info(f"... toplam {len(run.events)} geçiş")
+
+            st.plotly_chart(build_incline_events_figure(run))
+
     # TAB 4: Makara Sistemleri
     with tab4:
         st.subheader("🔗 Makara Sistemleri (Atwood Düzeneği)")
@@ -366,10 +400,8 @@ def show():
         # m1 > m2 olduğunu varsayalım (m1 aşağı, m2 yukarı)
 
         # Net kuvvet: (m1 - m2)*g = (m1 + m2)*a
-        a = ((m1 - m2) / (m1 + m2)) * g
-
         # İp gerilmesi: T = m2*(g + a) veya T = m1*(g - a)
-        T = m2 * (g + a)
+        a, T = dynamics.atwood(m1, m2, g)
 
         st.success(f"**Sistem ivmesi:** a = {abs(a):.3f} m/s²")
 
@@ -533,3 +565,60 @@ def show():
 
         (Sürtünmesiz, kütlesiz makara ve ip varsayımı ile)
         """)
+
+        # Genel makara ağı: kütleli makaralar, bileşik makaralar, masadaki bloklar
+        st.write("**Genel Makara Ağı:**")
+        if st.checkbox("Kütleli/bileşik makaralar ve masadaki bloklar (seyrek kısıt çözücüsü)", key="pulley_network"):
+            # scipy.sparse yalnızca bu seçenek açıldığında yüklenir
+            from physics import pulleys
+
+            st.latex(r"\begin{bmatrix} M & A^T \\ A & 0 \end{bmatrix}"
+                     r"\begin{bmatrix} \ddot q \\ T \end{bmatrix} = \begin{bmatrix} Q \\ 0 \end{bmatrix}")
+            st.caption("Her ip parçası bir doğrusal uzunluk kısıtıdır (A·q̈ = 0); gerilmeler kısıt çarpanlarıdır. "
+                       "Konumlar aşağı (asılı) ve makaraya doğru (masada) pozitiftir.")
+
+            sistem = st.selectbox("Sistem:", ["Kütleli makaralı Atwood", "Masa + asılı blok", "Bileşik makara",
+                                              "Blok zinciri"], key="pulley_system")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                R = st.number_input("Makara yarıçapı R (m):", value=0.1, format="%.3f", min_value=0.001,
+                                    key="pulley_R")
+                I = st.number_input("Makara eylemsizlik momenti I (kg·m²):", value=0.0, format="%.4f",
+                                    min_value=0.0, key="pulley_I")
+            with col2:
+                if sistem == "Kütleli makaralı Atwood":
+                    ag = pulleys.atwood(m1, m2, g, I, R)
+                elif sistem == "Masa + asılı blok":
+                    m_masa = st.number_input("Masadaki kütle (kg):", value=4.0, format="%.2f", min_value=0.01,
+                                             key="pulley_mt")
+                    mu_masa = st.number_input("Kinetik sürtünme μₖ:", value=0.2, format="%.3f", min_value=0.0,
+                                              key="pulley_mu")
+                    ag = pulleys.table_and_hanging(m_masa, mu_masa, m2, g, I, R)
+                elif sistem == "Bileşik makara":
+                    kademe = st.slider("Hareketli makara sayısı:", min_value=1, max_value=20, value=2,
+                                       key="pulley_stages")
+                    m_makara = st.number_input("Hareketli makara kütlesi (kg):", value=0.0, format="%.2f",
+                                               min_value=0.0, key="pulley_mp")
+                    st.info(f"İdeal denge: karşı kütle = yük / 2ⁿ = {m1 / 2**kademe:.4f} kg (yük m₁, karşı kütle m₂)")
+                    ag = pulleys.compound(m1, m2, kademe, g, m_makara, I, R)
+                else:
+                    n_blok = st.slider("Masadaki blok sayısı:", min_value=1, max_value=50, value=10,
+                                       key="pulley_blocks")
+                    mu_masa = st.number_input("Kinetik sürtünme μₖ:", value=0.1, format="%.3f", min_value=0.0,
+                                              key="pulley_mu_chain")
+                    ag = pulleys.block_chain([m1] * n_blok, mu_masa, m2 * n_blok, g, I, R)
+
+            cozum = ag.solve()
+            if cozum.static:
+                st.warning("Sürtünme hareketi engelliyor: sistem durgun kalır (gerilmeler statik olarak belirsiz).")
+            else:
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.table({
+                        "Koordinat": cozum.names,
+                        "İvme": [f"{a_i:.4f} {'rad/s²' if '(dönme)' in ad else 'm/s²'}"
+                                 for ad, a_i in zip(cozum.names, cozum.a)],
+                    })
+                with col2:
+                    st.table({"İp": cozum.rope_names, "Gerilme (N)": [f"{T_i:.3f}" for T_i in cozum.T]})
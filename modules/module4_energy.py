@@ -3,6 +3,99 @@ import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from physics import cache, energy, oscillations
+
+# Hava yoğunluğu (kg/m³), sürüklenme sabiti k = ½ρC_dA/m için
+HAVA_YOGUNLUGU = 1.225
+
+RAY_PROFILLERI = ["Basit iniş (h₁ → h₂)", "İniş + döngü + tepe", "Kontrol noktaları (CSV)"]
+
+
+@cache.cached(maxsize=16)
+def build_coaster_figure(points, m, v0, g, mu, k):
+    """Spline ray üzerinde hız, enerji ve g-yükü grafikleri (önbellekli); (fig, ride, check) döner."""
+    from physics import coaster
+
+    track = coaster.build_track(points)
+    ride = coaster.ride(track, v0, g, mu, k)
+    check = coaster.loop_check(track, ride, g)
+
+    fig = make_subplots(
+        rows=3, cols=1,
+        subplot_titles=("Ray (renk: hız)", "Enerji Dönüşümü", "g-Yükü (normal kuvvet / mg)"),
+        row_heights=[0.45, 0.3, 0.25],
+        vertical_spacing=0.08
+    )
+
+    # Üst: ray ve hız
+    fig.add_trace(go.Scatter(
+        x=track.x, y=track.y,
+        mode='lines',
+        name='Ray',
+        line=dict(color='brown', width=2)
+    ), row=1, col=1)
+    fig.add_trace(go.Scatter(
+        x=track.x, y=track.y,
+        mode='markers',
+        name='Hız',
+        marker=dict(color=ride.v, colorscale='Turbo', size=5, colorbar=dict(title="v (m/s)", len=0.4, y=0.8)),
+        text=[f"v = {v:.2f} m/s" for v in ride.v],
+        showlegend=False
+    ), row=1, col=1)
+    fig.add_trace(go.Scatter(
+        x=points[:, 0], y=points[:, 1],
+        mode='markers',
+        name='Kontrol noktaları',
+        marker=dict(color='black', size=6, symbol='x'),
+        visible='legendonly'
+    ), row=1, col=1)
+
+    # Orta: enerji (J)
+    PE = energy.potential_energy(m, g, track.y)
+    KE = energy.kinetic_energy(m, ride.v)
+    fig.add_trace(go.Scatter(x=track.s, y=PE, mode='lines', name='PE (Potansiyel)',
+                             line=dict(color='red', width=2)), row=2, col=1)
+    fig.add_trace(go.Scatter(x=track.s, y=KE, mode='lines', name='KE (Kinetik)',
+                             line=dict(color='blue', width=2)), row=2, col=1)
+    fig.add_trace(go.Scatter(x=track.s, y=m * ride.energy_loss, mode='lines', name='Kayıp (sürtünme + hava)',
+                             line=dict(color='gray', width=2, dash='dot')), row=2, col=1)
+
+    # Alt: g-yükü
+    fig.add_trace(go.Scatter(x=track.s, y=ride.g_load, mode='lines', name='g-yükü',
+                             line=dict(color='purple', width=2)), row=3, col=1)
+    fig.add_hline(y=0, line=dict(color='black', width=1, dash='dash'), row=3, col=1)
+
+    fig.update_xaxes(title_text="Yatay Mesafe (m)", row=1, col=1)
+    fig.update_yaxes(title_text="Yükseklik (m)", scaleanchor="x", scaleratio=1, row=1, col=1)
+    fig.update_xaxes(title_text="Ray boyunca yol s (m)", row=2, col=1)
+    fig.update_yaxes(title_text="Enerji (J)", row=2, col=1)
+    fig.update_xaxes(title_text="Ray boyunca yol s (m)", row=3, col=1)
+    fig.update_yaxes(title_text="g", row=3, col=1)
+    fig.update_layout(height=900, showlegend=True, title_text=f"Roller Coaster (ray uzunluğu {track.length:.1f} m)")
+    return fig, ride, check
+
+
+def _read_track_points(dosya):
+    """İki sütunlu (x, y) CSV; ilk satır başlık olabilir.
+
+    Çakışan ardışık noktalar atılır. Okunamayan dosyada ValueError fırlatılır.
+    """
+    satirlar = dosya.getvalue().decode("utf-8").strip().splitlines()
+    try:
+        [float(h) for h in satirlar[0].split(",")]
+    except (ValueError, IndexError):
+        satirlar = satirlar[1:]
+    if not satirlar:
+        return np.empty((0, 2))
+    points = np.loadtxt(satirlar, delimiter=",", ndmin=2)
+    if points.shape[1] < 2:
+        raise ValueError("Dosyada x ve y olmak üzere iki sütun olmalı.")
+    points = points[:, :2]
+    if not np.isfinite(points).all():
+        raise ValueError("Kontrol noktaları sonlu sayılar olmalı.")
+    return points[np.concatenate(([True], np.any(np.diff(points, axis=0) != 0, axis=1)))]
+
+
 def show():
     st.markdown('<h2 class="module-header">⚡ Modül 4: İş, Güç ve Enerji</h2>', unsafe_allow_html=True)
 
@@ -25,7 +118,7 @@ def show():
             theta = st.number_input("Açı θ (derece):", value=0.0, format="%.2f")
 
         theta_rad = np.radians(theta)
-        W = F * d * np.cos(theta_rad)
+        W = energy.work(F, d, theta)
 
         st.success(f"**Yapılan İş:** W = {W:.2f} J (Joule)")
 
@@ -110,12 +203,12 @@ def show():
             with col2:
                 v = st.number_input("Hız v (m/s):", value=5.0, format="%.2f", min_value=0.0)
 
-            KE = 0.5 * m * v**2
+            KE = energy.kinetic_energy(m, v)
             st.success(f"**Kinetik Enerji:** KE = {KE:.2f} J")
 
             # Grafik: KE vs hız
             v_range = np.linspace(0, v*2, 100)
-            KE_range = 0.5 * m * v_range**2
+            KE_range = energy.kinetic_energy(m, v_range)
 
             fig = go.Figure()
             fig.add_trace(go.Scatter(
@@ -153,7 +246,7 @@ def show():
             with col3:
                 h = st.number_input("Yükseklik h (m):", value=10.0, format="%.2f")
 
-            PE = m * g * h
+            PE = energy.potential_energy(m, g, h)
             st.success(f"**Potansiyel Enerji:** PE = {PE:.2f} J")
 
             # Görselleştirme
@@ -207,12 +300,12 @@ def show():
             with col2:
                 x = st.number_input("Sıkıştırma/Uzama x (m):", value=0.5, format="%.3f")
 
-            PE_spring = 0.5 * k * x**2
+            PE_spring = energy.spring_potential_energy(k, x)
             st.success(f"**Yay Potansiyel Enerjisi:** PE = {PE_spring:.2f} J")
 
             # Grafik: PE vs uzama
             x_range = np.linspace(-abs(x)*2, abs(x)*2, 100)
-            PE_range = 0.5 * k * x_range**2
+            PE_range = energy.spring_potential_energy(k, x_range)
 
             fig = go.Figure()
             fig.add_trace(go.Scatter(
@@ -261,9 +354,8 @@ def show():
 
             theta_0_rad = np.radians(theta_0)
 
-            # Enerji hesaplamaları
-            h_max = L * (1 - np.cos(theta_0_rad))  # Maksimum yükseklik
-            E_total = m * g * h_max  # Toplam mekanik enerji
+            # Enerji hesaplamaları: maksimum yükseklik, toplam mekanik enerji, en alt noktadaki hız
+            h_max, E_total, v_max = energy.pendulum_energy(m, L, theta_0, g)
 
             st.success(f"**Toplam Mekanik Enerji:** E = {E_total:.3f} J (sabit)")
 
@@ -272,20 +364,18 @@ def show():
             # Enerji korunumu: mgh + (1/2)mv^2 = E_total
             # h = L(1 - cos(theta))
             # v = sqrt(2g(h_max - h))
+            # Periyot ve konumlar tam (eliptik integral) çözümden gelir
+            T = oscillations.pendulum_params(L, g, theta_0_rad).T
 
             theta_range = np.linspace(-theta_0_rad, theta_0_rad, 100)
-            h_range = L * (1 - np.cos(theta_range))
-            PE_range = m * g * h_range
-            KE_range = E_total - PE_range
-            v_range = np.sqrt(2 * KE_range / m)
 
             # Pozisyon
             x_range = L * np.sin(theta_range)
             y_range = -L * np.cos(theta_range)
 
-            # Animasyon için birkaç nokta
+            # Yarım periyot boyunca eşit zaman aralıklı birkaç konum
             n_points = 10
-            theta_points = theta_0_rad * np.cos(np.linspace(0, np.pi, n_points))
+            theta_points = oscillations.pendulum_state(L, g, m, theta_0_rad, np.linspace(0, T / 2, n_points)).theta
 
             fig = make_subplots(
                 rows=1, cols=2,
@@ -334,9 +424,7 @@ def show():
 
             # Sağ: Enerji grafikleri
             theta_plot = np.linspace(-theta_0_rad, theta_0_rad, 100)
-            h_plot = L * (1 - np.cos(theta_plot))
-            PE_plot = m * g * h_plot
-            KE_plot = E_total - PE_plot
+            PE_plot, KE_plot = energy.pendulum_energy_profile(m, L, g, E_total, theta_plot)
 
             theta_deg_plot = np.degrees(theta_plot)
 
@@ -370,8 +458,9 @@ def show():
             st.plotly_chart(fig)
 
             # En alt noktada hız
-            v_max = np.sqrt(2 * g * h_max)
             st.info(f"**En alt noktadaki maksimum hız:** v_max = {v_max:.3f} m/s")
+            st.info(f"**Periyot (tam çözüm):** T = {T:.3f} s (küçük açı yaklaşımı: "
+                    f"{oscillations.pendulum_params(L, g).T:.3f} s); konumlar T/{2 * (n_points - 1)} aralıklıdır.")
 
         else:  # Roller Coaster
             st.write("**Roller Coaster (Hız Treni):** Bir tren tepeden aşağı iniyor")
@@ -389,102 +478,78 @@ def show():
             # (1/2)m*v1^2 + m*g*h1 = (1/2)m*v2^2 + m*g*h2
             # v2 = sqrt(v1^2 + 2*g*(h1 - h2))
 
-            E1 = 0.5 * m * v1**2 + m * g * h1
-            E2_potential = m * g * h2
-            E2_kinetic = E1 - E2_potential
+            E1, E2_kinetic, E2_potential, v2 = energy.roller_coaster(m, h1, v1, h2, g)
 
             if E2_kinetic >= 0:
-                v2 = np.sqrt(2 * E2_kinetic / m)
 
                 st.success(f"**Başlangıç toplam enerjisi:** E₁ = {E1:.2f} J")
                 st.success(f"**Son hız:** v₂ = {v2:.3f} m/s")
                 st.success(f"**Son kinetik enerji:** KE₂ = {E2_kinetic:.2f} J")
                 st.success(f"**Son potansiyel enerji:** PE₂ = {E2_potential:.2f} J")
 
-                # Simülasyon - yol boyunca enerji dönüşümü
-                # Basit bir yörünge oluşturalım
-                n_points = 100
-                x_path = np.linspace(0, 100, n_points)
-
-                # Yükseklik profili (basit bir eğri)
-                h_path = h1 - (h1 - h2) * (x_path / 100)**2
-
-                # Her noktada hız (enerji korunumu)
-                PE_path = m * g * h_path
-                KE_path = E1 - PE_path
-                KE_path = np.maximum(KE_path, 0)  # Negatif enerji olmasın
-                v_path = np.sqrt(2 * KE_path / m)
-
-                fig = make_subplots(
-                    rows=2, cols=1,
-                    subplot_titles=("Roller Coaster Yörüngesi", "Enerji Dönüşümü"),
-                    row_heights=[0.5, 0.5],
-                    vertical_spacing=0.15
-                )
-
-                # Üst: Yörünge
-                fig.add_trace(go.Scatter(
-                    x=x_path, y=h_path,
-                    mode='lines',
-                    name='Yörünge',
-                    line=dict(color='brown', width=4),
-                    fill='tozeroy',
-                    fillcolor='rgba(139, 69, 19, 0.3)'
-                ), row=1, col=1)
-
-                # Başlangıç ve bitiş noktaları
-                fig.add_trace(go.Scatter(
-                    x=[0], y=[h1],
-                    mode='markers+text',
-                    name='Başlangıç',
-                    marker=dict(color='green', size=15),
-                    text=['Start'],
-                    textposition='top center'
-                ), row=1, col=1)
-
-                fig.add_trace(go.Scatter(
-                    x=[100], y=[h2],
-                    mode='markers+text',
-                    name='Bitiş',
-                    marker=dict(color='red', size=15),
-                    text=['End'],
-                    textposition='top center'
-                ), row=1, col=1)
-
-                # Alt: Enerji grafikleri
-                fig.add_trace(go.Scatter(
-                    x=x_path, y=PE_path,
-                    mode='lines',
-                    name='PE (Potansiyel)',
-                    line=dict(color='red', width=3),
-                    fill='tonexty'
-                ), row=2, col=1)
-
-                fig.add_trace(go.Scatter(
-                    x=x_path, y=KE_path,
-                    mode='lines',
-                    name='KE (Kinetik)',
-                    line=dict(color='blue', width=3),
-                    fill='tonexty'
-                ), row=2, col=1)
-
-                fig.add_trace(go.Scatter(
-                    x=x_path, y=[E1]*len(x_path),
-                    mode='lines',
-                    name='Toplam Enerji',
-                    line=dict(color='green', width=2, dash='dash')
-                ), row=2, col=1)
+            else:
+                st.error("⚠️ Tren son yüksekliğe ulaşamaz! İlk enerji yetersiz.")
 
-                fig.update_xaxes(title_text="Yatay Mesafe (m)", row=1, col=1)
-                fig.update_yaxes(title_text="Yükseklik (m)", row=1, col=1)
-                fig.update_xaxes(title_text="Yatay Mesafe (m)", row=2, col=1)
-                fig.update_yaxes(title_text="Enerji (J)", row=2, col=1)
+            # Ray profili: kübik spline, yay uzunluğu parametrizasyonu, sürtünme ve hava direnci
+            st.write("**Ray Simülasyonu:**")
+            # scipy yalnızca hız treni seçildiğinde yüklenir
+            from physics import coaster
+
+            profil = st.radio("Ray profili:", RAY_PROFILLERI, horizontal=True, key="coaster_profile")
+            if profil == RAY_PROFILLERI[0]:
+                points = coaster.compose([coaster.drop(h1 - h2, 100.0)], start=(0.0, h1))
+            elif profil == RAY_PROFILLERI[1]:
+                col1, col2 = st.columns(2)
+                with col1:
+                    R_dongu = st.number_input("Döngü yarıçapı R (m):", value=10.0, format="%.2f", min_value=1.0,
+                                              key="coaster_R")
+                with col2:
+                    tepe = st.number_input("Tepe yüksekliği (m):", value=10.0, format="%.2f", min_value=0.0,
+                                           key="coaster_hill")
+                points = coaster.compose([coaster.drop(h1 - h2, 60.0), coaster.straight(20.0), coaster.loop(R_dongu),
+                                          coaster.straight(20.0), coaster.hill(tepe, 40.0), coaster.straight(10.0)],
+                                         start=(0.0, h1))
+            else:
+                dosya = st.file_uploader("Kontrol noktaları (x, y sütunlu CSV):", type=["csv", "txt"],
+                                         key="coaster_csv")
+                if dosya is None:
+                    st.info("Dosya yüklenmedi; örnek ray kullanılıyor.")
+                    points = coaster.compose([coaster.drop(h1 - h2, 60.0), coaster.hill(15.0, 50.0),
+                                              coaster.straight(10.0)], start=(0.0, h1))
+                else:
+                    try:
+                        points = _read_track_points(dosya)
+                    except ValueError as hata:
+                        st.error(f"❌ Dosya okunamadı: {hata}")
+                        points = np.empty((0, 2))
 
-                fig.update_layout(height=700, showlegend=True, title_text=f"Roller Coaster (E_total = {E1:.2f} J)")
-                st.plotly_chart(fig)
+            col1, col2 = st.columns(2)
+            with col1:
+                mu_r = st.number_input("Yuvarlanma sürtünme katsayısı μ:", value=0.0, format="%.4f", min_value=0.0,
+                                       key="coaster_mu")
+            with col2:
+                CdA = st.number_input("Hava direnci C_d·A (m²):", value=0.0, format="%.3f", min_value=0.0,
+                                      key="coaster_cda")
 
+            if len(points) < 3:
+                st.error("En az 3 farklı kontrol noktası gerekli.")
             else:
-                st.error("⚠️ Tren son yüksekliğe ulaşamaz! İlk enerji yetersiz.")
+                fig, yolculuk, kontrol = build_coaster_figure(points, m, v1, g, mu_r, 0.5 * HAVA_YOGUNLUGU * CdA / m)
+
+                if np.isfinite(yolculuk.stall_s):
+                    st.error(f"⚠️ Tren s = {yolculuk.stall_s:.1f} m'de duruyor (enerji yetersiz).")
+                if np.isfinite(kontrol.worst_s):
+                    if kontrol.feasible:
+                        st.success(f"✅ Döngüler güvenli: en düşük hız payı {kontrol.margin:.2f} m/s "
+                                   f"(s = {kontrol.worst_s:.1f} m)")
+                    else:
+                        st.error(f"⚠️ Tren s = {kontrol.worst_s:.1f} m civarında döngü tepesinde raydan ayrılır.")
+                    st.info(f"Sürtünmesiz rayda döngüler için gereken en küçük başlangıç hızı: "
+                            f"v₀ = {kontrol.v0_required:.2f} m/s")
+                if kontrol.airtime:
+                    st.warning("Bazı kısımlarda g-yükü negatif (havada kalma): vagon alttan tutunan tekerleklerle "
+                               "rayda tutulur.")
+                st.plotly_chart(fig)
 
     # TAB 4: Güç Hesaplayıcı
     with tab4:
@@ -507,11 +572,11 @@ def show():
             with col2:
                 t = st.number_input("Zaman t (s):", value=10.0, format="%.2f", min_value=0.01)
 
-            P = W / t
+            P = energy.power(W, t)
 
             st.success(f"**Güç:** P = {P:.2f} W (Watt)")
             st.info(f"**Güç (kW):** P = {P/1000:.3f} kW")
-            st.info(f"**Güç (hp - beygir gücü):** P = {P/745.7:.3f} hp")
+            st.info(f"**Güç (hp - beygir gücü):** P = {P/energy.HP_IN_WATTS:.3f} hp")
 
         else:  # Kuvvet ve Hızdan
             st.write("Sabit kuvvet ve hız için:")
@@ -524,11 +589,11 @@ def show():
             with col2:
                 v = st.number_input("Hız v (m/s):", value=5.0, format="%.2f", min_value=0.0, key="power_v")
 
-            P = F * v
+            P = energy.power_from_force(F, v)
 
             st.success(f"**Güç:** P = {P:.2f} W (Watt)")
             st.info(f"**Güç (kW):** P = {P/1000:.3f} kW")
-            st.info(f"**Güç (hp):** P = {P/745.7:.3f} hp")
+            st.info(f"**Güç (hp):** P = {P/energy.HP_IN_WATTS:.3f} hp")
 
         st.markdown("---")
         st.write("**Güç birimleri:**")
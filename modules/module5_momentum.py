@@ -3,10 +3,140 @@ import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from modules import plotting
+from physics import cache, collisions, disks, kernels, momentum
+
+ZINCIR_MODELLERI = ["Newton Beşiği", "Piston ve Gaz"]
+DISK_MODELLERI = ["Bilardo Açılışı", "İdeal Gaz"]
+
+# Animasyonda gösterilen en fazla disk (tarayıcı yükü); benzetim tüm disklerle yapılır
+ANIMASYON_DISK_SINIRI = 2000
+
+
+@cache.cached(maxsize=32)
+def build_collision_animation(v1, v2, v1_final, v2_final, n_frames=150):
+    """1D çarpışma animasyonu; kareler yalnızca iki cismin x konumlarını taşır (önbellekli)."""
+    t_before = 2  # Çarpışma öncesi süre
+    t_after = 2  # Çarpışma sonrası
+
+    # Çarpışma x = 0'da olur; kare başına konumlar (2, n_frames)
+    positions = momentum.collision_positions(v1, v2, v1_final, v2_final, n_frames, t_before, t_after)
+    start_x1, start_x2 = positions[:, 0]
+
+    fig = go.Figure()
+
+    # Stil yalnızca ilk izlerde tanımlanır
+    fig.add_trace(go.Scatter(
+        x=[start_x1], y=[0],
+        mode='markers+text',
+        marker=dict(size=30, color='red'),
+        text=['m₁'],
+        textposition='top center',
+        name='Cisim 1'
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=[start_x2], y=[0.5],
+        mode='markers+text',
+        marker=dict(size=30, color='blue'),
+        text=['m₂'],
+        textposition='top center',
+        name='Cisim 2'
+    ))
+
+    fig.update_layout(
+        xaxis=dict(range=[min(start_x1, start_x2) - 5, max(start_x1, start_x2) + 10], zeroline=True),
+        yaxis=dict(range=[-1, 2], showticklabels=False),
+        title="Çarpışma Simülasyonu (Basitleştirilmiş)",
+        showlegend=True,
+        height=300
+    )
+
+    # Toplam oynatma süresi kare sayısından bağımsız olarak ~3 s
+    return plotting.animate_x(fig, positions, frame_duration=max(3000 // n_frames, 5))
+
+
+@cache.cached(maxsize=16)
+def build_chain_figures(model, n_bodies, n_moving, e, t_end, n_frames=120):
+    """Çok cisimli zincir animasyonu ve enerji grafiği (önbellekli); (fig, fig2, series) döner."""
+    if model == "Newton Beşiği":
+        m, x, v, radius = collisions.newtons_cradle(n_bodies, n_moving)
+        walls = None
+        sizes, colors = 30, "steelblue"
+    else:
+        m, x, v, radius, walls = collisions.piston_gas(n_bodies)
+        piston = np.argmax(m)
+        sizes = np.where(m == m[piston], 24, 5)
+        colors = np.where(m == m[piston], "gray", "crimson").tolist()
+    series = collisions.simulate_chain(m, x, v, t_end, n_frames, radius, e, walls, max_events=500_000)
+
+    fig = go.Figure(go.Scatter(
+        x=series.x[0], y=np.zeros(series.x.shape[1]),
+        mode='markers',
+        marker=dict(size=sizes, color=colors, symbol='circle' if walls is None else 'square'),
+        name='Cisimler'
+    ))
+    x_min, x_max = walls if walls is not None else (series.x.min() - 1, series.x.max() + 1)
+    fig.update_layout(
+        xaxis=dict(range=[x_min, x_max], title="x (m)"),
+        yaxis=dict(range=[-1, 1], showticklabels=False),
+        title=f"{model} ({len(m)} cisim, {series.n_events} çarpışma)",
+        height=250
+    )
+    plotting.animate_x(fig, series.x[None], frame_duration=max(4000 // n_frames, 5), decimals=2)
+
+    fig2 = go.Figure(go.Scatter(x=series.t, y=collisions.kinetic_energy(m, series.v), name='Toplam KE (J)'))
+    if walls is not None:
+        fig2.add_trace(go.Scatter(x=series.t, y=series.x[:, piston], name='Piston konumu (m)', yaxis='y2'))
+        fig2.update_layout(yaxis2=dict(title="Piston x (m)", overlaying='y', side='right'))
+    fig2.update_layout(title="Enerji ve Zaman", xaxis_title="Zaman (s)", yaxis_title="Kinetik enerji (J)", height=300)
+    return fig, fig2, series
+
+
+@cache.cached(maxsize=8)
+def build_disk_figures(model, n_disks, e, n_frames=40):
+    """Çok diskli 2D benzetim animasyonu ve hız dağılımı (önbellekli); (fig, fig2, series) döner."""
+    if model == "Bilardo Açılışı":
+        pos, vel, radius, mass, box = disks.billiards_break()
+        t_end = 2.0
+        colors = ["white"] + ["crimson"] * (len(pos) - 1)
+    else:
+        pos, vel, radius, mass, box = disks.ideal_gas(n_disks, (2.0 * np.sqrt(n_disks),) * 2)
+        t_end = 30.0
+        colors = "royalblue"
+    series = disks.simulate_disks(pos, vel, radius, mass, box, t_end, n_frames, e)
+
+    shown = series.pos[:, :ANIMASYON_DISK_SINIRI]
+    W, H = box
+    size_px = max(2.0, 2 * radius / W * 500)
+    fig = go.Figure(go.Scatter(
+        x=shown[0, :, 0], y=shown[0, :, 1],
+        mode='markers',
+        marker=dict(size=size_px, color=colors, line=dict(width=1, color='black')),
+        name='Diskler'
+    ))
+    fig.update_layout(
+        xaxis=dict(range=[0, W], constrain='domain'),
+        yaxis=dict(range=[0, H], scaleanchor='x', scaleratio=1),
+        plot_bgcolor='darkgreen' if model == "Bilardo Açılışı" else 'white',
+        title=f"{model} ({len(pos)} disk, {series.n_collisions} çarpışma)",
+        width=600, height=600 * H / W + 100
+    )
+    plotting.animate_xy(fig, shown[None], frame_duration=100, decimals=3)
+
+    fig2 = go.Figure()
+    fig2.add_trace(go.Histogram(x=series.speed[0], name='Başlangıç', opacity=0.6, nbinsx=40))
+    fig2.add_trace(go.Histogram(x=series.speed[-1], name='Son', opacity=0.6, nbinsx=40))
+    fig2.update_layout(barmode='overlay', title="Hız Dağılımı", xaxis_title="|v| (m/s)", yaxis_title="Disk sayısı",
+                       height=300)
+    return fig, fig2, series
+
+
 def show():
     st.markdown('<h2 class="module-header">💥 Modül 5: Momentum ve Çarpışmalar</h2>', unsafe_allow_html=True)
 
-    tab1, tab2, tab3 = st.tabs(["📊 Momentum ve İtme", "💥 1D Çarpışmalar", "🎱 2D Çarpışmalar"])
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 Momentum ve İtme", "💥 1D Çarpışmalar", "🎱 2D Çarpışmalar",
+                                            "🔗 Çok Cisimli Zincir", "🫧 Çok Diskli 2D"])
 
     # TAB 1: Momentum ve İtme
     with tab1:
@@ -30,7 +160,7 @@ def show():
             with col2:
                 v = st.number_input("Hız v (m/s):", value=5.0, format="%.2f")
 
-            p = m * v
+            p = momentum.momentum(m, v)
 
             st.success(f"**Momentum:** p = {p:.2f} kg·m/s")
 
@@ -54,11 +184,8 @@ def show():
             with col2:
                 dt = st.number_input("Zaman aralığı Δt (s):", value=2.0, format="%.2f", min_value=0.01)
 
-            p1 = m * v1
-            p2 = m * v2
-            dp = p2 - p1
+            p1, p2, dp, F_avg = momentum.impulse(m, v1, v2, dt)
             I = dp
-            F_avg = I / dt
 
             st.success(f"**İlk momentum:** p₁ = {p1:.2f} kg·m/s")
             st.success(f"**Son momentum:** p₂ = {p2:.2f} kg·m/s")
@@ -128,19 +255,11 @@ def show():
             m2 = st.number_input("Kütle m₂ (kg):", value=3.0, format="%.2f", min_value=0.01, key="coll_m2")
             v2 = st.number_input("İlk hız v₂ (m/s):", value=0.0, format="%.2f", key="coll_v2")
 
-        # Başlangıç momentumu ve enerjisi
-        p_initial = m1 * v1 + m2 * v2
-        KE_initial = 0.5 * m1 * v1**2 + 0.5 * m2 * v2**2
-
         if carpisma_tipi == "Elastik Çarpışma":
             st.write("**Elastik çarpışma:** Hem momentum hem de kinetik enerji korunur")
 
             # Elastik çarpışma formülleri
-            v1_final = ((m1 - m2) * v1 + 2 * m2 * v2) / (m1 + m2)
-            v2_final = ((m2 - m1) * v2 + 2 * m1 * v1) / (m1 + m2)
-
-            p_final = m1 * v1_final + m2 * v2_final
-            KE_final = 0.5 * m1 * v1_final**2 + 0.5 * m2 * v2_final**2
+            v1_final, v2_final, p_initial, p_final, KE_initial, KE_final, _ = momentum.elastic_collision(m1, v1, m2, v2)
 
             st.success(f"**Cisim 1 son hız:** v₁' = {v1_final:.3f} m/s")
             st.success(f"**Cisim 2 son hız:** v₂' = {v2_final:.3f} m/s")
@@ -151,11 +270,7 @@ def show():
             st.write("**Tam inelastik çarpışma:** Cisimler birleşir, sadece momentum korunur")
 
             # Birleşik hız
-            v_final = (m1 * v1 + m2 * v2) / (m1 + m2)
-
-            p_final = (m1 + m2) * v_final
-            KE_final = 0.5 * (m1 + m2) * v_final**2
-            energy_loss = KE_initial - KE_final
+            v_final, _, p_initial, p_final, KE_initial, KE_final, energy_loss = momentum.perfectly_inelastic_collision(m1, v1, m2, v2)
 
             st.success(f"**Birleşik cisim son hız:** v' = {v_final:.3f} m/s")
             st.success(f"**Toplam momentum:** {p_initial:.3f} → {p_final:.3f} kg·m/s ✓")
@@ -177,12 +292,7 @@ def show():
             v_rel = v1 - v2
             if abs(v_rel) > 0.001:
                 # Çözüm:
-                v1_final = (m1 * v1 + m2 * v2 - m2 * e * v_rel) / (m1 + m2)
-                v2_final = (m1 * v1 + m2 * v2 + m1 * e * v_rel) / (m1 + m2)
-
-                p_final = m1 * v1_final + m2 * v2_final
-                KE_final = 0.5 * m1 * v1_final**2 + 0.5 * m2 * v2_final**2
-                energy_loss = KE_initial - KE_final
+                v1_final, v2_final, p_initial, p_final, KE_initial, KE_final, energy_loss = momentum.restitution_collision(m1, v1, m2, v2, e)
 
                 st.success(f"**Cisim 1 son hız:** v₁' = {v1_final:.3f} m/s")
                 st.success(f"**Cisim 2 son hız:** v₂' = {v2_final:.3f} m/s")
@@ -197,96 +307,11 @@ def show():
         # Animasyon
         st.write("**Çarpışma Animasyonu:**")
 
-        fig = go.Figure()
-
-        # Zaman çizelgesi
-        t_before = 2  # Çarpışma öncesi süre
-        t_collision = 0.1  # Çarpışma anı
-        t_after = 2  # Çarpışma sonrası
-
-        # Çarpışma konumunu belirle
-        # v1*t = collision_x - start_x1
-        # v2*t = collision_x - start_x2
-        # Basitlik için collision_x = 0 alalım
-
-        collision_x = 0
-        start_x1 = collision_x - v1 * t_before
-        start_x2 = collision_x - v2 * t_before
-
-        frames = []
-        n_frames = 60
-
-        for i in range(n_frames):
-            if i < n_frames * 0.4:  # Öncesi
-                t = i / (n_frames * 0.4) * t_before
-                x1 = start_x1 + v1 * t
-                x2 = start_x2 + v2 * t
-            elif i < n_frames * 0.5:  # Çarpışma
-                x1 = collision_x
-                x2 = collision_x
-            else:  # Sonrası
-                t = (i - n_frames * 0.5) / (n_frames * 0.5) * t_after
-                if carpisma_tipi == "Tam İnelastik Çarpışma":
-                    x1 = collision_x + v_final * t
-                    x2 = collision_x + v_final * t
-                else:
-                    x1 = collision_x + v1_final * t
-                    x2 = collision_x + v2_final * t
-
-            frame_data = [
-                go.Scatter(
-                    x=[x1], y=[0],
-                    mode='markers+text',
-                    marker=dict(size=30, color='red'),
-                    text=[f'm₁'],
-                    textposition='top center',
-                    name='Cisim 1'
-                ),
-                go.Scatter(
-                    x=[x2], y=[0.5],
-                    mode='markers+text',
-                    marker=dict(size=30, color='blue'),
-                    text=[f'm₂'],
-                    textposition='top center',
-                    name='Cisim 2'
-                )
-            ]
-
-            frames.append(go.Frame(data=frame_data, name=str(i)))
-
-        # İlk frame
-        fig.add_trace(go.Scatter(
-            x=[start_x1], y=[0],
-            mode='markers+text',
-            marker=dict(size=30, color='red'),
-            text=[f'm₁'],
-            textposition='top center',
-            name='Cisim 1'
-        ))
-
-        fig.add_trace(go.Scatter(
-            x=[start_x2], y=[0.5],
-            mode='markers+text',
-            marker=dict(size=30, color='blue'),
-            text=[f'm₂'],
-            textposition='top center',
-            name='Cisim 2'
-        ))
-
-        fig.update_layout(
-            xaxis=dict(range=[min(start_x1, start_x2) - 5, max(start_x1, start_x2) + 10], zeroline=True),
-            yaxis=dict(range=[-1, 2], showticklabels=False),
-            title="Çarpışma Simülasyonu (Basitleştirilmiş)",
-            showlegend=True,
-            height=300,
-            updatemenus=[dict(
-                type="buttons",
-                buttons=[dict(label="▶ Oynat", method="animate", args=[None, {"frame": {"duration": 50}}])]
-            )],
-            frames=frames
-        )
+        if carpisma_tipi == "Tam İnelastik Çarpışma":
+            v1_final = v2_final = v_final
 
-        st.plotly_chart(fig)
+        n_kare = st.select_slider("Kare sayısı:", options=[60, 150, 300, 600], value=150, key="coll_frames")
+        st.plotly_chart(build_collision_animation(v1, v2, v1_final, v2_final, n_kare))
 
     # TAB 3: 2D Çarpışmalar
     with tab3:
@@ -316,25 +341,17 @@ def show():
             horizontal=True
         )
 
-        # Başlangıç momentumu
-        px_initial = m1 * v1x + m2 * v2x
-        py_initial = m1 * v1y + m2 * v2y
-        p_total_initial = np.sqrt(px_initial**2 + py_initial**2)
-
-        KE_initial = 0.5 * m1 * (v1x**2 + v1y**2) + 0.5 * m2 * (v2x**2 + v2y**2)
+        # Başlangıç momentumu ve birleşik hız
+        px_initial, py_initial, KE_initial, vx_final, vy_final, KE_final, energy_loss = momentum.perfectly_inelastic_collision_2d(
+            m1, v1x, v1y, m2, v2x, v2y
+        )
 
         if carpisma_2d == "Tam İnelastik (Birleşme)":
-            # Birleşik hız
-            vx_final = px_initial / (m1 + m2)
-            vy_final = py_initial / (m1 + m2)
             v_final_mag = np.sqrt(vx_final**2 + vy_final**2)
 
             px_final = (m1 + m2) * vx_final
             py_final = (m1 + m2) * vy_final
 
-            KE_final = 0.5 * (m1 + m2) * (vx_final**2 + vy_final**2)
-            energy_loss = KE_initial - KE_final
-
             st.success(f"**Birleşik cisim son hızı:**")
             st.success(f"   vₓ' = {vx_final:.3f} m/s")
             st.success(f"   vᵧ' = {vy_final:.3f} m/s")
@@ -359,8 +376,7 @@ def show():
 
         # Cisim 1 yörüngesi (öncesi)
         t_before = 2
-        x1_path = np.array([v1x * (-t) for t in np.linspace(t_before, 0, 20)])
-        y1_path = np.array([v1y * (-t) for t in np.linspace(t_before, 0, 20)])
+        x1_path, y1_path = kernels.straight_path(v1x, v1y, -t_before, 0)
 
         fig.add_trace(go.Scatter(
             x=x1_path, y=y1_path,
@@ -370,8 +386,7 @@ def show():
         ))
 
         # Cisim 2 yörüngesi (öncesi)
-        x2_path = np.array([v2x * (-t) for t in np.linspace(t_before, 0, 20)])
-        y2_path = np.array([v2y * (-t) for t in np.linspace(t_before, 0, 20)])
+        x2_path, y2_path = kernels.straight_path(v2x, v2y, -t_before, 0)
 
         fig.add_trace(go.Scatter(
             x=x2_path, y=y2_path,
@@ -410,8 +425,7 @@ def show():
         # Sonrası yörünge
         if carpisma_2d == "Tam İnelastik (Birleşme)":
             t_after = 2
-            x_final_path = np.array([vx_final * t for t in np.linspace(0, t_after, 20)])
-            y_final_path = np.array([vy_final * t for t in np.linspace(0, t_after, 20)])
+            x_final_path, y_final_path = kernels.straight_path(vx_final, vy_final, 0, t_after)
 
             fig.add_trace(go.Scatter(
                 x=x_final_path, y=y_final_path,
@@ -459,3 +473,73 @@ def show():
         )
 
         st.plotly_chart(fig)
+
+    # TAB 4: Çok Cisimli Zincir
+    with tab4:
+        st.subheader("🔗 Çok Cisimli 1D Çarpışmalar")
+
+        st.write("Olay güdümlü benzetim: bir sonraki çarpışma anı öncelik kuyruğundan alınır, "
+                 "yalnızca çarpışan komşu cisimler güncellenir.")
+
+        model = st.radio("Model:", ZINCIR_MODELLERI, horizontal=True, key="chain_model")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if model == "Newton Beşiği":
+                n_bodies = st.slider("Top sayısı:", min_value=2, max_value=50, value=5, key="chain_n")
+                n_moving = st.slider("Gelen top sayısı:", min_value=1, max_value=n_bodies - 1, value=1,
+                                     key="chain_moving")
+                t_end = 10.0
+            else:
+                n_bodies = st.slider("Gaz parçacığı sayısı:", min_value=10, max_value=500, value=200, step=10,
+                                     key="chain_n_gas")
+                n_moving = 0
+                t_end = 100.0
+        with col2:
+            e = st.slider("Restitüsyon katsayısı e:", min_value=0.0, max_value=1.0, value=1.0, step=0.05,
+                          key="chain_e")
+            st.info("Piston modelinde sol bölme sıcak, sağ bölme soğuk gazla başlar; piston basınç farkıyla itilir."
+                    if model == "Piston ve Gaz" else
+                    "Eşit kütleli elastik toplarda gelen top sayısı kadar top öbür uçtan çıkar.")
+
+        fig, fig2, series = build_chain_figures(model, n_bodies, n_moving, e, t_end)
+        if not series.complete:
+            st.warning("Olay sınırına ulaşıldı (e < 1'de inelastik çöküş); son kareler dondurulmuştur.")
+        st.plotly_chart(fig)
+        st.plotly_chart(fig2)
+
+    # TAB 5: Çok Diskli 2D
+    with tab5:
+        st.subheader("🫧 Çok Diskli 2D Çarpışmalar")
+
+        st.write("Sert diskler eğik çarpışır: itme çarpışma normali boyunca uygulanır, teğetsel hız korunur. "
+                 "Aday çiftler uzamsal karma (düzgün ızgara) ile yalnızca komşu hücrelerden bulunur.")
+        st.latex(r"J = -\frac{(1 + e)\,(\vec v_2 - \vec v_1)\cdot\hat n}{1/m_1 + 1/m_2}")
+
+        model = st.radio("Model:", DISK_MODELLERI, horizontal=True, key="disk_model")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if model == "İdeal Gaz":
+                n_disks = st.select_slider("Disk sayısı:", options=[100, 500, 1000, 2000, 5000, 10000], value=1000,
+                                           key="disk_n")
+            else:
+                n_disks = 16
+        with col2:
+            e = st.slider("Restitüsyon katsayısı e:", min_value=0.5, max_value=1.0, value=1.0, step=0.05,
+                          key="disk_e")
+
+        fig, fig2, series = build_disk_figures(model, n_disks, e)
+        if n_disks > ANIMASYON_DISK_SINIRI:
+            st.info(f"Animasyonda ilk {ANIMASYON_DISK_SINIRI} disk gösterilir; hız dağılımı tüm disklerden hesaplanır.")
+        st.plotly_chart(fig)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Kinetik enerji (başlangıç)", f"{series.kinetic_energy[0]:.3f} J")
+        with col2:
+            st.metric("Kinetik enerji (son)", f"{series.kinetic_energy[-1]:.3f} J")
+        if model == "İdeal Gaz":
+            st.write("Eşit hızla başlayan diskler çarpıştıkça hız dağılımı 2D Maxwell-Boltzmann "
+                     "(Rayleigh) dağılımına yaklaşır:")
+        st.plotly_chart(fig2)
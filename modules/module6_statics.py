@@ -3,6 +3,149 @@ import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from physics import statics
+
+
+def build_beam_figure(L, support_A, support_B, loads, R_A, R_B, W_beam, total_down):
+    """Kiriş, destekler, yükler ve tepki kuvvetleri (oklar 1 mm/N ölçeğinde)."""
+    beam_center = L / 2  # Kiriş ağırlığı merkezde
+    fig = go.Figure()
+
+    # Kiriş
+    fig.add_trace(go.Scatter(
+        x=[0, L], y=[0, 0],
+        mode='lines',
+        name='Kiriş',
+        line=dict(color='brown', width=8)
+    ))
+
+    # Destekler
+    fig.add_trace(go.Scatter(
+        x=[support_A], y=[0],
+        mode='markers+text',
+        name='Destek A',
+        marker=dict(color='green', size=20, symbol='triangle-up'),
+        text=[f'A: {R_A:.0f}N'],
+        textposition='bottom center'
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=[support_B], y=[0],
+        mode='markers+text',
+        name='Destek B',
+        marker=dict(color='blue', size=20, symbol='triangle-up'),
+        text=[f'B: {R_B:.0f}N'],
+        textposition='bottom center'
+    ))
+
+    # Kiriş ağırlığı
+    fig.add_annotation(
+        x=beam_center, y=-W_beam*0.001,
+        ax=beam_center, ay=0,
+        xref="x", yref="y",
+        axref="x", ayref="y",
+        showarrow=True,
+        arrowhead=2,
+        arrowsize=1,
+        arrowwidth=2,
+        arrowcolor="purple",
+        text=f"W_beam={W_beam:.0f}N"
+    )
+
+    # Nokta yükleri
+    for i, (pos, force) in enumerate(loads):
+        fig.add_annotation(
+            x=pos, y=-force*0.001,
+            ax=pos, ay=0,
+            xref="x", yref="y",
+            axref="x", ayref="y",
+            showarrow=True,
+            arrowhead=2,
+            arrowsize=1,
+            arrowwidth=3,
+            arrowcolor="red",
+            text=f"F{i+1}={force:.0f}N"
+        )
+
+    # Tepki kuvvetleri
+    scale = 0.001
+    fig.add_annotation(
+        x=support_A, y=R_A*scale,
+        ax=support_A, ay=0,
+        xref="x", yref="y",
+        axref="x", ayref="y",
+        showarrow=True,
+        arrowhead=2,
+        arrowsize=1,
+        arrowwidth=3,
+        arrowcolor="green"
+    )
+
+    fig.add_annotation(
+        x=support_B, y=R_B*scale,
+        ax=support_B, ay=0,
+        xref="x", yref="y",
+        axref="x", ayref="y",
+        showarrow=True,
+        arrowhead=2,
+        arrowsize=1,
+        arrowwidth=3,
+        arrowcolor="blue"
+    )
+
+    fig.update_layout(
+        title="Kiriş Statik Denge",
+        xaxis_title="Konum (m)",
+        yaxis_title="",
+        showlegend=True,
+        width=900,
+        height=400,
+        xaxis=dict(range=[-1, L+1]),
+        yaxis=dict(range=[-max(total_down*0.002, 1), max(total_down*0.002, 1)], showticklabels=False)
+    )
+
+    return fig
+
+
+def build_center_of_mass_figure(masses, x_cm, y_cm):
+    """Nokta kütleler [(m, x, y), ...] ve kütle merkezi."""
+    fig = go.Figure()
+
+    # Kütleler
+    for i, (m, x, y) in enumerate(masses):
+        fig.add_trace(go.Scatter(
+            x=[x], y=[y],
+            mode='markers+text',
+            name=f'm{i+1}={m}kg',
+            marker=dict(size=m*20, color=f'rgb({50+i*40},{100+i*30},{200-i*20})'),
+            text=[f'm{i+1}'],
+            textposition='top center'
+        ))
+
+    # Kütle merkezi
+    fig.add_trace(go.Scatter(
+        x=[x_cm], y=[y_cm],
+        mode='markers+text',
+        name='Kütle Merkezi',
+        marker=dict(color='red', size=25, symbol='star'),
+        text=['CM'],
+        textposition='bottom center'
+    ))
+
+    fig.update_layout(
+        title=f"Kütle Merkezi: ({x_cm:.2f}, {y_cm:.2f})",
+        xaxis_title="X (m)",
+        yaxis_title="Y (m)",
+        showlegend=True,
+        width=700,
+        height=600,
+        xaxis=dict(zeroline=True, scaleanchor="y", scaleratio=1),
+        yaxis=dict(zeroline=True, scaleanchor="x", scaleratio=1)
+    )
+
+    return fig
+
+
 def show():
     st.markdown('<h2 class="module-header">🏗️ Modül 6: Statik ve Dönme Hareketi</h2>', unsafe_allow_html=True)
 
@@ -25,7 +168,7 @@ def show():
             theta = st.number_input("Açı θ (derece):", value=90.0, format="%.2f")
 
         theta_rad = np.radians(theta)
-        tau = r * F * np.sin(theta_rad)
+        tau = statics.torque(r, F, theta)
 
         st.success(f"**Tork:** τ = {tau:.2f} N·m")
 
@@ -143,131 +286,20 @@ def show():
                 force = st.number_input(f"Yük {i+1} kuvveti (N, aşağı):", value=500.0, format="%.2f", min_value=0.0, key=f"load_force_{i}")
             loads.append((pos, force))
 
-        # Kiriş ağırlığı (merkezde)
-        W_beam = m_beam * g
-        beam_center = L / 2
-
-        # Toplam aşağı kuvvet
-        total_down = W_beam + sum(f for _, f in loads)
-
         # Moment dengesi (A noktasına göre)
         # Σ τ_A = 0
         # R_B * (support_B - support_A) - W_beam * (beam_center - support_A) - Σ(load_i * (pos_i - support_A)) = 0
+        # Kuvvet dengesi: R_A = toplam aşağı kuvvet - R_B
 
         if abs(support_B - support_A) > 0.1:
-            moment_A = 0
-            moment_A -= W_beam * (beam_center - support_A)
-            for pos, force in loads:
-                moment_A -= force * (pos - support_A)
-
-            R_B = moment_A / (support_B - support_A)
-            R_B = -R_B  # İşaret düzeltmesi
-
-            # Kuvvet dengesi
-            R_A = total_down - R_B
+            R_A, R_B, W_beam, total_down = statics.beam_reactions(L, m_beam, g, support_A, support_B, loads)
 
             st.success(f"**Destek A tepki kuvveti:** R_A = {R_A:.2f} N")
             st.success(f"**Destek B tepki kuvveti:** R_B = {R_B:.2f} N")
             st.success(f"**Toplam aşağı kuvvet:** {total_down:.2f} N")
             st.success(f"**Kontrol (R_A + R_B):** {R_A + R_B:.2f} N {'✓' if abs(R_A + R_B - total_down) < 0.1 else '✗'}")
 
-            # Görselleştirme
-            fig = go.Figure()
-
-            # Kiriş
-            fig.add_trace(go.Scatter(
-                x=[0, L], y=[0, 0],
-                mode='lines',
-                name='Kiriş',
-                line=dict(color='brown', width=8)
-            ))
-
-            # Destekler
-            fig.add_trace(go.Scatter(
-                x=[support_A], y=[0],
-                mode='markers+text',
-                name='Destek A',
-                marker=dict(color='green', size=20, symbol='triangle-up'),
-                text=[f'A: {R_A:.0f}N'],
-                textposition='bottom center'
-            ))
-
-            fig.add_trace(go.Scatter(
-                x=[support_B], y=[0],
-                mode='markers+text',
-                name='Destek B',
-                marker=dict(color='blue', size=20, symbol='triangle-up'),
-                text=[f'B: {R_B:.0f}N'],
-                textposition='bottom center'
-            ))
-
-            # Kiriş ağırlığı
-            fig.add_annotation(
-                x=beam_center, y=-W_beam*0.001,
-                ax=beam_center, ay=0,
-                xref="x", yref="y",
-                axref="x", ayref="y",
-                showarrow=True,
-                arrowhead=2,
-                arrowsize=1,
-                arrowwidth=2,
-                arrowcolor="purple",
-                text=f"W_beam={W_beam:.0f}N"
-            )
-
-            # Nokta yükleri
-            for i, (pos, force) in enumerate(loads):
-                fig.add_annotation(
-                    x=pos, y=-force*0.001,
-                    ax=pos, ay=0,
-                    xref="x", yref="y",
-                    axref="x", ayref="y",
-                    showarrow=True,
-                    arrowhead=2,
-                    arrowsize=1,
-                    arrowwidth=3,
-                    arrowcolor="red",
-                    text=f"F{i+1}={force:.0f}N"
-                )
-
-            # Tepki kuvvetleri
-            scale = 0.001
-            fig.add_annotation(
-                x=support_A, y=R_A*scale,
-                ax=support_A, ay=0,
-                xref="x", yref="y",
-                axref="x", ayref="y",
-                showarrow=True,
-                arrowhead=2,
-                arrowsize=1,
-                arrowwidth=3,
-                arrowcolor="green"
-            )
-
-            fig.add_annotation(
-                x=support_B, y=R_B*scale,
-                ax=support_B, ay=0,
-                xref="x", yref="y",
-                axref="x", ayref="y",
-                showarrow=True,
-                arrowhead=2,
-                arrowsize=1,
-                arrowwidth=3,
-                arrowcolor="blue"
-            )
-
-            fig.update_layout(
-                title="Kiriş Statik Denge",
-                xaxis_title="Konum (m)",
-                yaxis_title="",
-                showlegend=True,
-                width=900,
-                height=400,
-                xaxis=dict(range=[-1, L+1]),
-                yaxis=dict(range=[-max(total_down*0.002, 1), max(total_down*0.002, 1)], showticklabels=False)
-            )
-
-            st.plotly_chart(fig)
+            st.plotly_chart(build_beam_figure(L, support_A, support_B, loads, R_A, R_B, W_beam, total_down))
 
         else:
             st.error("Destekler aynı noktada olamaz!")
@@ -302,49 +334,12 @@ def show():
                 masses.append((m, x, y))
 
             # Kütle merkezi
-            total_mass = sum(m for m, _, _ in masses)
-            x_cm = sum(m * x for m, x, _ in masses) / total_mass
-            y_cm = sum(m * y for m, _, y in masses) / total_mass
+            total_mass, x_cm, y_cm = statics.center_of_mass(*zip(*masses))
 
             st.success(f"**Toplam kütle:** M = {total_mass:.2f} kg")
             st.success(f"**Kütle merkezi:** (x_cm, y_cm) = ({x_cm:.3f}, {y_cm:.3f}) m")
 
-            # Görselleştirme
-            fig = go.Figure()
-
-            # Kütleler
-            for i, (m, x, y) in enumerate(masses):
-                fig.add_trace(go.Scatter(
-                    x=[x], y=[y],
-                    mode='markers+text',
-                    name=f'm{i+1}={m}kg',
-                    marker=dict(size=m*20, color=f'rgb({50+i*40},{100+i*30},{200-i*20})'),
-                    text=[f'm{i+1}'],
-                    textposition='top center'
-                ))
-
-            # Kütle merkezi
-            fig.add_trace(go.Scatter(
-                x=[x_cm], y=[y_cm],
-                mode='markers+text',
-                name='Kütle Merkezi',
-                marker=dict(color='red', size=25, symbol='star'),
-                text=['CM'],
-                textposition='bottom center'
-            ))
-
-            fig.update_layout(
-                title=f"Kütle Merkezi: ({x_cm:.2f}, {y_cm:.2f})",
-                xaxis_title="X (m)",
-                yaxis_title="Y (m)",
-                showlegend=True,
-                width=700,
-                height=600,
-                xaxis=dict(zeroline=True, scaleanchor="y", scaleratio=1),
-                yaxis=dict(zeroline=True, scaleanchor="x", scaleratio=1)
-            )
-
-            st.plotly_chart(fig)
+            st.plotly_chart(build_center_of_mass_figure(masses, x_cm, y_cm))
 
         else:  # Geometrik Şekiller
             st.write("L veya T şeklinde plakaların kütle merkezini hesaplayın:")
@@ -411,17 +406,8 @@ def show():
                     w2 = st.number_input("Genişlik (m):", value=2.0, format="%.2f", min_value=0.1, key="l_w2")
                     h2 = st.number_input("Yükseklik (m):", value=4.0, format="%.2f", min_value=0.1, key="l_h2")
 
-                # Alanlar (kütle orantılı)
-                A1 = w1 * h1
-                A2 = w2 * h2
-
-                # Her parçanın merkezi
-                x1, y1 = w1/2, h1/2
-                x2, y2 = w2/2, h1 + h2/2
-
-                # Toplam kütle merkezi
-                x_cm = (A1 * x1 + A2 * x2) / (A1 + A2)
-                y_cm = (A1 * y1 + A2 * y2) / (A1 + A2)
+                # Alanlar (kütle orantılı) ile her parçanın merkezinin ağırlıklı ortalaması
+                x_cm, y_cm = statics.l_shape_center(w1, h1, w2, h2)
 
                 st.success(f"**L şekli kütle merkezi:** ({x_cm:.3f}, {y_cm:.3f}) m")
 
@@ -502,7 +488,7 @@ def show():
                 with col2:
                     r = st.number_input("Dönme yarıçapı r (m):", value=2.0, format="%.2f", min_value=0.0, key="I_point_r")
 
-                I = m * r**2
+                I = statics.moment_of_inertia(shape, m, r)
                 st.success(f"**Eylemsizlik Momenti:** I = {I:.3f} kg·m²")
 
             elif shape == "Çubuk (merkez eksen)":
@@ -513,7 +499,7 @@ def show():
                 with col2:
                     L = st.number_input("Uzunluk L (m):", value=2.0, format="%.2f", min_value=0.01, key="I_rod_L")
 
-                I = (1/12) * m * L**2
+                I = statics.moment_of_inertia(shape, m, L)
                 st.success(f"**Eylemsizlik Momenti:** I = {I:.3f} kg·m²")
 
             elif shape == "Çubuk (uç eksen)":
@@ -524,7 +510,7 @@ def show():
                 with col2:
                     L = st.number_input("Uzunluk L (m):", value=2.0, format="%.2f", min_value=0.01, key="I_rod_end_L")
 
-                I = (1/3) * m * L**2
+                I = statics.moment_of_inertia(shape, m, L)
                 st.success(f"**Eylemsizlik Momenti:** I = {I:.3f} kg·m²")
 
             elif shape == "Disk/Silindir":
@@ -535,7 +521,7 @@ def show():
                 with col2:
                     R = st.number_input("Yarıçap R (m):", value=0.5, format="%.2f", min_value=0.01, key="I_disk_R")
 
-                I = 0.5 * m * R**2
+                I = statics.moment_of_inertia(shape, m, R)
                 st.success(f"**Eylemsizlik Momenti:** I = {I:.3f} kg·m²")
 
             elif shape == "Küre (katı)":
@@ -546,7 +532,7 @@ def show():
                 with col2:
                     R = st.number_input("Yarıçap R (m):", value=0.3, format="%.2f", min_value=0.01, key="I_sphere_R")
 
-                I = 0.4 * m * R**2
+                I = statics.moment_of_inertia(shape, m, R)
                 st.success(f"**Eylemsizlik Momenti:** I = {I:.3f} kg·m²")
 
             else:  # Halka
@@ -557,7 +543,7 @@ def show():
                 with col2:
                     R = st.number_input("Yarıçap R (m):", value=1.0, format="%.2f", min_value=0.01, key="I_ring_R")
 
-                I = m * R**2
+                I = statics.moment_of_inertia(shape, m, R)
                 st.success(f"**Eylemsizlik Momenti:** I = {I:.3f} kg·m²")
 
         elif alt_tab == "Dönme Dinamiği (τ = Iα)":
@@ -573,7 +559,7 @@ def show():
                 with col2:
                     I = st.number_input("Eylemsizlik Momenti I (kg·m²):", value=10.0, format="%.3f", min_value=0.01, key="rot_I")
 
-                alpha = tau / I
+                alpha = statics.angular_acceleration(tau, I)
                 st.success(f"**Açısal İvme:** α = {alpha:.3f} rad/s²")
 
             elif hesaplama == "Tork (τ)":
@@ -606,12 +592,12 @@ def show():
             with col2:
                 omega = st.number_input("Açısal Hız ω (rad/s):", value=10.0, format="%.3f", key="ke_rot_omega")
 
-            KE_rot = 0.5 * I * omega**2
+            KE_rot = statics.rotational_kinetic_energy(I, omega)
             st.success(f"**Dönme Kinetik Enerjisi:** KE_rot = {KE_rot:.3f} J")
 
             # Grafik
             omega_range = np.linspace(0, omega*2, 100)
-            KE_range = 0.5 * I * omega_range**2
+            KE_range = statics.rotational_kinetic_energy(I, omega_range)
 
             fig = go.Figure()
             fig.add_trace(go.Scatter(
@@ -3,10 +3,445 @@ import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from modules import plotting
+from physics import cache, kernels, oscillations, spectral
+
+# Simülasyon çözünürlüğü seçenekleri (grafik yükü seyreltme sayesinde sabit kalır)
+ORNEK_SAYILARI = [500, 5_000, 50_000, 500_000, 1_000_000]
+
+# Rezonans eğrisinde karşılaştırma için çizilen sönüm oranları ve frekans sayısı seçenekleri
+REZONANS_ZETA = (0.05, 0.1, 0.25, 0.5, 1.0)
+FREKANS_SAYILARI = [1_000, 5_000, 20_000, 100_000]
+
+# Welch PSD segment uzunluğu seçenekleri
+SEGMENT_UZUNLUKLARI = [256, 1024, 4096, 16384]
+HARMONIK_SAYISI = 5
+
+ZINCIR_SISTEMLERI = ["Yay-kütle zinciri", "Bağlaşık sarkaçlar"]
+# Uzay-zaman haritasındaki zaman örneği sayısı
+ZINCIR_KARE_SAYISI = 200
+
+
+@cache.cached(maxsize=32)
+def build_shm_figure(m, k, A, phi, t_sim, n=500):
+    """Yay-kütle sisteminin x, v, a ve enerji grafikleri (parametre başına önbellekli).
+
+    n örnekli seriler çizilmeden önce seyreltilir; büyük n'de izler WebGL'dir.
+    """
+    _, T, f, _, _, _ = oscillations.shm_params(m, k, A)
+
+    # Konum, hız, ivme ve enerji
+    t_array, (x_array, v_array, a_array, KE_array, PE_array) = oscillations.shm_series(m, k, A, phi, t_sim, n)
+
+    # Grafikler
+    fig = make_subplots(
+        rows=4, cols=1,
+        subplot_titles=("Konum x(t)", "Hız v(t)", "İvme a(t)", "Enerji"),
+        vertical_spacing=0.08,
+        row_heights=[0.25, 0.25, 0.25, 0.25]
+    )
+
+    # Konum
+    fig.add_trace(plotting.line_trace(
+        x=t_array, y=x_array,
+        mode='lines',
+        name='x(t)',
+        line=dict(color='blue', width=2)
+    ), row=1, col=1)
+
+    # Hız
+    fig.add_trace(plotting.line_trace(
+        x=t_array, y=v_array,
+        mode='lines',
+        name='v(t)',
+        line=dict(color='green', width=2)
+    ), row=2, col=1)
+
+    # İvme
+    fig.add_trace(plotting.line_trace(
+        x=t_array, y=a_array,
+        mode='lines',
+        name='a(t)',
+        line=dict(color='red', width=2)
+    ), row=3, col=1)
+
+    # Enerji
+    fig.add_trace(plotting.line_trace(
+        x=t_array, y=KE_array,
+        mode='lines',
+        name='KE (Kinetik)',
+        line=dict(color='orange', width=2)
+    ), row=4, col=1)
+
+    fig.add_trace(plotting.line_trace(
+        x=t_array, y=PE_array,
+        mode='lines',
+        name='PE (Potansiyel)',
+        line=dict(color='purple', width=2)
+    ), row=4, col=1)
+
+    fig.add_trace(plotting.line_trace(
+        x=t_array, y=KE_array + PE_array,
+        mode='lines',
+        name='Toplam Enerji',
+        line=dict(color='black', width=2, dash='dash')
+    ), row=4, col=1)
+
+    fig.update_xaxes(title_text="Zaman (s)", row=4, col=1)
+    fig.update_yaxes(title_text="x (m)", row=1, col=1)
+    fig.update_yaxes(title_text="v (m/s)", row=2, col=1)
+    fig.update_yaxes(title_text="a (m/s²)", row=3, col=1)
+    fig.update_yaxes(title_text="Enerji (J)", row=4, col=1)
+
+    fig.update_layout(height=1000, showlegend=True, title_text=f"Yay-Kütle Sistemi (T={T:.2f}s, f={f:.2f}Hz)")
+    return fig
+
+
+@cache.cached(maxsize=32)
+def build_driven_figure(m, k, c, F0, omega, x0, v0, t_sim, n=500):
+    """Sönümlü/zorlanmış sistemin geçici yanıtı: konum, hız, enerji ve güç (önbellekli ODE çözümü)."""
+    # scipy yalnızca zaman yanıtı istendiğinde yüklenir
+    from physics import driven
+
+    run = driven.driven_response(m, k, c, F0, omega, x0, v0, t_sim, n)
+
+    fig = make_subplots(
+        rows=4, cols=1,
+        subplot_titles=("Konum x(t)", "Hız v(t)", "Enerji", "Güç"),
+        vertical_spacing=0.08
+    )
+
+    fig.add_trace(plotting.line_trace(
+        x=run.t, y=run.x,
+        mode='lines',
+        name='x(t)',
+        line=dict(color='blue', width=2)
+    ), row=1, col=1)
+    fig.add_trace(plotting.line_trace(
+        x=run.t, y=run.x_steady,
+        mode='lines',
+        name='Kalıcı yanıt',
+        line=dict(color='gray', width=1, dash='dash')
+    ), row=1, col=1)
+
+    fig.add_trace(plotting.line_trace(
+        x=run.t, y=run.v,
+        mode='lines',
+        name='v(t)',
+        line=dict(color='green', width=2)
+    ), row=2, col=1)
+
+    fig.add_trace(plotting.line_trace(
+        x=run.t, y=run.KE,
+        mode='lines',
+        name='KE (Kinetik)',
+        line=dict(color='orange', width=2)
+    ), row=3, col=1)
+    fig.add_trace(plotting.line_trace(
+        x=run.t, y=run.PE,
+        mode='lines',
+        name='PE (Potansiyel)',
+        line=dict(color='purple', width=2)
+    ), row=3, col=1)
+    fig.add_trace(plotting.line_trace(
+        x=run.t, y=run.KE + run.PE,
+        mode='lines',
+        name='Mekanik Enerji',
+        line=dict(color='black', width=2, dash='dash')
+    ), row=3, col=1)
+
+    fig.add_trace(plotting.line_trace(
+        x=run.t, y=run.P_drive,
+        mode='lines',
+        name='Dış kuvvetin gücü F·v',
+        line=dict(color='red', width=2)
+    ), row=4, col=1)
+    fig.add_trace(plotting.line_trace(
+        x=run.t, y=run.P_loss,
+        mode='lines',
+        name='Sönüm kaybı c·v²',
+        line=dict(color='brown', width=2)
+    ), row=4, col=1)
+
+    fig.update_xaxes(title_text="Zaman (s)", row=4, col=1)
+    fig.update_yaxes(title_text="x (m)", row=1, col=1)
+    fig.update_yaxes(title_text="v (m/s)", row=2, col=1)
+    fig.update_yaxes(title_text="Enerji (J)", row=3, col=1)
+    fig.update_yaxes(title_text="Güç (W)", row=4, col=1)
+    fig.update_layout(height=1000, showlegend=True, title_text="Sönümlü ve Zorlanmış Salınım")
+    return fig
+
+
+@cache.cached(maxsize=32)
+def build_resonance_figure(m, k, c, F0, omega, n=5_000):
+    """Kalıcı genlik ve faz; seçilen sönüm ve karşılaştırma ζ değerleri tek vektörize çağrıda."""
+    omega0 = np.sqrt(k / m)
+    w = np.linspace(0.0, 3 * max(omega0, omega), n)
+    zeta = np.array(REZONANS_ZETA)[:, None]
+    reference = oscillations.steady_state(m, k, 2 * zeta * np.sqrt(k * m), F0, w)
+    selected = oscillations.steady_state(m, k, c, F0, w)
+    selected = selected._replace(amplitude=np.where(np.isfinite(selected.amplitude), selected.amplitude, np.nan))
+
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=("Genlik A(Ω)", "Faz farkı δ(Ω)"),
+        shared_xaxes=True,
+        vertical_spacing=0.1
+    )
+    for z, amp, ph in zip(REZONANS_ZETA, reference.amplitude, reference.phase):
+        fig.add_trace(plotting.line_trace(x=w, y=amp, mode='lines', name=f'ζ = {z}', legendgroup=f'{z}',
+                                          line=dict(width=1, dash='dot')), row=1, col=1)
+        fig.add_trace(plotting.line_trace(x=w, y=np.degrees(ph), mode='lines', legendgroup=f'{z}',
+                                          showlegend=False, line=dict(width=1, dash='dot')), row=2, col=1)
+
+    fig.add_trace(plotting.line_trace(x=w, y=selected.amplitude, mode='lines', name='Seçilen c',
+                                      legendgroup='secilen', line=dict(color='blue', width=3)), row=1, col=1)
+    fig.add_trace(plotting.line_trace(x=w, y=np.degrees(selected.phase), mode='lines', legendgroup='secilen',
+                                      showlegend=False, line=dict(color='blue', width=3)), row=2, col=1)
+
+    for row in (1, 2):
+        fig.add_vline(x=omega0, line=dict(color='green', width=1, dash='dash'), row=row, col=1)
+        fig.add_vline(x=omega, line=dict(color='red', width=1), row=row, col=1)
+
+    fig.update_xaxes(title_text="Sürücü açısal frekans Ω (rad/s)", row=2, col=1)
+    fig.update_yaxes(title_text="A (m)", type="log", row=1, col=1)
+    fig.update_yaxes(title_text="δ (derece)", range=[0, 180], row=2, col=1)
+    fig.update_layout(height=700, showlegend=True,
+                      title_text=f"Rezonans Eğrisi (ω₀ = {omega0:.3f} rad/s, yeşil; Ω kırmızı)")
+    return fig
+
+
+@cache.cached(maxsize=16)
+def build_spectrum_figure(t_array, y, etiket, pencere="hann", nperseg=1024):
+    """Serinin genlik spektrumu ve Welch PSD'si; (fig, harmonikler) döner.
+
+    Aynı uzunluktaki seriler spectral modülünün plan tamponlarını yeniden kullanır.
+    """
+    dt = float(t_array[1] - t_array[0])
+    spec = spectral.spectrum(y, dt, pencere)
+    psd = spectral.welch_psd(y, dt, nperseg, window_name=pencere)
+    peaks = spectral.harmonics(y, dt, HARMONIK_SAYISI, pencere)
+
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=(f"Genlik Spektrumu |{etiket}(f)|", f"Güç Spektral Yoğunluğu (Welch, {psd.segments} segment)"),
+        vertical_spacing=0.15
+    )
+    fig.add_trace(plotting.line_trace(
+        x=spec.f, y=spec.amplitude,
+        mode='lines',
+        name='Genlik',
+        line=dict(color='blue', width=1)
+    ), row=1, col=1)
+    fig.add_trace(go.Scatter(
+        x=[p.f for p in peaks], y=[p.amplitude for p in peaks],
+        mode='markers+text',
+        name='Harmonikler',
+        marker=dict(color='red', size=9, symbol='x'),
+        text=[f"{i}f₀" for i in range(1, len(peaks) + 1)],
+        textposition='top center'
+    ), row=1, col=1)
+    fig.add_trace(plotting.line_trace(
+        x=psd.f, y=psd.psd,
+        mode='lines',
+        name='PSD',
+        line=dict(color='purple', width=1)
+    ), row=2, col=1)
+
+    # Harmoniklerin görüneceği aralık
+    f_max = min(float(spec.f[-1]), (HARMONIK_SAYISI + 1) * peaks[0].f) if peaks else float(spec.f[-1])
+    for row in (1, 2):
+        fig.update_xaxes(title_text="Frekans (Hz)", range=[0, f_max], row=row, col=1)
+    fig.update_yaxes(title_text="Genlik", type="log", row=1, col=1)
+    fig.update_yaxes(title_text="birim²/Hz", type="log", row=2, col=1)
+    fig.update_layout(height=650, showlegend=False, title_text=f"Frekans Analizi: {etiket}")
+    return fig, peaks
+
+
+def spectrum_panel(key, seriler, T_beklenen=None):
+    """Seçilen zaman serisinin FFT/PSD görünümü; baskın frekanstan ölçülen periyodu beklenenle karşılaştırır.
+
+    seriler: (t_array, {etiket: dizi}) döndüren çağrılabilir; tüm diziler t_array ile eşit
+    aralıklı örneklenmiş olmalıdır. Seriler yalnızca spektrum kutusu işaretliyken hesaplanır.
+    """
+    if not st.checkbox("Frekans spektrumu (FFT / Welch PSD)", key=f"{key}_spectrum"):
+        return
+    t_array, seriler = seriler()
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        etiket = st.selectbox("Seri:", list(seriler), key=f"{key}_spectrum_series")
+    with col2:
+        pencere = st.selectbox("Pencere:", spectral.WINDOWS, key=f"{key}_spectrum_window")
+    with col3:
+        nperseg = st.select_slider("Welch segment uzunluğu:", options=SEGMENT_UZUNLUKLARI, value=1024,
+                                   key=f"{key}_spectrum_nperseg")
+
+    fig, peaks = build_spectrum_figure(t_array, seriler[etiket], etiket, pencere, nperseg)
+    if peaks:
+        f0 = peaks[0].f
+        st.success(f"**Baskın frekans:** f₀ = {f0:.5f} Hz → ölçülen periyot T = {1 / f0:.5f} s")
+        if T_beklenen is not None:
+            st.info(f"Beklenen periyot T = {T_beklenen:.5f} s (fark {100 * abs(1 / f0 - T_beklenen) / T_beklenen:.3f}%). "
+                    f"Frekans çözünürlüğü 1/t_sim = {1 / (t_array[-1] - t_array[0]):.4f} Hz; "
+                    "uzun simülasyonlar daha hassas ölçer.")
+        st.table({
+            "Harmonik": [f"{i}f₀" for i in range(1, len(peaks) + 1)],
+            "Frekans (Hz)": [f"{p.f:.5f}" for p in peaks],
+            "Genlik": [f"{p.amplitude:.4g}" for p in peaks],
+        })
+    st.plotly_chart(fig)
+
+
+def _chain_modes(sistem, N, m, m2, k, L, g, sabit_uc):
+    """Çift sıradaki kütleler m, tek sıradakiler m2 (m2 = m ise tek düze zincir)."""
+    # scipy yalnızca bağlaşık salınıcılar açıldığında yüklenir
+    from physics import chains
+
+    masses = np.where(np.arange(N) % 2 == 0, m, m2)
+    if sistem == ZINCIR_SISTEMLERI[0]:
+        return chains.spring_chain(masses, k, sabit_uc)
+    return chains.pendulum_chain(masses, L, g, k)
+
+
+@cache.cached(maxsize=16)
+def _chain_motion(sistem, N, m, m2, k, L, g, sabit_uc, kosul, indeks, genlik):
+    """Mod katsayıları, sayfanın skaler parametreleriyle önbelleğe alınır.
+
+    Zaman kaydırıcısının her hareketinde anahtar birkaç sayıdır; N×N mod
+    şekilleri matrisi yeniden özetlenmez.
+    """
+    from physics import chains
+
+    modes = _chain_modes(sistem, N, m, m2, k, L, g, sabit_uc)
+    x0, v0 = chains.initial_state(modes, kosul, genlik, indeks)
+    return chains.chain_motion(modes, x0, v0)
+
+
+@cache.cached(maxsize=16)
+def build_chain_figure(sistem, N, m, m2, k, L, g, sabit_uc, kosul, indeks, genlik, t_sim):
+    """Zincirin uzay-zaman haritası, mod frekansları ve modlara düşen enerji (önbellekli).
+
+    Mod ayrışımı bir kez yapılır; ZINCIR_KARE_SAYISI anın tümü tek matris
+    çarpımıyla modların üst üste binmesinden elde edilir.
+    """
+    motion = _chain_motion(sistem, N, m, m2, k, L, g, sabit_uc, kosul, indeks, genlik)
+    t_array = np.linspace(0, t_sim, ZINCIR_KARE_SAYISI)
+    X = motion(t_array)
+    mod_no = np.arange(1, N + 1)
+
+    fig = make_subplots(
+        rows=3, cols=1,
+        subplot_titles=("Yer değiştirme x_i(t)", "Mod frekansları ω_j", "Modlara düşen enerji"),
+        row_heights=[0.5, 0.25, 0.25],
+        vertical_spacing=0.1
+    )
+
+    fig.add_trace(go.Heatmap(
+        x=np.arange(1, N + 1), y=t_array, z=X,
+        colorscale='RdBu', zmid=0,
+        colorbar=dict(title="x (m)", len=0.45, y=0.78)
+    ), row=1, col=1)
+
+    fig.add_trace(go.Scatter(
+        x=mod_no, y=motion.modes.omega,
+        mode='lines+markers' if N <= 100 else 'lines',
+        name='ω_j',
+        line=dict(color='blue', width=2)
+    ), row=2, col=1)
+
+    fig.add_trace(go.Bar(
+        x=mod_no, y=motion.energy,
+        name='E_j',
+        marker_color='orange'
+    ), row=3, col=1)
+
+    fig.update_xaxes(title_text="Kütle sırası i", row=1, col=1)
+    fig.update_yaxes(title_text="Zaman (s)", row=1, col=1)
+    fig.update_xaxes(title_text="Mod j", row=2, col=1)
+    fig.update_yaxes(title_text="ω (rad/s)", row=2, col=1)
+    fig.update_xaxes(title_text="Mod j", row=3, col=1)
+    fig.update_yaxes(title_text="Enerji (J)", row=3, col=1)
+    fig.update_layout(height=1000, showlegend=False,
+                      title_text=f"{sistem} (N = {N}, toplam enerji {motion.energy.sum():.4g} J)")
+    return fig
+
+
+@cache.cached(maxsize=32)
+def build_pendulum_figure(L, g, m, theta_0, t_sim, n=500):
+    """Sarkacın açı, açısal hız ve enerji grafikleri (parametre başına önbellekli, seyreltilmiş)."""
+    T = oscillations.pendulum_params(L, g, theta_0).T
+
+    # Açı, açısal hız ve enerji (tam doğrusal olmayan çözüm)
+    t_array, state = oscillations.pendulum_series(L, g, m, theta_0, t_sim, n)
+    theta_array, theta_dot_array, KE_array, PE_array = state.theta, state.theta_dot, state.KE, state.PE
+
+    # Grafikler
+    fig = make_subplots(
+        rows=3, cols=1,
+        subplot_titles=("Açı θ(t)", "Açısal Hız θ'(t)", "Enerji"),
+        vertical_spacing=0.12,
+        row_heights=[0.33, 0.33, 0.34]
+    )
+
+    # Açı
+    fig.add_trace(plotting.line_trace(
+        x=t_array, y=np.degrees(theta_array),
+        mode='lines',
+        name='θ(t)',
+        line=dict(color='blue', width=2)
+    ), row=1, col=1)
+
+    # Karşılaştırma: küçük açı yaklaşımı θ₀·cos(√(g/L)·t)
+    fig.add_trace(plotting.line_trace(
+        x=t_array, y=np.degrees(theta_0 * np.cos(np.sqrt(g / L) * t_array)),
+        mode='lines',
+        name='Küçük açı yaklaşımı',
+        line=dict(color='gray', width=1, dash='dash')
+    ), row=1, col=1)
+
+    # Açısal hız
+    fig.add_trace(plotting.line_trace(
+        x=t_array, y=theta_dot_array,
+        mode='lines',
+        name="θ'(t)",
+        line=dict(color='green', width=2)
+    ), row=2, col=1)
+
+    # Enerji
+    fig.add_trace(plotting.line_trace(
+        x=t_array, y=KE_array,
+        mode='lines',
+        name='KE (Kinetik)',
+        line=dict(color='orange', width=2)
+    ), row=3, col=1)
+
+    fig.add_trace(plotting.line_trace(
+        x=t_array, y=PE_array,
+        mode='lines',
+        name='PE (Potansiyel)',
+        line=dict(color='purple', width=2)
+    ), row=3, col=1)
+
+    fig.add_trace(plotting.line_trace(
+        x=t_array, y=KE_array + PE_array,
+        mode='lines',
+        name='Toplam Enerji',
+        line=dict(color='black', width=2, dash='dash')
+    ), row=3, col=1)
+
+    fig.update_xaxes(title_text="Zaman (s)", row=3, col=1)
+    fig.update_yaxes(title_text="Açı (derece)", row=1, col=1)
+    fig.update_yaxes(title_text="Açısal Hız (rad/s)", row=2, col=1)
+    fig.update_yaxes(title_text="Enerji (J)", row=3, col=1)
+
+    fig.update_layout(height=800, showlegend=True, title_text=f"Basit Sarkaç (L={L}m, T={T:.2f}s)")
+    return fig
+
+
 def show():
     st.markdown('<h2 class="module-header">〰️ Modül 7: Salınımlar ve Dalgalar</h2>', unsafe_allow_html=True)
 
-    tab1, tab2 = st.tabs(["🔄 Yay-Kütle Sistemi", "⚖️ Basit Sarkaç"])
+    tab1, tab2, tab3 = st.tabs(["🔄 Yay-Kütle Sistemi", "⚖️ Basit Sarkaç", "🔗 Bağlaşık Salınıcılar"])
 
     # TAB 1: Yay-Kütle Sistemi
     with tab1:
@@ -35,16 +470,9 @@ def show():
             phi_deg = st.number_input("Faz açısı φ (derece):", value=0.0, format="%.2f")
 
         phi = np.radians(phi_deg)
-        omega = np.sqrt(k / m)
-        T = 2 * np.pi / omega
-        f = 1 / T
-
-        # Maksimum hız ve ivme
-        v_max = A * omega
-        a_max = A * omega**2
 
-        # Enerji
-        E_total = 0.5 * k * A**2
+        # Açısal frekans, periyot, maksimum hız/ivme ve toplam enerji
+        omega, T, f, v_max, a_max, E_total = oscillations.shm_params(m, k, A)
 
         st.success(f"**Açısal frekans:** ω = {omega:.3f} rad/s")
         st.success(f"**Periyot:** T = {T:.3f} s")
@@ -57,78 +485,17 @@ def show():
         st.write("**Simülasyon:**")
 
         t_sim = st.slider("Simülasyon süresi (saniye):", min_value=1.0, max_value=20.0, value=10.0, step=0.5)
+        n_ornek = st.select_slider("Örnek sayısı:", options=ORNEK_SAYILARI, value=500, key="shm_n",
+                                   help="Grafiğe seyreltilmiş olarak yalnızca birkaç bin nokta gönderilir.")
 
-        t_array = np.linspace(0, t_sim, 500)
-        x_array = A * np.cos(omega * t_array + phi)
-        v_array = -A * omega * np.sin(omega * t_array + phi)
-        a_array = -A * omega**2 * np.cos(omega * t_array + phi)
-
-        # Enerji hesaplamaları
-        KE_array = 0.5 * m * v_array**2
-        PE_array = 0.5 * k * x_array**2
-
-        # Grafikler
-        fig = make_subplots(
-            rows=4, cols=1,
-            subplot_titles=("Konum x(t)", "Hız v(t)", "İvme a(t)", "Enerji"),
-            vertical_spacing=0.08,
-            row_heights=[0.25, 0.25, 0.25, 0.25]
-        )
-
-        # Konum
-        fig.add_trace(go.Scatter(
-            x=t_array, y=x_array,
-            mode='lines',
-            name='x(t)',
-            line=dict(color='blue', width=2)
-        ), row=1, col=1)
-
-        # Hız
-        fig.add_trace(go.Scatter(
-            x=t_array, y=v_array,
-            mode='lines',
-            name='v(t)',
-            line=dict(color='green', width=2)
-        ), row=2, col=1)
-
-        # İvme
-        fig.add_trace(go.Scatter(
-            x=t_array, y=a_array,
-            mode='lines',
-            name='a(t)',
-            line=dict(color='red', width=2)
-        ), row=3, col=1)
-
-        # Enerji
-        fig.add_trace(go.Scatter(
-            x=t_array, y=KE_array,
-            mode='lines',
-            name='KE (Kinetik)',
-            line=dict(color='orange', width=2)
-        ), row=4, col=1)
-
-        fig.add_trace(go.Scatter(
-            x=t_array, y=PE_array,
-            mode='lines',
-            name='PE (Potansiyel)',
-            line=dict(color='purple', width=2)
-        ), row=4, col=1)
+        fig = build_shm_figure(m, k, A, phi, t_sim, n_ornek)
+        st.plotly_chart(fig)
 
-        fig.add_trace(go.Scatter(
-            x=t_array, y=KE_array + PE_array,
-            mode='lines',
-            name='Toplam Enerji',
-            line=dict(color='black', width=2, dash='dash')
-        ), row=4, col=1)
+        def shm_seriler():
+            t_array, durum = oscillations.shm_series(m, k, A, phi, t_sim, n_ornek)
+            return t_array, {"x": durum.x, "v": durum.v, "a": durum.a}
 
-        fig.update_xaxes(title_text="Zaman (s)", row=4, col=1)
-        fig.update_yaxes(title_text="x (m)", row=1, col=1)
-        fig.update_yaxes(title_text="v (m/s)", row=2, col=1)
-        fig.update_yaxes(title_text="a (m/s²)", row=3, col=1)
-        fig.update_yaxes(title_text="Enerji (J)", row=4, col=1)
-
-        fig.update_layout(height=1000, showlegend=True, title_text=f"Yay-Kütle Sistemi (T={T:.2f}s, f={f:.2f}Hz)")
-        st.plotly_chart(fig)
+        spectrum_panel("shm", shm_seriler, T)
 
         # Animasyon
         st.write("**Görsel Animasyon:**")
@@ -136,10 +503,7 @@ def show():
         # Belirli bir anı seç
         t_selected = st.slider("Zaman seçin (s):", min_value=0.0, max_value=t_sim, value=0.0, step=0.1)
 
-        x_t = A * np.cos(omega * t_selected + phi)
-        v_t = -A * omega * np.sin(omega * t_selected + phi)
-        KE_t = 0.5 * m * v_t**2
-        PE_t = 0.5 * k * x_t**2
+        x_t, v_t, _, KE_t, PE_t = oscillations.shm_state(m, k, A, phi, t_selected)
 
         # Yay gösterimi
         fig2 = make_subplots(
@@ -160,10 +524,7 @@ def show():
 
         # Yay (zigzag çizimi)
         n_coils = 10
-        spring_x = np.linspace(-0.4, x_t - 0.1, n_coils * 2)
-        spring_y = np.zeros(n_coils * 2)
-        for i in range(n_coils * 2):
-            spring_y[i] = 0.05 * ((-1) ** i)
+        spring_x, spring_y = kernels.zigzag(-0.4, x_t - 0.1, n_coils * 2, 0.05)
 
         fig2.add_trace(go.Scatter(
             x=spring_x, y=spring_y,
@@ -209,14 +570,62 @@ def show():
         fig2.update_layout(height=400, showlegend=False, title_text=f"Anlık Durum (x={x_t:.3f}m, v={v_t:.3f}m/s)")
         st.plotly_chart(fig2)
 
+        # Sönüm ve dış kuvvet: m·x'' + c·x' + k·x = F₀·cos(Ωt)
+        st.write("**Sönüm ve Dış Kuvvet:**")
+        if st.checkbox("Sönümlü / zorlanmış salınım ve rezonans eğrisi", key="shm_driven"):
+            st.latex(r"m\ddot{x} + c\dot{x} + kx = F_0 \cos(\Omega t)")
+            st.latex(r"A(\Omega) = \frac{F_0}{\sqrt{(k - m\Omega^2)^2 + (c\Omega)^2}}, \quad "
+                     r"\zeta = \frac{c}{2\sqrt{km}}")
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                c = st.number_input("Sönüm katsayısı c (kg/s):", value=1.0, format="%.3f", min_value=0.0,
+                                    key="driven_c")
+            with col2:
+                F0 = st.number_input("Kuvvet genliği F₀ (N):", value=5.0, format="%.2f", key="driven_F0")
+            with col3:
+                Omega = st.number_input("Sürücü açısal frekans Ω (rad/s):", value=float(round(0.9 * omega, 2)),
+                                        format="%.3f", min_value=0.0, key="driven_omega")
+
+            sonum = oscillations.damping_params(m, k, c)
+            st.success(f"**Sönüm oranı:** ζ = {sonum.zeta:.4f} ({sonum.regime}), Q = {sonum.Q:.2f}")
+            if sonum.regime == oscillations.UNDERDAMPED:
+                st.success(f"**Sönümlü açısal frekans:** ω_d = {sonum.omega_d:.4f} rad/s")
+            if np.isfinite(sonum.omega_r):
+                st.success(f"**Genlik rezonansı:** Ω_r = {sonum.omega_r:.4f} rad/s")
+            A_kalici, delta = oscillations.steady_state(m, k, c, F0, Omega)
+            if np.isfinite(A_kalici):
+                st.success(f"**Kalıcı genlik:** A = {A_kalici:.4f} m, faz farkı δ = {np.degrees(delta):.2f}°")
+            else:
+                st.warning("⚠️ Sönümsüz rezonans (c = 0, Ω = ω₀): kalıcı yanıt yok, genlik zamanla doğrusal büyür.")
+
+            gorunum = st.radio("Görünüm:", ["Zaman yanıtı", "Rezonans eğrisi"], horizontal=True, key="driven_mode")
+            if gorunum == "Zaman yanıtı":
+                # Başlangıç koşulu yukarıdaki A ve φ'den: x₀ = A·cos φ, v₀ = -Aω·sin φ
+                x0, v0 = oscillations.shm_state(m, k, A, phi, 0.0)[:2]
+                fig3 = build_driven_figure(m, k, c, F0, Omega, float(x0), float(v0), t_sim, n_ornek)
+                # Önbellekteki ODE çözümü; kalıcı yanıtta baskın frekans Ω/2π olmalıdır
+                def driven_seriler():
+                    from physics import driven
+
+                    run = driven.driven_response(m, k, c, F0, Omega, float(x0), float(v0), t_sim, n_ornek)
+                    return run.t, {"x": run.x, "v": run.v}
+
+                spectrum_panel("driven", driven_seriler, 2 * np.pi / Omega if Omega > 0 else None)
+            else:
+                n_frekans = st.select_slider("Frekans sayısı:", options=FREKANS_SAYILARI, value=5_000,
+                                             key="driven_nfreq")
+                fig3 = build_resonance_figure(m, k, c, F0, Omega, n_frekans)
+            st.plotly_chart(fig3)
+
     # TAB 2: Basit Sarkaç
     with tab2:
         st.subheader("⚖️ Basit Sarkaç")
 
-        st.write("**Basit Sarkaç (küçük açılar için):**")
-        st.latex(r"\theta(t) = \theta_0 \cos(\omega t + \phi)")
-        st.latex(r"\omega = \sqrt{\frac{g}{L}}")
-        st.latex(r"T = 2\pi\sqrt{\frac{L}{g}}")
+        st.write("**Basit Sarkaç (tam çözüm, her genlikte geçerli):**")
+        st.latex(r"\sin\frac{\theta(t)}{2} = k\,\mathrm{sn}\!\left(K(k) - \omega_0 t,\ k\right), \quad k = \sin\frac{\theta_0}{2}")
+        st.latex(r"\omega_0 = \sqrt{\frac{g}{L}}")
+        st.latex(r"T = 4K(k)\sqrt{\frac{L}{g}} \;\approx\; 2\pi\sqrt{\frac{L}{g}} \ (\text{küçük açılarda})")
 
         col1, col2 = st.columns(2)
 
@@ -225,112 +634,44 @@ def show():
             g = st.number_input("Yerçekimi g (m/s²):", value=9.81, format="%.2f", key="pendulum_g")
 
         with col2:
-            theta_0_deg = st.number_input("Başlangıç açısı θ₀ (derece):", value=15.0, format="%.2f", min_value=0.1, max_value=30.0)
+            theta_0_deg = st.number_input("Başlangıç açısı θ₀ (derece):", value=15.0, format="%.2f", min_value=0.1, max_value=179.0)
             m = st.number_input("Kütle m (kg):", value=1.0, format="%.2f", min_value=0.01, key="pendulum_m")
 
         theta_0 = np.radians(theta_0_deg)
-        omega = np.sqrt(g / L)
-        T = 2 * np.pi / L * np.sqrt(L / g)
-        f = 1 / T
+        omega, T, f = oscillations.pendulum_params(L, g, theta_0)
 
         st.success(f"**Açısal frekans:** ω = {omega:.3f} rad/s")
         st.success(f"**Periyot:** T = {T:.3f} s")
         st.success(f"**Frekans:** f = {f:.3f} Hz")
 
-        # Not
-        if theta_0_deg > 15:
-            st.warning("⚠️ Açı 15° üzerinde, küçük açı yaklaşımı hata verebilir.")
+        # Küçük açı yaklaşımıyla karşılaştırma
+        T_small = oscillations.pendulum_params(L, g).T
+        st.info(f"Küçük açı yaklaşımı T₀ = {T_small:.3f} s verir; tam periyot {100 * (T / T_small - 1):.2f}% daha uzun.")
 
         # Simülasyon
         st.write("**Simülasyon:**")
 
         t_sim = st.slider("Simülasyon süresi (saniye):", min_value=5.0, max_value=30.0, value=15.0, step=1.0, key="pendulum_sim")
+        n_ornek = st.select_slider("Örnek sayısı:", options=ORNEK_SAYILARI, value=500, key="pendulum_n",
+                                   help="Grafiğe seyreltilmiş olarak yalnızca birkaç bin nokta gönderilir.")
 
-        t_array = np.linspace(0, t_sim, 500)
-        theta_array = theta_0 * np.cos(omega * t_array)
-        theta_dot_array = -theta_0 * omega * np.sin(omega * t_array)
-
-        # Pozisyon (kartezyen)
-        x_array = L * np.sin(theta_array)
-        y_array = -L * np.cos(theta_array)
-
-        # Hız (çizgisel)
-        v_array = L * theta_dot_array
-
-        # Enerji
-        h_array = L * (1 - np.cos(theta_array))
-        PE_array = m * g * h_array
-        KE_array = 0.5 * m * v_array**2
-        E_total = m * g * L * (1 - np.cos(theta_0))
-
-        # Grafikler
-        fig = make_subplots(
-            rows=3, cols=1,
-            subplot_titles=("Açı θ(t)", "Açısal Hız θ'(t)", "Enerji"),
-            vertical_spacing=0.12,
-            row_heights=[0.33, 0.33, 0.34]
-        )
-
-        # Açı
-        fig.add_trace(go.Scatter(
-            x=t_array, y=np.degrees(theta_array),
-            mode='lines',
-            name='θ(t)',
-            line=dict(color='blue', width=2)
-        ), row=1, col=1)
-
-        # Açısal hız
-        fig.add_trace(go.Scatter(
-            x=t_array, y=theta_dot_array,
-            mode='lines',
-            name="θ'(t)",
-            line=dict(color='green', width=2)
-        ), row=2, col=1)
-
-        # Enerji
-        fig.add_trace(go.Scatter(
-            x=t_array, y=KE_array,
-            mode='lines',
-            name='KE (Kinetik)',
-            line=dict(color='orange', width=2)
-        ), row=3, col=1)
+        E_total = oscillations.pendulum_total_energy(m, g, L, theta_0)
 
-        fig.add_trace(go.Scatter(
-            x=t_array, y=PE_array,
-            mode='lines',
-            name='PE (Potansiyel)',
-            line=dict(color='purple', width=2)
-        ), row=3, col=1)
-
-        fig.add_trace(go.Scatter(
-            x=t_array, y=KE_array + PE_array,
-            mode='lines',
-            name='Toplam Enerji',
-            line=dict(color='black', width=2, dash='dash')
-        ), row=3, col=1)
+        fig = build_pendulum_figure(L, g, m, theta_0, t_sim, n_ornek)
+        st.plotly_chart(fig)
 
-        fig.update_xaxes(title_text="Zaman (s)", row=3, col=1)
-        fig.update_yaxes(title_text="Açı (derece)", row=1, col=1)
-        fig.update_yaxes(title_text="Açısal Hız (rad/s)", row=2, col=1)
-        fig.update_yaxes(title_text="Enerji (J)", row=3, col=1)
+        def sarkac_seriler():
+            t_array, durum = oscillations.pendulum_series(L, g, m, theta_0, t_sim, n_ornek)
+            return t_array, {"θ": durum.theta, "θ'": durum.theta_dot}
 
-        fig.update_layout(height=800, showlegend=True, title_text=f"Basit Sarkaç (L={L}m, T={T:.2f}s)")
-        st.plotly_chart(fig)
+        spectrum_panel("pendulum", sarkac_seriler, T)
 
         # Animasyon
         st.write("**Görsel Animasyon:**")
 
         t_selected = st.slider("Zaman seçin (s):", min_value=0.0, max_value=t_sim, value=0.0, step=0.1, key="pendulum_t")
 
-        theta_t = theta_0 * np.cos(omega * t_selected)
-        theta_dot_t = -theta_0 * omega * np.sin(omega * t_selected)
-        x_t = L * np.sin(theta_t)
-        y_t = -L * np.cos(theta_t)
-        v_t = L * theta_dot_t
-
-        h_t = L * (1 - np.cos(theta_t))
-        PE_t = m * g * h_t
-        KE_t = 0.5 * m * v_t**2
+        theta_t, theta_dot_t, x_t, y_t, v_t, KE_t, PE_t = oscillations.pendulum_state(L, g, m, theta_0, t_selected)
 
         # Sarkaç gösterimi
         fig2 = make_subplots(
@@ -407,6 +748,76 @@ def show():
         st.plotly_chart(fig2)
 
         st.info("""
-        **Not:** Bu simülasyon küçük açı yaklaşımı kullanır (sin θ ≈ θ).
-        Büyük açılar için gerçek sarkaç hareketi daha karmaşıktır ve periyot açıya bağlıdır.
+        **Not:** Bu simülasyon küçük açı yaklaşımı (sin θ ≈ θ) kullanmaz; hareket Jacobi eliptik
+        fonksiyonlarıyla tam olarak hesaplanır. Periyot genlikle artar ve θ₀ → 180°'de sınırsız büyür.
         """)
+
+    # TAB 3: Bağlaşık Salınıcılar
+    with tab3:
+        st.subheader("🔗 Bağlaşık Salınıcılar (Normal Modlar)")
+
+        st.write("N kütle komşularına yaylarla bağlıdır; hareket normal modların üst üste binmesidir:")
+        st.latex(r"M\ddot{x} + Kx = 0 \quad\Rightarrow\quad x(t) = \sum_j \phi_j \left(q_j \cos\omega_j t + "
+                 r"\frac{\dot{q}_j}{\omega_j} \sin\omega_j t\right)")
+
+        if st.checkbox("Zinciri normal modlarına ayır ve simüle et", key="chain_modes"):
+            sistem = st.radio("Sistem:", ZINCIR_SISTEMLERI, horizontal=True, key="chain_system")
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                N = int(st.number_input("Kütle sayısı N:", value=50, min_value=2, max_value=1000, step=1,
+                                        key="chain_n"))
+                k = st.number_input("Bağlantı yayı k (N/m):", value=100.0 if sistem == ZINCIR_SISTEMLERI[0] else 2.0,
+                                    format="%.3f", min_value=0.001, key="chain_k")
+            with col2:
+                m = st.number_input("Kütle m (kg):", value=1.0, format="%.3f", min_value=0.001, key="chain_m")
+                m2 = st.number_input("Ara kütle m₂ (kg, tek sıradakiler):", value=1.0, format="%.3f",
+                                     min_value=0.001, key="chain_m2", help="m₂ ≠ m ise iki atomlu zincir.")
+            with col3:
+                if sistem == ZINCIR_SISTEMLERI[0]:
+                    sabit_uc = st.checkbox("Uçlar duvara bağlı", value=True, key="chain_fixed")
+                    L, g = 1.0, 9.81
+                else:
+                    sabit_uc = False
+                    L = st.number_input("Sarkaç boyu L (m):", value=1.0, format="%.2f", min_value=0.01,
+                                        key="chain_L")
+                    g = st.number_input("Yerçekimi g (m/s²):", value=9.81, format="%.2f", key="chain_g")
+
+            from physics import chains
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                kosul = st.selectbox("Başlangıç koşulu:", chains.INITIAL_KINDS, key="chain_initial")
+            with col2:
+                indeks = int(st.number_input("Kütle / mod sırası (1'den):", value=1, min_value=1, max_value=N,
+                                             step=1, key="chain_index")) - 1
+            with col3:
+                genlik = st.number_input("Genlik (m):", value=0.1, format="%.3f", key="chain_amp")
+
+            modes = _chain_modes(sistem, N, m, m2, k, L, g, sabit_uc)
+            st.success(f"**En düşük mod:** ω₁ = {modes.omega[0]:.4f} rad/s, "
+                       f"**en yüksek mod:** ω_N = {modes.omega[-1]:.4f} rad/s")
+
+            t_sim = st.slider("Simülasyon süresi (saniye):", min_value=1.0, max_value=100.0, value=20.0, step=1.0,
+                              key="chain_tsim")
+            fig = build_chain_figure(sistem, N, m, m2, k, L, g, sabit_uc, kosul, indeks, genlik, t_sim)
+            st.plotly_chart(fig)
+
+            # Zaman kaydırıcısı yalnızca önbellekteki mod katsayılarını kullanır (yeni özdeğer hesabı yok)
+            t_selected = st.slider("Zaman seçin (s):", min_value=0.0, max_value=t_sim, value=0.0, step=0.05,
+                                   key="chain_t")
+            motion = _chain_motion(sistem, N, m, m2, k, L, g, sabit_uc, kosul, indeks, genlik)
+            x_t = motion(t_selected)
+
+            fig2 = go.Figure()
+            fig2.add_trace(go.Scatter(
+                x=np.arange(1, N + 1), y=x_t,
+                mode='lines+markers' if N <= 100 else 'lines',
+                name='x_i',
+                line=dict(color='blue', width=2)
+            ))
+            y_max = 1.2 * max(abs(genlik), float(np.max(np.abs(x_t))))
+            fig2.update_xaxes(title_text="Kütle sırası i")
+            fig2.update_yaxes(title_text="Yer değiştirme (m)", range=[-y_max, y_max])
+            fig2.update_layout(height=350, title_text=f"Anlık Durum (t={t_selected:.2f}s)")
+            st.plotly_chart(fig2)
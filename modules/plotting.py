@@ -0,0 +1,159 @@
+"""Hafif çizim yardımcıları: uzun zaman serileri ve animasyonlar.
+
+Sunucu tarafında seyreltme (decimation) ile her ize yalnızca hedef piksel
+genişliği kadar nokta gönderilir; ham örnek sayısı eşiği aşınca iz WebGL
+tabanlı go.Scattergl olur. 10⁶ örnekli bir seri bile tarayıcıya birkaç bin
+noktayla ulaşır.
+
+Animasyon kareleri yalnızca değişen koordinatları taşır (`animate_x`,
+`animate_xy`). Doğrusal hareket eden aralıklardaki kareler gönderilmez:
+yalnızca hareketin yön veya hız değiştirdiği anahtar kareler kalır ve
+tarayıcı aradaki konumları doğrusal geçişle (transition) kendisi çizer.
+"""
+import numpy as np
+import plotly.graph_objects as go
+
+# Bu sayıdan fazla ham örnekte go.Scattergl kullanılır
+GL_THRESHOLD = 5000
+
+# Hedef grafik genişliği (piksel); min/max seyreltmede piksel başına 2 nokta
+TARGET_WIDTH_PX = 1200
+
+
+def minmax_decimate(x: np.ndarray, y: np.ndarray, n_buckets: int):
+    """Her kovadan en küçük ve en büyük noktayı tutar (tepe/çukurlar korunur).
+
+    Tamamen vektörizedir; çıktı en fazla 2·n_buckets + 2 nokta içerir.
+    """
+    n = len(y)
+    if n <= 2 * n_buckets + 2:
+        return x, y
+    size = (n - 2) // n_buckets
+    body = y[1:1 + size * n_buckets].reshape(n_buckets, size)
+    offsets = 1 + np.arange(n_buckets) * size
+    lo = offsets + np.argmin(body, axis=1)
+    hi = offsets + np.argmax(body, axis=1)
+    # Kova içinde zaman sırası korunur
+    pairs = np.sort(np.column_stack([lo, hi]), axis=1).ravel()
+    tail = np.arange(1 + size * n_buckets, n)
+    if len(tail) > 1:
+        tail = np.array([tail[np.argmin(y[tail])], tail[np.argmax(y[tail])]])
+        tail.sort()
+    idx = np.concatenate(([0], pairs, tail, [n - 1]))
+    idx = idx[np.r_[True, np.diff(idx) > 0]]
+    return x[idx], y[idx]
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int):
+    """Largest-Triangle-Three-Buckets: görsel şekli en iyi koruyan n_out nokta."""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return x, y
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    idx = np.empty(n_out, dtype=int)
+    idx[0], idx[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        # Bir sonraki kovanın ortalaması üçgenin üçüncü köşesi
+        nxt_stop = edges[i + 2] if i + 2 < len(edges) else n
+        ax, ay = x[prev], y[prev]
+        cx = x[stop:nxt_stop].mean()
+        cy = y[stop:nxt_stop].mean()
+        area = np.abs((ax - cx) * (y[start:stop] - ay) - (ax - x[start:stop]) * (cy - ay))
+        prev = start + int(np.argmax(area))
+        idx[i + 1] = prev
+    return x[idx], y[idx]
+
+
+def decimate(x, y, max_points: int = 2 * TARGET_WIDTH_PX, method: str = "minmax"):
+    """Seriyi en fazla yaklaşık max_points noktaya indirger ("minmax" veya "lttb")."""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(y) <= max_points:
+        return x, y
+    if method == "lttb":
+        return lttb(x, y, max_points)
+    return minmax_decimate(x, y, max_points // 2)
+
+
+def keyframes(positions: np.ndarray, tol: float) -> np.ndarray:
+    """Aradaki karelerin doğrusal aradeğerlemeden en fazla tol saptığı kare indisleri.
+
+    positions: (kare sayısı, ...) dizi. İlk ve son kare her zaman tutulur;
+    her bölüm, içindeki tüm kareler (tüm iz ve noktalarda) iki uç karenin
+    doğrusal aradeğerlemesine tol içinde uyduğu sürece uzatılır.
+    """
+    n = len(positions)
+    flat = positions.reshape(n, -1)
+    keep = [0]
+    start = 0
+    while start < n - 1:
+        end = start + 1
+        while end + 1 < n:
+            span = flat[start:end + 2]  # start..end+1 kareleri
+            w = np.linspace(0.0, 1.0, len(span))[1:-1, None]
+            line = (1 - w) * span[0] + w * span[-1]
+            if np.abs(span[1:-1] - line).max() > tol:
+                break
+            end += 1
+        keep.append(end)
+        start = end
+    return np.array(keep)
+
+
+def animate_x(fig: go.Figure, positions, frame_duration: int = 20, decimals: int = 3) -> go.Figure:
+    """fig'in ilk len(positions) izini kare kare x ekseninde hareket ettirir.
+
+    positions: (iz sayısı, kare sayısı) veya iz başına birden çok nokta için
+    (iz sayısı, kare sayısı, nokta sayısı) dizi. Karelerde yalnızca
+    yuvarlanmış x konumları taşınır; işaret, renk, metin gibi stiller izlerde
+    bir kez gönderilir. Doğrusal aralıklar tek geçişle oynatılır (keyframes).
+    """
+    positions = np.round(np.asarray(positions, dtype=float), decimals) + 0.0  # -0.0 -> 0.0
+    if positions.ndim == 2:
+        positions = positions[:, :, None]
+    frames = positions.transpose(1, 0, 2)
+    keep = keyframes(frames, 1.001 * 10.0**-decimals)
+    traces = list(range(len(positions)))
+    fig.frames = [go.Frame(data=[{"x": x} for x in frame], traces=traces) for frame in frames[keep].tolist()]
+    return _play_button(fig, frame_duration, keep)
+
+
+def animate_xy(fig: go.Figure, positions, frame_duration: int = 50, decimals: int = 3) -> go.Figure:
+    """fig'in izlerini kare kare düzlemde hareket ettirir.
+
+    positions: (iz sayısı, kare sayısı, nokta sayısı, 2) dizi; karelerde
+    yalnızca yuvarlanmış x ve y konumları taşınır.
+    """
+    positions = np.round(np.asarray(positions, dtype=float), decimals) + 0.0
+    frames = positions.transpose(1, 0, 2, 3)
+    keep = keyframes(frames, 1.001 * 10.0**-decimals)
+    traces = list(range(len(positions)))
+    fig.frames = [go.Frame(data=[{"x": xy[:, 0].tolist(), "y": xy[:, 1].tolist()} for xy in frame], traces=traces)
+                  for frame in frames[keep]]
+    return _play_button(fig, frame_duration, keep)
+
+
+def _play_button(fig: go.Figure, frame_duration: int, keep: np.ndarray) -> go.Figure:
+    # Her anahtar kare, atlanan kare sayısı kadar süren doğrusal bir geçişle oynatılır
+    durations = (np.diff(keep, prepend=0) * frame_duration).tolist()
+    if all(d == frame_duration for d in durations[1:]):  # Hiç kare atlanmadı
+        frame = {"duration": frame_duration, "redraw": False}
+        transition = {"duration": 0}
+    else:
+        frame = [{"duration": d, "redraw": False} for d in durations]
+        transition = [{"duration": d, "easing": "linear"} for d in durations]
+    fig.update_layout(updatemenus=[dict(
+        type="buttons",
+        buttons=[dict(label="▶ Oynat", method="animate", args=[None, {"frame": frame, "transition": transition}])]
+    )])
+    return fig
+
+
+def line_trace(x, y, max_points: int = 2 * TARGET_WIDTH_PX, method: str = "minmax", **kwargs):
+    """Seyreltilmiş çizgi izi; ham örnek sayısı GL_THRESHOLD'u aşarsa go.Scattergl."""
+    n_raw = len(y)
+    x, y = decimate(x, y, max_points, method)
+    trace_type = go.Scattergl if n_raw > GL_THRESHOLD else go.Scatter
+    return trace_type(x=x, y=y, mode=kwargs.pop("mode", "lines"), **kwargs)
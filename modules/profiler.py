@@ -0,0 +1,239 @@
+"""Sayfa yeniden çalıştırmalarının isteğe bağlı zaman profili.
+
+FIZIKSIM_PROFILE=1 ile açılır. Seçili sayfanın show() çağrısı süresince
+geçen zaman dört kaleme ayrılır:
+
+* hesap: physics paketindeki açık (alt çizgisiz) fonksiyonlar ve sınıf metotları
+* şekil: go.* nesnelerinin kurulması ve go.Figure'ın add_*/update_* metotları
+* grafik gönderimi: st.plotly_chart (şeklin JSON'a çevrilip oturuma yazılması)
+* diğer: streamlit bileşenleri ve sayfanın kendi Python kodu
+
+Kalemler iç içe geçtiğinde süre en içteki kaleme yazılır (ör. bir
+build_*_figure içindeki physics çağrısı hesap, go.Scatter kurulumu şekil
+sayılır). Ölçüm noktaları ilk profilde bir kez yerleştirilir; profil
+dışındaki çağrılarda (başka oturumlar dahil) yalnızca bir iş parçacığı
+yerel değişkeni okunur. Sayfanın çalışırken ilk kez içe aktardığı physics
+alt modülleri bir sonraki yeniden çalıştırmadan itibaren ölçülür.
+
+FIZIKSIM_PROFILE_DUMP=N ayrıca her yeniden çalıştırmayı cProfile ile
+kaydeder; son N .prof dosyası FIZIKSIM_PROFILE_DIR (varsayılan: geçici
+dizinde fiziksim-profil) altında tutulur. Başka bir profil aracı etkinken
+(Python 3.12+ süreç başına tek araca izin verir) o yeniden çalıştırmanın
+.prof dosyası atlanır, kalem süreleri yine ölçülür:
+
+    python -m pstats /tmp/fiziksim-profil/<dosya>.prof
+"""
+import cProfile
+import functools
+import glob
+import inspect
+import io
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+# Açma anahtarları
+PROFILE_ENV = "FIZIKSIM_PROFILE"
+DUMP_ENV = "FIZIKSIM_PROFILE_DUMP"
+DUMP_DIR_ENV = "FIZIKSIM_PROFILE_DIR"
+
+COMPUTE, FIGURE, CHART, OTHER = "hesap", "şekil", "grafik gönderimi", "diğer"
+CATEGORIES = (COMPUTE, FIGURE, CHART, OTHER)
+
+# Kenar çubuğunda tutulan yeniden çalıştırma sayısı
+HISTORY = 10
+# cProfile özetinde gösterilen fonksiyon sayısı
+TOP_FUNCTIONS = 15
+
+# Ölçülmeyen physics alt modülleri (altyapı)
+SKIP_MODULES = ("physics.cache", "physics.cli", "physics.service")
+
+
+class Rerun(NamedTuple):
+    page: str
+    total_ms: float
+    spans: Dict[str, float]  # Kalem -> ms (toplamları total_ms'dir)
+    calls: Dict[str, int]  # Kalem -> ölçülen çağrı sayısı
+    dump: Optional[str]  # .prof dosyası (cProfile kapalıysa None)
+    top: str  # cProfile özeti (kümülatif süreye göre)
+
+
+class _Recorder:
+    """Kalemlerin dışlayıcı (iç içe geçmeyen) sürelerini toplar."""
+
+    def __init__(self):
+        self.totals = dict.fromkeys(CATEGORIES, 0.0)
+        self.calls = dict.fromkeys(CATEGORIES, 0)
+        self.stack = [[OTHER, time.perf_counter()]]
+
+    def enter(self, category: str) -> None:
+        now = time.perf_counter()
+        top = self.stack[-1]
+        self.totals[top[0]] += now - top[1]
+        self.stack.append([category, now])
+        self.calls[category] += 1
+
+    def exit(self) -> None:
+        now = time.perf_counter()
+        category, start = self.stack.pop()
+        self.totals[category] += now - start
+        self.stack[-1][1] = now
+
+    def close(self) -> None:
+        while len(self.stack) > 1:
+            self.exit()
+        category, start = self.stack.pop()
+        self.totals[category] += time.perf_counter() - start
+
+
+_local = threading.local()
+_lock = threading.Lock()
+_patched_modules = set()
+_base_patched = False
+_sequence = 0
+
+
+def enabled() -> bool:
+    return os.environ.get(PROFILE_ENV, "").lower() in ("1", "true", "yes")
+
+
+def dump_count() -> int:
+    try:
+        return max(int(os.environ.get(DUMP_ENV, "0")), 0)
+    except ValueError:
+        return 0
+
+
+def dump_dir() -> str:
+    return os.environ.get(DUMP_DIR_ENV) or os.path.join(tempfile.gettempdir(), "fiziksim-profil")
+
+
+def _wrap(func: Callable, category: str) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        recorder = getattr(_local, "recorder", None)
+        if recorder is None or recorder.stack[-1][0] == category:
+            return func(*args, **kwargs)
+        recorder.enter(category)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            recorder.exit()
+
+    wrapper._profiled = True
+    return wrapper
+
+
+def _patch(owner, name: str, category: str) -> None:
+    func = getattr(owner, name)
+    if callable(func) and not getattr(func, "_profiled", False):
+        setattr(owner, name, _wrap(func, category))
+
+
+def _instrument_base() -> None:
+    """plotly ve streamlit ölçüm noktaları (süreç başına bir kez)."""
+    import plotly.graph_objects as go
+    import streamlit as st
+    from plotly.basedatatypes import BaseFigure, BasePlotlyType
+    from streamlit.elements.plotly_chart import PlotlyMixin
+
+    for name in go.__all__:
+        cls = getattr(go, name)
+        if isinstance(cls, type) and issubclass(cls, (BasePlotlyType, BaseFigure)) and "__init__" in cls.__dict__:
+            _patch(cls, "__init__", FIGURE)
+    for name in dir(go.Figure):
+        if name.startswith(("add_", "update_", "set_subplots")):
+            _patch(go.Figure, name, FIGURE)
+
+    _patch(PlotlyMixin, "plotly_chart", CHART)
+    _patch(st, "plotly_chart", CHART)  # st.plotly_chart içe aktarmada bağlanmış bir metottur
+
+
+def _instrument_physics() -> None:
+    """Yüklü physics alt modüllerinin açık fonksiyonları ve sınıf metotları."""
+    for name, module in list(sys.modules.items()):
+        if not name.startswith("physics.") or name in _patched_modules or name in SKIP_MODULES:
+            continue
+        for attr, value in list(vars(module).items()):
+            if attr.startswith("_") or getattr(value, "__module__", None) != name:
+                continue
+            if inspect.isfunction(value):
+                _patch(module, attr, COMPUTE)
+            elif isinstance(value, type):
+                for method, func in list(vars(value).items()):
+                    if inspect.isfunction(func) and (not method.startswith("_") or method == "__call__"):
+                        _patch(value, method, COMPUTE)
+        _patched_modules.add(name)
+
+
+def instrument() -> None:
+    global _base_patched
+    with _lock:
+        if not _base_patched:
+            _instrument_base()
+            _base_patched = True
+        _instrument_physics()
+
+
+def _dump(profile: cProfile.Profile, page: str, keep: int) -> Optional[str]:
+    global _sequence
+    directory = dump_dir()
+    os.makedirs(directory, exist_ok=True)
+    with _lock:
+        _sequence += 1
+        path = os.path.join(directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{_sequence:05d}-{page}.prof")
+    profile.dump_stats(path)
+    for old in sorted(glob.glob(os.path.join(directory, "*.prof")), key=os.path.getmtime)[:-keep]:
+        try:
+            os.remove(old)
+        except OSError:
+            pass  # Başka bir oturum silmiş olabilir
+    return path
+
+
+def run(page: str, show: Callable[[], None]) -> Rerun:
+    """show()'u ölçerek çalıştırır; sayfanın istisnaları (st.stop dahil) yeniden fırlatılır."""
+    instrument()
+    keep = dump_count()
+    profile = cProfile.Profile() if keep else None
+    recorder = _local.recorder = _Recorder()
+    start = time.perf_counter()
+    try:
+        if profile is not None:
+            try:
+                profile.enable()
+            except ValueError:
+                # Python 3.12+: süreçte aynı anda tek profil aracı etkin olabilir (ör. başka bir
+                # oturumun cProfile'ı); bu yeniden çalıştırma cProfile'sız ölçülür
+                profile = None
+        try:
+            show()
+        finally:
+            if profile is not None:
+                profile.disable()
+    finally:
+        total_ms = (time.perf_counter() - start) * 1000
+        recorder.close()
+        _local.recorder = None
+
+    dump, top = None, ""
+    if profile is not None:
+        dump = _dump(profile, page, keep)
+        out = io.StringIO()
+        pstats.Stats(profile, stream=out).strip_dirs().sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        top = out.getvalue()
+    spans = {category: seconds * 1000 for category, seconds in recorder.totals.items()}
+    return Rerun(page, total_ms, spans, dict(recorder.calls), dump, top)
+
+
+def summary_rows(history: List[Rerun]) -> Dict[str, list]:
+    """Kenar çubuğu tablosu için sütunlar (en yeni yeniden çalıştırma en üstte)."""
+    rows = list(reversed(history))
+    table = {"Sayfa": [r.page for r in rows], "Toplam": [f"{r.total_ms:.0f} ms" for r in rows]}
+    for category in CATEGORIES:
+        table[category] = [f"{r.spans[category]:.0f}" for r in rows]
+    return table
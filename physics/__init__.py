@@ -0,0 +1,38 @@
+# Fizik Hesaplama Çekirdeği
+#
+# Streamlit'ten bağımsız, saf NumPy hesaplama fonksiyonları. modules/ altındaki
+# sayfalar bu fonksiyonları çağırır; aynı motorlar toplu işlerden ve
+# ölçümlerden de doğrudan kullanılabilir. Tüm fonksiyonlar skaler veya NumPy
+# dizisi kabul eder.
+#
+# Alt modüller ilk erişimde yüklenir; `import physics` tek başına NumPy'yi
+# bile içe aktarmaz.
+import importlib
+
+__all__ = [
+    "units",
+    "vectors",
+    "kinematics",
+    "dynamics",
+    "energy",
+    "momentum",
+    "statics",
+    "oscillations",
+    "cache",
+    "ballistics",
+    "collisions",
+    "disks",
+    "kernels",
+    "incline",
+    "pulleys",
+    "coaster",
+    "driven",
+    "chains",
+    "spectral",
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f"physics.{name}")
+    raise AttributeError(f"module 'physics' has no attribute {name!r}")
@@ -0,0 +1,5 @@
+import sys
+
+from physics.cli import main
+
+sys.exit(main())
@@ -0,0 +1,221 @@
+"""Hava dirençli eğik atış: karesel sürüklenme, rüzgâr ve yüksekliğe bağlı g.
+
+Hareket denklemi, rüzgâra göre bağıl hız v_r = (vx - w, vy) ile
+
+    a = -k·|v_r|·v_r - g(y)·ŷ,    k = ½·ρ·C_d·A / m  [1/m]
+
+olarak uyarlanabilir adımlı bir integratörle (scipy solve_ivp) çözülür. Yere
+çarpma ve tepe noktası olay (event) olarak tam zamanında bulunur; sürekli
+(dense) çözüm sayesinde grafikler sabit örnek sayısına bağlı değildir.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+from scipy.integrate import solve_ivp
+from scipy.optimize import brentq
+
+from physics.cache import cached
+from physics.kinematics import LaunchSolutions, ProjectileGrid
+
+AIR_DENSITY = 1.225  # kg/m³, deniz seviyesi
+EARTH_RADIUS = 6.371e6  # m
+
+# Varsayılan bağıl/mutlak tolerans: grafik ve sonuç kartları için yeterli, tek çözüm < 5 ms
+RTOL = 1e-6
+ATOL = 1e-6
+
+
+def drag_constant(m: float, Cd: float, area: float, rho: float = AIR_DENSITY) -> float:
+    """k = ½·ρ·C_d·A / m (1/m); k = 0 boşluktaki atıştır."""
+    return 0.5 * rho * Cd * area / m
+
+
+class Trajectory(NamedTuple):
+    t_flight: float
+    range_x: float
+    max_height: float
+    t_apex: float
+    x_apex: float
+    impact_speed: float
+    impact_angle_deg: float
+    sol: object  # scipy OdeSolution: sol(t) -> [x, y, vx, vy]
+
+    def sample(self, n: Optional[int] = None, per_step: int = 16):
+        """(t, x, y, vx, vy) örnekleri.
+
+        n verilirse eşit aralıklı n örnek; verilmezse integratörün her adımı
+        per_step parçaya bölünür, böylece çözünürlük adım boyunu izler.
+        """
+        if n is not None:
+            t = np.linspace(0, self.t_flight, n)
+        else:
+            knots = np.append(self.sol.ts[self.sol.ts < self.t_flight], self.t_flight)
+            frac = np.arange(per_step) / per_step
+            t = np.append((knots[:-1, None] + np.diff(knots)[:, None] * frac).ravel(), self.t_flight)
+        x, y, vx, vy = self.sol(t)
+        return t, x, y, vx, vy
+
+
+def _rhs_factory(k: float, wind: float, g: float, variable_g: bool):
+    R = EARTH_RADIUS
+    sqrt = math.sqrt
+
+    if variable_g:
+        def rhs(t, s):
+            _, y, vx, vy = s
+            rx = vx - wind
+            speed = sqrt(rx * rx + vy * vy)
+            gy = g * (R / (R + y)) ** 2
+            return (vx, vy, -k * speed * rx, -k * speed * vy - gy)
+    else:
+        def rhs(t, s):
+            _, _, vx, vy = s
+            rx = vx - wind
+            speed = sqrt(rx * rx + vy * vy)
+            return (vx, vy, -k * speed * rx, -k * speed * vy - g)
+    return rhs
+
+
+def _ground(t, s):
+    return s[1]
+
+
+_ground.terminal = True
+_ground.direction = -1
+
+
+def _apex(t, s):
+    return s[3]
+
+
+_apex.direction = -1
+
+
+@cached(maxsize=256)
+def solve_trajectory(v0: float, angle_deg: float, h0: float = 0.0, g: float = 9.81, k: float = 0.0,
+                     wind: float = 0.0, variable_g: bool = False,
+                     rtol: float = RTOL, atol: float = ATOL) -> Trajectory:
+    """Atışı yere çarpana kadar integre eder.
+
+    k: sürüklenme sabiti (drag_constant), wind: yatay rüzgâr hızı (m/s, +x
+    yönünde), variable_g: g(y) = g·(R/(R+y))². Cisim yere ulaşmazsa
+    (örn. h0 < 0) uçuş değerleri NaN olur.
+    """
+    angle = math.radians(angle_deg)
+    vx0, vy0 = v0 * math.cos(angle), v0 * math.sin(angle)
+
+    # Üst zaman sınırı: boşluktaki uçuş süresi + limit hızla en yüksek noktadan düşüş süresi
+    t_vacuum = (vy0 + math.sqrt(max(vy0 * vy0 + 2 * g * h0, 0.0))) / g
+    h_top = h0 + max(vy0, 0.0) ** 2 / (2 * g)
+    v_terminal = math.sqrt(g / k) if k > 0 else math.inf
+    t_end = 2 * t_vacuum + h_top / v_terminal + 1.0
+
+    result = solve_ivp(
+        _rhs_factory(k, wind, g, variable_g), (0.0, t_end), (0.0, h0, vx0, vy0),
+        method="RK45", rtol=rtol, atol=atol, events=(_ground, _apex), dense_output=True,
+    )
+
+    ground_t, apex_t = result.t_events
+    ground_s, apex_s = result.y_events
+    if len(apex_t):
+        t_apex, x_apex, max_height = apex_t[0], apex_s[0][0], apex_s[0][1]
+    else:  # Aşağı doğru atış: tepe noktası başlangıçtır
+        t_apex, x_apex, max_height = 0.0, 0.0, h0
+
+    if len(ground_t):
+        x, _, vx, vy = ground_s[0]
+        t_flight, range_x = ground_t[0], x
+        impact_speed = math.hypot(vx, vy)
+        impact_angle = math.degrees(math.atan2(-vy, vx))
+    else:
+        t_flight = range_x = impact_speed = impact_angle = math.nan
+
+    return Trajectory(t_flight, range_x, max_height, t_apex, x_apex, impact_speed, impact_angle, result.sol)
+
+
+# Izgara taraması: bu sayıdan az nokta süreç havuzu kurmadan aynı süreçte çözülür
+SERIAL_THRESHOLD = 256
+
+
+def _solve_chunk(args):
+    points, g, k, wind, variable_g = args
+    out = np.empty((len(points), 3))
+    for i, (angle, v0, h0) in enumerate(points):
+        # Önbelleği atla: ızgara noktaları tekrar kullanılmaz
+        traj = solve_trajectory.__wrapped__(v0, angle, h0, g, k, wind, variable_g)
+        out[i] = traj.range_x, traj.max_height, traj.t_flight
+    return out
+
+
+@cached(maxsize=8)
+def trajectory_grid(angles_deg: ArrayLike, speeds: ArrayLike, heights: ArrayLike, g: float, k: float,
+                    wind: float = 0.0, variable_g: bool = False, workers: Optional[int] = None) -> ProjectileGrid:
+    """Hava dirençli atışı (açı × v₀ × h₀) ızgarasında çözer.
+
+    Noktalar parçalara bölünüp ProcessPoolExecutor ile çekirdeklere dağıtılır;
+    workers=1 veya küçük ızgaralar aynı süreçte çözülür. Sonuç,
+    kinematics.projectile_grid ile aynı ProjectileGrid yapısındadır.
+    """
+    angles_deg, speeds, heights = (np.atleast_1d(np.asarray(a, dtype=float)) for a in (angles_deg, speeds, heights))
+    shape = (angles_deg.size, speeds.size, heights.size)
+    A, V, H = np.meshgrid(angles_deg, speeds, heights, indexing="ij")
+    points = np.column_stack([A.ravel(), V.ravel(), H.ravel()]).tolist()
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(points) < SERIAL_THRESHOLD:
+        results = _solve_chunk((points, g, k, wind, variable_g))
+    else:
+        # Çekirdek başına birkaç parça: dengesiz uçuş süreleri arasında yük dengesi
+        n_chunks = workers * 4
+        size = -(-len(points) // n_chunks)
+        chunks = [(points[i:i + size], g, k, wind, variable_g) for i in range(0, len(points), size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = np.concatenate(list(pool.map(_solve_chunk, chunks)))
+
+    range_x, max_height, t_flight = (results[:, i].reshape(shape) for i in range(3))
+    return ProjectileGrid(angles_deg, speeds, heights, range_x, max_height, t_flight)
+
+
+# Hedef çözücü: kaba tarama açıları (derece); kökler bu aralıklarda brentq ile inceltilir
+SCAN_ANGLES = np.linspace(-80.0, 89.0, 40)
+
+
+def _height_miss(angle_deg, v0, x, y, h0, g, k, wind, variable_g):
+    """x hedef mesafesinde yörünge yüksekliği ile hedef yüksekliği farkı.
+
+    Yörünge x'e varmadan yere düşerse fark, eksik kalan mesafe kadar negatif
+    uzatılır; böylece fonksiyon açıya göre sürekli kalır.
+    """
+    traj = solve_trajectory(v0, float(angle_deg), h0, g, k, wind, variable_g)
+    if not np.isfinite(traj.range_x) or traj.range_x < x:
+        reach = traj.range_x if np.isfinite(traj.range_x) else 0.0
+        return (reach - x) - y
+    t_hit = brentq(lambda t: traj.sol(t)[0] - x, 0.0, traj.t_flight, xtol=1e-12)
+    return traj.sol(t_hit)[1] - y
+
+
+def launch_angles(v0: float, x: float, y: float, h0: float = 0.0, g: float = 9.81, k: float = 0.0,
+                  wind: float = 0.0, variable_g: bool = False, xtol: float = 1e-6) -> LaunchSolutions:
+    """Hava dirençli atışta (x, y) hedefini vuran alçak ve yüksek açılar (derece).
+
+    Zemin y = 0'dır; hedef yüksekliği y ≥ 0 olmalıdır.
+
+    Açı ekseni kabaca taranıp işaret değişimleri bulunur, kökler brentq ile
+    inceltilir. Yörüngeler solve_trajectory önbelleğinden gelir; aynı hedef
+    veya komşu çözümler tekrar integre edilmez. Çözüm yoksa NaN döner.
+    """
+    args = (v0, x, y, h0, g, k, wind, variable_g)
+    misses = [_height_miss(a, *args) for a in SCAN_ANGLES]
+    roots = []
+    for a0, a1, m0, m1 in zip(SCAN_ANGLES[:-1], SCAN_ANGLES[1:], misses[:-1], misses[1:]):
+        if m0 == 0:
+            roots.append(a0)
+        elif m0 * m1 < 0:
+            roots.append(brentq(_height_miss, a0, a1, args=args, xtol=xtol))
+    if not roots:
+        return LaunchSolutions(np.nan, np.nan)
+    return LaunchSolutions(roots[0], roots[-1])
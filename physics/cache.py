@@ -0,0 +1,190 @@
+"""Parametre anahtarlı sonuç önbelleği (st.cache_data benzeri).
+
+Hesaplama çekirdekleri ve şekil oluşturucular `@cached(...)` ile sarılır.
+Anahtar, fonksiyonun sayısal parametrelerinden üretilir; aynı veya geri
+dönülen kaydırıcı konumları bellekten sunulur. Her önbellek hem girdi sayısı
+hem de yaklaşık bayt boyutuyla sınırlı bir LRU'dur.
+
+Önbellek süreç içinde tüm oturumlarca paylaşılır; dönen nesneler salt okunur
+kabul edilmelidir (NumPy dizileri yazmaya kapatılır).
+"""
+import functools
+import hashlib
+import sys
+import threading
+import types
+from collections import OrderedDict
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+import numpy as np
+
+DEFAULT_MAXSIZE = 128
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+    max_bytes: int
+
+
+# Öznitelikleri sayılmayan nesneler (sınıflar, fonksiyonlar, modüller)
+_OPAQUE = (type, types.FunctionType, types.BuiltinFunctionType, types.MethodType, types.ModuleType, functools.partial)
+
+
+def sizeof(obj: Any, _seen: Optional[set] = None) -> int:
+    """Önbellek girdisinin yaklaşık bellek boyutu (bayt).
+
+    Diziler, kaplar ve plotly şekillerinin yanında sıradan nesnelerin
+    öznitelikleri de sayılır (ör. Trajectory içindeki scipy OdeSolution'ın
+    ts dizisi ve aradeğerleyicileri); aynı nesne iki kez sayılmaz.
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, (str, bytes, int, float, complex, bool, type(None), np.generic)):
+        return sys.getsizeof(obj)
+    _seen = set() if _seen is None else _seen
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+    if isinstance(obj, (tuple, list)):
+        return sys.getsizeof(obj) + sum(sizeof(item, _seen) for item in obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(sizeof(k, _seen) + sizeof(v, _seen) for k, v in obj.items())
+    if hasattr(obj, "to_plotly_json"):  # plotly şekilleri ve izleri
+        return sizeof(obj.to_plotly_json(), _seen)
+    if hasattr(obj, "__dict__") and not isinstance(obj, _OPAQUE):
+        return sys.getsizeof(obj) + sizeof(vars(obj), _seen)
+    return sys.getsizeof(obj)
+
+
+def _freeze(obj: Any) -> Any:
+    """Önbelleğe giren dizileri paylaşıldıkları için yazmaya kapatır."""
+    if isinstance(obj, np.ndarray):
+        obj.flags.writeable = False
+    elif isinstance(obj, tuple):
+        for item in obj:
+            _freeze(item)
+    return obj
+
+
+def make_key(args: tuple, kwargs: dict) -> tuple:
+    """Parametrelerden hashlenebilir anahtar üretir; diziler içerik özetiyle temsil edilir.
+
+    Skalerler Python eşitliğiyle karşılaştırılır: 1, 1.0 ve True (ya da
+    np.float64(1.0)) aynı anahtarı verir. Sayısal çekirdekler için sonuç
+    aynıdır; türe göre farklı sonuç döndüren bir fonksiyon önbelleğe
+    alınmamalıdır.
+    """
+    def norm(value):
+        if isinstance(value, np.ndarray):
+            digest = hashlib.blake2b(np.ascontiguousarray(value).view(np.uint8), digest_size=16).hexdigest()
+            return ("ndarray", value.shape, value.dtype.str, digest)
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, (list, tuple)):
+            return tuple(norm(v) for v in value)
+        if isinstance(value, dict):
+            return tuple(sorted((k, norm(v)) for k, v in value.items()))
+        return value
+
+    return norm(args), norm(kwargs)
+
+
+class LRUCache:
+    """Girdi sayısı ve toplam bayt ile sınırlı, iş parçacığı güvenli LRU."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value) -> None:
+        size = sizeof(value)
+        if size > self.max_bytes:
+            return  # Tek başına sınırı aşan sonuçlar saklanmaz
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            self._data[key] = (value, size)
+            self.nbytes += size
+            while len(self._data) > self.maxsize or self.nbytes > self.max_bytes:
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self.nbytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self.hits, self.misses, self.evictions, len(self._data), self.nbytes, self.max_bytes)
+
+
+_MISSING = object()
+_registry: Dict[str, LRUCache] = {}
+
+
+def cached(maxsize: int = DEFAULT_MAXSIZE, max_bytes: int = DEFAULT_MAX_BYTES,
+           name: Optional[str] = None) -> Callable:
+    """Fonksiyon sonucunu parametrelerine göre önbelleğe alan dekoratör.
+
+    Sarılan fonksiyonda `.cache` (LRUCache) ve `.cache_clear()` bulunur;
+    tüm önbelleklerin sayaçları `stats()` ile okunur.
+    """
+    def decorator(func):
+        cache_name = name or f"{func.__module__}.{func.__qualname__}"
+        cache = LRUCache(maxsize, max_bytes)
+        _registry[cache_name] = cache
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = _freeze(func(*args, **kwargs))
+                cache.put(key, result)
+            return result
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+def register(cache_name: str, cache: LRUCache) -> LRUCache:
+    """Dekoratör dışında oluşturulan bir önbelleği stats()/clear_all() kapsamına ekler."""
+    _registry[cache_name] = cache
+    return cache
+
+
+def stats() -> Dict[str, CacheStats]:
+    """Kayıtlı tüm önbelleklerin isabet/ıska sayaçları ve boyutları."""
+    return {cache_name: cache.stats() for cache_name, cache in _registry.items()}
+
+
+def clear_all() -> None:
+    for cache in _registry.values():
+        cache.clear()
@@ -0,0 +1,248 @@
+"""Sayfalardaki hesaplayıcıların adlandırılmış kaydı (toplu iş ve servis için).
+
+Her hesaplayıcı; parametre adları, varsayılanları ve sonucu üreten çekirdek
+fonksiyonla birlikte REGISTRY'de tutulur. evaluate() bir parametre satırı
+listesini (sözlükler) sonuç sözlüklerine çevirir:
+
+* Vektörize hesaplayıcılarda satırlar sütun dizilerine dönüştürülüp
+  çekirdek tek çağrıda çalıştırılır (10⁵ satır milisaniyeler içinde).
+* Satır başına hesaplayıcılarda (kiriş yükleri gibi yapılandırılmış
+  girdiler, ODE çözen ağır motorlar) her satır ayrı çözülür.
+
+Her iki yolda da hatalı satır yalnızca kendi sonucunda "hata" alanıyla
+işaretlenir: vektörize çağrı bir satır yüzünden hata verirse parçanın her
+satırı tek satırlık sütunlarla aynı çekirdekten yeniden çözülür. Böylece
+bir satırın sonucu parça boyuna ve komşu satırlara bağlı değildir.
+
+Tanımsız sonuçlar (NaN, ±∞) JSON uyumluluğu için None olarak döner.
+"""
+import math
+import numbers
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from physics import dynamics, energy, kinematics, momentum, oscillations, statics
+
+G = 9.81
+
+# Parametre türleri: sayı, metin, yük listesi ("konum:kuvvet;konum:kuvvet" veya [[konum, kuvvet], ...])
+FLOAT, TEXT, LOADS, BOOL = "sayı", "metin", "yükler", "mantıksal"
+
+
+class Param(NamedTuple):
+    name: str
+    default: Any = None  # None: zorunlu
+    kind: str = FLOAT
+
+
+class Calculator(NamedTuple):
+    name: str
+    func: Callable[..., Any]
+    params: Tuple[Param, ...]
+    page: str  # Hesaplayıcının arayüzdeki sayfası
+    doc: str
+    vectorized: bool = True
+    heavy: bool = False  # CPU yoğun (ODE/olay çözücü): toplu işte süreç havuzuna dağıtılır
+
+
+def _parse(param: Param, value: Any) -> Any:
+    if value is None or value == "":
+        if param.default is None:
+            raise ValueError(f"Eksik parametre: {param.name}")
+        return param.default
+    if param.kind == FLOAT:
+        return float(value)
+    if param.kind == BOOL:
+        return value if isinstance(value, bool) else str(value).strip().lower() in ("1", "true", "evet", "e")
+    if param.kind == LOADS:
+        if isinstance(value, str):
+            value = [item.split(":") for item in value.split(";") if item.strip()]
+        return [(float(pos), float(force)) for pos, force in value]
+    return str(value)
+
+
+def _clean(value: Any) -> Any:
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def _as_dict(result: Any) -> Dict[str, Any]:
+    if hasattr(result, "_asdict"):
+        items = result._asdict().items()
+    elif isinstance(result, dict):
+        items = result.items()
+    else:
+        items = [("sonuc", result)]
+    # Yalnızca skaler sayısal alanlar (ör. Trajectory.sol gibi nesneler atlanır)
+    return {k: _clean(v) for k, v in items
+            if isinstance(v, (numbers.Number, np.bool_)) or (isinstance(v, np.ndarray) and v.ndim == 0)}
+
+
+# --- Arayüzdeki girdi adlarına uyarlanmış sarmalayıcılar ---
+
+class PendulumPeriod(NamedTuple):
+    omega: float
+    T: float
+    f: float
+    T_small_angle: float
+
+
+def _pendulum(L, g, theta_0_deg):
+    omega, T, f = oscillations.pendulum_params(L, g, np.radians(theta_0_deg))
+    return PendulumPeriod(omega, T, f, oscillations.pendulum_params(L, g).T)
+
+
+def _driven(m, k, c, F0, omega):
+    amplitude, phase = oscillations.steady_state(m, k, c, F0, omega)
+    return {"A": amplitude, "delta_deg": np.degrees(phase), "zeta": c / (2 * np.sqrt(k * m))}
+
+
+def _beam(L, m_beam, support_A, support_B, loads, g):
+    return statics.beam_reactions(L, m_beam, g, support_A, support_B, loads)
+
+
+def _inertia(shape, m, r, omega):
+    if shape not in statics.INERTIA_COEFFICIENTS:
+        raise ValueError(f"Bilinmeyen şekil: {shape} (seçenekler: {', '.join(statics.INERTIA_COEFFICIENTS)})")
+    I = statics.moment_of_inertia(shape, m, r)
+    return {"I": I, "KE_rot": statics.rotational_kinetic_energy(I, omega)}
+
+
+def _drag_trajectory(v0, angle_deg, h0, g, k, wind, variable_g):
+    # scipy yalnızca bu hesaplayıcı çalıştığında yüklenir; tek seferlik satırlar önbelleğe alınmaz
+    from physics import ballistics
+    return ballistics.solve_trajectory.__wrapped__(v0, angle_deg, h0, g, k, wind, variable_g)
+
+
+def _incline_run(m, mu_s, mu_k, F, angle_deg, v0, t_end, g):
+    from physics import incline
+    run = incline.simulate_incline.__wrapped__(m, mu_s, mu_k, F, angle_deg, v0, t_end, g)
+    stuck = [e.t for e in run.events if e.kind == "yapıştı"]
+    return {"s_final": run.s[-1], "v_final": run.v[-1], "events": len(run.events),
+            "t_first_stick": stuck[0] if stuck else np.nan}
+
+
+def _register(*calculators: Calculator) -> Dict[str, Calculator]:
+    return {c.name: c for c in calculators}
+
+
+P = Param
+REGISTRY: Dict[str, Calculator] = _register(
+    # Modül 2: Kinematik
+    Calculator("serbest_dusme", kinematics.free_fall_impact, (P("h0"), P("v0", 0.0), P("g", G)), "Modül 2",
+               "Yere çarpma zamanı ve hızı"),
+    Calculator("egik_atis", kinematics.projectile, (P("v0"), P("angle_deg"), P("h0", 0.0), P("g", G)), "Modül 2",
+               "Boşlukta eğik atış: menzil, tepe yüksekliği, uçuş süresi"),
+    Calculator("direncli_atis", _drag_trajectory,
+               (P("v0"), P("angle_deg"), P("h0", 0.0), P("g", G), P("k", 0.0), P("wind", 0.0),
+                P("variable_g", False, BOOL)), "Modül 2",
+               "Hava dirençli eğik atış (solve_ivp)", vectorized=False, heavy=True),
+    # Modül 3: Dinamik
+    Calculator("surtunme", dynamics.horizontal_friction,
+               (P("m"), P("g", G), P("mu_s"), P("mu_k"), P("F_applied")), "Modül 3",
+               "Yatay yüzeyde statik/kinetik sürtünme"),
+    Calculator("egik_duzlem", dynamics.incline_forces,
+               (P("m"), P("theta_deg"), P("g", G), P("mu", 0.0), P("v0", 0.0)), "Modül 3",
+               "Eğik düzlemde kuvvet analizi"),
+    Calculator("egik_duzlem_olay", _incline_run,
+               (P("m"), P("mu_s"), P("mu_k"), P("F", 0.0), P("angle_deg", 30.0), P("v0", 0.0), P("t_end", 10.0),
+                P("g", G)), "Modül 3",
+               "Eğik düzlemde durma/kayma geçişli benzetim", vectorized=False, heavy=True),
+    Calculator("atwood", dynamics.atwood, (P("m1"), P("m2"), P("g", G)), "Modül 3", "Atwood düzeneği"),
+    # Modül 4: Enerji
+    Calculator("is", energy.work, (P("F"), P("d"), P("theta_deg", 0.0)), "Modül 4", "W = F·d·cos θ"),
+    Calculator("kinetik_enerji", energy.kinetic_energy, (P("m"), P("v")), "Modül 4", "KE = ½mv²"),
+    Calculator("sarkac_enerjisi", energy.pendulum_energy, (P("m"), P("L"), P("theta_0_deg"), P("g", G)),
+               "Modül 4", "Sarkacın toplam enerjisi ve en alt noktadaki hızı"),
+    Calculator("hiz_treni", energy.roller_coaster, (P("m"), P("h1"), P("v1"), P("h2"), P("g", G)), "Modül 4",
+               "Enerji korunumuyla son hız"),
+    Calculator("guc", energy.power_from_force, (P("F"), P("v")), "Modül 4", "P = F·v"),
+    # Modül 5: Momentum
+    Calculator("carpisma", momentum.restitution_collision,
+               (P("m1"), P("v1"), P("m2"), P("v2"), P("e", 1.0)), "Modül 5", "Restitüsyon katsayılı 1D çarpışma"),
+    Calculator("egik_carpisma", momentum.oblique_collision_2d,
+               (P("m1"), P("v1x"), P("v1y"), P("m2"), P("v2x"), P("v2y"), P("nx"), P("ny"), P("e", 1.0)),
+               "Modül 5", "Eğik 2D çarpışma"),
+    Calculator("itme", momentum.impulse, (P("m"), P("v1"), P("v2"), P("dt")), "Modül 5", "İtme ve ortalama kuvvet"),
+    # Modül 6: Statik
+    Calculator("tork", statics.torque, (P("r"), P("F"), P("theta_deg", 90.0)), "Modül 6", "τ = r·F·sin θ"),
+    Calculator("kiris", _beam,
+               (P("L"), P("m_beam"), P("support_A"), P("support_B"), P("loads", (), LOADS), P("g", G)), "Modül 6",
+               "İki destekli kirişte tepki kuvvetleri", vectorized=False),
+    Calculator("eylemsizlik", _inertia, (P("shape", None, TEXT), P("m"), P("r"), P("omega", 0.0)), "Modül 6",
+               "I = c·m·r² ve dönme kinetik enerjisi", vectorized=False),
+    # Modül 7: Salınımlar
+    Calculator("yay_kutle", oscillations.shm_params, (P("m"), P("k"), P("A")), "Modül 7",
+               "Basit harmonik hareket büyüklükleri"),
+    Calculator("sarkac", _pendulum, (P("L"), P("g", G), P("theta_0_deg")), "Modül 7",
+               "Tam (eliptik integral) sarkaç periyodu"),
+    Calculator("zorlanmis_salinim", _driven, (P("m"), P("k"), P("c"), P("F0"), P("omega")), "Modül 7",
+               "Sönümlü/zorlanmış salınımın kalıcı genliği ve fazı"),
+)
+
+
+# Satır hatası sayılan istisnalar (geçersiz girdi veya tanım aralığı dışı parametre)
+ROW_ERRORS = (ValueError, TypeError, KeyError, ArithmeticError)
+
+
+def _evaluate_row(calc: Calculator, row: Mapping[str, Any]) -> Dict[str, Any]:
+    try:
+        kwargs = {p.name: _parse(p, row.get(p.name)) for p in calc.params}
+        return _as_dict(calc.func(**kwargs))
+    except ROW_ERRORS as exc:
+        return {"hata": str(exc)}
+
+
+def _evaluate_columns(calc: Calculator, rows: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """Vektörize çekirdeği satırların sütun dizileriyle bir kez çağırır; hatalı girdi ROW_ERRORS fırlatır."""
+    columns = {p.name: np.array([_parse(p, row.get(p.name)) for row in rows], dtype=float) for p in calc.params}
+    with np.errstate(all="ignore"):
+        result = calc.func(**columns)
+    fields = result._asdict() if hasattr(result, "_asdict") else (
+        result if isinstance(result, dict) else {"sonuc": result})
+    columns = [_clean_column(np.broadcast_to(v, len(rows))) for v in fields.values()]
+    keys = list(fields)
+    return [dict(zip(keys, values)) for values in zip(*columns)]
+
+
+def _evaluate_vector_row(calc: Calculator, row: Mapping[str, Any]) -> Dict[str, Any]:
+    # Tek satırlık sütunlarla aynı vektörize yol: sonuç satırın komşularına bağlı olmaz
+    try:
+        return _evaluate_columns(calc, [row])[0]
+    except ROW_ERRORS as exc:
+        return {"hata": str(exc)}
+
+
+def evaluate(name: str, rows: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """Satırları (parametre sözlükleri) hesaplar; satır başına bir sonuç sözlüğü döner."""
+    calc = REGISTRY[name]
+    if not calc.vectorized or not rows:
+        return [_evaluate_row(calc, row) for row in rows]
+    try:
+        return _evaluate_columns(calc, rows)
+    except ROW_ERRORS:
+        # Hatalı girdi veya çekirdeğin reddettiği değer (ör. sarkaçta θ₀ = 180°): satırlar
+        # tek tek aynı yoldan çözülür, yalnızca hatalı olanlar işaretlenir
+        return [_evaluate_vector_row(calc, row) for row in rows]
+
+
+def _clean_column(values: np.ndarray) -> list:
+    """_clean'in sütun sürümü: sonlu olmayanlar None, tam sayı ve mantıksal türler korunur."""
+    out = values.tolist()
+    if values.dtype.kind == "f":
+        for i in np.flatnonzero(~np.isfinite(values)).tolist():
+            out[i] = None
+    return out
+
+
+def describe(name: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Hesaplayıcıların (veya birinin) adı, sayfası, açıklaması ve parametreleri."""
+    names = [name] if name else list(REGISTRY)
+    return [{"ad": c.name, "sayfa": c.page, "aciklama": c.doc, "agir": c.heavy,
+             "parametreler": [{"ad": p.name, "varsayilan": p.default, "tur": p.kind} for p in c.params]}
+            for c in (REGISTRY[n] for n in names)]
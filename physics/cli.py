@@ -0,0 +1,194 @@
+"""Komut satırı: hesaplayıcıları bir parametre dosyası üzerinde toplu çalıştırır.
+
+    python -m physics list [hesaplayıcı]
+    python -m physics batch carpisma girdi.csv -o sonuc.jsonl
+    python -m physics serve --port 8765   (HTTP/JSON servisi, bkz. physics.service)
+
+Girdi başlıklı CSV veya JSONL (satır başına bir JSON nesnesi) olabilir;
+"-" standart girdidir. Satırlar sabit boyutlu parçalar hâlinde okunur,
+hesaplanır ve hemen yazılır: bellek kullanımı dosya boyutundan
+bağımsızdır. Ağır (ODE/olay çözücü) hesaplayıcılarda parçalar
+ProcessPoolExecutor ile çekirdeklere dağıtılır; bekleyen parça sayısı
+sınırlı tutulur ve sonuçlar girdi sırasıyla yazılır. Çıktı satırı girdi
+sütunlarıyla hesaplanan alanların birleşimidir. Bitişte satır sayısı,
+süre ve satır/s verimi standart hataya yazılır.
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from physics import calculators
+
+# Varsayılan parça boyutları: vektörize hesaplayıcılar büyük parçalardan yararlanır
+CHUNK_ROWS = 4096
+HEAVY_CHUNK_ROWS = 16
+
+Row = Dict[str, object]
+
+
+def read_rows(stream, fmt: str) -> Iterator[Row]:
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    else:
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _chunks(rows: Iterable[Row], size: int) -> Iterator[List[Row]]:
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_chunks(name: str, chunks: Iterable[List[Row]], workers: int = 1) -> Iterator[Tuple[List[Row], List[Row]]]:
+    """(girdi parçası, sonuçlar) çiftlerini girdi sırasıyla üretir.
+
+    workers > 1 ise parçalar süreç havuzunda çözülür; aynı anda en fazla
+    2·workers parça bekler, böylece okuma hesaplamanın çok önüne geçmez.
+    """
+    if workers <= 1:
+        for chunk in chunks:
+            yield chunk, calculators.evaluate(name, chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append((chunk, pool.submit(calculators.evaluate, name, chunk)))
+            if len(pending) >= 2 * workers:
+                chunk_done, future = pending.popleft()
+                yield chunk_done, future.result()
+        while pending:
+            chunk_done, future = pending.popleft()
+            yield chunk_done, future.result()
+
+
+class _Writer:
+    """JSONL veya CSV çıktı.
+
+    CSV başlığı girdi sütunları ile ilk başarılı satırın sonuç alanlarından
+    kurulur (+ "hata"). Başarılı satır gelene kadar hatalı satırlar
+    bekletilir; hiç gelmezse başlık girdi sütunları ve "hata" olur.
+    """
+
+    def __init__(self, stream, fmt: str):
+        self.stream = stream
+        self.fmt = fmt
+        self.csv = None
+        self.fields: List[str] = []
+        self.held: List[Row] = []
+
+    def write(self, inputs: List[Row], results: List[Row]):
+        rows = [{**row, **result} for row, result in zip(inputs, results)]
+        if self.fmt == "jsonl":
+            self.stream.write("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows))
+            return
+        if self.csv is None:
+            ok = next((i for i, result in enumerate(results) if "hata" not in result), None)
+            if ok is None:
+                self.held.extend(rows)
+                return
+            self._start(list(inputs[ok]) + [f for f in results[ok] if f not in inputs[ok]])
+        self._write_rows(rows)
+
+    def close(self):
+        if self.fmt == "csv" and self.csv is None and self.held:
+            self._start(list(self.held[0]))
+
+    def _start(self, fields: List[str]):
+        self.fields = [f for f in fields if f != "hata"] + ["hata"]
+        self.csv = csv.writer(self.stream)
+        self.csv.writerow(self.fields)
+        held, self.held = self.held, []
+        self._write_rows(held)
+
+    def _write_rows(self, rows: List[Row]):
+        fields = self.fields
+        self.csv.writerows([[row.get(f, "") for f in fields] for row in rows])
+
+
+def _format_of(path: str, given: Optional[str]) -> str:
+    if given:
+        return given
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def batch(name: str, src: str, dst: str = "-", input_format: Optional[str] = None,
+          output_format: Optional[str] = None, chunk: Optional[int] = None, workers: Optional[int] = None) -> int:
+    """src'deki satırları name hesaplayıcısıyla çözüp dst'ye akıtır; yazılan satır sayısını döndürür."""
+    calc = calculators.REGISTRY[name]
+    chunk = chunk or (HEAVY_CHUNK_ROWS if calc.heavy else CHUNK_ROWS)
+    workers = (workers or os.cpu_count() or 1) if calc.heavy else 1
+
+    src_file = sys.stdin if src == "-" else open(src, newline="", encoding="utf-8")
+    dst_file = sys.stdout if dst == "-" else open(dst, "w", newline="", encoding="utf-8")
+    writer = _Writer(dst_file, _format_of(dst, output_format))
+    n_rows = 0
+    try:
+        rows = read_rows(src_file, _format_of(src, input_format))
+        for chunk_rows, results in run_chunks(name, _chunks(rows, chunk), workers):
+            writer.write(chunk_rows, results)
+            n_rows += len(chunk_rows)
+        writer.close()
+    finally:
+        if src_file is not sys.stdin:
+            src_file.close()
+        if dst_file is not sys.stdout:
+            dst_file.close()
+        else:
+            dst_file.flush()
+    return n_rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="fiziksim", description="Fizik hesaplayıcılarını komut satırından çalıştırır.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_list = sub.add_parser("list", help="hesaplayıcıları ve parametrelerini listeler")
+    p_list.add_argument("calculator", nargs="?", choices=list(calculators.REGISTRY))
+
+    p_batch = sub.add_parser("batch", help="parametre dosyasını toplu hesaplar")
+    p_batch.add_argument("calculator", choices=list(calculators.REGISTRY))
+    p_batch.add_argument("input", help="CSV veya JSONL dosyası ('-': standart girdi)")
+    p_batch.add_argument("-o", "--output", default="-", help="çıktı dosyası ('-': standart çıktı)")
+    p_batch.add_argument("--input-format", choices=["csv", "jsonl"])
+    p_batch.add_argument("--output-format", choices=["csv", "jsonl"])
+    p_batch.add_argument("--chunk", type=int, help=f"parça boyutu (varsayılan {CHUNK_ROWS}, ağırlarda {HEAVY_CHUNK_ROWS})")
+    p_batch.add_argument("--workers", type=int, help="ağır hesaplayıcılar için süreç sayısı (varsayılan: çekirdek sayısı)")
+
+    p_serve = sub.add_parser("serve", help="hesaplayıcıları yerel HTTP/JSON servisi olarak sunar")
+    p_serve.add_argument("--host", default="127.0.0.1")
+    p_serve.add_argument("--port", type=int, default=8765)
+    p_serve.add_argument("--workers", type=int, help="havuz başına işçi sayısı (varsayılan: çekirdek sayısı)")
+    p_serve.add_argument("--max-pending", type=int, help="havuzlardaki en fazla eşzamanlı iş (varsayılan: 4·işçi)")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for info in calculators.describe(args.calculator):
+            params = ", ".join(p["ad"] if p["varsayilan"] is None else f"{p['ad']}={p['varsayilan']}"
+                               for p in info["parametreler"])
+            print(f"{info['ad']:<20}{info['sayfa']:<10}{info['aciklama']}\n{'':<30}{params}")
+        return 0
+
+    if args.command == "serve":
+        from physics import service  # asyncio yalnızca servis için yüklenir
+
+        service.run(args.host, args.port, args.workers, args.max_pending)
+        return 0
+
+    start = time.perf_counter()
+    n_rows = batch(args.calculator, args.input, args.output, args.input_format, args.output_format,
+                   args.chunk, args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"{n_rows} satır, {elapsed:.2f} s, {n_rows / max(elapsed, 1e-9):.0f} satır/s", file=sys.stderr)
+    return 0
@@ -0,0 +1,177 @@
+"""Hız treni: kübik spline raylar, yay uzunluğu parametrizasyonu ve kayıplar.
+
+Ray, kontrol noktalarından (veya tepe/döngü gibi ilkel parçalardan)
+parametrik kübik spline ile (x(u), y(u)) olarak kurulur; döngüler için x'in
+monoton olması gerekmez. Ray bir kez yay uzunluğu s'ye göre eşit aralıklı
+örneklenir ve eğim açısı θ(s) ile işaretli eğrilik κ(s) önceden hesaplanıp
+önbelleğe alınır.
+
+Birim kütle başına enerji E = v²/2 için ray boyunca
+
+    dE/ds = -g·sin θ - μ·|n| - k·v²,    n = κ·v² + g·cos θ
+
+çözülür; n, rayın vagona uyguladığı normal kuvvetin m'ye bölümüdür (sol
+normal yönünde, vagon rayın üstündeyken +). g-yükü n/g'dir. Döngü
+uygunluğu (n ≥ 0, yani tepede en küçük hız şartı) tüm ray boyunca tek
+vektörize geçişte sınanır.
+"""
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
+from scipy.interpolate import CubicSpline
+
+from physics.cache import cached
+
+
+class Track(NamedTuple):
+    s: np.ndarray  # Yay uzunluğu (m), eşit aralıklı
+    x: np.ndarray
+    y: np.ndarray
+    theta: np.ndarray  # Teğet açısı (rad)
+    kappa: np.ndarray  # İşaretli eğrilik (1/m), sola dönüşte +
+    length: float
+
+
+# --- İlkel parçalar: (0, 0)'dan başlayan kontrol noktaları ---
+
+def straight(length: float, n: int = 3) -> np.ndarray:
+    return np.column_stack([np.linspace(0.0, length, n), np.zeros(n)])
+
+
+def drop(height: float, length: float, n: int = 9) -> np.ndarray:
+    """Parabolik iniş (height > 0) veya çıkış (height < 0): y = -height·(x/L)²."""
+    x = np.linspace(0.0, length, n)
+    return np.column_stack([x, -height * (x / length) ** 2])
+
+
+def hill(height: float, length: float, n: int = 9) -> np.ndarray:
+    """Kosinüs tümseği: yatay girip yatay çıkar."""
+    x = np.linspace(0.0, length, n)
+    return np.column_stack([x, height * 0.5 * (1 - np.cos(2 * np.pi * x / length))])
+
+
+def loop(radius: float, n: int = 17, drift: Optional[float] = None) -> np.ndarray:
+    """Dikey döngü; çıkış, rayların üst üste binmemesi için drift kadar ileridedir."""
+    drift = radius * 0.5 if drift is None else drift
+    phi = np.linspace(-np.pi / 2, 3 * np.pi / 2, n)
+    x = radius * np.cos(phi) + drift * (phi + np.pi / 2) / (2 * np.pi)
+    y = radius + radius * np.sin(phi)
+    return np.column_stack([x, y])
+
+
+def compose(parts: Sequence[np.ndarray], start: ArrayLike = (0.0, 0.0)) -> np.ndarray:
+    """Parçaları uç uca ekler; her parça bir öncekinin bittiği noktadan başlar."""
+    points = [np.asarray(start, dtype=float)[None, :]]
+    for part in parts:
+        part = np.asarray(part, dtype=float)
+        points.append(part[1:] - part[0] + points[-1][-1])
+    return np.concatenate(points)
+
+
+@cached(maxsize=32)
+def build_track(points: ArrayLike, n: int = 2000, oversample: int = 8) -> Track:
+    """Kontrol noktalarından yay uzunluğuyla parametrize edilmiş ray.
+
+    Spline kiriş uzunluğu parametresiyle kurulur, yay uzunluğu ince bir
+    ızgarada yamuk kuralıyla integre edilip ters çevrilir; sonuç n eşit s
+    aralığında örneklenir.
+    """
+    points = np.asarray(points, dtype=float)
+    chord = np.linalg.norm(np.diff(points, axis=0), axis=1)
+    keep = np.concatenate(([True], chord > 0))  # Çakışan ardışık noktalar atılır
+    points = points[keep]
+    u = np.concatenate(([0.0], np.cumsum(chord[chord > 0])))
+    # Uçlarda teğet ilk/son kiriş yönüne sabitlenir: başlangıçta yalancı tümsek oluşmaz
+    start_dir, end_dir = (d / np.linalg.norm(d) for d in (points[1] - points[0], points[-1] - points[-2]))
+    spline = CubicSpline(u, points, axis=0, bc_type=((1, start_dir), (1, end_dir)))
+
+    u_fine = np.linspace(0.0, u[-1], n * oversample)
+    speed = np.linalg.norm(spline(u_fine, 1), axis=1)
+    s_fine = np.concatenate(([0.0], np.cumsum(0.5 * (speed[1:] + speed[:-1]) * np.diff(u_fine))))
+
+    s = np.linspace(0.0, s_fine[-1], n)
+    u_s = np.interp(s, s_fine, u_fine)
+    (x, y), (dx, dy), (ddx, ddy) = (spline(u_s, k).T for k in range(3))
+    theta = np.arctan2(dy, dx)
+    kappa = (dx * ddy - dy * ddx) / np.hypot(dx, dy) ** 3
+    return Track(s, x, y, theta, kappa, float(s[-1]))
+
+
+class Ride(NamedTuple):
+    s: np.ndarray
+    v: np.ndarray  # Hız (m/s); tren durduktan sonra NaN
+    g_load: np.ndarray  # Normal kuvvet / (m·g)
+    energy_loss: np.ndarray  # Sürtünme + sürüklenme ile kaybedilen enerji, birim kütle başına (J/kg)
+    stall_s: float  # Trenin durduğu s (durmazsa NaN)
+
+
+@cached(maxsize=32)
+def ride(track: Track, v0: float, g: float = 9.81, mu: float = 0.0, k: float = 0.0) -> Ride:
+    """Ray boyunca hız ve g-yükü; mu yuvarlanma sürtünmesi, k = ½ρC_dA/m (1/m).
+
+    Sürtünmesiz ve sürüklenmesiz durumda enerji korunumundan kapalı biçimde,
+    aksi hâlde s ızgarasında orta nokta (RK2) adımlarıyla hesaplanır.
+    """
+    s, y, theta, kappa = track.s, track.y, track.theta, track.kappa
+    E = np.full(len(s), np.nan)
+    if mu == 0 and k == 0:
+        E = 0.5 * v0 ** 2 - g * (y - y[0])
+        stalled = np.flatnonzero(E < 0)
+        if len(stalled):
+            E[stalled[0]:] = np.nan
+    else:
+        sin_t, cos_t = np.sin(theta).tolist(), np.cos(theta).tolist()
+        kap = kappa.tolist()
+        ds = float(s[1] - s[0])
+
+        def dE(E_, sin_, cos_, kap_):
+            return -g * sin_ - mu * abs(2 * E_ * kap_ + g * cos_) - 2 * k * E_
+
+        E[0] = E_i = 0.5 * v0 ** 2
+        for i in range(len(s) - 1):
+            f0 = dE(E_i, sin_t[i], cos_t[i], kap[i])
+            E_mid = E_i + 0.5 * ds * f0
+            f_mid = dE(E_mid, 0.5 * (sin_t[i] + sin_t[i + 1]), 0.5 * (cos_t[i] + cos_t[i + 1]),
+                       0.5 * (kap[i] + kap[i + 1]))
+            E_i = E_i + ds * f_mid
+            if E_i < 0:
+                break
+            E[i + 1] = E_i
+
+    v = np.sqrt(2 * E)
+    n_force = kappa * v ** 2 + g * np.cos(theta)
+    loss = 0.5 * v0 ** 2 + g * y[0] - (E + g * y)
+    stalled = np.flatnonzero(np.isnan(E))
+    return Ride(s, v, n_force / g, loss, float(s[stalled[0]]) if len(stalled) else np.nan)
+
+
+class LoopCheck(NamedTuple):
+    v_min: np.ndarray  # Ters dönülen yerlerde rayla temas için en küçük hız (m/s), diğer yerlerde 0
+    feasible: bool  # Tren durmadan ve döngülerde raydan ayrılmadan tüm rayı geçiyor mu
+    worst_s: float  # Döngülerde hız payının en küçük olduğu s (ters kısım yoksa NaN)
+    margin: float  # Döngülerde min(v - v_min) (m/s)
+    airtime: bool  # Düz duruşta (cos θ > 0) normal kuvvet negatif: tekerlekler ray altına tutunur
+    v0_required: float  # Sürtünmesiz rayda döngüler için gereken en küçük başlangıç hızı
+
+
+def loop_check(track: Track, result: Ride, g: float = 9.81) -> LoopCheck:
+    """Tüm rayda döngü şartını (ters dönülen yerde v² ≥ g·|cos θ|/κ) tek vektörize geçişte sınar."""
+    cos_t = np.cos(track.theta)
+    inverted = cos_t < 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Ters dönülen yerlerde merkezcil ivme yerçekimini karşılamalı; κ ≤ 0 ise hiçbir hız yetmez
+        v2_min = np.where(inverted, np.where(track.kappa > 0, -g * cos_t / track.kappa, np.inf), 0.0)
+    v_min = np.sqrt(v2_min)
+    stalled = bool(np.isnan(result.v).any())
+
+    slack = np.where(np.isnan(result.v), -np.inf, result.v - v_min)[inverted]
+    if len(slack):
+        worst = int(np.argmin(slack))
+        worst_s, margin = float(track.s[inverted][worst]), float(slack[worst])
+    else:
+        worst_s, margin = np.nan, np.inf
+    airtime = bool(np.any((result.g_load < 0) & ~inverted))
+    # Sürtünmesiz durumda enerji korunumu: v0² ≥ max(v_min² + 2g(y - y0))
+    v0_required = float(np.sqrt(max(np.max(v2_min + 2 * g * (track.y - track.y[0])), 0.0)))
+    return LoopCheck(v_min, not stalled and margin >= 0, worst_s, margin, airtime, v0_required)
@@ -0,0 +1,213 @@
+"""Olay güdümlü çok cisimli 1D çarpışma motoru.
+
+Doğru üzerindeki N cisim sabit hızla ilerler; yalnızca komşu cisimler (ve
+uçlardaki cisimler ile duvarlar) çarpışabilir. Bir sonraki çarpışma anları
+öncelik kuyruğunda (heapq) tutulur. Her olayda yalnızca çarpışan iki cismin
+durumu güncellenir ve en fazla üç yeni olay kuyruğa eklenir; böylece olay
+başına maliyet O(log N)'dir. Eskimiş olaylar, cisim başına çarpışma
+sayaçlarıyla kuyruktan çekildiklerinde ayıklanır.
+
+Cisim konumları tembel tutulur: x(t) = x_ref + v·(t - t_ref). Çarpışma
+hızları momentum.restitution_collision ile hesaplanır (e = 1 elastik,
+e = 0 tam inelastik).
+"""
+import heapq
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from physics.cache import cached
+from physics.momentum import restitution_collision
+
+# Varsayılan olay sınırı: e < 1 iken sonlu sürede sonsuz çarpışma (inelastik çöküş) olabilir
+MAX_EVENTS = 1_000_000
+
+
+class EventChain:
+    """Doğru üzerinde çarpışan cisimler zinciri.
+
+    m, x, v, radius: cisim başına kütle, merkez konumu, hız ve yarı genişlik
+    (x artan sırada, cisimler üst üste binmemeli). e: cisimler arası
+    restitüsyon katsayısı. walls: (sol, sağ) duvar konumları; duvarlar
+    elastik yansıtır, None ise o yön açıktır.
+    """
+
+    def __init__(self, m: ArrayLike, x: ArrayLike, v: ArrayLike, radius: ArrayLike = 0.0, e: float = 1.0,
+                 walls: Optional[Tuple[Optional[float], Optional[float]]] = None):
+        x = np.asarray(x, dtype=float)
+        n = x.size
+        m, v, radius = (np.broadcast_to(np.asarray(a, dtype=float), (n,)) for a in (m, v, radius))
+        if np.any(np.diff(x) - radius[:-1] - radius[1:] < 0):
+            raise ValueError("Cisimler x'e göre sıralı olmalı ve üst üste binmemeli")
+        left, right = walls if walls is not None else (None, None)
+        if (left is not None and x[0] - radius[0] < left) or (right is not None and x[-1] + radius[-1] > right):
+            raise ValueError("Cisimler duvarların arasında olmalı")
+
+        self.n = n
+        self.e = float(e)
+        self.walls = (left, right)
+        self.t = 0.0
+        self.n_events = 0
+        # Olay başına skaler erişim Python listeleriyle daha hızlıdır
+        self._m = m.tolist()
+        self._r = radius.tolist()
+        self._x = x.tolist()
+        self._v = v.tolist()
+        self._t_ref = [0.0] * n
+        self._count = [0] * n
+        self._queue = []
+        for i in range(-1, n):
+            self._predict(i)
+
+    def _pos(self, i: int, t: float) -> float:
+        return self._x[i] + self._v[i] * (t - self._t_ref[i])
+
+    def _predict(self, i: int) -> None:
+        """(i, i+1) çiftinin sonraki çarpışmasını kuyruğa ekler; i = -1 ve i = n-1 duvarlardır."""
+        n = self.n
+        if i < -1 or i >= n or n == 0:
+            return
+        left, right = self.walls
+        if i == -1:
+            if left is None or self._v[0] >= 0:
+                return
+            dt = (self._pos(0, self.t) - self._r[0] - left) / -self._v[0]
+            counts = (self._count[0], -1)
+        elif i == n - 1:
+            if right is None or self._v[i] <= 0:
+                return
+            dt = (right - self._pos(i, self.t) - self._r[i]) / self._v[i]
+            counts = (self._count[i], -1)
+        else:
+            dv = self._v[i] - self._v[i + 1]
+            if dv <= 0:
+                return
+            gap = self._pos(i + 1, self.t) - self._pos(i, self.t) - self._r[i] - self._r[i + 1]
+            dt = gap / dv
+            counts = (self._count[i], self._count[i + 1])
+        heapq.heappush(self._queue, (self.t + max(dt, 0.0), i, counts))
+
+    def _valid(self, i: int, counts) -> bool:
+        if i == -1:
+            return self._count[0] == counts[0]
+        if i == self.n - 1:
+            return self._count[i] == counts[0]
+        return self._count[i] == counts[0] and self._count[i + 1] == counts[1]
+
+    def _settle(self, i: int) -> None:
+        """i'nin referans konumunu şimdiki zamana taşır."""
+        self._x[i] = self._pos(i, self.t)
+        self._t_ref[i] = self.t
+
+    def advance(self, t_end: float, max_events: int = MAX_EVENTS) -> bool:
+        """t_end anına kadar tüm çarpışmaları işler.
+
+        max_events olayda t_end'e ulaşılamazsa (inelastik çöküş) saat son
+        olayda kalır ve False döner.
+        """
+        queue = self._queue
+        processed = 0
+        while queue and queue[0][0] <= t_end:
+            if processed >= max_events:
+                return False
+            t, i, counts = heapq.heappop(queue)
+            if not self._valid(i, counts):
+                continue
+            self.t = t
+            processed += 1
+            self.n_events += 1
+            if i == -1 or i == self.n - 1:
+                j = 0 if i == -1 else i
+                self._settle(j)
+                self._v[j] = -self._v[j]
+                self._count[j] += 1
+                self._predict(j - 1)
+                self._predict(j)
+                continue
+            j = i + 1
+            self._settle(i)
+            self._settle(j)
+            self._v[i], self._v[j] = restitution_collision(self._m[i], self._v[i], self._m[j], self._v[j], self.e)[:2]
+            self._count[i] += 1
+            self._count[j] += 1
+            self._predict(i - 1)
+            self._predict(i)
+            self._predict(j)
+        self.t = max(self.t, t_end)
+        return True
+
+    def positions(self) -> np.ndarray:
+        """Şimdiki zamanda cisim merkezleri."""
+        return np.asarray(self._x) + np.asarray(self._v) * (self.t - np.asarray(self._t_ref))
+
+    def velocities(self) -> np.ndarray:
+        return np.asarray(self._v)
+
+
+class ChainSeries(NamedTuple):
+    t: np.ndarray  # (n_t,)
+    x: np.ndarray  # (n_t, N)
+    v: np.ndarray  # (n_t, N)
+    n_events: int
+    complete: bool  # False: olay sınırına takıldı, son örnekler donmuştur
+
+
+@cached(maxsize=16)
+def simulate_chain(m: ArrayLike, x: ArrayLike, v: ArrayLike, t_end: float, n: int = 200,
+                   radius: ArrayLike = 0.0, e: float = 1.0,
+                   walls: Optional[Tuple[Optional[float], Optional[float]]] = None,
+                   max_events: int = MAX_EVENTS) -> ChainSeries:
+    """Zinciri [0, t_end] aralığında eşit aralıklı n anda örnekler."""
+    chain = EventChain(m, x, v, radius, e, walls)
+    t = np.linspace(0.0, t_end, n)
+    xs = np.empty((n, chain.n))
+    vs = np.empty((n, chain.n))
+    complete = True
+    for k, t_k in enumerate(t):
+        if complete:
+            complete = chain.advance(t_k, max_events - chain.n_events)
+        xs[k] = chain.positions()
+        vs[k] = chain.velocities()
+    return ChainSeries(t, xs, vs, chain.n_events, complete)
+
+
+def newtons_cradle(n_balls: int = 5, n_moving: int = 1, v0: float = 1.0, radius: float = 0.5,
+                   gap: float = 2.0):
+    """Newton beşiği başlangıcı: sağda birbirine değen duran toplar, soldan gelen n_moving top.
+
+    (m, x, v, radius) döner.
+    """
+    d = 2 * radius
+    x_rest = np.arange(n_balls - n_moving) * d
+    x_moving = -gap - d * np.arange(n_moving, 0, -1)
+    x = np.concatenate([x_moving, x_rest])
+    v = np.where(np.arange(n_balls) < n_moving, v0, 0.0)
+    return np.ones(n_balls), x, v, radius
+
+
+def piston_gas(n_particles: int = 200, length: float = 100.0, piston_mass: float = 50.0,
+               piston_x: float = 50.0, v_rms: float = 1.0, radius: float = 0.0, seed: int = 0):
+    """Piston-gaz modeli: [0, length] kutusunda piston ile ikiye ayrılmış birim kütleli gaz.
+
+    Sol bölmedeki parçacıklar v_rms, sağdakiler v_rms/2 ölçekli hızlarla başlar
+    (sıcak / soğuk taraf). (m, x, v, radius, walls) döner.
+    """
+    rng = np.random.default_rng(seed)
+    n_left = n_particles // 2
+    n_right = n_particles - n_left
+    x_left = np.sort(rng.uniform(radius, piston_x - 1.0, n_left))
+    x_right = np.sort(rng.uniform(piston_x + 1.0, length - radius, n_right))
+    v_left = rng.normal(0.0, v_rms, n_left)
+    v_right = rng.normal(0.0, v_rms / 2, n_right)
+    x = np.concatenate([x_left, [piston_x], x_right])
+    v = np.concatenate([v_left, [0.0], v_right])
+    m = np.ones(n_particles + 1)
+    m[n_left] = piston_mass
+    return m, x, v, radius, (0.0, length)
+
+
+def kinetic_energy(m: ArrayLike, v: ArrayLike):
+    """Son eksen boyunca toplam kinetik enerji (zaman serileri için)."""
+    return 0.5 * np.sum(np.asarray(m) * np.asarray(v) ** 2, axis=-1)
+
@@ -0,0 +1,226 @@
+"""2D sert disk benzetimi (bilardo, ideal gaz).
+
+Durum bitişik NumPy dizilerinde tutulur: konum ve hız (N, 2), yarıçap ve
+kütle (N,). Her zaman adımında:
+
+1. Diskler sabit hızla ilerler, kutu duvarlarından yansır.
+2. Geniş faz: diskler kenarı en büyük çap kadar olan düzgün bir ızgaraya
+   (uzamsal karma) yerleştirilir; aday çiftler yalnızca aynı ve komşu
+   hücrelerden üretilir (yarım şablon, her çift bir kez). O(N²) yerine
+   yaklaşık O(N) çift sınanır.
+3. Dar faz: örtüşen ve birbirine yaklaşan çiftlere momentum.oblique_collision_2d
+   ile eğik itme uygulanır (e = 1 elastik, e < 1 inelastik), örtüşme
+   kütleyle orantılı olarak giderilir.
+
+Tüm adımlar vektörizedir; Python döngüsü yalnızca zaman adımları, beş
+komşu hücre ofseti ve aynı diski paylaşan temasların çözüm turları
+üzerindedir.
+"""
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from physics.cache import cached
+from physics.momentum import oblique_collision_2d
+
+# Yarım şablon: her komşu hücre çifti bir kez ziyaret edilir
+_NEIGHBOR_OFFSETS = ((1, 0), (-1, 1), (0, 1), (1, 1))
+
+# Otomatik zaman adımında bir adımdaki en büyük yer değiştirme / en küçük yarıçap
+CFL = 0.25
+
+
+class DiskSystem:
+    """Dikdörtgen kutu içinde çarpışan diskler.
+
+    box: (genişlik, yükseklik), kutu [0, W] × [0, H]. e: diskler arası,
+    e_wall: duvar restitüsyon katsayısı.
+    """
+
+    def __init__(self, pos: ArrayLike, vel: ArrayLike, radius: ArrayLike, mass: ArrayLike = 1.0,
+                 box: Tuple[float, float] = (1.0, 1.0), e: float = 1.0, e_wall: float = 1.0):
+        self.pos = np.ascontiguousarray(pos, dtype=float).reshape(-1, 2).copy()
+        n = len(self.pos)
+        self.vel = np.ascontiguousarray(vel, dtype=float).reshape(n, 2).copy()
+        self.radius = np.ascontiguousarray(np.broadcast_to(np.asarray(radius, dtype=float), (n,)))
+        self.mass = np.ascontiguousarray(np.broadcast_to(np.asarray(mass, dtype=float), (n,)))
+        self.box = np.asarray(box, dtype=float)
+        self.e = float(e)
+        self.e_wall = float(e_wall)
+        self.t = 0.0
+        self.n_collisions = 0
+
+        self.cell = 2 * float(self.radius.max()) if n else 1.0
+        self.grid = np.maximum(np.ceil(self.box / self.cell).astype(int), 1)
+
+    def auto_dt(self) -> float:
+        """En hızlı disk bir adımda en küçük yarıçapın CFL katı kadar ilerler."""
+        v_max = float(np.sqrt((self.vel ** 2).sum(axis=1).max())) if len(self.vel) else 0.0
+        return CFL * float(self.radius.min()) / v_max if v_max > 0 else 1.0
+
+    def candidate_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Uzamsal karma ile aynı/komşu hücrelerdeki aday çiftler (i, j)."""
+        nx, ny = self.grid
+        cells = np.clip((self.pos // self.cell).astype(np.intp), 0, [nx - 1, ny - 1])
+        keys = cells[:, 1] * nx + cells[:, 0]
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        counts = np.bincount(sorted_keys, minlength=nx * ny)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        cx, cy = cells[order, 0], cells[order, 1]
+        rank = np.arange(len(order))
+
+        # Aynı hücre: sıralı dizide kendisinden sonraki hücre arkadaşları
+        first = [rank + 1]
+        count = [starts[sorted_keys] + counts[sorted_keys] - rank - 1]
+        owner = [rank]
+        for dx, dy in _NEIGHBOR_OFFSETS:
+            nxc, nyc = cx + dx, cy + dy
+            ok = (nxc >= 0) & (nxc < nx) & (nyc < ny)
+            nkey = nyc[ok] * nx + nxc[ok]
+            first.append(starts[nkey])
+            count.append(counts[nkey])
+            owner.append(rank[ok])
+        first, count, owner = (np.concatenate(a) for a in (first, count, owner))
+
+        total = int(count.sum())
+        offsets = np.arange(total) - np.repeat(np.cumsum(count) - count, count)
+        i = order[np.repeat(owner, count)]
+        j = order[np.repeat(first, count) + offsets]
+        return i, j
+
+    def _collide(self) -> None:
+        i, j = self.candidate_pairs()
+        d = self.pos[j] - self.pos[i]
+        dist2 = np.einsum("ij,ij->i", d, d)
+        reach = self.radius[i] + self.radius[j]
+        touching = (dist2 < reach * reach) & (dist2 > 0)
+        i, j, d, reach = i[touching], j[touching], d[touching], reach[touching]
+        dist = np.sqrt(dist2[touching])
+        n = d / dist[:, None]
+
+        mi, mj = self.mass[i], self.mass[j]
+        self._resolve(i, j, n, mi, mj)
+
+        # Örtüşmeyi gider: ağır disk daha az itilir
+        push = ((reach - dist) / (mi + mj))[:, None] * n
+        np.add.at(self.pos, i, -push * mj[:, None])
+        np.add.at(self.pos, j, push * mi[:, None])
+
+    def _resolve(self, i, j, n, mi, mj) -> None:
+        """Yaklaşan temasları ortak diski olmayan gruplar hâlinde çözer.
+
+        Her turda her disk en fazla bir çiftte yer alır (çift, iki diskinin de
+        ilk çifti ise seçilir); kalan temaslar güncel hızlarla yeniden sınanır.
+        Böylece aynı diske aynı anda iki itme eklenip enerji üretilmez.
+        """
+        pending = np.arange(len(i))
+        first = np.empty(len(self.pos), dtype=np.intp)
+        while len(pending):
+            vi, vj = self.vel[i[pending]], self.vel[j[pending]]
+            pending = pending[np.einsum("ij,ij->i", vj - vi, n[pending]) < 0]
+            if not len(pending):
+                break
+            first[i[pending]] = len(pending)
+            first[j[pending]] = len(pending)
+            order = np.arange(len(pending))
+            np.minimum.at(first, i[pending], order)
+            np.minimum.at(first, j[pending], order)
+            chosen = (first[i[pending]] == order) & (first[j[pending]] == order)
+            k = pending[chosen]
+            a, b = i[k], j[k]
+            v1x, v1y, v2x, v2y = oblique_collision_2d(mi[k], self.vel[a, 0], self.vel[a, 1], mj[k],
+                                                      self.vel[b, 0], self.vel[b, 1], n[k, 0], n[k, 1], self.e)
+            self.vel[a] = np.column_stack([v1x, v1y])
+            self.vel[b] = np.column_stack([v2x, v2y])
+            self.n_collisions += len(k)
+            pending = pending[~chosen]
+
+    def _walls(self) -> None:
+        r = self.radius[:, None]
+        low = self.pos < r
+        high = self.pos > self.box - r
+        self.pos = np.where(low, 2 * r - self.pos, np.where(high, 2 * (self.box - r) - self.pos, self.pos))
+        # Yalnızca duvara doğru giden bileşen yansıtılır
+        flip = (low & (self.vel < 0)) | (high & (self.vel > 0))
+        self.vel[flip] *= -self.e_wall
+
+    def step(self, dt: float) -> None:
+        self.pos += self.vel * dt
+        self._walls()
+        self._collide()
+        self.t += dt
+
+    def kinetic_energy(self) -> float:
+        return 0.5 * float(np.sum(self.mass * (self.vel ** 2).sum(axis=1)))
+
+    def momentum(self) -> np.ndarray:
+        return (self.mass[:, None] * self.vel).sum(axis=0)
+
+
+class DiskSeries(NamedTuple):
+    t: np.ndarray  # (n_frames,)
+    pos: np.ndarray  # (n_frames, N, 2)
+    speed: np.ndarray  # (n_frames, N)
+    kinetic_energy: np.ndarray  # (n_frames,)
+    n_collisions: int
+
+
+@cached(maxsize=8)
+def simulate_disks(pos: ArrayLike, vel: ArrayLike, radius: ArrayLike, mass: ArrayLike, box: Tuple[float, float],
+                   t_end: float, n_frames: int = 60, e: float = 1.0, e_wall: float = 1.0,
+                   dt: Optional[float] = None) -> DiskSeries:
+    """Diskleri [0, t_end] boyunca ilerletip eşit aralıklı n_frames kare kaydeder.
+
+    dt verilmezse başlangıç hızlarından auto_dt ile seçilir.
+    """
+    system = DiskSystem(pos, vel, radius, mass, box, e, e_wall)
+    dt = dt or system.auto_dt()
+    t = np.linspace(0.0, t_end, n_frames)
+    frames = np.empty((n_frames, len(system.pos), 2))
+    speed = np.empty((n_frames, len(system.pos)))
+    ke = np.empty(n_frames)
+    for k, t_k in enumerate(t):
+        while system.t < t_k - 1e-12:
+            system.step(min(dt, t_k - system.t))
+        frames[k] = system.pos
+        speed[k] = np.sqrt((system.vel ** 2).sum(axis=1))
+        ke[k] = system.kinetic_energy()
+    return DiskSeries(t, frames, speed, ke, system.n_collisions)
+
+
+def ideal_gas(n_disks: int = 1000, box: Tuple[float, float] = (100.0, 100.0), radius: float = 0.4,
+              speed: float = 1.0, seed: int = 0):
+    """Aynı hızla rastgele yönlerde başlayan eşit diskler (ızgaraya dizili, örtüşmesiz).
+
+    Çarpışmalarla hız dağılımı 2D Maxwell-Boltzmann (Rayleigh) dağılımına
+    yaklaşır. (pos, vel, radius, mass, box) döner.
+    """
+    rng = np.random.default_rng(seed)
+    W, H = box
+    side = int(np.ceil(np.sqrt(n_disks * W / H)))
+    rows = int(np.ceil(n_disks / side))
+    gx = (np.arange(side) + 0.5) * W / side
+    gy = (np.arange(rows) + 0.5) * H / rows
+    pos = np.stack(np.meshgrid(gx, gy), axis=-1).reshape(-1, 2)[:n_disks]
+    if min(W / side, H / rows) < 2 * radius:
+        raise ValueError("Diskler kutuya sığmıyor")
+    angle = rng.uniform(0, 2 * np.pi, n_disks)
+    vel = speed * np.column_stack([np.cos(angle), np.sin(angle)])
+    return pos, vel, radius, 1.0, box
+
+
+def billiards_break(speed: float = 5.0, radius: float = 0.0286, box: Tuple[float, float] = (2.54, 1.27)):
+    """Bilardo açılışı: 15 topluk üçgen ve ona doğru giden beyaz top (m, SI ölçüleri).
+
+    (pos, vel, radius, mass, box) döner; ilk disk beyaz toptur.
+    """
+    W, H = box
+    d = 2 * radius * 1.001
+    rack = [(0.75 * W + row * d * np.sqrt(3) / 2, H / 2 + (k - row / 2) * d)
+            for row in range(5) for k in range(row + 1)]
+    pos = np.array([(0.25 * W, H / 2)] + rack)
+    vel = np.zeros_like(pos)
+    vel[0] = speed, 0.0
+    return pos, vel, radius, 0.17, box
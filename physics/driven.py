@@ -0,0 +1,47 @@
+"""Sönümlü ve zorlanmış yay-kütle sistemi: geçici (transient) yanıt.
+
+    m·x'' + c·x' + k·x = F₀·cos(Ω·t),    x(0) = x₀, x'(0) = v₀
+
+Geçici yanıt scipy solve_ivp ile sürekli çözüm (dense output) olarak bir
+kez integre edilir ve parametre kümesi başına önbelleğe alınır; zaman
+örnekleri bu çözümden vektörize okunur. Büyük c (aşırı sönüm) denklemi
+katılaştırdığı için katı/katı olmayan kipleri kendiliğinden değiştiren
+LSODA kullanılır. Kalıcı yanıt ve rezonans eğrisi analitiktir:
+physics.oscillations.steady_state.
+"""
+from typing import NamedTuple
+
+import numpy as np
+from scipy.integrate import solve_ivp
+
+from physics.cache import cached
+from physics.oscillations import steady_state
+
+
+class DrivenRun(NamedTuple):
+    t: np.ndarray
+    x: np.ndarray
+    v: np.ndarray
+    a: np.ndarray
+    x_steady: np.ndarray  # Yalnızca kalıcı yanıt A·cos(Ωt - δ); sönümsüz rezonansta NaN
+    KE: np.ndarray
+    PE: np.ndarray
+    P_drive: np.ndarray  # Dış kuvvetin gücü F(t)·v (W)
+    P_loss: np.ndarray  # Sönümde harcanan güç c·v² (W)
+
+
+@cached(maxsize=32)
+def driven_response(m: float, k: float, c: float, F0: float, omega: float, x0: float, v0: float,
+                    t_end: float, n: int = 500) -> DrivenRun:
+    """[0, t_end] boyunca n eşit aralıklı örnekle tam (geçici + kalıcı) yanıt."""
+    def rhs(t, y):
+        return (y[1], (F0 * np.cos(omega * t) - c * y[1] - k * y[0]) / m)
+
+    result = solve_ivp(rhs, (0.0, t_end), (x0, v0), method="LSODA", dense_output=True, rtol=1e-9, atol=1e-12)
+    t = np.linspace(0.0, t_end, n)
+    x, v = result.sol(t)
+    force = F0 * np.cos(omega * t)
+    amplitude, phase = steady_state(m, k, c, F0, omega)
+    x_steady = amplitude * np.cos(omega * t - phase) if np.isfinite(amplitude) else np.full_like(t, np.nan)
+    return DrivenRun(t, x, v, (force - c * v - k * x) / m, x_steady,
+                     0.5 * m * v**2, 0.5 * k * x**2, force * v, c * v**2)
@@ -0,0 +1,88 @@
+"""Dinamik: Newton yasaları, sürtünme, eğik düzlem ve Atwood düzeneği."""
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+def net_force(m: ArrayLike, a: ArrayLike):
+    """F = m·a"""
+    return m * a
+
+
+def mass(F: ArrayLike, a: ArrayLike):
+    """m = F / a"""
+    return F / a
+
+
+def acceleration(F: ArrayLike, m: ArrayLike):
+    """a = F / m"""
+    return F / m
+
+
+class Friction(NamedTuple):
+    N: float
+    f_s_max: float
+    f_k: float
+    moving: bool
+    friction: float
+    a: float
+
+
+def horizontal_friction(m: ArrayLike, g: ArrayLike, mu_s: ArrayLike, mu_k: ArrayLike,
+                        F_applied: ArrayLike) -> Friction:
+    """Yatay yüzeyde sürtünme analizi.
+
+    Uygulanan kuvvet maksimum statik sürtünmeyi aşmıyorsa cisim hareketsizdir
+    ve statik sürtünme uygulanan kuvvete eşittir.
+    """
+    N = m * g  # Normal kuvvet
+    f_s_max = mu_s * N  # Maksimum statik sürtünme
+    f_k = mu_k * N  # Kinetik sürtünme
+
+    moving = F_applied > f_s_max
+    friction = np.where(moving, f_k, F_applied)
+    a = np.where(moving, (F_applied - f_k) / m, 0.0)
+    return Friction(N, f_s_max, f_k, moving, friction, a)
+
+
+class Incline(NamedTuple):
+    W: float
+    N: float
+    W_parallel: float
+    f: float
+    F_net: float
+    a: float
+
+
+def incline_forces(m: ArrayLike, theta_deg: ArrayLike, g: ArrayLike, mu: ArrayLike,
+                   v0: ArrayLike) -> Incline:
+    """Eğik düzlemde kuvvet analizi (yukarı yön pozitif).
+
+    Sürtünme, hareket yönünün (v₀ işaretinin) tersine etki eder; durgun cisim
+    için yukarı hareket gibi ele alınır.
+    """
+    theta_rad = np.radians(theta_deg)
+
+    W = m * g  # Ağırlık
+    N = W * np.cos(theta_rad)  # Normal kuvvet
+    W_parallel = W * np.sin(theta_rad)  # Paralel bileşen (aşağı)
+    f = mu * N  # Sürtünme kuvveti
+
+    F_net = np.where(np.asarray(v0) >= 0, -W_parallel - f, -W_parallel + f)
+    return Incline(W, N, W_parallel, f, F_net, F_net / m)
+
+
+class Atwood(NamedTuple):
+    a: float
+    T: float
+
+
+def atwood(m1: ArrayLike, m2: ArrayLike, g: ArrayLike) -> Atwood:
+    """Atwood düzeneği (sürtünmesiz, kütlesiz makara ve ip).
+
+    a > 0: m₁ aşağı, m₂ yukarı hareket eder.
+    """
+    a = ((m1 - m2) / (m1 + m2)) * g
+    T = m2 * (g + a)
+    return Atwood(a, T)
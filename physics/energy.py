@@ -0,0 +1,78 @@
+"""İş, enerji ve güç."""
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+HP_IN_WATTS = 745.7
+
+
+def work(F: ArrayLike, d: ArrayLike, theta_deg: ArrayLike):
+    """W = F·d·cos(θ)"""
+    return F * d * np.cos(np.radians(theta_deg))
+
+
+def kinetic_energy(m: ArrayLike, v: ArrayLike):
+    """KE = ½mv²"""
+    return 0.5 * m * np.asarray(v, dtype=float)**2
+
+
+def potential_energy(m: ArrayLike, g: ArrayLike, h: ArrayLike):
+    """PE = mgh"""
+    return m * g * np.asarray(h, dtype=float)
+
+
+def spring_potential_energy(k: ArrayLike, x: ArrayLike):
+    """PE = ½kx²"""
+    return 0.5 * k * np.asarray(x, dtype=float)**2
+
+
+class PendulumEnergy(NamedTuple):
+    h_max: float
+    E_total: float
+    v_max: float
+
+
+def pendulum_energy(m: ArrayLike, L: ArrayLike, theta_0_deg: ArrayLike, g: ArrayLike) -> PendulumEnergy:
+    """Sarkacın toplam mekanik enerjisi ve en alt noktadaki hızı."""
+    h_max = L * (1 - np.cos(np.radians(theta_0_deg)))
+    return PendulumEnergy(h_max, m * g * h_max, np.sqrt(2 * g * h_max))
+
+
+def pendulum_energy_profile(m: ArrayLike, L: ArrayLike, g: ArrayLike, E_total: ArrayLike, theta_rad: ArrayLike):
+    """Açıya göre (PE, KE); KE = E_total - PE."""
+    PE = potential_energy(m, g, L * (1 - np.cos(theta_rad)))
+    return PE, E_total - PE
+
+
+def speed_from_energy(m: ArrayLike, g: ArrayLike, E_total: ArrayLike, h: ArrayLike):
+    """Enerji korunumundan yükseklik h'deki hız; erişilemeyen noktalarda 0."""
+    KE = np.maximum(E_total - potential_energy(m, g, h), 0)  # Negatif enerji olmasın
+    return np.sqrt(2 * KE / m)
+
+
+class Coaster(NamedTuple):
+    E1: float
+    KE2: float
+    PE2: float
+    v2: float
+
+
+def roller_coaster(m: ArrayLike, h1: ArrayLike, v1: ArrayLike, h2: ArrayLike, g: ArrayLike) -> Coaster:
+    """½mv₁² + mgh₁ = ½mv₂² + mgh₂; tren h₂'ye ulaşamıyorsa v2 NaN olur."""
+    E1 = kinetic_energy(m, v1) + potential_energy(m, g, h1)
+    PE2 = potential_energy(m, g, h2)
+    KE2 = E1 - PE2
+    with np.errstate(invalid="ignore"):
+        v2 = np.sqrt(2 * KE2 / m)
+    return Coaster(E1, KE2, PE2, v2)
+
+
+def power(W: ArrayLike, t: ArrayLike):
+    """P = W / t"""
+    return W / t
+
+
+def power_from_force(F: ArrayLike, v: ArrayLike):
+    """P = F·v"""
+    return F * v
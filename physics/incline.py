@@ -0,0 +1,186 @@
+"""Eğik düzlemde blok: zamanla değişen kuvvet ve eğim, durma/kayma geçişleri.
+
+Düzlem boyunca yukarı yön pozitiftir. Blok üzerine uygulanan kuvvet F(t)
+(düzleme paralel) ve eğim açısı θ(t) Profile ile verilir; normal kuvvet
+N = m·g·cos θ(t) anlık değerden hesaplanır (eğimin dönme hızından doğan
+eylemsizlik etkileri ihmal edilir).
+
+Hareket parçalı düzgündür ve iki kipte çözülür:
+
+* Kayma (yön σ = ±1): m·a = F - m·g·sin θ - σ·μₖ·N. v = 0 olayı aranır; o
+  anda sürücü kuvvet D = F - m·g·sin θ statik sınırı aşmıyorsa blok
+  yapışır, aşıyorsa D yönünde (gerekirse ters dönerek) kaymaya devam eder.
+* Yapışma: v = 0, statik sürtünme D'yi dengeler. |D| - μₛ·N = 0 olayıyla
+  kopma anı bulunur.
+
+Geçişler scipy solve_ivp olay (event) mekanizmasıyla kök bulunarak tam
+zamanında yakalanır; sık örnekleme gerekmez.
+"""
+import math
+from typing import List, NamedTuple, Tuple, Union
+
+import numpy as np
+from scipy.integrate import solve_ivp
+
+from physics.cache import cached
+
+# Profil türleri: sabit a; rampa a → b ([0, T] boyunca); sinüs a + b·sin(2πt/T); basamak t < T iken a, sonra b
+PROFILE_KINDS = ("sabit", "rampa", "sinüs", "basamak")
+
+STUCK, UP, DOWN = 0, 1, -1
+
+# Sonsuz geçiş (Zeno) durumlarına karşı en fazla parça sayısı
+MAX_SEGMENTS = 10_000
+
+
+class Profile(NamedTuple):
+    kind: str = "sabit"
+    a: float = 0.0
+    b: float = 0.0
+    T: float = 1.0
+
+    def __call__(self, t: float) -> float:
+        if self.kind == "sabit":
+            return self.a
+        if self.kind == "rampa":
+            return self.a + (self.b - self.a) * min(max(t / self.T, 0.0), 1.0)
+        if self.kind == "sinüs":
+            return self.a + self.b * math.sin(2 * math.pi * t / self.T)
+        if self.kind == "basamak":
+            return self.a if t < self.T else self.b
+        raise ValueError(f"Bilinmeyen profil türü: {self.kind}")
+
+    def breakpoints(self) -> Tuple[float, ...]:
+        """Profilin türevinin süreksiz olduğu anlar (integratör bunları atlamamalı)."""
+        return (self.T,) if self.kind in ("rampa", "basamak") else ()
+
+
+ProfileLike = Union[Profile, float]
+
+
+def _as_profile(p: ProfileLike) -> Profile:
+    return p if isinstance(p, Profile) else Profile("sabit", float(p))
+
+
+class InclineEvent(NamedTuple):
+    t: float
+    s: float
+    kind: str  # "yapıştı", "koptu", "döndü"
+
+
+class InclineRun(NamedTuple):
+    t: np.ndarray
+    s: np.ndarray
+    v: np.ndarray
+    a: np.ndarray
+    friction: np.ndarray  # Düzleme paralel sürtünme kuvveti (yukarı +)
+    mode: np.ndarray  # STUCK, UP, DOWN
+    events: List[InclineEvent]
+
+
+@cached(maxsize=32)
+def simulate_incline(m: float, mu_s: float, mu_k: float, force: ProfileLike = 0.0, angle_deg: ProfileLike = 30.0,
+                     v0: float = 0.0, t_end: float = 10.0, g: float = 9.81, s0: float = 0.0,
+                     n: int = 400, max_step: float = np.inf) -> InclineRun:
+    """Bloğu [0, t_end] boyunca integre eder; n eşit aralıklı örnek ve tüm geçiş anları döner.
+
+    force: düzleme paralel uygulanan kuvvet (N, yukarı +), angle_deg: eğim (°).
+    Sinüs gibi hızlı profillerde max_step, kısa süreli kopmaların atlanmaması
+    için profil periyodundan küçük seçilmelidir.
+    """
+    F, theta = _as_profile(force), _as_profile(angle_deg)
+
+    def drive(t):
+        th = math.radians(theta(t))
+        return F(t) - m * g * math.sin(th), m * g * math.cos(th)
+
+    def mode_at_rest(t):
+        D, N = drive(t)
+        if abs(D) <= mu_s * N:
+            return STUCK
+        return UP if D > 0 else DOWN
+
+    def sliding(direction):
+        def rhs(t, y):
+            D, N = drive(t)
+            return (y[1], (D - direction * mu_k * N) / m)
+
+        def stop(t, y):
+            return y[1]
+
+        stop.terminal = True
+        stop.direction = -direction
+        return rhs, stop
+
+    def stuck_rhs(t, y):
+        return (0.0, 0.0)
+
+    def breakaway(t, y):
+        D, N = drive(t)
+        return abs(D) - mu_s * N
+
+    breakaway.terminal = True
+    breakaway.direction = 1
+
+    t_samples = np.linspace(0.0, t_end, n)
+    # Profil kırılma noktaları parça sınırı olur: olay fonksiyonlarının kökleri arada kaybolmaz
+    stops = sorted({b for p in (F, theta) for b in p.breakpoints() if 0.0 < b < t_end} | {t_end})
+
+    t0, s, v = 0.0, float(s0), float(v0)
+    mode = (UP if v > 0 else DOWN) if v != 0 else mode_at_rest(0.0)
+    events: List[InclineEvent] = []
+    pieces = []  # (t_a, t_b, kip, sol)
+
+    for _ in range(MAX_SEGMENTS):
+        if t0 >= t_end:
+            break
+        t_stop = next(b for b in stops if b > t0)
+        if mode == STUCK:
+            result = solve_ivp(stuck_rhs, (t0, t_stop), (s, 0.0), events=breakaway, dense_output=True,
+                               max_step=max_step, rtol=1e-9, atol=1e-9)
+        else:
+            rhs, stop = sliding(mode)
+            result = solve_ivp(rhs, (t0, t_stop), (s, v), events=stop, dense_output=True,
+                               max_step=max_step, rtol=1e-9, atol=1e-9)
+        t1 = float(result.t[-1])
+        pieces.append((t0, t1, mode, result.sol))
+        s, v = float(result.y[0, -1]), float(result.y[1, -1])
+
+        if result.status == 1:  # Olay
+            if mode == STUCK:
+                mode = mode_at_rest(t1)
+                if mode == STUCK:  # Sayısal sınır: eşiğe dokunup geri döndü
+                    mode = UP if drive(t1)[0] > 0 else DOWN
+                events.append(InclineEvent(t1, s, "koptu"))
+            else:
+                v = 0.0
+                new_mode = mode_at_rest(t1)
+                if new_mode == STUCK:
+                    events.append(InclineEvent(t1, s, "yapıştı"))
+                elif new_mode != mode:
+                    events.append(InclineEvent(t1, s, "döndü"))
+                mode = new_mode
+        elif mode != STUCK and v == 0.0:
+            mode = mode_at_rest(t1)
+        t0 = t1
+
+    # Örnekler ve geçiş anları birleştirilip her parçanın sürekli çözümünden okunur
+    # (MAX_SEGMENTS'e takılınca kapsanmayan örnekler NaN kalır)
+    t = np.union1d(t_samples, [e.t for e in events])
+    s_out, v_out, a_out, f_out = (np.full_like(t, np.nan) for _ in range(4))
+    mode_out = np.zeros(t.shape, dtype=int)
+    for t_a, t_b, piece_mode, sol in pieces:
+        mask = (t >= t_a) & (t <= t_b)
+        if not mask.any():
+            continue
+        s_out[mask], v_out[mask] = sol(t[mask])
+        mode_out[mask] = piece_mode
+        for idx in np.flatnonzero(mask):
+            D, N = drive(t[idx])
+            if piece_mode == STUCK:
+                v_out[idx] = 0.0
+                f_out[idx], a_out[idx] = -D, 0.0
+            else:
+                f_out[idx] = -piece_mode * mu_k * N
+                a_out[idx] = (D + f_out[idx]) / m
+    return InclineRun(t, s_out, v_out, a_out, f_out, mode_out, events)
@@ -0,0 +1,53 @@
+"""Grafik tepki eğrileri için vektörize dizi çekirdekleri.
+
+Sayfalardaki örnek başına Python döngüleri (append ile büyüyen listeler,
+liste üreteçleri) yerine her eğri tek bir NumPy ifadesiyle üretilir. Tüm
+çekirdekler fiziksel parametreleri ve örnek sayısı n'yi alıp dizileri
+NamedTuple olarak döndürür. Tepki eğrileri (friction_response) eşit
+aralıklı bağımsız değişkeni de içerir; çizim yolları (Path) yalnızca x ve
+y koordinatlarıdır; straight_path'in zaman parametresi t döndürülmez.
+
+Döngülü karşılıklarıyla karşılaştırma: benchmarks/bench_kernels.py
+"""
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from physics.dynamics import horizontal_friction
+
+
+class Path(NamedTuple):
+    x: np.ndarray
+    y: np.ndarray
+
+
+class FrictionCurve(NamedTuple):
+    F: np.ndarray
+    friction: np.ndarray
+    a: np.ndarray
+
+
+def friction_response(m: float, g: float, mu_s: float, mu_k: float, F_max: float, n: int = 100) -> FrictionCurve:
+    """[0, F_max] aralığında uygulanan kuvvete göre sürtünme kuvveti ve ivme.
+
+    F ≤ fₛ(max) iken cisim durur (sürtünme = F, a = 0), sonra kinetik
+    sürtünme ve a = (F - fₖ)/m geçerlidir.
+    """
+    F = np.linspace(0.0, F_max, n)
+    _, _, _, _, friction, a = horizontal_friction(m, g, mu_s, mu_k, F)
+    return FrictionCurve(F, friction, a)
+
+
+def straight_path(vx: float, vy: float, t_start: float, t_end: float, n: int = 20,
+                  x0: float = 0.0, y0: float = 0.0) -> Path:
+    """Sabit hızlı yol: (x0 + vx·t, y0 + vy·t), t ∈ [t_start, t_end]."""
+    t = np.linspace(t_start, t_end, n)
+    return Path(x0 + vx * t, y0 + vy * t)
+
+
+def zigzag(x_start: float, x_end: ArrayLike, n: int = 20, amplitude: float = 0.05) -> Path:
+    """Yay çizimi: x_start ile x_end arasında ±amplitude arasında gidip gelen n köşe."""
+    x = np.linspace(x_start, x_end, n)
+    y = np.where(np.arange(n) % 2 == 0, amplitude, -amplitude)
+    return Path(x, y)
@@ -0,0 +1,221 @@
+"""Kinematik: 1D hareket, atışlar ve düzgün dairesel hareket."""
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from physics.cache import cached
+
+
+def uniform_velocity_position(x0: ArrayLike, v: ArrayLike, t: ArrayLike):
+    """Sabit hızlı hareket: x = x₀ + v·t"""
+    return x0 + v * np.asarray(t, dtype=float)
+
+
+def uniform_acceleration_velocity(v0: ArrayLike, a: ArrayLike, t: ArrayLike):
+    """Sabit ivmeli hareket: v = v₀ + a·t"""
+    return v0 + a * np.asarray(t, dtype=float)
+
+
+def uniform_acceleration_position(x0: ArrayLike, v0: ArrayLike, a: ArrayLike, t: ArrayLike):
+    """Sabit ivmeli hareket: x = x₀ + v₀·t + ½·a·t²"""
+    t = np.asarray(t, dtype=float)
+    return x0 + v0 * t + 0.5 * a * t**2
+
+
+class FreeFall(NamedTuple):
+    t_hit: float
+    v_hit: float
+
+
+def free_fall_impact(h0: ArrayLike, v0: ArrayLike, g: ArrayLike) -> FreeFall:
+    """Yere çarpma zamanı ve hızı (h = h₀ + v₀t - ½gt² = 0).
+
+    Diskriminant negatifse (cisim yere düşmüyor) NaN döner.
+    """
+    discriminant = np.asarray(v0**2 + 2 * g * h0, dtype=float)
+    with np.errstate(invalid="ignore"):
+        t_hit = (-v0 + np.sqrt(discriminant)) / g
+    v_hit = v0 - g * t_hit
+    return FreeFall(t_hit, v_hit)
+
+
+def free_fall_height(h0: ArrayLike, v0: ArrayLike, g: ArrayLike, t: ArrayLike):
+    t = np.asarray(t, dtype=float)
+    return h0 + v0 * t - 0.5 * g * t**2
+
+
+class Projectile(NamedTuple):
+    v0x: float
+    v0y: float
+    t_max_height: float
+    max_height: float
+    x_max_height: float
+    t_flight: float
+    range_x: float
+
+
+def projectile(v0: ArrayLike, angle_deg: ArrayLike, h0: ArrayLike, g: ArrayLike) -> Projectile:
+    """Eğik atışın kapalı form büyüklükleri (boşlukta).
+
+    Uçuş süresi y = h₀ + v₀y·t - ½gt² = 0 denkleminden bulunur; çözüm yoksa
+    t_flight ve range_x NaN olur.
+    """
+    angle_rad = np.radians(angle_deg)
+    v0x = v0 * np.cos(angle_rad)
+    v0y = v0 * np.sin(angle_rad)
+
+    t_max_height = v0y / g
+    max_height = h0 + (v0y**2) / (2 * g)
+
+    discriminant = np.asarray(v0y**2 + 2 * g * h0, dtype=float)
+    with np.errstate(invalid="ignore"):
+        t_flight = (v0y + np.sqrt(discriminant)) / g
+    range_x = v0x * t_flight
+
+    return Projectile(v0x, v0y, t_max_height, max_height, v0x * t_max_height, t_flight, range_x)
+
+
+class LaunchSolutions(NamedTuple):
+    low_deg: float
+    high_deg: float
+
+
+def launch_angles(v0: ArrayLike, x: ArrayLike, y: ArrayLike, h0: ArrayLike, g: ArrayLike) -> LaunchSolutions:
+    """(x, y) hedefini vuran alçak ve yüksek atış açıları (boşlukta).
+
+    tan θ = (v² ∓ √(v⁴ - g(g·x² + 2·Δy·v²))) / (g·x),  Δy = y - h₀.
+    Hedefe ulaşılamıyorsa açılar NaN olur.
+    """
+    v2 = np.asarray(v0, dtype=float) ** 2
+    dy = np.asarray(y, dtype=float) - h0
+    x = np.asarray(x, dtype=float)
+    discriminant = v2**2 - g * (g * x**2 + 2 * dy * v2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        root = np.sqrt(discriminant)
+        low = np.degrees(np.arctan2(v2 - root, g * x))
+        high = np.degrees(np.arctan2(v2 + root, g * x))
+    return LaunchSolutions(low, high)
+
+
+class ProjectileGrid(NamedTuple):
+    """Açı × v₀ × h₀ ızgarası; sonuç dizilerinin şekli (Nθ, Nv, Nh)."""
+    angle_deg: np.ndarray
+    v0: np.ndarray
+    h0: np.ndarray
+    range_x: np.ndarray
+    max_height: np.ndarray
+    t_flight: np.ndarray
+
+    def best_angle(self, metric: str = "range_x"):
+        """Her (v₀, h₀) için metriği en büyük yapan açı ve o değer; şekil (Nv, Nh)."""
+        values = np.where(np.isfinite(getattr(self, metric)), getattr(self, metric), -np.inf)
+        idx = np.argmax(values, axis=0)
+        return self.angle_deg[idx], np.take_along_axis(values, idx[np.newaxis], axis=0)[0]
+
+    def optimum(self, metric: str = "range_x"):
+        """Tüm ızgaradaki en iyi nokta: (açı, v₀, h₀, değer)."""
+        values = getattr(self, metric)
+        i, j, k = np.unravel_index(np.nanargmax(values), values.shape)
+        return self.angle_deg[i], self.v0[j], self.h0[k], values[i, j, k]
+
+
+def projectile_grid(angles_deg: ArrayLike, speeds: ArrayLike, heights: ArrayLike, g: float) -> ProjectileGrid:
+    """Boşluktaki atışı tüm (açı, v₀, h₀) ızgarasında tek vektörize geçişte hesaplar."""
+    angles_deg, speeds, heights = (np.atleast_1d(np.asarray(a, dtype=float)) for a in (angles_deg, speeds, heights))
+    p = projectile(speeds[None, :, None], angles_deg[:, None, None], heights[None, None, :], g)
+    shape = (angles_deg.size, speeds.size, heights.size)
+    return ProjectileGrid(angles_deg, speeds, heights,
+                          *(np.broadcast_to(a, shape) for a in (p.range_x, p.max_height, p.t_flight)))
+
+
+def projectile_path(v0x: ArrayLike, v0y: ArrayLike, h0: ArrayLike, g: ArrayLike, t: ArrayLike):
+    """Eğik atış yörüngesi (x(t), y(t))."""
+    t = np.asarray(t, dtype=float)
+    return v0x * t, h0 + v0y * t - 0.5 * g * t**2
+
+
+class ProjectileSeries(NamedTuple):
+    t: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    vx: np.ndarray
+    vy: np.ndarray
+
+
+@cached(maxsize=64)
+def projectile_series(v0: float, angle_deg: float, h0: float, g: float, n: int = 200) -> ProjectileSeries:
+    """Kalkıştan inişe n örnekli yörünge ve hız bileşenleri (önbellekli)."""
+    p = projectile(v0, angle_deg, h0, g)
+    t = np.linspace(0, p.t_flight, n)
+    x, y = projectile_path(p.v0x, p.v0y, h0, g, t)
+    return ProjectileSeries(t, x, y, np.full_like(t, p.v0x), uniform_acceleration_velocity(p.v0y, -g, t))
+
+
+class HorizontalProjectile(NamedTuple):
+    t_flight: float
+    range_x: float
+    v_final: float
+
+
+def horizontal_projectile(v0: ArrayLike, h0: ArrayLike, g: ArrayLike) -> HorizontalProjectile:
+    """Yatay atış: uçuş süresi, menzil ve yere çarpma hızı."""
+    t_flight = np.sqrt(2 * h0 / g)
+    range_x = v0 * t_flight
+    v_final = np.sqrt(v0**2 + (g * t_flight)**2)
+    return HorizontalProjectile(t_flight, range_x, v_final)
+
+
+class RiverCrossing(NamedTuple):
+    v_swim_x: float
+    v_swim_y: float
+    v_net_x: float
+    v_net: float
+    t_cross: float
+    drift: float
+
+
+def river_crossing(v_swimmer: ArrayLike, v_river: ArrayLike, river_width: ArrayLike,
+                   angle_deg: ArrayLike) -> RiverCrossing:
+    """Nehir problemi; açı akıntı yönüne göre ölçülür.
+
+    Yüzücünün karşıya doğru hız bileşeni pozitif değilse t_cross ve drift NaN olur.
+    """
+    angle_rad = np.radians(angle_deg)
+    v_swim_x = v_swimmer * np.cos(angle_rad)  # Akıntı yönü
+    v_swim_y = v_swimmer * np.sin(angle_rad)  # Karşıya
+
+    v_net_x = v_swim_x + v_river
+    v_net = np.sqrt(v_net_x**2 + v_swim_y**2)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t_cross = np.where(v_swim_y > 0, river_width / np.where(v_swim_y > 0, v_swim_y, 1), np.nan)
+    drift = v_net_x * t_cross
+    return RiverCrossing(v_swim_x, v_swim_y, v_net_x, v_net, t_cross, drift)
+
+
+class CircularMotion(NamedTuple):
+    T: float
+    f: float
+    omega: float
+    v: float
+    ac: float
+
+
+def circular_from_period(T: ArrayLike, r: ArrayLike) -> CircularMotion:
+    omega = 2 * np.pi / T
+    return CircularMotion(T, 1 / T, omega, omega * r, omega**2 * r)
+
+
+def circular_from_frequency(f: ArrayLike, r: ArrayLike) -> CircularMotion:
+    return circular_from_period(1 / f, r)
+
+
+def circular_from_angular_velocity(omega: ArrayLike, r: ArrayLike) -> CircularMotion:
+    return CircularMotion(2 * np.pi / omega, omega / (2 * np.pi), omega, omega * r, omega**2 * r)
+
+
+def centripetal(m: ArrayLike, v: ArrayLike, r: ArrayLike):
+    """Merkezcil ivme ve kuvvet: (aᶜ, Fᶜ)."""
+    ac = v**2 / r
+    return ac, m * ac
@@ -0,0 +1,126 @@
+"""Momentum, itme ve çarpışmalar."""
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+def momentum(m: ArrayLike, v: ArrayLike):
+    """p = m·v"""
+    return m * v
+
+
+class Impulse(NamedTuple):
+    p1: float
+    p2: float
+    dp: float
+    F_avg: float
+
+
+def impulse(m: ArrayLike, v1: ArrayLike, v2: ArrayLike, dt: ArrayLike) -> Impulse:
+    """I = F·Δt = Δp"""
+    p1 = m * v1
+    p2 = m * v2
+    dp = p2 - p1
+    return Impulse(p1, p2, dp, dp / dt)
+
+
+def total_kinetic_energy(m1: ArrayLike, v1: ArrayLike, m2: ArrayLike, v2: ArrayLike):
+    return 0.5 * m1 * v1**2 + 0.5 * m2 * v2**2
+
+
+class Collision(NamedTuple):
+    v1_final: float
+    v2_final: float
+    p_initial: float
+    p_final: float
+    KE_initial: float
+    KE_final: float
+    energy_loss: float
+
+
+def restitution_collision(m1: ArrayLike, v1: ArrayLike, m2: ArrayLike, v2: ArrayLike,
+                          e: ArrayLike) -> Collision:
+    """Restitüsyon katsayılı 1D çarpışma: e = (v₂' - v₁') / (v₁ - v₂).
+
+    e = 1 elastik, e = 0 tam inelastik (cisimler birleşik hızla hareket eder).
+    """
+    p_initial = m1 * v1 + m2 * v2
+    KE_initial = total_kinetic_energy(m1, v1, m2, v2)
+
+    v_rel = v1 - v2
+    v1_final = (p_initial - m2 * e * v_rel) / (m1 + m2)
+    v2_final = (p_initial + m1 * e * v_rel) / (m1 + m2)
+
+    p_final = m1 * v1_final + m2 * v2_final
+    KE_final = total_kinetic_energy(m1, v1_final, m2, v2_final)
+    return Collision(v1_final, v2_final, p_initial, p_final, KE_initial, KE_final, KE_initial - KE_final)
+
+
+def elastic_collision(m1: ArrayLike, v1: ArrayLike, m2: ArrayLike, v2: ArrayLike) -> Collision:
+    """Elastik çarpışma: hem momentum hem kinetik enerji korunur."""
+    return restitution_collision(m1, v1, m2, v2, 1.0)
+
+
+def perfectly_inelastic_collision(m1: ArrayLike, v1: ArrayLike, m2: ArrayLike, v2: ArrayLike) -> Collision:
+    """Tam inelastik çarpışma: cisimler birleşir, sadece momentum korunur."""
+    return restitution_collision(m1, v1, m2, v2, 0.0)
+
+
+def collision_positions(v1: float, v2: float, v1_final: float, v2_final: float, n_frames: int = 60,
+                        t_before: float = 2.0, t_after: float = 2.0) -> np.ndarray:
+    """1D çarpışma animasyonu için kare başına konumlar, şekil (2, n_frames).
+
+    Karelerin ilk %40'ı çarpışma öncesi, %40–50 arası çarpışma anı (x = 0),
+    kalanı çarpışma sonrasıdır.
+    """
+    i = np.arange(n_frames)
+    before = i < n_frames * 0.4
+    during = ~before & (i < n_frames * 0.5)
+    t_b = i / (n_frames * 0.4) * t_before
+    t_a = (i - n_frames * 0.5) / (n_frames * 0.5) * t_after
+    v_initial = np.array([[v1], [v2]])
+    v_final = np.array([[v1_final], [v2_final]])
+    return np.where(before, v_initial * (t_b - t_before), np.where(during, 0.0, v_final * t_a))
+
+
+class Collision2D(NamedTuple):
+    px_initial: float
+    py_initial: float
+    KE_initial: float
+    vx_final: float
+    vy_final: float
+    KE_final: float
+    energy_loss: float
+
+
+def perfectly_inelastic_collision_2d(m1: ArrayLike, v1x: ArrayLike, v1y: ArrayLike,
+                                     m2: ArrayLike, v2x: ArrayLike, v2y: ArrayLike) -> Collision2D:
+    """2D tam inelastik çarpışma: x ve y momentumları ayrı ayrı korunur."""
+    px_initial = m1 * v1x + m2 * v2x
+    py_initial = m1 * v1y + m2 * v2y
+    KE_initial = 0.5 * m1 * (v1x**2 + v1y**2) + 0.5 * m2 * (v2x**2 + v2y**2)
+
+    vx_final = px_initial / (m1 + m2)
+    vy_final = py_initial / (m1 + m2)
+    KE_final = 0.5 * (m1 + m2) * (vx_final**2 + vy_final**2)
+    return Collision2D(px_initial, py_initial, KE_initial, vx_final, vy_final, KE_final, KE_initial - KE_final)
+
+
+class ObliqueCollision(NamedTuple):
+    v1x: float
+    v1y: float
+    v2x: float
+    v2y: float
+
+
+def oblique_collision_2d(m1: ArrayLike, v1x: ArrayLike, v1y: ArrayLike, m2: ArrayLike, v2x: ArrayLike,
+                         v2y: ArrayLike, nx: ArrayLike, ny: ArrayLike, e: ArrayLike = 1.0) -> ObliqueCollision:
+    """Eğik (merkezî olmayan) 2D çarpışma; (nx, ny) 1'den 2'ye birim çarpışma normali.
+
+    Normal doğrultudaki hız bileşenleri restitution_collision ile aynı e
+    bağıntısına uyar, teğetsel bileşenler (sürtünmesiz temas) korunur.
+    """
+    v_rel_n = (v2x - v1x) * nx + (v2y - v1y) * ny
+    J = -(1 + e) * v_rel_n / (1 / m1 + 1 / m2)
+    return ObliqueCollision(v1x - J / m1 * nx, v1y - J / m1 * ny, v2x + J / m2 * nx, v2y + J / m2 * ny)
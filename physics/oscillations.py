@@ -0,0 +1,182 @@
+"""Salınımlar: yay-kütle sistemi ve basit sarkaç.
+
+Sarkaç küçük açı yaklaşımı olmadan, tam doğrusal olmayan çözümüyle verilir:
+k = sin(θ₀/2), ω₀ = √(g/L) için
+
+    sin(θ/2) = k·sn(K(k) - ω₀t, k),    θ' = -2kω₀·cn(K(k) - ω₀t, k),
+    T = 4·K(k)/ω₀
+
+K tam eliptik integral, sn/cn Jacobi eliptik fonksiyonlarıdır. İkisi de
+aritmetik-geometrik ortalama (AGM) ile birkaç NumPy dizi işleminde
+hesaplanır; scipy gerekmez ve maliyet kapalı cos(ωt) formülüyle aynı
+mertebededir.
+"""
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from physics.cache import cached
+
+
+class SHMParams(NamedTuple):
+    omega: float
+    T: float
+    f: float
+    v_max: float
+    a_max: float
+    E_total: float
+
+
+def shm_params(m: ArrayLike, k: ArrayLike, A: ArrayLike) -> SHMParams:
+    """Yay-kütle sistemi: ω = √(k/m), T = 2π/ω."""
+    omega = np.sqrt(k / m)
+    T = 2 * np.pi / omega
+    return SHMParams(omega, T, 1 / T, A * omega, A * omega**2, 0.5 * k * A**2)
+
+
+class SHMState(NamedTuple):
+    x: np.ndarray
+    v: np.ndarray
+    a: np.ndarray
+    KE: np.ndarray
+    PE: np.ndarray
+
+
+def shm_state(m: float, k: float, A: float, phi: float, t: ArrayLike) -> SHMState:
+    """x(t) = A·cos(ωt + φ) ve türevleri, anlık kinetik/potansiyel enerji."""
+    omega = np.sqrt(k / m)
+    phase = omega * np.asarray(t, dtype=float) + phi
+    x = A * np.cos(phase)
+    v = -A * omega * np.sin(phase)
+    a = -A * omega**2 * np.cos(phase)
+    return SHMState(x, v, a, 0.5 * m * v**2, 0.5 * k * x**2)
+
+
+@cached(maxsize=64)
+def shm_series(m: float, k: float, A: float, phi: float, t_end: float, n: int = 500):
+    """[0, t_end] aralığında n örnekli zaman dizisi ve SHMState (önbellekli)."""
+    t = np.linspace(0, t_end, n)
+    return t, shm_state(m, k, A, phi, t)
+
+
+# AGM yakınsama eşiği; k < 1 - 1e-12 için en fazla ~8 yineleme
+AGM_TOL = 1e-15
+
+
+def ellipk(k: ArrayLike) -> np.ndarray:
+    """Birinci tür tam eliptik integral K(k) (k modül, 0 ≤ k < 1): K = π / (2·AGM(1, √(1-k²)))."""
+    k = np.asarray(k, dtype=float)
+    if np.any(np.abs(k) >= 1):
+        raise ValueError("K(k) yalnızca |k| < 1 için tanımlı (sarkaçta |θ₀| < 180°)")
+    a, b = np.ones_like(k), np.sqrt(1 - k ** 2)
+    while np.any(np.abs(a - b) > AGM_TOL * a):
+        a, b = 0.5 * (a + b), np.sqrt(a * b)
+    return np.pi / (2 * a)
+
+
+def jacobi_sn_cn(u: ArrayLike, k: float):
+    """Jacobi sn(u, k) ve cn(u, k); azalan AGM dizisi ve geri yerine koyma (Abramowitz-Stegun 16.4)."""
+    a, b, c = [1.0], [np.sqrt(1 - k ** 2)], [k]
+    while abs(c[-1]) > AGM_TOL:
+        a.append(0.5 * (a[-1] + b[-1]))
+        b.append(np.sqrt(a[-2] * b[-1]))
+        c.append(0.5 * (a[-2] - b[-2]))
+    n = len(a) - 1
+    phi = 2.0 ** n * a[n] * np.asarray(u, dtype=float)
+    for i in range(n, 0, -1):
+        phi = 0.5 * (phi + np.arcsin(c[i] / a[i] * np.sin(phi)))
+    return np.sin(phi), np.cos(phi)
+
+
+# Sönüm rejimleri (ζ < 1, ζ = 1, ζ > 1)
+UNDERDAMPED, CRITICAL, OVERDAMPED = "az sönümlü", "kritik sönümlü", "aşırı sönümlü"
+
+
+class DampingParams(NamedTuple):
+    omega0: float  # Sönümsüz doğal açısal frekans √(k/m)
+    gamma: float  # c/(2m)
+    zeta: float  # Sönüm oranı γ/ω₀
+    omega_d: float  # Sönümlü açısal frekans (yalnızca az sönümlüde, aksi hâlde 0)
+    omega_r: float  # Genlik rezonansı ω₀·√(1 - 2ζ²) (ζ ≥ 1/√2 ise NaN)
+    Q: float  # Kalite faktörü 1/(2ζ)
+    regime: str
+
+
+def damping_params(m: float, k: float, c: float, rtol: float = 1e-9) -> DampingParams:
+    """m·x'' + c·x' + k·x = 0 için sönüm oranı ve rejim; |ζ - 1| ≤ rtol kritik sayılır."""
+    omega0 = np.sqrt(k / m)
+    gamma = c / (2 * m)
+    zeta = gamma / omega0
+    regime = CRITICAL if abs(zeta - 1) <= rtol else (UNDERDAMPED if zeta < 1 else OVERDAMPED)
+    omega_d = omega0 * np.sqrt(1 - zeta**2) if regime == UNDERDAMPED else 0.0
+    omega_r = omega0 * np.sqrt(1 - 2 * zeta**2) if zeta**2 < 0.5 else np.nan
+    Q = 1 / (2 * zeta) if zeta > 0 else np.inf
+    return DampingParams(omega0, gamma, zeta, omega_d, omega_r, Q, regime)
+
+
+class SteadyState(NamedTuple):
+    amplitude: np.ndarray
+    phase: np.ndarray  # Konumun kuvvetin gerisinde kalma açısı δ (rad), [0, π]
+
+
+def steady_state(m: ArrayLike, k: ArrayLike, c: ArrayLike, F0: ArrayLike, omega: ArrayLike) -> SteadyState:
+    """F₀·cos(ωt) ile sürülen sistemin kalıcı yanıtı x = A·cos(ωt - δ).
+
+    A = F₀ / √((k - mω²)² + (cω)²), δ = atan2(cω, k - mω²). Tüm argümanlar
+    yayınlanır: binlerce frekans (ve birkaç sönüm değeri) tek çağrıda hesaplanır.
+    Sönümsüz rezonansta (c = 0, ω = ω₀) genlik sonsuzdur.
+    """
+    omega = np.asarray(omega, dtype=float)
+    stiffness, drag = k - m * omega**2, c * omega
+    with np.errstate(divide="ignore"):
+        return SteadyState(F0 / np.hypot(stiffness, drag), np.arctan2(drag, stiffness))
+
+
+class PendulumParams(NamedTuple):
+    omega: float  # Etkin açısal frekans 2π/T
+    T: float
+    f: float
+
+
+def pendulum_params(L: ArrayLike, g: ArrayLike, theta_0: ArrayLike = 0.0) -> PendulumParams:
+    """Basit sarkaç: T = 4·K(sin(θ₀/2))·√(L/g); θ₀ → 0 için T = 2π√(L/g)."""
+    T = 4 * ellipk(np.sin(np.asarray(theta_0) / 2)) * np.sqrt(L / g)
+    return PendulumParams(2 * np.pi / T, T, 1 / T)
+
+
+class PendulumState(NamedTuple):
+    theta: np.ndarray
+    theta_dot: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    v: np.ndarray
+    KE: np.ndarray
+    PE: np.ndarray
+
+
+def pendulum_state(L: float, g: float, m: float, theta_0: float, t: ArrayLike) -> PendulumState:
+    """t = 0'da θ₀'dan durgun bırakılan sarkacın tam çözümü (|θ₀| < π); kartezyen konum, çizgisel hız, enerji."""
+    omega = np.sqrt(g / L)
+    k = np.sin(abs(theta_0) / 2)
+    K = float(ellipk(k))
+    # Büyük t'de AGM açısı büyümesin diye faz bir periyoda (4K) indirgenir
+    u = np.mod(K - omega * np.asarray(t, dtype=float), 4 * K)
+    sn, cn = jacobi_sn_cn(u, k)
+    sign = np.sign(theta_0)
+    theta = sign * 2 * np.arcsin(k * sn)
+    theta_dot = -sign * 2 * k * omega * cn
+    v = L * theta_dot
+    PE = m * g * L * (1 - np.cos(theta))
+    return PendulumState(theta, theta_dot, L * np.sin(theta), -L * np.cos(theta), v, 0.5 * m * v**2, PE)
+
+
+@cached(maxsize=64)
+def pendulum_series(L: float, g: float, m: float, theta_0: float, t_end: float, n: int = 500):
+    """[0, t_end] aralığında n örnekli zaman dizisi ve PendulumState (önbellekli)."""
+    t = np.linspace(0, t_end, n)
+    return t, pendulum_state(L, g, m, theta_0, t)
+
+
+def pendulum_total_energy(m: ArrayLike, g: ArrayLike, L: ArrayLike, theta_0: ArrayLike):
+    return m * g * L * (1 - np.cos(theta_0))
@@ -0,0 +1,199 @@
+"""Genel makara/ip ağı çözücüsü.
+
+Her cisim bir genelleştirilmiş koordinata sahiptir: asılı blok ve hareketli
+makara için düşey konum (aşağı +), masadaki blok için yatay konum, her
+makara için dönme açısı. Esnemeyen her ip parçası doğrusal bir uzunluk
+kısıtıdır:
+
+    Σ cₖ·qₖ = sabit   ⇒   A·q̈ = 0
+
+cₖ, qₖ bir birim arttığında ipin o parçasının ne kadar uzadığıdır. Gerilme
+T, ipin kısalma yönünde çektiği için qₖ'ya -T·cₖ genelleştirilmiş kuvvet
+uygular. Hareket denklemleri ile kısıtlar birlikte tek bir seyrek doğrusal
+sistem (KKT / eyer noktası) olarak kurulup scipy.sparse ile çözülür:
+
+    [M  Aᵀ] [q̈]   [Q]
+    [A  0 ] [T ] = [0]
+
+M köşegen kütle/eylemsizlik matrisi, Q yerçekimi, uygulanan kuvvet ve
+sürtünmedir. Kütlesiz makaralarda (I = 0) M'nin köşegeni sıfır olur;
+kısıtlar yine sistemi belirler. Onlarca cisimli ağlar milisaniyeler içinde
+çözülür.
+"""
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import spsolve
+
+# Hareket yönü belirlenirken sıfır sayılan ivme (m/s²)
+A_TOL = 1e-12
+
+
+class Coord(NamedTuple):
+    index: int
+    name: str
+
+
+class Pulley(NamedTuple):
+    rot: Coord  # Dönme açısı (saat yönü +)
+    trans: Optional[Coord]  # Hareketli makarada düşey konum (aşağı +)
+    R: float
+
+
+class PulleySolution(NamedTuple):
+    names: List[str]
+    a: np.ndarray  # Koordinat başına ivme (dönmede açısal ivme, rad/s²)
+    T: np.ndarray  # İp parçası başına gerilme (N)
+    rope_names: List[str]
+    static: bool  # Sürtünme hareketi engelledi; ivmeler sıfır, gerilmeler belirsiz (NaN)
+
+
+class PulleyNetwork:
+    """Makara ağı kurucusu: cisimler ve ipler eklenir, solve() ile tek adımda çözülür."""
+
+    def __init__(self, g: float = 9.81):
+        self.g = g
+        self._mass: List[float] = []
+        self._force: List[float] = []
+        self._mu: List[float] = []  # Masadaki bloğun normal kuvvetiyle çarpılan kinetik sürtünme katsayısı
+        self._names: List[str] = []
+        self._ropes: List[Tuple[str, Sequence[Tuple[Coord, float]]]] = []
+
+    def _coord(self, name: str, mass: float, force: float = 0.0, mu: float = 0.0) -> Coord:
+        self._mass.append(float(mass))
+        self._force.append(float(force))
+        self._mu.append(float(mu))
+        self._names.append(name)
+        return Coord(len(self._names) - 1, name)
+
+    def hanging(self, m: float, name: Optional[str] = None, F: float = 0.0) -> Coord:
+        """Asılı blok (aşağı +); F ek düşey kuvvettir (aşağı +)."""
+        return self._coord(name or f"blok {len(self._names) + 1}", m, m * self.g + F)
+
+    def table(self, m: float, mu: float = 0.0, name: Optional[str] = None, F: float = 0.0) -> Coord:
+        """Yatay masadaki blok; F koordinat yönünde uygulanan kuvvet, mu kinetik sürtünme."""
+        return self._coord(name or f"blok {len(self._names) + 1}", m, F, mu * m * self.g)
+
+    def pulley(self, R: float = 0.1, I: float = 0.0, m: float = 0.0, movable: bool = False,
+               name: Optional[str] = None) -> Pulley:
+        """Makara; I dönme eylemsizliği (kütlesiz makarada 0). Hareketli makara m·g ile yüklenir."""
+        name = name or f"makara {sum(n.endswith('(dönme)') for n in self._names) + 1}"
+        rot = self._coord(f"{name} (dönme)", I)
+        trans = self._coord(f"{name} (konum)", m, m * self.g) if movable else None
+        return Pulley(rot, trans, float(R))
+
+    def rope(self, *terms: Tuple[Coord, float], name: Optional[str] = None) -> int:
+        """İp parçası: Σ cₖ·qₖ = sabit. terms (koordinat, cₖ) çiftleridir.
+
+        Örnek: makaranın solundan sarkan blok için (blok, 1), (makara.rot, -R);
+        sağındaki için (blok2, 1), (makara.rot, R).
+        """
+        self._ropes.append((name or f"ip {len(self._ropes) + 1}", terms))
+        return len(self._ropes) - 1
+
+    def over(self, pulley: Pulley, left: Coord, right: Coord, c_left: float = 1.0,
+             c_right: float = 1.0) -> Tuple[int, int]:
+        """pulley üzerinden geçen ip: sol ve sağ parçalar ayrı gerilmelidir (I > 0 iken farklı)."""
+        a = self.rope((left, c_left), (pulley.rot, -pulley.R))
+        b = self.rope((right, c_right), (pulley.rot, pulley.R))
+        return a, b
+
+    def _system(self, friction: np.ndarray):
+        n, k = len(self._names), len(self._ropes)
+        rows, cols, vals = [], [], []
+        for r, (_, terms) in enumerate(self._ropes):
+            for coord, c in terms:
+                rows.append(r)
+                cols.append(coord.index)
+                vals.append(c)
+        A = sp.coo_matrix((vals, (rows, cols)), shape=(k, n))
+        M = sp.diags(self._mass)
+        K = sp.bmat([[M, A.T], [A, None]], format="csc")
+        rhs = np.concatenate([np.asarray(self._force) + friction, np.zeros(k)])
+        x = spsolve(K, rhs)
+        return x[:n], x[n:]
+
+    def solve(self) -> PulleySolution:
+        """İvmeleri ve ip gerilmelerini tek seyrek çözümle bulur.
+
+        Sürtünme, sürtünmesiz çözümden bulunan hareket yönüne karşı uygulanır;
+        sürtünme bir bloğun yönünü tersine çevirecek kadar büyükse sistem
+        durgun kalır (static=True).
+        """
+        mu_N = np.asarray(self._mu)
+        rope_names = [name for name, _ in self._ropes]
+        a, T = self._system(np.zeros(len(mu_N)))
+        rubbing = mu_N > 0
+        if rubbing.any():
+            direction = np.sign(np.where(np.abs(a) > A_TOL, a, 0.0))
+            a, T = self._system(-direction * mu_N)
+            if np.any(rubbing & (direction * a < -A_TOL)) or not np.any(direction[rubbing]):
+                return PulleySolution(list(self._names), np.zeros_like(a), np.full_like(T, np.nan),
+                                      rope_names, True)
+        return PulleySolution(list(self._names), a, T, rope_names, False)
+
+
+def atwood(m1: float, m2: float, g: float = 9.81, I: float = 0.0, R: float = 0.1) -> PulleyNetwork:
+    """Klasik Atwood düzeneği; I > 0 ise makara kütlelidir."""
+    net = PulleyNetwork(g)
+    b1, b2 = net.hanging(m1, "m₁"), net.hanging(m2, "m₂")
+    net.over(net.pulley(R, I, name="makara"), b1, b2)
+    return net
+
+
+def table_and_hanging(m_table: float, mu: float, m_hanging: float, g: float = 9.81, I: float = 0.0,
+                      R: float = 0.1) -> PulleyNetwork:
+    """Masadaki blok, masa kenarındaki makara üzerinden asılı bloğa bağlı.
+
+    Masadaki bloğun koordinatı makaraya doğrudur (ip kısalır, cₖ = -1).
+    """
+    net = PulleyNetwork(g)
+    b1 = net.table(m_table, mu, "masadaki blok")
+    b2 = net.hanging(m_hanging, "asılı blok")
+    net.over(net.pulley(R, I, name="makara"), b1, b2, c_left=-1.0)
+    return net
+
+
+def compound(m_load: float, m_effort: float, n_stages: int = 1, g: float = 9.81, m_pulley: float = 0.0,
+             I: float = 0.0, R: float = 0.1) -> PulleyNetwork:
+    """Bileşik (İspanyol tipi) makara zinciri.
+
+    Yük, n_stages hareketli makaranın sonuncusuna asılıdır. Her hareketli
+    makaranın ipinin bir ucu tavana, öbür ucu bir öncekinin eksenine
+    bağlıdır; ilk makaranın ipi sabit bir makaradan geçip karşı kütleye
+    iner. İdeal durumda dengede m_effort = m_load / 2ⁿ.
+    """
+    net = PulleyNetwork(g)
+    effort = net.hanging(m_effort, "karşı kütle")
+    top = net.pulley(R, I, name="sabit makara")
+    movers = [net.pulley(R, I, m_pulley, movable=True, name=f"hareketli makara {k + 1}") for k in range(n_stages)]
+    load = net.hanging(m_load, "yük")
+
+    # Karşı kütle sabit makaranın solundan sarkar; sağından inen ip birinci hareketli makaraya gider
+    net.rope((effort, 1.0), (top.rot, -top.R), name="ip (karşı kütle)")
+    upper = (top.rot, top.R)
+    for mover in movers:
+        # Yukarıdan inen ip makaranın altından geçip tavana çıkar
+        net.rope(upper, (mover.trans, 1.0), (mover.rot, -mover.R))
+        net.rope((mover.trans, 1.0), (mover.rot, mover.R))
+        # Sonraki makaranın ipi bu makaranın eksenine bağlıdır
+        upper = (mover.trans, -1.0)
+    # Yük son hareketli makaranın eksenine rijit bağlıdır (aynı ivme)
+    net.rope((load, 1.0), (movers[-1].trans, -1.0), name="askı")
+    return net
+
+
+def block_chain(masses: Sequence[float], mu: float = 0.0, m_hanging: float = 1.0, g: float = 9.81,
+                I: float = 0.0, R: float = 0.1) -> PulleyNetwork:
+    """Masada iplerle art arda bağlı bloklar; sondaki makaradan bir blok sarkar."""
+    net = PulleyNetwork(g)
+    blocks = [net.table(m, mu, f"masa bloğu {k + 1}") for k, m in enumerate(masses)]
+    for left, right in zip(blocks[:-1], blocks[1:]):
+        # Bloklar makaraya doğru (+) ilerler; aradaki ip: q_sol - q_sağ = sabit
+        net.rope((left, -1.0), (right, 1.0))
+    hanging = net.hanging(m_hanging, "asılı blok")
+    p = net.pulley(R, I, name="makara")
+    net.rope((blocks[-1], -1.0), (p.rot, -p.R))
+    net.rope((hanging, 1.0), (p.rot, p.R))
+    return net
@@ -0,0 +1,187 @@
+"""Hesaplayıcıları yerel bir HTTP/JSON servisi olarak sunar (yalnızca standart kütüphane).
+
+    python -m physics serve --port 8765
+
+Uç noktalar:
+
+* GET  /calculators            → tüm hesaplayıcılar ve parametreleri
+* GET  /calculators/<ad>       → tek hesaplayıcının tanımı
+* POST /calc/<ad>              → gövde bir parametre nesnesi (sonuç nesnesi döner)
+                                 veya nesne dizisi (aynı sırada sonuç dizisi döner)
+* GET  /stats                  → önbellek sayaçları ve bekleyen iş sayısı
+
+Sunucu asyncio akışları üzerinde çalışan küçük bir HTTP/1.1 (keep-alive)
+uygulamasıdır. Satır sonuçları (hesaplayıcı, parametreler) anahtarıyla
+süreç içi bir LRU'da tutulur; bir dizideki yalnızca önbellekte olmayan
+satırlar tek evaluate() çağrısıyla hesaplanır. Küçük vektörize işler olay
+döngüsünde, büyük diziler iş parçacığı havuzunda, ağır (ODE/olay
+çözücü) hesaplayıcılar süreç havuzunda çözülür. Aynı anda havuzlara
+verilen iş sayısı sınırlıdır; sınır dolduğunda istek kısa bir süre bekler,
+sonra 503 ile reddedilir. Böylece ani istek yığınları olay döngüsünü
+kilitlemez.
+"""
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
+
+from physics import cache, calculators
+
+# Bu sayıdan az satırlı vektörize istekler olay döngüsünde doğrudan hesaplanır
+INLINE_ROWS = 256
+MAX_BODY_BYTES = 16 * 1024 * 1024
+RESULT_CACHE_SIZE = 100_000
+# Havuz dolduğunda yeni işin yer beklediği en uzun süre (s)
+QUEUE_TIMEOUT = 5.0
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ComputeService:
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None,
+                 cache_size: int = RESULT_CACHE_SIZE):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 4 * self.workers
+        self.results = cache.register("physics.service", cache.LRUCache(cache_size, 256 * 1024 * 1024))
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.pending = 0
+
+    # --- Hesaplama ---
+
+    async def _offload(self, calc: calculators.Calculator, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if not calc.heavy and len(rows) < INLINE_ROWS:
+            return calculators.evaluate(calc.name, rows)
+        try:
+            await asyncio.wait_for(self._slots.acquire(), QUEUE_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "Sunucu meşgul, daha sonra tekrar deneyin")
+        self.pending += 1
+        try:
+            pool = self._processes if calc.heavy else self._threads
+            return await asyncio.get_running_loop().run_in_executor(pool, calculators.evaluate, calc.name, rows)
+        finally:
+            self.pending -= 1
+            self._slots.release()
+
+    async def compute(self, name: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Önbellekteki satırları doğrudan, kalanları tek toplu çağrıyla hesaplar.
+
+        evaluate() bir satırın sonucunu aynı çağrıdaki diğer satırlardan
+        bağımsız verdiği için satır sonucu tek başına önbelleğe alınabilir.
+        """
+        calc = calculators.REGISTRY[name]
+        keys = [(name, json.dumps(row, sort_keys=True, default=str)) for row in rows]
+        results = [self.results.get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            fresh = await self._offload(calc, [rows[i] for i in missing])
+            for i, result in zip(missing, fresh):
+                results[i] = result
+                if "hata" not in result:
+                    self.results.put(keys[i], result)
+        return results
+
+    # --- HTTP ---
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> Tuple[HTTPStatus, Any]:
+        parts = [p for p in path.split("?", 1)[0].split("/") if p]
+        if method == "GET" and parts == ["calculators"]:
+            return HTTPStatus.OK, calculators.describe()
+        if method == "GET" and len(parts) == 2 and parts[0] == "calculators":
+            if parts[1] not in calculators.REGISTRY:
+                raise HTTPError(HTTPStatus.NOT_FOUND, f"Bilinmeyen hesaplayıcı: {parts[1]}")
+            return HTTPStatus.OK, calculators.describe(parts[1])[0]
+        if method == "GET" and parts == ["stats"]:
+            return HTTPStatus.OK, {"pending": self.pending, "max_pending": self.max_pending,
+                                   "cache": {k: v._asdict() for k, v in cache.stats().items()}}
+        if len(parts) == 2 and parts[0] == "calc":
+            if method != "POST":
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "Hesaplama için POST kullanın")
+            if parts[1] not in calculators.REGISTRY:
+                raise HTTPError(HTTPStatus.NOT_FOUND, f"Bilinmeyen hesaplayıcı: {parts[1]}")
+            try:
+                payload = json.loads(body or b"null")
+            except ValueError as exc:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, f"Geçersiz JSON: {exc}")
+            rows = payload if isinstance(payload, list) else [payload]
+            if not all(isinstance(row, dict) for row in rows):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "Gövde bir nesne veya nesne dizisi olmalı")
+            results = await self.compute(parts[1], rows)
+            return HTTPStatus.OK, results if isinstance(payload, list) else results[0]
+        raise HTTPError(HTTPStatus.NOT_FOUND, f"Bilinmeyen yol: {path}")
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break  # HTTP istek satırı değil
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+                try:
+                    try:
+                        length = int(headers.get("content-length", 0))
+                    except ValueError:
+                        keep_alive = False
+                        raise HTTPError(HTTPStatus.BAD_REQUEST, "Geçersiz Content-Length")
+                    if length > MAX_BODY_BYTES:
+                        keep_alive = False
+                        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Gövde çok büyük")
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = await self.dispatch(method, path, body)
+                except HTTPError as exc:
+                    status, payload = exc.status, {"hata": str(exc)}
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    raise
+                except Exception as exc:  # Hesaplayıcıdaki beklenmeyen hata: bağlantı yanıtsız kapanmaz
+                    status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"hata": f"{type(exc).__name__}: {exc}"}
+
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # Kopan bağlantı: yalnızca bu bağlantı kapanır
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        self._slots = asyncio.Semaphore(self.max_pending)
+        with ThreadPoolExecutor(self.workers) as threads, ProcessPoolExecutor(self.workers) as processes:
+            self._threads, self._processes = threads, processes
+            server = await asyncio.start_server(self.handle, host, port)
+            print(f"fiziksim servis: http://{host}:{port} ({self.workers} işçi)", flush=True)
+            async with server:
+                await server.serve_forever()
+
+
+def run(host: str = "127.0.0.1", port: int = 8765, workers: Optional[int] = None,
+        max_pending: Optional[int] = None) -> None:
+    try:
+        asyncio.run(ComputeService(workers, max_pending).serve(host, port))
+    except KeyboardInterrupt:
+        pass
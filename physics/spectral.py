@@ -0,0 +1,217 @@
+"""Zaman serileri için spektral analiz: gerçek FFT, Welch PSD, baskın frekans ve harmonikler.
+
+Herhangi bir motorun eşit aralıklı örneklenmiş serisi (x(t), v(t), θ(t)
+...) örnekleme aralığı dt ile birlikte verilir. Aynı uzunluk ve pencere
+için bir SpectrumPlan oluşturulur ve süreç içinde yeniden kullanılır:
+pencere katsayıları, frekans ızgarası, normalizasyon sabitleri ile
+pencerelenmiş giriş ve karmaşık spektrum tamponları bir kez ayrılır.
+Sayfa yeniden çalıştığında aynı uzunluktaki seriler yeni bellek ayırmadan
+dönüştürülür; NumPy'nin pocketfft'i dönüşüm planlarını uzunluk başına
+kendi içinde önbelleğe alır. Tutulan planların toplam tampon boyutu
+MAX_PLAN_BYTES ile sınırlıdır; bu sınırı tek başına aşan plan (ör. uzun
+bir serinin toplu Welch tamponları) yalnızca o çağrı için oluşturulur.
+
+Baskın frekans, genlik tepesinin komşu bölmelerine logaritmik parabol
+oturtularak bölme aralığından daha hassas bulunur.
+"""
+import inspect
+import threading
+from collections import OrderedDict
+from typing import List, NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+WINDOWS = ("hann", "hamming", "blackman", "boxcar")
+
+# Bellekte tutulan en fazla plan sayısı (uzunluk, pencere ve segment sayısı başına bir plan)
+MAX_PLANS = 16
+# Tutulan planların toplam tampon boyutu (bayt)
+MAX_PLAN_BYTES = 64 * 1024 * 1024
+
+# NumPy ≥ 2.0: rfft sonucu önceden ayrılmış tampona yazılabilir
+_RFFT_OUT = "out" in inspect.signature(np.fft.rfft).parameters
+
+
+def window(name: str, n: int) -> np.ndarray:
+    """Spektral analiz için periyodik pencere (uzunluk n)."""
+    phase = 2 * np.pi * np.arange(n) / n
+    if name == "hann":
+        return 0.5 - 0.5 * np.cos(phase)
+    if name == "hamming":
+        return 0.54 - 0.46 * np.cos(phase)
+    if name == "blackman":
+        return 0.42 - 0.5 * np.cos(phase) + 0.08 * np.cos(2 * phase)
+    if name == "boxcar":
+        return np.ones(n)
+    raise ValueError(f"Bilinmeyen pencere: {name}")
+
+
+class SpectrumPlan:
+    """Sabit (segment sayısı, uzunluk) ve pencere için yeniden kullanılan tamponlar.
+
+    Tamponlar paylaşıldığı için dönüşüm bir kilit altında yapılır; transform()
+    tampona bir görünüm döndürür, kilidi tutan çağıran onu kopyalamadan okur.
+    """
+
+    def __init__(self, n: int, window_name: str = "hann", segments: int = 1):
+        self.n = n
+        self.window = window(window_name, n)
+        self.freq_bins = np.fft.rfftfreq(n)  # dt = 1 için; gerçek frekans = bins / dt
+        self.amplitude_scale = 2.0 / float(self.window.sum())  # Tek taraflı sinüs genliği
+        self.power_sum = float(np.sum(self.window**2))
+        self.buffer = np.empty((segments, n))
+        self.spectrum = np.empty((segments, n // 2 + 1), dtype=complex)
+        self.magnitude = np.empty(n // 2 + 1)
+        self.lock = threading.Lock()
+        self.nbytes = sum(a.nbytes for a in (self.window, self.freq_bins, self.buffer, self.spectrum, self.magnitude))
+
+    def transform(self, frames: np.ndarray, detrend: bool = True) -> np.ndarray:
+        """(segments, n) çerçeveleri ortalaması çıkarılıp pencerelenerek dönüştürür."""
+        np.copyto(self.buffer, frames)
+        if detrend:
+            self.buffer -= self.buffer.mean(axis=1, keepdims=True)
+        self.buffer *= self.window
+        if _RFFT_OUT:
+            return np.fft.rfft(self.buffer, axis=1, out=self.spectrum)
+        self.spectrum[...] = np.fft.rfft(self.buffer, axis=1)
+        return self.spectrum
+
+    def magnitudes(self, x: np.ndarray) -> np.ndarray:
+        """Tek serinin |X| değerleri (ölçeklenmemiş), magnitude tamponuna yazılır."""
+        return np.abs(self.transform(x[None, :])[0], out=self.magnitude)
+
+
+_plans: "OrderedDict[tuple, SpectrumPlan]" = OrderedDict()
+_plans_lock = threading.Lock()
+_plan_bytes = 0
+
+
+def get_plan(n: int, window_name: str = "hann", segments: int = 1) -> SpectrumPlan:
+    """Önbellekteki planı döndürür (yoksa oluşturur).
+
+    Plan sayısı veya toplam bayt sınırı aşılırsa en eski kullanılan planlar
+    atılır; MAX_PLAN_BYTES'tan büyük plan önbelleğe girmez.
+    """
+    global _plan_bytes
+    key = (n, window_name, segments)
+    with _plans_lock:
+        plan = _plans.get(key)
+        if plan is not None:
+            _plans.move_to_end(key)
+            return plan
+    plan = SpectrumPlan(n, window_name, segments)
+    if plan.nbytes > MAX_PLAN_BYTES:
+        return plan
+    with _plans_lock:
+        if key in _plans:  # Başka bir iş parçacığı aynı planı bu arada ekledi
+            return _plans[key]
+        _plans[key] = plan
+        _plan_bytes += plan.nbytes
+        while len(_plans) > MAX_PLANS or _plan_bytes > MAX_PLAN_BYTES:
+            _plan_bytes -= _plans.popitem(last=False)[1].nbytes
+        return plan
+
+
+class Spectrum(NamedTuple):
+    f: np.ndarray  # Frekans (Hz)
+    amplitude: np.ndarray  # Tek taraflı genlik (serinin birimiyle)
+    phase: np.ndarray  # Faz (rad)
+
+
+def spectrum(x: ArrayLike, dt: float, window_name: str = "hann", detrend: bool = True) -> Spectrum:
+    """Pencerelenmiş gerçek FFT; A·cos(2πft) için f bölmesinde ≈ A genliği verir."""
+    x = np.asarray(x, dtype=float)
+    plan = get_plan(len(x), window_name)
+    with plan.lock:
+        X = plan.transform(x[None, :], detrend)[0]
+        return Spectrum(plan.freq_bins / dt, np.abs(X) * plan.amplitude_scale, np.angle(X))
+
+
+class PSD(NamedTuple):
+    f: np.ndarray  # Frekans (Hz)
+    psd: np.ndarray  # Tek taraflı güç spektral yoğunluğu (birim²/Hz)
+    segments: int
+
+
+def welch_psd(x: ArrayLike, dt: float, nperseg: int = 1024, overlap: float = 0.5,
+              window_name: str = "hann") -> PSD:
+    """Welch yöntemi: örtüşen segmentlerin periodogramlarının ortalaması.
+
+    Tüm segmentler tek bir toplu (batched) rfft ile dönüştürülür. Seri
+    nperseg'den kısaysa tek segment kullanılır.
+    """
+    x = np.asarray(x, dtype=float)
+    nperseg = min(nperseg, len(x))
+    step = max(int(nperseg * (1 - overlap)), 1)
+    frames = np.lib.stride_tricks.sliding_window_view(x, nperseg)[::step]
+    plan = get_plan(nperseg, window_name, len(frames))
+    with plan.lock:
+        X = plan.transform(frames)
+        psd = np.mean(X.real**2 + X.imag**2, axis=0) * (2 * dt / plan.power_sum)
+    # DC ve (çift uzunlukta) Nyquist bölmeleri tek taraflı katlamada iki kez sayılmaz
+    psd[0] /= 2
+    if nperseg % 2 == 0:
+        psd[-1] /= 2
+    return PSD(plan.freq_bins / dt, psd, len(frames))
+
+
+class Peak(NamedTuple):
+    f: float  # Hz
+    amplitude: float
+
+
+def _interpolated_peak(amplitude: np.ndarray, i: int) -> tuple:
+    """i bölmesindeki tepeye log-genlik parabolü; (kesirli bölme, genlik)."""
+    if i <= 0 or i >= len(amplitude) - 1:
+        return float(i), float(amplitude[i])
+    a, b, c = np.log(np.maximum(amplitude[i - 1:i + 2], np.finfo(float).tiny)).tolist()
+    denom = a - 2 * b + c
+    shift = 0.5 * (a - c) / denom if denom < 0 else 0.0
+    return i + shift, float(np.exp(b - 0.25 * (a - c) * shift))
+
+
+def _dominant_bin(plan: SpectrumPlan, amplitude: np.ndarray, dt: float, f_min: float) -> tuple:
+    start = max(1, int(np.searchsorted(plan.freq_bins, f_min * dt, side="right")))
+    return _interpolated_peak(amplitude, start + int(np.argmax(amplitude[start:])))
+
+
+def dominant_frequency(x: ArrayLike, dt: float, window_name: str = "hann", f_min: float = 0.0) -> Peak:
+    """Genliği en büyük (f > f_min, DC hariç) bileşenin frekansı ve genliği.
+
+    Yalnızca plan tamponları üzerinde çalışır; uzun serilerde periyot
+    denetimi yeni bellek ayırmayan tek bir FFT'dir.
+    """
+    x = np.asarray(x, dtype=float)
+    plan = get_plan(len(x), window_name)
+    with plan.lock:
+        k, peak = _dominant_bin(plan, plan.magnitudes(x), dt, f_min)
+        return Peak(k / (plan.n * dt), peak * plan.amplitude_scale)
+
+
+def harmonics(x: ArrayLike, dt: float, count: int = 5, window_name: str = "hann") -> List[Peak]:
+    """Temel frekans f₀ ve katları k·f₀ (k = 1..count).
+
+    Her harmonik k·f₀ ± f₀/4 içindeki yerel tepedir; orada tepe yoksa (ör.
+    simetrik salınımlarda çift harmonikler) k·f₀'daki genlik verilir.
+    Nyquist frekansını aşan harmonikler listeye girmez.
+    """
+    x = np.asarray(x, dtype=float)
+    plan = get_plan(len(x), window_name)
+    with plan.lock:
+        amplitude = plan.magnitudes(x)
+        bin_f0, _ = _dominant_bin(plan, amplitude, dt, 0.0)
+        last = len(amplitude) - 1
+        peaks = []
+        for k in range(1, count + 1):
+            center = k * bin_f0
+            if center >= last:
+                break
+            lo, hi = max(int(np.floor(center - bin_f0 / 4)), 1), min(int(np.ceil(center + bin_f0 / 4)), last)
+            i = lo + int(np.argmax(amplitude[lo:hi + 1]))
+            if lo < i < hi:
+                b, peak = _interpolated_peak(amplitude, i)
+            else:
+                b, peak = center, float(amplitude[int(round(center))])
+            peaks.append(Peak(b / (plan.n * dt), peak * plan.amplitude_scale))
+        return peaks
@@ -0,0 +1,83 @@
+"""Statik ve dönme hareketi: tork, kiriş dengesi, kütle merkezi, eylemsizlik momenti."""
+from typing import NamedTuple, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+def torque(r: ArrayLike, F: ArrayLike, theta_deg: ArrayLike):
+    """τ = r·F·sin(θ)"""
+    return r * F * np.sin(np.radians(theta_deg))
+
+
+class BeamReactions(NamedTuple):
+    R_A: float
+    R_B: float
+    W_beam: float
+    total_down: float
+
+
+def beam_reactions(L: float, m_beam: float, g: float, support_A: float, support_B: float,
+                   loads: Sequence[Tuple[float, float]]) -> BeamReactions:
+    """İki destekli kirişte tepki kuvvetleri.
+
+    loads: (konum, aşağı kuvvet) çiftleri. Kiriş ağırlığı merkezde etki eder.
+    A noktasına göre moment dengesinden R_B, kuvvet dengesinden R_A bulunur.
+    Destekler çakışıksa ValueError.
+    """
+    if abs(support_B - support_A) <= 0.1:
+        raise ValueError("Destekler aynı noktada olamaz!")
+
+    positions = np.array([pos for pos, _ in loads], dtype=float)
+    forces = np.array([force for _, force in loads], dtype=float)
+
+    W_beam = m_beam * g
+    beam_center = L / 2
+    total_down = W_beam + forces.sum()
+
+    moment_A = W_beam * (beam_center - support_A) + np.dot(forces, positions - support_A)
+    R_B = moment_A / (support_B - support_A)
+    R_A = total_down - R_B
+    return BeamReactions(R_A, R_B, W_beam, total_down)
+
+
+def center_of_mass(masses: ArrayLike, x: ArrayLike, y: ArrayLike):
+    """Nokta kütlelerin kütle merkezi: (M, x_cm, y_cm)."""
+    masses = np.asarray(masses, dtype=float)
+    total_mass = masses.sum()
+    return total_mass, np.dot(masses, x) / total_mass, np.dot(masses, y) / total_mass
+
+
+def l_shape_center(w1: float, h1: float, w2: float, h2: float):
+    """L şekli: alt yatay (w1×h1) ve üstüne oturan dikey (w2×h2) dikdörtgen."""
+    areas = np.array([w1 * h1, w2 * h2])
+    xs = np.array([w1 / 2, w2 / 2])
+    ys = np.array([h1 / 2, h1 + h2 / 2])
+    _, x_cm, y_cm = center_of_mass(areas, xs, ys)
+    return x_cm, y_cm
+
+
+# Eylemsizlik momenti katsayıları: I = c·m·r²
+INERTIA_COEFFICIENTS = {
+    "Nokta Kütle": 1.0,
+    "Çubuk (merkez eksen)": 1 / 12,
+    "Çubuk (uç eksen)": 1 / 3,
+    "Disk/Silindir": 0.5,
+    "Küre (katı)": 0.4,
+    "Halka": 1.0,
+}
+
+
+def moment_of_inertia(shape: str, m: ArrayLike, r: ArrayLike):
+    """Şekle göre I = c·m·r² (çubuklar için r = L)."""
+    return INERTIA_COEFFICIENTS[shape] * m * np.asarray(r, dtype=float)**2
+
+
+def angular_acceleration(tau: ArrayLike, I: ArrayLike):
+    """α = τ / I"""
+    return tau / I
+
+
+def rotational_kinetic_energy(I: ArrayLike, omega: ArrayLike):
+    """KE_rot = ½Iω²"""
+    return 0.5 * I * np.asarray(omega, dtype=float)**2
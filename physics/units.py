@@ -0,0 +1,373 @@
+"""Birim tabloları ve birim dönüşümleri (her şey SI birimine göre).
+
+Tablolar içe aktarmada bir kez kurulur. `convert` NumPy dizilerini tek
+çarpımla çevirir; `convert_csv` ve `convert_npy` büyük dosyaları parça parça
+işleyerek sabit bellekle çalışır.
+
+Bileşik birimler ("kN*m", "kWh/day", "m/s^2") `parse_unit` ile SI temel
+boyut vektörüne indirgenir; ayrıştırma ve birim çifti çarpanları
+önbelleklenir, tekrar eden dönüşümler tek sözlük araması ve bir çarpımdır.
+"""
+import csv
+import functools
+import itertools
+import re
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# Birim dönüşüm tanımları: her birimin SI karşılığındaki çarpanı
+BIRIMLER: Dict[str, Dict[str, float]] = {
+    "Uzunluk": {
+        "metre (m)": 1,
+        "kilometre (km)": 1000,
+        "santimetre (cm)": 0.01,
+        "milimetre (mm)": 0.001,
+        "feet (ft)": 0.3048,
+        "inç (in)": 0.0254,
+        "mil (mi)": 1609.34
+    },
+    "Kütle": {
+        "kilogram (kg)": 1,
+        "gram (g)": 0.001,
+        "ton": 1000,
+        "pound (lb)": 0.453592,
+        "ons (oz)": 0.0283495
+    },
+    "Zaman": {
+        "saniye (s)": 1,
+        "dakika (dk)": 60,
+        "saat (sa)": 3600,
+        "gün": 86400,
+        "yıl": 31536000
+    },
+    "Kuvvet": {
+        "Newton (N)": 1,
+        "kilonewton (kN)": 1000,
+        "pound-force (lbf)": 4.44822,
+        "dyne": 1e-5
+    },
+    "Enerji": {
+        "Joule (J)": 1,
+        "kilojoule (kJ)": 1000,
+        "kalori (cal)": 4.184,
+        "kilokalori (kcal)": 4184,
+        "kilowatt-saat (kWh)": 3.6e6,
+        "elektron-volt (eV)": 1.602e-19
+    },
+    "Hız": {
+        "metre/saniye (m/s)": 1,
+        "kilometre/saat (km/h)": 0.277778,
+        "mil/saat (mph)": 0.44704,
+        "knot": 0.514444
+    },
+    "İvme": {
+        "metre/saniye² (m/s²)": 1,
+        "g (yerçekimi ivmesi)": 9.80665,
+        "feet/saniye² (ft/s²)": 0.3048
+    }
+}
+
+KATEGORILER = list(BIRIMLER)
+
+
+def conversion_factor(category: str, source: str, target: str) -> float:
+    """source biriminden target birimine geçiş çarpanı."""
+    table = BIRIMLER[category]
+    return table[source] / table[target]
+
+
+def convert(value: ArrayLike, category: str, source: str, target: str, out: Optional[np.ndarray] = None):
+    """Değeri (veya diziyi) aynı kategori içinde bir birimden diğerine çevirir.
+
+    `out` verilirse sonuç bu diziye yazılır (yerinde dönüşüm için out=value).
+    """
+    return np.multiply(value, conversion_factor(category, source, target), out=out)
+
+
+# Bileşik birimler: SI temel boyutları sırası
+TEMEL_BOYUTLAR = ("m", "kg", "s", "A", "K", "mol", "cd")
+
+
+def _dim(m=0, kg=0, s=0, A=0, K=0, mol=0, cd=0) -> Tuple[int, ...]:
+    return (m, kg, s, A, K, mol, cd)
+
+
+# Sembol -> (SI çarpanı, boyut vektörü)
+SEMBOLLER: Dict[str, Tuple[float, Tuple[int, ...]]] = {
+    # Temel birimler (kütle gram üzerinden tanımlı, kg = k + g)
+    "m": (1, _dim(m=1)),
+    "g": (1e-3, _dim(kg=1)),
+    "s": (1, _dim(s=1)),
+    "A": (1, _dim(A=1)),
+    "K": (1, _dim(K=1)),
+    "mol": (1, _dim(mol=1)),
+    "cd": (1, _dim(cd=1)),
+    # Türetilmiş SI birimleri
+    "N": (1, _dim(m=1, kg=1, s=-2)),
+    "J": (1, _dim(m=2, kg=1, s=-2)),
+    "W": (1, _dim(m=2, kg=1, s=-3)),
+    "Pa": (1, _dim(m=-1, kg=1, s=-2)),
+    "Hz": (1, _dim(s=-1)),
+    "C": (1, _dim(s=1, A=1)),
+    "V": (1, _dim(m=2, kg=1, s=-3, A=-1)),
+    "L": (1e-3, _dim(m=3)),
+    # Zaman
+    "min": (60, _dim(s=1)),
+    "h": (3600, _dim(s=1)),
+    "day": (86400, _dim(s=1)),
+    "yr": (31536000, _dim(s=1)),
+    # Uzunluk, kütle, hız, ivme (BIRIMLER ile aynı çarpanlar)
+    "ft": (0.3048, _dim(m=1)),
+    "in": (0.0254, _dim(m=1)),
+    "mi": (1609.34, _dim(m=1)),
+    "t": (1000, _dim(kg=1)),
+    "lb": (0.453592, _dim(kg=1)),
+    "oz": (0.0283495, _dim(kg=1)),
+    "mph": (0.44704, _dim(m=1, s=-1)),
+    "knot": (0.514444, _dim(m=1, s=-1)),
+    "g0": (9.80665, _dim(m=1, s=-2)),
+    # Kuvvet, enerji, güç, basınç
+    "lbf": (4.44822, _dim(m=1, kg=1, s=-2)),
+    "dyn": (1e-5, _dim(m=1, kg=1, s=-2)),
+    "cal": (4.184, _dim(m=2, kg=1, s=-2)),
+    "eV": (1.602e-19, _dim(m=2, kg=1, s=-2)),
+    "Wh": (3600, _dim(m=2, kg=1, s=-2)),
+    "hp": (745.7, _dim(m=2, kg=1, s=-3)),
+    "bar": (1e5, _dim(m=-1, kg=1, s=-2)),
+    "atm": (101325, _dim(m=-1, kg=1, s=-2)),
+    "psi": (6894.76, _dim(m=-1, kg=1, s=-2)),
+}
+
+# SI önekleri; yalnızca ONEK_ALAN birimlerle birlikte kullanılabilir
+ONEKLER = {
+    "G": 1e9, "M": 1e6, "k": 1e3, "h": 1e2, "d": 1e-1, "c": 1e-2,
+    "m": 1e-3, "µ": 1e-6, "μ": 1e-6, "u": 1e-6, "n": 1e-9,
+}
+ONEK_ALAN = {"m", "g", "s", "A", "K", "mol", "N", "J", "W", "Pa", "Hz", "C", "V", "L", "cal", "eV", "Wh", "bar"}
+
+_TOKEN = re.compile(r"\s*(?:(?P<name>[A-Za-zµμ][A-Za-zµμ0-9]*)|(?P<op>[*/()^·])|(?P<num>-?\d+)|(?P<sup>[⁻]?[¹²³⁴]))")
+_UST = {"¹": 1, "²": 2, "³": 3, "⁴": 4}
+
+
+class Unit(NamedTuple):
+    factor: float
+    dims: Tuple[int, ...]
+
+
+def _symbol(name: str) -> Unit:
+    if name in SEMBOLLER:
+        return Unit(*SEMBOLLER[name])
+    prefix, base = name[0], name[1:]
+    if prefix in ONEKLER and base in ONEK_ALAN:
+        factor, dims = SEMBOLLER[base]
+        return Unit(ONEKLER[prefix] * factor, dims)
+    raise ValueError(f"Bilinmeyen birim: {name!r}")
+
+
+def _power(unit: Unit, n: int) -> Unit:
+    return Unit(unit.factor ** n, tuple(d * n for d in unit.dims))
+
+
+def _mul(a: Unit, b: Unit) -> Unit:
+    return Unit(a.factor * b.factor, tuple(x + y for x, y in zip(a.dims, b.dims)))
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_unit(expr: str) -> Unit:
+    """Bileşik birim ifadesini SI çarpanı ve temel boyut vektörüne indirger.
+
+    Çarpma `*` veya `·`, bölme `/`, üs `^n` veya `²`, gruplama parantezle
+    yazılır: "kN*m", "lbf·ft", "kWh/day", "m/s^2", "kg/(m·s²)".
+    """
+    tokens = []
+    pos = 0
+    text = expr.strip()
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if match is None or match.end() == pos:
+            raise ValueError(f"Geçersiz birim ifadesi: {expr!r}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        pos = match.end()
+
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else (None, None)
+
+    def take():
+        nonlocal position
+        token = peek()
+        position += 1
+        return token
+
+    def factor() -> Unit:
+        kind, value = take()
+        if kind == "name":
+            unit = _symbol(value)
+        elif kind == "num" and value == "1":
+            unit = Unit(1.0, _dim())
+        elif (kind, value) == ("op", "("):
+            unit = product()
+            if take() != ("op", ")"):
+                raise ValueError(f"Kapanmamış parantez: {expr!r}")
+        else:
+            raise ValueError(f"Geçersiz birim ifadesi: {expr!r}")
+        kind, value = peek()
+        if (kind, value) == ("op", "^"):
+            take()
+            kind, value = take()
+            if kind != "num":
+                raise ValueError(f"Geçersiz üs: {expr!r}")
+            unit = _power(unit, int(value))
+        elif kind == "sup":
+            take()
+            unit = _power(unit, -_UST[value[-1]] if value.startswith("⁻") else _UST[value])
+        return unit
+
+    def product() -> Unit:
+        unit = factor()
+        while peek()[0] == "op" and peek()[1] in "*·/":
+            _, op = take()
+            rhs = factor()
+            unit = _mul(unit, rhs if op != "/" else _power(rhs, -1))
+        return unit
+
+    if not tokens:
+        raise ValueError("Boş birim ifadesi")
+    unit = product()
+    if position != len(tokens):
+        raise ValueError(f"Geçersiz birim ifadesi: {expr!r}")
+    return unit
+
+
+@functools.lru_cache(maxsize=4096)
+def compound_factor(source: str, target: str) -> float:
+    """İki bileşik birim arasındaki çarpan; boyutlar farklıysa ValueError."""
+    src, dst = parse_unit(source), parse_unit(target)
+    if src.dims != dst.dims:
+        raise ValueError(f"Boyutlar uyuşmuyor: {source} {format_dims(src.dims)} ↔ {target} {format_dims(dst.dims)}")
+    return src.factor / dst.factor
+
+
+def format_dims(dims: Tuple[int, ...]) -> str:
+    """Boyut vektörünü okunur hale getirir: (1, 1, -2, ...) -> "m·kg·s^-2"."""
+    parts = [base if n == 1 else f"{base}^{n}" for base, n in zip(TEMEL_BOYUTLAR, dims) if n]
+    return "·".join(parts) or "boyutsuz"
+
+
+def convert_units(value: ArrayLike, source: str, target: str, out: Optional[np.ndarray] = None):
+    """Değeri (veya diziyi) bileşik birim ifadeleri arasında çevirir: "kWh/day" -> "W"."""
+    return np.multiply(value, compound_factor(source, target), out=out)
+
+
+# Dönüşüm tanımı: (kategori, kaynak, hedef) tablo birimleri veya (kaynak, hedef) bileşik ifadeler
+UnitSpec = Union[Tuple[str, str, str], Tuple[str, str]]
+
+# Sütun adı -> dönüşüm tanımı
+ColumnSpec = Mapping[str, UnitSpec]
+
+
+def spec_factor(spec: UnitSpec) -> float:
+    return conversion_factor(*spec) if len(spec) == 3 else compound_factor(*spec)
+
+CSV_CHUNK_ROWS = 65536
+# .npy akışında parça başına okunan bayt (satır genişliğinden bağımsız sabit bellek)
+NPY_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def _parse_floats(cells) -> np.ndarray:
+    try:
+        return np.fromiter(map(float, cells), np.float64, len(cells))
+    except ValueError:
+        # Boş hücreler NaN olarak taşınır
+        return np.fromiter((float(c) if c.strip() else np.nan for c in cells), np.float64, len(cells))
+
+
+class CsvReport(NamedTuple):
+    rows: int  # Yazılan veri satırı
+    short_lines: List[int]  # Seçili sütuna ulaşmayan satırların numaraları (başlık 1. satır)
+
+
+def convert_csv(src, dst, columns: ColumnSpec, chunk_rows: int = CSV_CHUNK_ROWS, delimiter: str = ",") -> CsvReport:
+    """Başlıklı bir CSV dosyasının seçili sütunlarını parça parça çevirir.
+
+    src/dst dosya yolu veya açık metin dosyası olabilir. Diğer sütunlar ve
+    boş hücreler olduğu gibi kopyalanır. Seçili sütuna ulaşmayan kısa
+    satırlar değiştirilmeden yazılır ve numaralarıyla raporlanır (çok
+    satırlı tırnaklı alan yoksa dosya satır numarasıdır).
+    """
+    src_file = open(src, newline="", encoding="utf-8") if isinstance(src, str) else src
+    dst_file = open(dst, "w", newline="", encoding="utf-8") if isinstance(dst, str) else dst
+    try:
+        reader = csv.reader(src_file, delimiter=delimiter)
+        writer = csv.writer(dst_file, delimiter=delimiter)
+        header = next(reader)
+        writer.writerow(header)
+
+        missing = [name for name in columns if name not in header]
+        if missing:
+            raise KeyError(f"CSV'de bulunmayan sütun(lar): {', '.join(missing)}")
+        factors = {header.index(name): spec_factor(spec) for name, spec in columns.items()}
+        width = max(factors) + 1
+
+        n_rows = 0
+        short_lines: List[int] = []
+        while True:
+            rows = list(itertools.islice(reader, chunk_rows))
+            if not rows:
+                break
+            full = rows
+            if any(len(row) < width for row in rows):
+                # Tamamen boş satırlar raporlanmadan kopyalanır
+                short_lines.extend(n_rows + i + 2 for i, row in enumerate(rows) if 0 < len(row) < width)
+                full = [row for row in rows if len(row) >= width]
+            for idx, factor in factors.items():
+                cells = [row[idx] for row in full]
+                values = _parse_floats(cells) * factor
+                converted = values.tolist()
+                if np.isnan(values).any():
+                    # Boş hücreler boş kalır
+                    converted = [v if c.strip() else c for v, c in zip(converted, cells)]
+                for row, value in zip(full, converted):
+                    row[idx] = value
+            writer.writerows(rows)
+            n_rows += len(rows)
+        return CsvReport(n_rows, short_lines)
+    finally:
+        if isinstance(src, str):
+            src_file.close()
+        if isinstance(dst, str):
+            dst_file.close()
+
+
+def convert_npy(src: str, dst: str, *spec: str, chunk_bytes: int = NPY_CHUNK_BYTES) -> int:
+    """Bir .npy dosyasını bellek eşlemeli olarak parça parça çevirir.
+
+    spec, (kategori, kaynak, hedef) veya bileşik (kaynak, hedef) olabilir.
+    Parçalar satır sayısıyla değil bayt ile sınırlanır: C sıralı dizilerde
+    düzleştirilmiş görünüm üzerinde, diğerlerinde ilk eksen boyunca
+    ilerlenir. Çıktı float64 bir .npy dosyasıdır. İşlenen eleman sayısını
+    döndürür.
+    """
+    factor = spec_factor(spec)
+    data = np.load(src, mmap_mode="r")
+    out = np.lib.format.open_memmap(dst, mode="w+", dtype=np.float64, shape=data.shape)
+    if data.ndim == 0:
+        out[...] = data * factor
+    elif data.size:
+        item_bytes = max(data.itemsize, out.itemsize)
+        if data.flags.c_contiguous:
+            data_flat, out_flat = data.reshape(-1), out.reshape(-1)
+            step = max(chunk_bytes // item_bytes, 1)
+        else:
+            data_flat, out_flat = data, out
+            step = max(chunk_bytes // (item_bytes * (data.size // data.shape[0])), 1)
+        for start in range(0, data_flat.shape[0], step):
+            stop = start + step
+            np.multiply(data_flat[start:stop], factor, out=out_flat[start:stop])
+    out.flush()
+    del out
+    return data.size
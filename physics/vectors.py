@@ -0,0 +1,155 @@
+"""Vektör işlemleri.
+
+Vektörler son eksende bileşen taşır: tek vektör için (2,) / (3,), çok sayıda
+vektör için (N, 2) / (N, 3) diziler aynı fonksiyonlarla işlenir.
+"""
+from typing import Dict, NamedTuple, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+def add(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    return np.add(a, b)
+
+
+def subtract(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    return np.subtract(a, b)
+
+
+def dot(a: ArrayLike, b: ArrayLike):
+    """Skaler (nokta) çarpım."""
+    return np.einsum("...i,...i->...", np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+
+
+def cross(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """Vektörel (çapraz) çarpım; 2 bileşenli vektörler için z bileşenini (skaler) verir."""
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if a.shape[-1] == 2:
+        return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+    return np.cross(a, b)
+
+
+def magnitude(v: ArrayLike):
+    """Vektör büyüklüğü |v|."""
+    return np.linalg.norm(np.asarray(v, dtype=float), axis=-1)
+
+
+def unit_vector(v: ArrayLike) -> np.ndarray:
+    """Birim vektör; sıfır vektörü için bileşenler NaN olur."""
+    v = np.asarray(v, dtype=float)
+    mag = magnitude(v)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return v / np.where(mag > 0, mag, np.nan)[..., np.newaxis]
+
+
+def angle_between(a: ArrayLike, b: ArrayLike):
+    """İki vektör arasındaki açı (radyan); sıfır vektörü varsa NaN."""
+    denom = magnitude(a) * magnitude(b)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cos_theta = dot(a, b) / np.where(denom > 0, denom, np.nan)
+    cos_theta = np.clip(cos_theta, -1, 1)  # Numerik hata düzeltmesi
+    return np.arccos(cos_theta)
+
+
+def to_polar(vx: ArrayLike, vy: ArrayLike):
+    """2D bileşenlerden (büyüklük, açı [rad])."""
+    return np.hypot(vx, vy), np.arctan2(vy, vx)
+
+
+def from_polar(r: ArrayLike, angle_rad: ArrayLike):
+    """Büyüklük ve açıdan (vx, vy)."""
+    return r * np.cos(angle_rad), r * np.sin(angle_rad)
+
+
+def to_spherical(vx: ArrayLike, vy: ArrayLike, vz: ArrayLike):
+    """3D bileşenlerden (r, θ polar, φ azimut); açılar radyan."""
+    vx, vy, vz = (np.asarray(c, dtype=float) for c in (vx, vy, vz))
+    r = np.sqrt(vx**2 + vy**2 + vz**2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        theta = np.where(r > 0, np.arccos(np.clip(vz / np.where(r > 0, r, 1), -1, 1)), 0.0)
+    phi = np.arctan2(vy, vx)
+    return r, theta, phi
+
+
+def from_spherical(r: ArrayLike, theta: ArrayLike, phi: ArrayLike):
+    """Küresel koordinatlardan (vx, vy, vz); açılar radyan."""
+    vx = r * np.sin(theta) * np.cos(phi)
+    vy = r * np.sin(theta) * np.sin(phi)
+    vz = r * np.cos(theta)
+    return vx, vy, vz
+
+
+# Toplu işlemler: (N, 2) / (N, 3) dizileri üzerinde, sonuç sütunları adlarıyla döner
+BATCH_OPS = ("add", "subtract", "dot", "cross", "magnitude", "unit", "angle", "polar", "spherical")
+BINARY_OPS = ("add", "subtract", "dot", "cross", "angle")
+
+_AXES = ("x", "y", "z")
+
+
+def as_vectors(v: ArrayLike) -> np.ndarray:
+    """Girdiyi (N, 2) veya (N, 3) float dizisine çevirir."""
+    v = np.asarray(v, dtype=float)
+    if v.ndim == 1:
+        v = v[np.newaxis, :]
+    if v.ndim != 2 or v.shape[1] not in (2, 3):
+        raise ValueError(f"(N, 2) veya (N, 3) dizi bekleniyordu, gelen şekil: {v.shape}")
+    return v
+
+
+def batch(op: str, a: ArrayLike, b: Optional[ArrayLike] = None) -> Dict[str, np.ndarray]:
+    """Bir işlemi tüm satırlara tek seferde uygular; sütun adı -> (N,) dizi döndürür."""
+    a = as_vectors(a)
+    dim = a.shape[1]
+    if op in BINARY_OPS:
+        if b is None:
+            raise ValueError(f"'{op}' işlemi iki dizi gerektirir")
+        b = as_vectors(b)
+        if b.shape != a.shape:
+            raise ValueError(f"A ve B aynı şekilde olmalı: {a.shape} ≠ {b.shape}")
+
+    if op in ("add", "subtract", "unit"):
+        result = add(a, b) if op == "add" else subtract(a, b) if op == "subtract" else unit_vector(a)
+        return {axis: result[:, i] for i, axis in enumerate(_AXES[:dim])}
+    if op == "dot":
+        return {"dot": dot(a, b)}
+    if op == "cross":
+        result = cross(a, b)
+        return {"z": result} if dim == 2 else {axis: result[:, i] for i, axis in enumerate(_AXES)}
+    if op == "magnitude":
+        return {"magnitude": magnitude(a)}
+    if op == "angle":
+        return {"angle_deg": np.degrees(angle_between(a, b))}
+    if op == "polar":
+        if dim != 2:
+            raise ValueError("Kutupsal dönüşüm (N, 2) dizi gerektirir")
+        r, angle = to_polar(a[:, 0], a[:, 1])
+        return {"r": r, "angle_deg": np.degrees(angle)}
+    if op == "spherical":
+        if dim != 3:
+            raise ValueError("Küresel dönüşüm (N, 3) dizi gerektirir")
+        r, theta, phi = to_spherical(a[:, 0], a[:, 1], a[:, 2])
+        return {"r": r, "theta_deg": np.degrees(theta), "phi_deg": np.degrees(phi)}
+    raise ValueError(f"Bilinmeyen işlem: {op!r}")
+
+
+class Summary(NamedTuple):
+    min: float
+    max: float
+    mean: float
+    std: float
+    nan_count: int
+
+
+def summarize(columns: Dict[str, np.ndarray]) -> Dict[str, Summary]:
+    """Her sonuç sütunu için özet istatistikler (NaN'lar hariç)."""
+    stats = {}
+    for name, values in columns.items():
+        nan_count = int(np.count_nonzero(np.isnan(values)))
+        if nan_count == values.size:
+            stats[name] = Summary(np.nan, np.nan, np.nan, np.nan, nan_count)
+        else:
+            stats[name] = Summary(float(np.nanmin(values)), float(np.nanmax(values)),
+                                  float(np.nanmean(values)), float(np.nanstd(values)), nan_count)
+    return stats
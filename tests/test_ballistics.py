@@ -0,0 +1,24 @@
+"""Sürüklenmeli atış motorunun boşluk limitinde kapalı forma karşı denetimi."""
+import numpy as np
+import pytest
+
+from physics import ballistics, kinematics
+
+
+@pytest.mark.parametrize("v0, angle, h0", [(20.0, 45.0, 0.0), (35.0, 30.0, 12.0), (8.0, 80.0, 2.0)])
+def test_ballistics_vacuum_limit(v0, angle, h0):
+    # k = 0 (sürüklenmesiz) ODE çözümü kapalı form eğik atışla örtüşmeli
+    run = ballistics.solve_trajectory(v0, angle, h0, 9.81, k=0.0)
+    exact = kinematics.projectile(v0, angle, h0, 9.81)
+    assert run.t_flight == pytest.approx(exact.t_flight, rel=1e-8)
+    assert run.range_x == pytest.approx(exact.range_x, rel=1e-8)
+    assert run.max_height == pytest.approx(exact.max_height, rel=1e-8)
+    assert run.t_apex == pytest.approx(exact.t_max_height, rel=1e-8)
+    assert run.impact_speed == pytest.approx(np.sqrt(v0**2 + 2 * 9.81 * h0), rel=1e-8)
+
+
+def test_ballistics_drag_shortens_range():
+    vacuum = ballistics.solve_trajectory(30.0, 45.0, k=0.0)
+    drag = ballistics.solve_trajectory(30.0, 45.0, k=0.01)
+    assert drag.range_x < vacuum.range_x
+    assert drag.impact_speed < vacuum.impact_speed
@@ -0,0 +1,21 @@
+"""Önbellek bayt hesabı ve LRU sınırları."""
+import numpy as np
+
+from physics import ballistics, cache
+
+
+def test_sizeof_counts_ode_solution():
+    run = ballistics.solve_trajectory(30.0, 45.0, k=0.01)
+    dense = sum(interp.Q.nbytes + interp.y_old.nbytes for interp in run.sol.interpolants if hasattr(interp, "Q"))
+    assert cache.sizeof(run) >= run.sol.ts.nbytes + dense
+
+
+def test_cache_is_bounded_by_bytes():
+    lru = cache.LRUCache(maxsize=100, max_bytes=10_000)
+    for i in range(10):
+        lru.put(i, np.zeros(250))  # 2000 bayt
+    assert lru.nbytes <= 10_000
+    assert lru.get(0) is None and lru.get(9) is not None
+    # Sınırı tek başına aşan değer tutulmaz
+    lru.put("büyük", np.zeros(5000))
+    assert lru.get("büyük") is None
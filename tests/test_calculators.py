@@ -0,0 +1,121 @@
+"""Hesaplayıcı kaydı, satır hataları ve toplu CLI."""
+import csv
+import json
+
+import pytest
+
+from physics import calculators, cli
+
+PENDULUM = {"L": 1.0, "g": 9.81, "theta_0_deg": 30.0}
+
+
+def test_every_calculator_is_described():
+    described = {d["ad"]: d for d in calculators.describe()}
+    assert set(described) == set(calculators.REGISTRY)
+
+
+def test_evaluate_vectorized_matches_single_rows():
+    rows = [dict(PENDULUM, theta_0_deg=angle) for angle in (5.0, 45.0, 120.0)]
+    batch = calculators.evaluate("sarkac", rows)
+    singles = [calculators.evaluate("sarkac", [row])[0] for row in rows]
+    for got, expected in zip(batch, singles):
+        assert got == pytest.approx(expected, rel=1e-12)
+    assert batch[0]["T"] == pytest.approx(batch[0]["T_small_angle"], rel=1e-3)
+
+
+def test_evaluate_isolates_failing_rows():
+    # θ₀ = 180° vektörize çekirdekte istisna fırlatır; yalnızca o satır hata almalı
+    rows = [PENDULUM, dict(PENDULUM, theta_0_deg=180.0), dict(PENDULUM, L="x"), dict(PENDULUM, theta_0_deg=60.0)]
+    results = calculators.evaluate("sarkac", rows)
+    assert "hata" not in results[0] and "hata" not in results[3]
+    assert "180" in results[1]["hata"]
+    assert "x" in results[2]["hata"]
+    assert results[3] == pytest.approx(calculators.evaluate("sarkac", [rows[3]])[0], rel=1e-12)
+
+
+@pytest.mark.parametrize("name, row", [
+    ("carpisma", {"m1": 0.0, "v1": 1.0, "m2": 0.0, "v2": 2.0}),  # 0/0: tanımsız sonuçlar None
+    ("sarkac", PENDULUM),
+    ("sarkac", dict(PENDULUM, theta_0_deg=180.0)),
+])
+def test_evaluate_row_does_not_depend_on_neighbours(name, row):
+    alone = calculators.evaluate(name, [row])[0]
+    bad = {key: "x" for key in row}
+    assert calculators.evaluate(name, [row, bad])[0] == alone
+    assert calculators.evaluate(name, [bad, row, row])[1:] == [alone, alone]
+
+
+def test_evaluate_missing_parameter():
+    results = calculators.evaluate("sarkac", [{"L": 1.0}])
+    assert results == [{"hata": "Eksik parametre: theta_0_deg"}]
+
+
+def test_evaluate_scalar_calculator_errors():
+    rows = [{"L": 4, "m_beam": 10, "support_A": 1, "support_B": 1},
+            {"L": 4, "m_beam": 10, "support_A": 0, "support_B": 4, "loads": "1:50;3:20"}]
+    bad, good = calculators.evaluate("kiris", rows)
+    assert "hata" in bad
+    assert good["R_A"] + good["R_B"] == pytest.approx(good["total_down"])
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def test_batch_csv_header_survives_failing_first_row(tmp_path):
+    src, dst = tmp_path / "girdi.csv", tmp_path / "cikti.csv"
+    _write_csv(src, [{"L": 4, "m_beam": 10, "support_A": 1, "support_B": 1},
+                     {"L": 4, "m_beam": 10, "support_A": 0, "support_B": 4}])
+    assert cli.batch("kiris", str(src), str(dst)) == 2
+    out = _read_csv(dst)
+    assert list(out[0]) == ["L", "m_beam", "support_A", "support_B", "R_A", "R_B", "W_beam", "total_down", "hata"]
+    assert out[0]["hata"] and out[0]["R_A"] == ""
+    assert float(out[1]["R_A"]) == pytest.approx(49.05) and out[1]["hata"] == ""
+
+
+def test_batch_csv_all_rows_failing(tmp_path):
+    src, dst = tmp_path / "girdi.csv", tmp_path / "cikti.csv"
+    _write_csv(src, [dict(PENDULUM, theta_0_deg=180.0)])
+    cli.batch("sarkac", str(src), str(dst))
+    out = _read_csv(dst)
+    assert list(out[0]) == ["L", "g", "theta_0_deg", "hata"] and out[0]["hata"]
+
+
+def test_batch_output_does_not_depend_on_chunk_size(tmp_path):
+    src = tmp_path / "girdi.jsonl"
+    rows = [{"m1": 0, "v1": 1, "m2": 0, "v2": 2}, {"m1": "x", "v1": 1, "m2": 1, "v2": 0},
+            {"m1": 1, "v1": 1, "m2": 2, "v2": 0}]
+    src.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+    outputs = []
+    for chunk in (1, 3):
+        dst = tmp_path / f"cikti{chunk}.jsonl"
+        cli.batch("carpisma", str(src), str(dst), chunk=chunk)
+        outputs.append(dst.read_text(encoding="utf-8"))
+    assert outputs[0] == outputs[1]
+
+
+def test_batch_jsonl_chunks_keep_order(tmp_path):
+    src, dst = tmp_path / "girdi.jsonl", tmp_path / "cikti.jsonl"
+    angles = [10.0 + i for i in range(25)]
+    angles[7] = 180.0
+    src.write_text("".join(json.dumps(dict(PENDULUM, theta_0_deg=a)) + "\n" for a in angles), encoding="utf-8")
+    assert cli.batch("sarkac", str(src), str(dst), chunk=4) == len(angles)
+    out = [json.loads(line) for line in dst.read_text(encoding="utf-8").splitlines()]
+    assert [row["theta_0_deg"] for row in out] == angles
+    assert "hata" in out[7] and all("T" in row for i, row in enumerate(out) if i != 7)
+
+
+def test_heavy_rows_bypass_engine_caches():
+    from physics import ballistics
+    before = ballistics.solve_trajectory.cache.stats().entries
+    results = calculators.evaluate("direncli_atis", [{"v0": 30.0, "angle_deg": 45.0, "k": 0.01}])
+    assert "range_x" in results[0]
+    assert ballistics.solve_trajectory.cache.stats().entries == before
@@ -0,0 +1,36 @@
+"""Normal mod ayrışımının sayısal integrasyona karşı denetimi."""
+import numpy as np
+import pytest
+from scipy.integrate import solve_ivp
+
+from physics import chains
+
+TIGHT = dict(method="DOP853", rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("fixed_ends", [True, False])
+def test_chain_modes_match_solve_ivp(fixed_ends):
+    masses = np.array([1.0, 2.0, 0.5, 1.5, 1.0, 3.0])
+    k, n = 4.0, 6
+    K = k * (np.diag(np.full(n, 2.0)) - np.diag(np.ones(n - 1), 1) - np.diag(np.ones(n - 1), -1))
+    if not fixed_ends:
+        K[0, 0] = K[-1, -1] = k
+    x0 = np.array([0.1, 0.0, -0.05, 0.0, 0.02, 0.0])
+    v0 = np.array([0.0, 0.3, 0.0, 0.0, -0.1, 0.2])
+    t = np.linspace(0.0, 15.0, 300)
+
+    modes = chains.spring_chain(masses, k, fixed_ends)
+    motion = chains.chain_motion(modes, x0, v0)
+    ref = solve_ivp(lambda _, y: np.concatenate([y[n:], -(K @ y[:n]) / masses]), (0.0, t[-1]),
+                    np.concatenate([x0, v0]), t_eval=t, **TIGHT)
+    np.testing.assert_allclose(motion(t), ref.y[:n].T, atol=1e-9)
+
+    # Mod enerjilerinin toplamı başlangıç enerjisidir
+    energy = 0.5 * (masses @ v0**2) + 0.5 * x0 @ K @ x0
+    assert motion.energy.sum() == pytest.approx(energy, rel=1e-10)
+
+
+def test_pendulum_chain_frequencies():
+    # Eşit kütleli bağlaşık iki sarkaç: ω₁ = √(g/L), ω₂ = √(g/L + 2k/m)
+    modes = chains.pendulum_chain([1.0, 1.0], 0.8, 9.81, 3.0)
+    np.testing.assert_allclose(modes.omega, [np.sqrt(9.81 / 0.8), np.sqrt(9.81 / 0.8 + 6.0)], rtol=1e-12)
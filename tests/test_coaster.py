@@ -0,0 +1,35 @@
+"""Roller coaster rayı ve kontrol noktası dosyasının okunması."""
+import io
+
+import numpy as np
+import pytest
+
+from modules.module4_energy import _read_track_points
+from physics import coaster
+
+
+class _Upload(io.BytesIO):
+    """st.file_uploader dosyası yerine geçen bellek içi dosya."""
+
+
+def test_flat_loop_curvature_and_speed():
+    R = 5.0
+    track = coaster.build_track(coaster.loop(R, n=33, drift=0.0))
+    inner = slice(len(track.s) // 10, -len(track.s) // 10)
+    # Kiriş uzunluğu parametreli spline, 33 noktalı çemberin eğriliğini birkaç yüzde içinde verir
+    np.testing.assert_allclose(track.kappa[inner], 1 / R, rtol=5e-2)
+    # Sürtünmesiz rayda enerji korunumu: v² = v₀² - 2g(y - y₀)
+    result = coaster.ride(track, 15.0)
+    np.testing.assert_allclose(result.v**2, 15.0**2 - 2 * 9.81 * (track.y - track.y[0]), rtol=1e-9)
+
+
+def test_track_file_drops_repeated_points():
+    points = _read_track_points(_Upload(b"x,y\n0,0\n0,0\n1,1\n1,1\n2,0\n"))
+    np.testing.assert_array_equal(points, [[0, 0], [1, 1], [2, 0]])
+    assert len(_read_track_points(_Upload(b"0,0\n0,0\n0,0\n"))) == 1
+
+
+@pytest.mark.parametrize("content", [b"x,y\n1,a\n2,3\n", b"5\n6\n7\n", b"x,y\n0,nan\n1,1\n2,0\n"])
+def test_track_file_errors_are_value_errors(content):
+    with pytest.raises(ValueError):
+        _read_track_points(_Upload(content))
@@ -0,0 +1,30 @@
+"""Olay güdümlü 1B çarpışma zincirinde enerji ve momentum korunumu."""
+import numpy as np
+
+from physics import collisions
+
+
+def _conserved_chain(m, x, v, radius, walls=None, t_end=20.0):
+    run = collisions.simulate_chain(m, x, v, t_end, n=100, radius=radius, e=1.0, walls=walls)
+    assert run.complete
+    assert run.n_events > 0
+    ke = collisions.kinetic_energy(m, run.v)
+    np.testing.assert_allclose(ke, ke[0], rtol=1e-12)
+    return run
+
+
+def test_newtons_cradle_conserves_energy_and_momentum():
+    m, x, v, radius = collisions.newtons_cradle(5, 2, v0=1.5)
+    run = _conserved_chain(m, x, v, radius)
+    momentum = run.v @ m
+    np.testing.assert_allclose(momentum, momentum[0], rtol=1e-12)
+    # Elastik beşikte gelen iki top durur, sağdaki iki top aynı hızla ayrılır
+    np.testing.assert_allclose(run.v[-1], [0.0, 0.0, 0.0, 1.5, 1.5], atol=1e-12)
+
+
+def test_piston_gas_conserves_energy():
+    m, x, v, radius, walls = collisions.piston_gas(60, seed=3)
+    run = _conserved_chain(m, x, v, radius, walls, t_end=50.0)
+    # Parçacıklar duvarlar ve pistonla sıralarını korur
+    assert np.all(np.diff(run.x, axis=1) >= -1e-9)
+    assert np.all((run.x >= walls[0] - 1e-9) & (run.x <= walls[1] + 1e-9))
@@ -0,0 +1,26 @@
+"""2B sert disk simülasyonunda enerji korunumu."""
+import numpy as np
+import pytest
+
+from physics import disks
+
+
+@pytest.mark.parametrize("setup", [
+    lambda: disks.billiards_break(speed=4.0),
+    lambda: disks.ideal_gas(80, box=(20.0, 20.0), radius=0.5, seed=1),
+])
+def test_disks_conserve_energy(setup):
+    pos, vel, radius, mass, box = setup()
+    run = disks.simulate_disks(pos, vel, radius, mass, box, t_end=3.0, n_frames=30)
+    assert run.n_collisions > 0
+    np.testing.assert_allclose(run.kinetic_energy, run.kinetic_energy[0], rtol=1e-9)
+    # Diskler kutudan çıkmaz
+    r = np.broadcast_to(radius, run.pos.shape[1])[:, None]
+    assert np.all(run.pos >= r - 1e-9) and np.all(run.pos <= np.array(box) - r + 1e-9)
+
+
+def test_disks_inelastic_loses_energy():
+    pos, vel, radius, mass, box = disks.ideal_gas(80, box=(20.0, 20.0), radius=0.5, seed=1)
+    run = disks.simulate_disks(pos, vel, radius, mass, box, t_end=3.0, n_frames=30, e=0.5)
+    assert run.kinetic_energy[-1] < run.kinetic_energy[0]
+    assert np.all(np.diff(run.kinetic_energy) <= 1e-9)
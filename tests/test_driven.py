@@ -0,0 +1,24 @@
+"""Zorlanmış salınıcının sayısal integrasyona ve kalıcı yanıta karşı denetimi."""
+import numpy as np
+import pytest
+from scipy.integrate import solve_ivp
+
+from physics import driven
+
+TIGHT = dict(method="DOP853", rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("c, omega", [(0.3, 2.0), (0.0, 1.5), (8.0, 3.0)])
+def test_driven_response_matches_solve_ivp(c, omega):
+    m, k, F0 = 1.2, 5.0, 0.7
+    run = driven.driven_response(m, k, c, F0, omega, 0.1, -0.2, 20.0, n=200)
+    ref = solve_ivp(lambda t, y: (y[1], (F0 * np.cos(omega * t) - c * y[1] - k * y[0]) / m), (0.0, 20.0),
+                    (0.1, -0.2), t_eval=run.t, **TIGHT)
+    np.testing.assert_allclose(run.x, ref.y[0], atol=1e-7)
+    np.testing.assert_allclose(run.v, ref.y[1], atol=1e-7)
+
+
+def test_driven_response_settles_to_steady_state():
+    run = driven.driven_response(1.0, 4.0, 1.0, 1.0, 1.0, 0.5, 0.0, 60.0, n=600)
+    tail = run.t > 40.0
+    np.testing.assert_allclose(run.x[tail], run.x_steady[tail], atol=1e-6)
@@ -0,0 +1,21 @@
+"""Eğik düzlem simülatörünün kapalı form sonuçlarına karşı denetimi."""
+import numpy as np
+
+from physics import incline
+
+
+def test_incline_sliding_matches_closed_form():
+    angle, mu_k, g = 30.0, 0.1, 9.81
+    run = incline.simulate_incline(1.0, 0.1, mu_k, 0.0, angle, t_end=2.0, g=g, n=50)
+    theta = np.radians(angle)
+    a = g * (np.sin(theta) - mu_k * np.cos(theta))
+    # Düzlemde yukarı yön pozitif: blok aşağı kayar
+    np.testing.assert_allclose(run.s, -0.5 * a * run.t**2, atol=1e-8)
+    np.testing.assert_allclose(run.v, -a * run.t, atol=1e-8)
+
+
+def test_incline_static_friction_holds():
+    # tan 30° ≈ 0.577 < μs: blok hareketsiz kalır
+    run = incline.simulate_incline(1.0, 0.7, 0.5, 0.0, 30.0, t_end=2.0, n=20)
+    np.testing.assert_allclose(run.s, 0.0, atol=1e-12)
+    np.testing.assert_allclose(run.friction, 9.81 * np.sin(np.radians(30.0)), rtol=1e-12)
@@ -0,0 +1,25 @@
+"""Tam sarkaç çözümünün sayısal integrasyona karşı denetimi."""
+import numpy as np
+import pytest
+from scipy.integrate import solve_ivp
+
+from physics import oscillations
+
+TIGHT = dict(method="DOP853", rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("theta_deg", [10.0, 90.0, 170.0])
+def test_pendulum_matches_solve_ivp(theta_deg):
+    L, g, m = 1.3, 9.81, 0.5
+    theta_0 = np.radians(theta_deg)
+    t = np.linspace(0.0, 12.0, 400)
+    ref = solve_ivp(lambda _, y: (y[1], -g / L * np.sin(y[0])), (0.0, t[-1]), (theta_0, 0.0), t_eval=t, **TIGHT)
+    state = oscillations.pendulum_state(L, g, m, theta_0, t)
+    np.testing.assert_allclose(state.theta, ref.y[0], atol=1e-8)
+    np.testing.assert_allclose(state.theta_dot, ref.y[1], atol=1e-7)
+    np.testing.assert_allclose(state.KE + state.PE, oscillations.pendulum_total_energy(m, g, L, theta_0), rtol=1e-9)
+
+
+def test_pendulum_period_small_angle_limit():
+    params = oscillations.pendulum_params(2.0, 9.81, 1e-6)
+    assert params.T == pytest.approx(2 * np.pi * np.sqrt(2.0 / 9.81), rel=1e-10)
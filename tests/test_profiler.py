@@ -0,0 +1,32 @@
+"""Yeniden çalıştırma profilinin cProfile çakışmasında sayfayı bozmaması."""
+from modules import profiler
+
+
+class _BusyProfile:
+    """Python 3.12+'da başka bir profil aracı etkinken cProfile'ın davranışı."""
+
+    def enable(self):
+        raise ValueError("Another profiling tool is already active")
+
+    def disable(self):
+        raise AssertionError("etkinleşmeyen profil kapatılmamalı")
+
+
+def test_busy_profiler_skips_dump(monkeypatch, tmp_path):
+    monkeypatch.setenv(profiler.DUMP_ENV, "3")
+    monkeypatch.setenv(profiler.DUMP_DIR_ENV, str(tmp_path))
+    monkeypatch.setattr(profiler, "instrument", lambda: None)
+    monkeypatch.setattr(profiler.cProfile, "Profile", _BusyProfile)
+    calls = []
+    rerun = profiler.run("sayfa", lambda: calls.append(1))
+    assert calls == [1]
+    assert rerun.dump is None and rerun.top == ""
+    assert not list(tmp_path.iterdir())
+
+
+def test_profiler_dumps_when_free(monkeypatch, tmp_path):
+    monkeypatch.setenv(profiler.DUMP_ENV, "3")
+    monkeypatch.setenv(profiler.DUMP_DIR_ENV, str(tmp_path))
+    monkeypatch.setattr(profiler, "instrument", lambda: None)
+    rerun = profiler.run("sayfa", lambda: sum(range(1000)))
+    assert rerun.dump and rerun.dump.startswith(str(tmp_path))
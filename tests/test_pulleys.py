@@ -0,0 +1,14 @@
+"""Makara ağı çözücüsünün Atwood kapalı formuna karşı denetimi."""
+import numpy as np
+import pytest
+
+from physics import pulleys
+
+
+@pytest.mark.parametrize("I", [0.0, 0.02])
+def test_atwood_matches_closed_form(I):
+    m1, m2, g, R = 2.0, 3.0, 9.81, 0.1
+    solution = pulleys.atwood(m1, m2, g, I, R).solve()
+    a = g * (m2 - m1) / (m1 + m2 + I / R**2)
+    np.testing.assert_allclose(solution.a[:2], [-a, a], rtol=1e-12)
+    np.testing.assert_allclose(solution.T, [m1 * (g + a), m2 * (g - a)], rtol=1e-12)
@@ -0,0 +1,114 @@
+"""HTTP servisinin gerçek bir soket üzerinden uçtan uca denetimi."""
+import asyncio
+import contextlib
+import http.client
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from physics import calculators, service
+
+
+@contextlib.contextmanager
+def _running(compute):
+    """Servisi arka plandaki bir olay döngüsünde boş bir porta bağlar; (port, döngü) verir."""
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    holder = {}
+
+    async def start():
+        compute._slots = asyncio.Semaphore(compute.max_pending)
+        holder["server"] = await asyncio.start_server(compute.handle, "127.0.0.1", 0)
+        holder["port"] = holder["server"].sockets[0].getsockname()[1]
+        ready.set()
+
+    thread = threading.Thread(target=lambda: (loop.run_until_complete(start()), loop.run_forever()), daemon=True)
+    with ThreadPoolExecutor(compute.workers) as threads, ProcessPoolExecutor(compute.workers) as processes:
+        compute._threads, compute._processes = threads, processes
+        thread.start()
+        assert ready.wait(10)
+        try:
+            yield holder["port"], loop
+        finally:
+            loop.call_soon_threadsafe(holder["server"].close)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(10)
+
+
+@pytest.fixture(scope="module")
+def port():
+    with _running(service.ComputeService(workers=2)) as (port, _):
+        yield port
+
+
+def _request(port, method, path, payload=None, conn=None):
+    headers = {"Content-Type": "application/json"}
+    if conn is None:
+        conn, headers["Connection"] = http.client.HTTPConnection("127.0.0.1", port, timeout=10), "close"
+    body = None if payload is None else json.dumps(payload)
+    conn.request(method, path, body, headers)
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_list_calculators(port):
+    status, payload = _request(port, "GET", "/calculators")
+    assert status == 200
+    assert {d["ad"] for d in payload} == set(calculators.REGISTRY)
+    status, payload = _request(port, "GET", "/calculators/sarkac")
+    assert status == 200 and payload["ad"] == "sarkac"
+
+
+def test_single_and_array_requests(port):
+    row = {"L": 1.0, "theta_0_deg": 30.0}
+    status, single = _request(port, "POST", "/calc/sarkac", row)
+    assert status == 200
+    assert single == pytest.approx(calculators.evaluate("sarkac", [row])[0], rel=1e-12)
+
+    rows = [dict(row, theta_0_deg=0.4 * a) for a in range(1, 400)]
+    rows[10]["theta_0_deg"] = 180.0
+    status, results = _request(port, "POST", "/calc/sarkac", rows)
+    assert status == 200 and len(results) == len(rows)
+    assert "hata" in results[10]
+    assert all("T" in r for i, r in enumerate(results) if i != 10)
+
+
+def test_keep_alive_connection_survives_errors(port):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    assert _request(port, "GET", "/yok", conn=conn)[0] == 404
+    assert _request(port, "POST", "/calc/yok", {}, conn=conn)[0] == 404
+    assert _request(port, "GET", "/calc/sarkac", conn=conn)[0] == 405
+    status, payload = _request(port, "POST", "/calc/sarkac", {"L": 1.0, "theta_0_deg": 180.0}, conn=conn)
+    assert status == 200 and "hata" in payload
+    status, payload = _request(port, "POST", "/calc/sarkac", [1, 2], conn=conn)
+    assert status == 400
+    status, payload = _request(port, "GET", "/stats", conn=conn)
+    assert status == 200 and payload["pending"] == 0
+    conn.close()
+
+
+def test_heavy_rows_use_process_pool(port):
+    rows = [{"v0": 30.0, "angle_deg": a, "k": 0.01} for a in (20.0, 45.0, 70.0)] + [{"v0": "x", "angle_deg": 45.0}]
+    status, results = _request(port, "POST", "/calc/direncli_atis", rows)
+    assert status == 200
+    assert results[:3] == pytest.approx(calculators.evaluate("direncli_atis", rows[:3]), rel=1e-12)
+    assert "hata" in results[3]
+    # Önbellekten dönen satır, tek başına hesaplananla aynıdır
+    assert _request(port, "POST", "/calc/direncli_atis", rows[1]) == (200, results[1])
+
+
+def test_busy_pool_answers_503(monkeypatch):
+    monkeypatch.setattr(service, "QUEUE_TIMEOUT", 0.1)
+    compute = service.ComputeService(workers=1, max_pending=1)
+    with _running(compute) as (port, loop):
+        # Tek iş yuvası dolu: ağır istek sıra bekler, süre dolunca 503 alır
+        asyncio.run_coroutine_threadsafe(compute._slots.acquire(), loop).result(10)
+        row = {"v0": 30.0, "angle_deg": 45.0, "k": 0.01}
+        status, payload = _request(port, "POST", "/calc/direncli_atis", row)
+        assert status == 503 and "hata" in payload
+        # Hafif ve küçük istekler olay döngüsünde çözülmeye devam eder
+        assert _request(port, "POST", "/calc/sarkac", {"L": 1.0, "theta_0_deg": 30.0})[0] == 200
+        loop.call_soon_threadsafe(compute._slots.release)
+        assert _request(port, "POST", "/calc/direncli_atis", row)[0] == 200
@@ -0,0 +1,44 @@
+"""Spektral analizin scipy.signal referansına karşı denetimi."""
+import numpy as np
+import pytest
+from scipy import signal
+
+from physics import spectral
+
+
+@pytest.mark.parametrize("nperseg, window_name", [(256, "hann"), (200, "hamming"), (1024, "blackman")])
+def test_welch_matches_scipy(nperseg, window_name):
+    rng = np.random.default_rng(0)
+    dt = 0.01
+    t = np.arange(5000) * dt
+    x = 0.8 * np.sin(2 * np.pi * 7.0 * t) + rng.normal(0.0, 0.3, len(t)) + 0.4
+    ours = spectral.welch_psd(x, dt, nperseg, 0.5, window_name)
+    f, psd = signal.welch(x, fs=1 / dt, window=window_name, nperseg=nperseg, noverlap=nperseg // 2,
+                          detrend="constant", scaling="density")
+    np.testing.assert_allclose(ours.f, f, rtol=1e-12)
+    np.testing.assert_allclose(ours.psd, psd, rtol=1e-9, atol=1e-15)
+
+
+def test_dominant_frequency_and_amplitude():
+    dt = 0.002
+    t = np.arange(6000) * dt
+    x = 1.7 * np.cos(2 * np.pi * 3.3 * t) + 0.2 * np.cos(2 * np.pi * 9.9 * t)
+    peak = spectral.dominant_frequency(x, dt)
+    assert peak.f == pytest.approx(3.3, rel=1e-3)
+    # Log-parabol tepe kestirimi Hann penceresinde genliği birkaç yüzde içinde verir
+    assert peak.amplitude == pytest.approx(1.7, rel=5e-2)
+    harmonics = spectral.harmonics(x, dt, count=3)
+    assert harmonics[2].f == pytest.approx(9.9, rel=1e-3)
+
+
+def test_plan_cache_is_bounded_by_bytes(monkeypatch):
+    monkeypatch.setattr(spectral, "_plans", spectral.OrderedDict())
+    monkeypatch.setattr(spectral, "_plan_bytes", 0)
+    monkeypatch.setattr(spectral, "MAX_PLAN_BYTES", 1_000_000)
+    for n in range(10_000, 20_000, 1000):
+        spectral.get_plan(n)
+        assert spectral._plan_bytes == sum(p.nbytes for p in spectral._plans.values())
+        assert spectral._plan_bytes <= spectral.MAX_PLAN_BYTES
+    # Sınırı tek başına aşan plan önbelleğe girmez
+    big = spectral.get_plan(200_000)
+    assert big.n == 200_000 and (200_000, "hann", 1) not in spectral._plans
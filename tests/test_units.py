@@ -0,0 +1,33 @@
+"""CSV ve .npy toplu birim dönüştürme akışları."""
+import io
+
+import numpy as np
+import pytest
+
+from physics import units
+
+
+def test_convert_csv_keeps_empty_cells_and_reports_short_rows():
+    src = io.StringIO("ad,uzunluk,kutle\na,1.5,2\nb,,3\nc\n\nd,2,4\n")
+    dst = io.StringIO()
+    report = units.convert_csv(src, dst, {"uzunluk": ("Uzunluk", "kilometre (km)", "metre (m)")}, chunk_rows=2)
+    assert report.short_lines == [4]
+    assert report.rows == 5
+    lines = dst.getvalue().splitlines()
+    assert lines == ["ad,uzunluk,kutle", "a,1500.0,2", "b,,3", "c", "", "d,2000.0,4"]
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_convert_npy_chunks_by_bytes(tmp_path, order):
+    data = np.asfortranarray(np.arange(3000.0).reshape(100, 30)) if order == "F" else np.arange(3000.0).reshape(100, 30)
+    src, dst = tmp_path / "girdi.npy", tmp_path / "cikti.npy"
+    np.save(src, data)
+    # Satır genişliğinden küçük parça: her adımda en az bir satır işlenir
+    assert units.convert_npy(str(src), str(dst), "km", "m", chunk_bytes=100) == data.size
+    np.testing.assert_allclose(np.load(dst), data * 1000.0)
+
+
+def test_convert_csv_rejects_non_numeric_cells():
+    # Sayfa bu hatayı st.error ile gösterir
+    with pytest.raises(ValueError):
+        units.convert_csv(io.StringIO("a,b\n1,x\n"), io.StringIO(), {"b": ("Uzunluk", "kilometre (km)", "metre (m)")})